@@ -0,0 +1,138 @@
+"""Dossiercache — genormaliseerde dossierdata, geversioneerd op Supabase-tijdstempels.
+
+Elke PDF- of preview-aanvraag leest dossier en aanvraag volledig uit
+Supabase en mapt ze opnieuw via field_mapper, ook als er sinds de vorige
+preview niets gewijzigd is.
+
+Hier wordt eerst per rij alleen het wijzigingstijdstip opgehaald
+(supabase_client.lees_versie, beide rijen gelijktijdig). Sleutel is (dossier_id, aanvraag_id,
+dossier-versie, aanvraag-versie); bij een hit worden de volledige rijen en
+de mapping overgeslagen. Berekeningen zitten in de `invoer` van de
+dossier-rij, dus de dossier-versie dekt die ook.
+
+- Geen versie (probe mislukt, kolom leeg): gewoon ophalen, niet cachen.
+- De probe gaat via RLS met de token van de gebruiker: wie de rij niet mag
+  lezen, krijgt ook geen cache-hit.
+- Bij een hit krijgt de aanroeper een eigen kopie van de data:
+  generate_sections vult o.a. het geschatte AOW-inkomen in.
+
+Hit/miss-tellers in de logs en via /cache/stats.
+
+Configuratie via env:
+- NAT_DOSSIER_CACHE_MAXSIZE: aantal dossiers (default 256, 0 schakelt uit)
+- NAT_DOSSIER_CACHE_TTL: seconden (default 3600)
+"""
+
+import copy
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from calculation_cache import ResultCache
+from adviesrapport_v2 import supabase_client
+from adviesrapport_v2.field_mapper import NormalizedDossierData, extract_dossier_data
+
+logger = logging.getLogger("nat-api.adviesrapport_v2.dossier_cache")
+
+DOSSIER_CACHE = ResultCache(
+    maxsize=int(os.environ.get("NAT_DOSSIER_CACHE_MAXSIZE", "256")),
+    ttl=float(os.environ.get("NAT_DOSSIER_CACHE_TTL", "3600")),
+)
+
+# Aanvragen die buiten de cache om gingen (geen versie beschikbaar)
+_niet_gecachet = {"probe_fouten": 0, "zonder_versie": 0}
+
+
+@dataclass(frozen=True)
+class GeladenDossier:
+    """Supabase-rijen plus genormaliseerde data van één dossier/aanvraag."""
+
+    dossier: dict
+    aanvraag: dict
+    data: NormalizedDossierData
+    cache_hit: bool = False
+
+
+async def _probe(dossier_id: str, aanvraag_id: str, access_token: str | None) -> Optional[Tuple[str, str]]:
+    """(dossier-versie, aanvraag-versie), of None als niet te bepalen."""
+    try:
+        versies = tuple(await supabase_client.lees_parallel(
+            lambda: supabase_client.lees_versie("dossiers", dossier_id, access_token),
+            lambda: supabase_client.lees_versie("aanvragen", aanvraag_id, access_token),
+        ))
+    except ValueError:
+        raise  # niet gevonden (of geen toegang): zelfde 404 als volledig ophalen
+    except Exception as e:
+        _niet_gecachet["probe_fouten"] += 1
+        logger.warning("Dossiercache probe mislukt, volledig ophalen: %s", e)
+        return None
+    if None in versies:
+        _niet_gecachet["zonder_versie"] += 1
+        return None
+    return versies
+
+
+def _sleutel(dossier_id: str, aanvraag_id: str, versies: Tuple[Any, Any]) -> tuple:
+    return (dossier_id, aanvraag_id, *versies)
+
+
+async def laad_dossier(
+    dossier_id: str,
+    aanvraag_id: str,
+    access_token: str | None = None,
+) -> GeladenDossier:
+    """Dossier + aanvraag + genormaliseerde data, uit de cache als niets wijzigde.
+
+    Raises:
+        ValueError: Als dossier of aanvraag niet gevonden wordt.
+        httpx.HTTPStatusError: Bij Supabase API fouten bij volledig ophalen.
+    """
+    versies = None
+    if DOSSIER_CACHE.enabled:
+        versies = await _probe(dossier_id, aanvraag_id, access_token)
+        if versies is not None:
+            gevonden = DOSSIER_CACHE.get(_sleutel(dossier_id, aanvraag_id, versies))
+            if gevonden is not None:
+                _log("hit", dossier_id)
+                return GeladenDossier(
+                    dossier=gevonden.dossier,
+                    aanvraag=gevonden.aanvraag,
+                    data=copy.deepcopy(gevonden.data),
+                    cache_hit=True,
+                )
+
+    dossier, aanvraag = await supabase_client.lees_parallel(
+        lambda: supabase_client.lees_dossier(dossier_id, access_token),
+        lambda: supabase_client.lees_aanvraag(aanvraag_id, access_token),
+    )
+    data = await run_in_threadpool(extract_dossier_data, dossier, aanvraag)
+
+    if DOSSIER_CACHE.enabled:
+        # Versie uit de opgehaalde rijen: wijzigt een rij tussen probe en
+        # ophalen, dan hoort de cache-entry bij wat er werkelijk gemapt is
+        kolom = supabase_client.SUPABASE_VERSIE_KOLOM
+        rij_versies = (dossier.get(kolom), aanvraag.get(kolom))
+        if None not in rij_versies:
+            DOSSIER_CACHE.put(
+                _sleutel(dossier_id, aanvraag_id, rij_versies),
+                GeladenDossier(dossier, aanvraag, copy.deepcopy(data)),
+            )
+        _log("miss" if versies is not None else "overgeslagen", dossier_id)
+
+    return GeladenDossier(dossier=dossier, aanvraag=aanvraag, data=data)
+
+
+def _log(uitkomst: str, dossier_id: str) -> None:
+    stats = DOSSIER_CACHE.stats()
+    logger.info(
+        "Dossiercache %s: dossier=%s (hits=%d, misses=%d, hit_rate=%.2f)",
+        uitkomst, dossier_id, stats["hits"], stats["misses"], stats["hit_rate"],
+    )
+
+
+def stats() -> Dict[str, Any]:
+    """Hit/miss-statistieken plus aanvragen die buiten de cache om gingen."""
+    return {**DOSSIER_CACHE.stats(), **_niet_gecachet}
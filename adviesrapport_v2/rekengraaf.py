@@ -0,0 +1,117 @@
+"""Rekengraaf — onafhankelijke berekeningen van het rapport gelijktijdig.
+
+generate_sections rekent max hypotheek, maandlasten, de vier
+scenariofamilies, relatiebeëindiging en de betaalbaarheidsgrafiek. Een
+deel daarvan hangt van elkaar af (de families gebruiken de toetsrente van
+max hypotheek, de grafiek de AOW-scenario's), de rest niet.
+
+Hier worden die stappen als knopen met afhankelijkheden beschreven. Elke
+knoop start op een executor zodra zijn afhankelijkheden klaar zijn en
+krijgt hun uitkomsten als keyword-argumenten mee.
+
+- Een knoop die faalt wordt gelogd en levert zijn standaardwaarde op;
+  afhankelijke knopen rekenen daarmee verder, zodat alleen de eigen
+  sectie degradeert. Knoopfuncties vangen hun fouten dus niet zelf af.
+- De duur van elke knoop wordt gelogd en teruggegeven, net als welke
+  knopen mislukten (zo'n uitkomst hoort niet in een cache).
+
+De knopen draaien op een eigen executor, niet op de rekenpool: een knoop
+mag zo op een scenariofamilie op de rekenpool wachten zonder deadlock.
+
+Configuratie via env:
+- NAT_RAPPORT_WORKERS: aantal threads voor knopen (default 4)
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("nat-api.adviesrapport_v2.rekengraaf")
+
+_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+@dataclass(frozen=True)
+class Knoop:
+    """Eén berekening: func(**uitkomsten van afhankelijk), of standaard bij een fout."""
+
+    func: Callable[..., Any]
+    afhankelijk: Tuple[str, ...] = ()
+    standaard: Any = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            workers = int(os.environ.get("NAT_RAPPORT_WORKERS") or 4)
+            if workers < 1:
+                raise ValueError("NAT_RAPPORT_WORKERS moet minimaal 1 zijn")
+            _executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="rapport",
+            )
+        return _executor
+
+
+def _voer_knoop_uit(naam: str, knoop: Knoop, kwargs: dict) -> Tuple[Any, float, bool]:
+    """Voer één knoop uit; (uitkomst, duur in seconden, mislukt), standaard bij een fout."""
+    start = time.perf_counter()
+    try:
+        uitkomst, mislukt = knoop.func(**kwargs), False
+    except Exception as e:
+        logger.error("%s mislukt: %s", naam, e, exc_info=True)
+        uitkomst, mislukt = knoop.standaard, True
+    return uitkomst, time.perf_counter() - start, mislukt
+
+
+def voer_uit(knopen: Dict[str, Knoop]) -> Tuple[Dict[str, Any], Dict[str, float], List[str]]:
+    """
+    Voer alle knopen uit, elk zodra zijn afhankelijkheden klaar zijn.
+
+    Returns:
+        (uitkomsten, duur, mislukt) — uitkomsten en duur (seconden) per
+        knoopnaam, en de namen van knopen die hun standaardwaarde kregen.
+
+    Raises:
+        ValueError: bij een onbekende afhankelijkheid of een cyclus.
+    """
+    for naam, knoop in knopen.items():
+        onbekend = [a for a in knoop.afhankelijk if a not in knopen]
+        if onbekend:
+            raise ValueError(f"Knoop '{naam}' hangt af van onbekende knoop: {', '.join(onbekend)}")
+
+    executor = _get_executor()
+    start = time.perf_counter()
+    uitkomsten: Dict[str, Any] = {}
+    duur: Dict[str, float] = {}
+    mislukt: List[str] = []
+    wachtend = dict(knopen)
+    lopend = {}
+
+    while wachtend or lopend:
+        for naam, knoop in list(wachtend.items()):
+            if all(a in uitkomsten for a in knoop.afhankelijk):
+                kwargs = {a: uitkomsten[a] for a in knoop.afhankelijk}
+                lopend[executor.submit(_voer_knoop_uit, naam, knoop, kwargs)] = naam
+                del wachtend[naam]
+        if not lopend:
+            raise ValueError(f"Cyclus in rekengraaf: {', '.join(wachtend)}")
+
+        klaar, _ = wait(lopend, return_when=FIRST_COMPLETED)
+        for future in klaar:
+            naam = lopend.pop(future)
+            uitkomsten[naam], duur[naam], fout = future.result()
+            if fout:
+                mislukt.append(naam)
+
+    logger.info(
+        "Rekengraaf: %.0f ms (%s)",
+        (time.perf_counter() - start) * 1000,
+        ", ".join(f"{naam}={duur[naam] * 1000:.0f}ms" for naam in knopen),
+    )
+    return uitkomsten, duur, mislukt
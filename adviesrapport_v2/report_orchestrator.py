@@ -11,6 +11,9 @@ Flow:
 8. Bouw 13 secties (section_builders)
 9. Assembleer rapport dict
 10. Genereer PDF (pdf_generator)
+
+Stap 3-7 draaien als rekengraaf (rekengraaf.py): onafhankelijke
+berekeningen gelijktijdig, per knoop getimed en geïsoleerd.
 """
 
 import json
@@ -22,15 +25,18 @@ import calculator_final
 import risk_scenarios
 import pdf_generator
 from aow_calculator import bereken_aow_datum
-from loan_projection import projecteer_hypotheekdelen
+from loan_projection import projecteer_tijdlijn
 
 from monthly_costs.domain.calculator import MortgageCalculator
+from monthly_costs.exceptions import MortgageCalculatorError
+from monthly_costs.rules.loader import load_rules
 from monthly_costs.schemas.input import (
     MonthlyCostsRequest, LoanPart, Partner, LoanType, Box,
 )
 
+from adviesrapport_v2 import rekengraaf, sectie_cache
 from adviesrapport_v2.field_mapper import (
-    NormalizedDossierData, NormalizedLeningdeel, extract_dossier_data,
+    NormalizedDossierData, extract_dossier_data,
 )
 from adviesrapport_v2.schemas import AdviesrapportOptions
 from adviesrapport_v2.formatters import format_bedrag, format_datum
@@ -81,12 +87,17 @@ LOAN_TYPE_MAP = {
     "Spaarhypotheek": LoanType.ANNUITY,  # Spaar berekend als annuïteit
 }
 
+# Belastingjaar van de fiscale regels voor de maandlasten
+MAANDLASTEN_BELASTINGJAAR = 2026
+
 
 def generate_sections(
     dossier: dict,
     aanvraag: dict,
     options: AdviesrapportOptions,
     berekening: dict | None = None,
+    data: NormalizedDossierData | None = None,
+    text_overrides: dict | None = None,
 ) -> tuple[list[dict], dict]:
     """Normaliseer data, bereken alles, bouw secties.
 
@@ -95,39 +106,26 @@ def generate_sections(
         aanvraag: Volledige rij uit Supabase `aanvragen` tabel
         options: Adviesrapport opties (uit Lovable dialog)
         berekening: Optioneel — rij uit `berekeningen` tabel (nieuwe structuur)
+        data: Optioneel — al genormaliseerde data (dossier_cache); wordt
+            aangevuld (geschat AOW-inkomen), geef dus een eigen kopie mee
+        text_overrides: Optioneel dict met aangepaste teksten per sectie-id,
+            toegepast nadat de secties gebouwd of uit de cache gehaald zijn
 
     Returns:
         (sections, context) — context bevat tussenresultaten voor preview/PDF.
     """
     # --- Stap 1-2: Normaliseer data ---
-    data = extract_dossier_data(dossier, aanvraag, berekening=berekening)
+    if data is None:
+        data = extract_dossier_data(dossier, aanvraag, berekening=berekening)
     logger.info("Data genormaliseerd: hypotheek=%.0f, leningdelen=%d",
                 data.hypotheek_bedrag, len(data.leningdelen))
 
-    # --- Stap 3: Max hypotheek ---
-    max_hypotheek, toetsrente_start = _bereken_max_hypotheek(data)
-    logger.info("Max hypotheek: %.0f, toetsrente: %.3f%%", max_hypotheek, toetsrente_start * 100)
-
-    # --- Stap 4: Maandlasten ---
-    bruto_maandlast, netto_maandlast = _bereken_maandlasten(data)
-    logger.info("Maandlasten: bruto=%.0f, netto=%.0f", bruto_maandlast, netto_maandlast)
-
-    # --- Stap 5: Risico-scenario's ---
     hypotheek_delen_api = [ld.to_api_dict() for ld in data.leningdelen_voor_api]
     ingangsdatum = date.today().isoformat()
+    is_stel = bool(not data.alleenstaand and data.partner)
 
-    common_risk_params = dict(
-        toetsrente=toetsrente_start,
-        energielabel=data.financiering.energielabel,
-        verduurzamings_maatregelen=0,
-        limieten_bkr_geregistreerd=data.limieten_bkr,
-        studievoorschot_studielening=data.studielening_maandlast,
-        erfpachtcanon_per_jaar=data.erfpachtcanon_per_maand,
-        jaarlast_overige_kredieten=data.overige_kredieten_maandlast,
-        geadviseerd_hypotheekbedrag=data.totale_hypotheekschuld,
-    )
-
-    # AOW-inkomen: gebruik data uit Supabase, of schat op basis van standaard AOW
+    # AOW-inkomen: gebruik data uit Supabase, of schat op basis van standaard AOW.
+    # Vóór de rekengraaf: de knopen lezen data alleen.
     inkomen_aanvrager_aow = data.inkomen_aanvrager_aow
     inkomen_partner_aow = data.inkomen_partner_aow
 
@@ -140,66 +138,7 @@ def generate_sections(
         data.partner.inkomen.aow_uitkering = inkomen_partner_aow
         logger.info("AOW partner geschat op %.0f (geen data in Supabase)", inkomen_partner_aow)
 
-    # 5a: AOW-scenario's
-    aow_result = _safe_call(
-        "AOW scenarios",
-        risk_scenarios.bereken_aow_scenarios,
-        hypotheek_delen=hypotheek_delen_api,
-        ingangsdatum_hypotheek=ingangsdatum,
-        geboortedatum_aanvrager=data.aanvrager.geboortedatum,
-        inkomen_aanvrager_huidig=data.inkomen_aanvrager_huidig,
-        inkomen_aanvrager_aow=inkomen_aanvrager_aow,
-        alleenstaande="NEE" if not data.alleenstaand else "JA",
-        geboortedatum_partner=data.partner.geboortedatum if data.partner else None,
-        inkomen_partner_huidig=data.inkomen_partner_huidig,
-        inkomen_partner_aow=inkomen_partner_aow,
-        **common_risk_params,
-    )
-    aow_scenarios = (aow_result or {}).get("scenarios", [])
-
-    # Voeg restschuld toe per AOW-scenario (nodig voor status-derivatie)
-    for sc in aow_scenarios:
-        peildatum_str = sc.get("peildatum", "")
-        if peildatum_str and ingangsdatum:
-            try:
-                from datetime import date as _date
-                peil = _date.fromisoformat(peildatum_str)
-                start_dt = _date.fromisoformat(ingangsdatum)
-                elapsed = max(0, (peil.year - start_dt.year) * 12 + (peil.month - start_dt.month))
-                restschuld = sum(
-                    _restschuld_leningdeel(ld, elapsed)
-                    for ld in data.leningdelen_voor_api
-                )
-                if data.financiering.is_wijziging and not data.bestaande_in_leningdelen:
-                    if data.financiering.is_oversluiten:
-                        totaal_bestaand = sum(h.hoofdsom for h in data.bestaande_hypotheken)
-                        restschuld += max(0, totaal_bestaand - data.financiering.koopsom)
-                    else:
-                        restschuld += data.financiering.koopsom
-                sc["restschuld_op_peildatum"] = round(restschuld)
-            except (ValueError, TypeError):
-                pass
-
-    # 5b: Overlijden (alleen stel)
-    overlijden_scenarios = []
-    if not data.alleenstaand and data.partner:
-        overl_result = _safe_call(
-            "Overlijden scenarios",
-            risk_scenarios.bereken_overlijdens_scenarios,
-            hypotheek_delen=hypotheek_delen_api,
-            geboortedatum_aanvrager=data.aanvrager.geboortedatum,
-            inkomen_aanvrager_huidig=data.inkomen_aanvrager_huidig,
-            geboortedatum_partner=data.partner.geboortedatum,
-            inkomen_partner_huidig=data.inkomen_partner_huidig,
-            nabestaandenpensioen_bij_overlijden_aanvrager=data.aanvrager.inkomen.nabestaandenpensioen,
-            nabestaandenpensioen_bij_overlijden_partner=data.partner.inkomen.nabestaandenpensioen if data.partner else 0,
-            heeft_kind_onder_18=data.heeft_kind_onder_18,
-            geboortedatum_jongste_kind=data.geboortedatum_jongste_kind or None,
-            **common_risk_params,
-        )
-        overlijden_scenarios = (overl_result or {}).get("scenarios", [])
-
-    # 5c: AO-scenario's — overslaan als alle personen al AOW-gerechtigd zijn
+    # AOW-gerechtigdheid: AO/WW overslaan als alle personen al AOW hebben
     _vandaag = date.today()
     try:
         _aow_datum_aanvrager = bereken_aow_datum(date.fromisoformat(data.aanvrager.geboortedatum))
@@ -217,28 +156,113 @@ def generate_sections(
 
     _alle_personen_aow = _aanvrager_is_aow and (data.alleenstaand or _partner_is_aow)
 
-    ao_scenarios = []
-    ww_scenarios = []
+    # Relatiebeëindiging: bij AOW-gerechtigden het AOW-inkomen als huidig inkomen
+    ink_a_relatie = data.inkomen_aanvrager_huidig
+    ink_p_relatie = data.inkomen_partner_huidig
+    if is_stel:
+        ink_a_relatie = inkomen_aanvrager_aow if _aanvrager_is_aow else data.inkomen_aanvrager_huidig
+        ink_p_relatie = inkomen_partner_aow if _partner_is_aow else data.inkomen_partner_huidig
 
-    if _alle_personen_aow:
-        logger.info("Alle personen AOW-gerechtigd — AO/WW-scenario's overgeslagen")
-    else:
-        ao_result = _safe_call(
-            "AO scenarios",
-            risk_scenarios.bereken_ao_scenarios,
+    # --- Stap 3-7: Berekeningen als rekengraaf ---
+    # Max hypotheek, maandlasten en relatiebeëindiging zijn onafhankelijk; de
+    # scenariofamilies wachten op de toetsrente van max hypotheek en rekenen
+    # gelijktijdig op de rekenpool met één rekencontext; de
+    # betaalbaarheidsgrafiek wacht op de AOW-scenario's.
+    reken_context = risk_scenarios.RekenContext()
+
+    def _familie(func, max_hypotheek, **kwargs) -> list:
+        _, toetsrente_start = max_hypotheek
+        taak = risk_scenarios.start_familie(
+            func,
+            context=reken_context,
             hypotheek_delen=hypotheek_delen_api,
+            toetsrente=toetsrente_start,
+            energielabel=data.financiering.energielabel,
+            verduurzamings_maatregelen=0,
+            limieten_bkr_geregistreerd=data.limieten_bkr,
+            studievoorschot_studielening=data.studielening_maandlast,
+            erfpachtcanon_per_jaar=data.erfpachtcanon_per_maand,
+            jaarlast_overige_kredieten=data.overige_kredieten_maandlast,
+            geadviseerd_hypotheekbedrag=data.totale_hypotheekschuld,
+            **kwargs,
+        )
+        return (taak.result() or {}).get("scenarios", [])
+
+    def _zonder_aow_personen(scenarios: list) -> list:
+        # Filter scenario's van personen die al AOW-gerechtigd zijn
+        if _aanvrager_is_aow:
+            scenarios = [s for s in scenarios if s.get("wie") != "aanvrager"]
+        if _partner_is_aow:
+            scenarios = [s for s in scenarios if s.get("wie") != "partner"]
+        return scenarios
+
+    inkomen_params = dict(
+        ingangsdatum_hypotheek=ingangsdatum,
+        geboortedatum_aanvrager=data.aanvrager.geboortedatum,
+        alleenstaande="NEE" if not data.alleenstaand else "JA",
+        geboortedatum_partner=data.partner.geboortedatum if data.partner else None,
+        inkomen_loondienst_aanvrager=data.aanvrager.inkomen.loondienst,
+        inkomen_onderneming_aanvrager=data.aanvrager.inkomen.onderneming,
+        inkomen_roz_aanvrager=data.aanvrager.inkomen.roz,
+        inkomen_overig_aanvrager=data.aanvrager.inkomen.overig + data.aanvrager.inkomen.overig_tijdelijk,
+        inkomen_loondienst_partner=data.partner.inkomen.loondienst if data.partner else 0,
+        inkomen_onderneming_partner=data.partner.inkomen.onderneming if data.partner else 0,
+        inkomen_roz_partner=data.partner.inkomen.roz if data.partner else 0,
+        inkomen_overig_partner=(data.partner.inkomen.overig + data.partner.inkomen.overig_tijdelijk) if data.partner else 0,
+    )
+
+    # 5a: AOW-scenario's, met restschuld per scenario (nodig voor status-derivatie)
+    def _aow(max_hypotheek) -> list:
+        aow_scenarios = _familie(
+            risk_scenarios.bereken_aow_scenarios,
+            max_hypotheek,
             ingangsdatum_hypotheek=ingangsdatum,
             geboortedatum_aanvrager=data.aanvrager.geboortedatum,
+            inkomen_aanvrager_huidig=data.inkomen_aanvrager_huidig,
+            inkomen_aanvrager_aow=inkomen_aanvrager_aow,
             alleenstaande="NEE" if not data.alleenstaand else "JA",
             geboortedatum_partner=data.partner.geboortedatum if data.partner else None,
-            inkomen_loondienst_aanvrager=data.aanvrager.inkomen.loondienst,
-            inkomen_onderneming_aanvrager=data.aanvrager.inkomen.onderneming,
-            inkomen_roz_aanvrager=data.aanvrager.inkomen.roz,
-            inkomen_overig_aanvrager=data.aanvrager.inkomen.overig + data.aanvrager.inkomen.overig_tijdelijk,
-            inkomen_loondienst_partner=data.partner.inkomen.loondienst if data.partner else 0,
-            inkomen_onderneming_partner=data.partner.inkomen.onderneming if data.partner else 0,
-            inkomen_roz_partner=data.partner.inkomen.roz if data.partner else 0,
-            inkomen_overig_partner=(data.partner.inkomen.overig + data.partner.inkomen.overig_tijdelijk) if data.partner else 0,
+            inkomen_partner_huidig=data.inkomen_partner_huidig,
+            inkomen_partner_aow=inkomen_partner_aow,
+        )
+        aow_met_peildatum = []
+        for sc in aow_scenarios:
+            peildatum_str = sc.get("peildatum", "")
+            if peildatum_str and ingangsdatum:
+                try:
+                    peil = date.fromisoformat(peildatum_str)
+                    start_dt = date.fromisoformat(ingangsdatum)
+                except (ValueError, TypeError):
+                    continue
+                elapsed = max(0, (peil.year - start_dt.year) * 12 + (peil.month - start_dt.month))
+                aow_met_peildatum.append((sc, elapsed))
+        if aow_met_peildatum:
+            restschulden = _restschuld_tijdlijn(data, [elapsed for _, elapsed in aow_met_peildatum])
+            for (sc, _), restschuld in zip(aow_met_peildatum, restschulden):
+                sc["restschuld_op_peildatum"] = round(restschuld)
+        return aow_scenarios
+
+    # 5b: Overlijden (alleen stel)
+    def _overlijden(max_hypotheek) -> list:
+        return _familie(
+            risk_scenarios.bereken_overlijdens_scenarios,
+            max_hypotheek,
+            geboortedatum_aanvrager=data.aanvrager.geboortedatum,
+            inkomen_aanvrager_huidig=data.inkomen_aanvrager_huidig,
+            geboortedatum_partner=data.partner.geboortedatum,
+            inkomen_partner_huidig=data.inkomen_partner_huidig,
+            nabestaandenpensioen_bij_overlijden_aanvrager=data.aanvrager.inkomen.nabestaandenpensioen,
+            nabestaandenpensioen_bij_overlijden_partner=data.partner.inkomen.nabestaandenpensioen if data.partner else 0,
+            heeft_kind_onder_18=data.heeft_kind_onder_18,
+            geboortedatum_jongste_kind=data.geboortedatum_jongste_kind or None,
+        )
+
+    # 5c: Arbeidsongeschiktheid
+    def _ao(max_hypotheek) -> list:
+        return _zonder_aow_personen(_familie(
+            risk_scenarios.bereken_ao_scenarios,
+            max_hypotheek,
+            **inkomen_params,
             ao_percentage=options.ao_percentage,
             benutting_rvc_percentage=options.benutting_rvc_percentage,
             loondoorbetaling_pct_jaar1_aanvrager=options.loondoorbetaling_pct_jaar1_aanvrager,
@@ -250,33 +274,14 @@ def generate_sections(
             woonlastenverzekering_ao_bruto_jaar=data.woonlastenverzekering_ao,
             arbeidsverleden_jaren_tm_2015=options.arbeidsverleden_jaren_tm_2015,
             arbeidsverleden_jaren_vanaf_2016=options.arbeidsverleden_jaren_vanaf_2016,
-            **common_risk_params,
-        )
-        ao_scenarios = (ao_result or {}).get("scenarios", [])
-
-        # Filter scenario's van personen die al AOW-gerechtigd zijn
-        if _aanvrager_is_aow:
-            ao_scenarios = [s for s in ao_scenarios if s.get("wie") != "aanvrager"]
-        if _partner_is_aow:
-            ao_scenarios = [s for s in ao_scenarios if s.get("wie") != "partner"]
+        ))
 
-        # 5d: Werkloosheid
-        ww_result = _safe_call(
-            "WW scenarios",
+    # 5d: Werkloosheid
+    def _ww(max_hypotheek) -> list:
+        return _zonder_aow_personen(_familie(
             risk_scenarios.bereken_werkloosheid_scenarios,
-            hypotheek_delen=hypotheek_delen_api,
-            ingangsdatum_hypotheek=ingangsdatum,
-            geboortedatum_aanvrager=data.aanvrager.geboortedatum,
-            alleenstaande="NEE" if not data.alleenstaand else "JA",
-            geboortedatum_partner=data.partner.geboortedatum if data.partner else None,
-            inkomen_loondienst_aanvrager=data.aanvrager.inkomen.loondienst,
-            inkomen_onderneming_aanvrager=data.aanvrager.inkomen.onderneming,
-            inkomen_roz_aanvrager=data.aanvrager.inkomen.roz,
-            inkomen_overig_aanvrager=data.aanvrager.inkomen.overig + data.aanvrager.inkomen.overig_tijdelijk,
-            inkomen_loondienst_partner=data.partner.inkomen.loondienst if data.partner else 0,
-            inkomen_onderneming_partner=data.partner.inkomen.onderneming if data.partner else 0,
-            inkomen_roz_partner=data.partner.inkomen.roz if data.partner else 0,
-            inkomen_overig_partner=(data.partner.inkomen.overig + data.partner.inkomen.overig_tijdelijk) if data.partner else 0,
+            max_hypotheek,
+            **inkomen_params,
             arbeidsverleden_jaren_totaal_aanvrager=options.arbeidsverleden_jaren_totaal_aanvrager,
             arbeidsverleden_pre2016_boven10_aanvrager=options.arbeidsverleden_pre2016_boven10_aanvrager,
             arbeidsverleden_vanaf2016_boven10_aanvrager=options.arbeidsverleden_vanaf2016_boven10_aanvrager,
@@ -284,45 +289,75 @@ def generate_sections(
             arbeidsverleden_pre2016_boven10_partner=options.arbeidsverleden_pre2016_boven10_partner,
             arbeidsverleden_vanaf2016_boven10_partner=options.arbeidsverleden_vanaf2016_boven10_partner,
             woonlastenverzekering_ww_bruto_jaar=data.woonlastenverzekering_ww,
-            **common_risk_params,
-        )
-        ww_scenarios = (ww_result or {}).get("scenarios", [])
-
-        # Filter scenario's van personen die al AOW-gerechtigd zijn
-        if _aanvrager_is_aow:
-            ww_scenarios = [s for s in ww_scenarios if s.get("wie") != "aanvrager"]
-        if _partner_is_aow:
-            ww_scenarios = [s for s in ww_scenarios if s.get("wie") != "partner"]
+        ))
 
-    # --- Stap 6: Relatiebeëindiging (alleen stel) ---
-    max_hyp_aanvrager_alleen = 0
-    max_hyp_partner_alleen = 0
-    if not data.alleenstaand and data.partner:
-        # Bij AOW-gerechtigden: gebruik AOW-inkomen als huidig inkomen
-        ink_a_relatie = inkomen_aanvrager_aow if _aanvrager_is_aow else data.inkomen_aanvrager_huidig
-        ink_p_relatie = inkomen_partner_aow if _partner_is_aow else data.inkomen_partner_huidig
-        max_hyp_aanvrager_alleen = _bereken_max_hypotheek_alleenstaand(
-            ink_a_relatie, data.financiering.energielabel, ontvangt_aow=_aanvrager_is_aow,
+    # 6: Relatiebeëindiging (alleen stel)
+    def _relatie() -> tuple[float, float]:
+        return (
+            _bereken_max_hypotheek_alleenstaand(
+                ink_a_relatie, data.financiering.energielabel, ontvangt_aow=_aanvrager_is_aow,
+            ),
+            _bereken_max_hypotheek_alleenstaand(
+                ink_p_relatie, data.financiering.energielabel, ontvangt_aow=_partner_is_aow,
+            ),
         )
-        max_hyp_partner_alleen = _bereken_max_hypotheek_alleenstaand(
-            ink_p_relatie, data.financiering.energielabel, ontvangt_aow=_partner_is_aow,
+
+    # 7: Betaalbaarheid chart data (was: Pensioen chart)
+    def _pensioen_chart(max_hypotheek, aow) -> dict | None:
+        return _build_pensioen_chart_data(
+            data=data,
+            aow_scenarios=aow,
+            max_hypotheek_huidig=max_hypotheek[0],
+            hypotheek_delen_api=hypotheek_delen_api,
+            toetsrente=max_hypotheek[1],
+            inkomen_aanvrager_aow=inkomen_aanvrager_aow,
+            inkomen_partner_aow=inkomen_partner_aow,
         )
 
+    knopen = {
+        "max_hypotheek": rekengraaf.Knoop(lambda: _bereken_max_hypotheek(data), standaard=(0, 0.05)),
+        "maandlasten": rekengraaf.Knoop(lambda: _bereken_maandlasten(data), standaard=(0, 0)),
+        "aow": rekengraaf.Knoop(_aow, ("max_hypotheek",), standaard=[]),
+        "pensioen_chart": rekengraaf.Knoop(_pensioen_chart, ("max_hypotheek", "aow")),
+    }
+    if is_stel:
+        knopen["overlijden"] = rekengraaf.Knoop(_overlijden, ("max_hypotheek",), standaard=[])
+        knopen["relatie"] = rekengraaf.Knoop(_relatie, standaard=(0, 0))
+    if _alle_personen_aow:
+        logger.info("Alle personen AOW-gerechtigd — AO/WW-scenario's overgeslagen")
+    else:
+        knopen["ao"] = rekengraaf.Knoop(_ao, ("max_hypotheek",), standaard=[])
+        knopen["ww"] = rekengraaf.Knoop(_ww, ("max_hypotheek",), standaard=[])
+
+    # Bij gelijke data en opties (bijv. alleen teksten bewerkt in de preview)
+    # de vorige uitkomsten hergebruiken (sectie_cache.py)
+    memo = sectie_cache.SectieMemo(data, _maandlasten_regels_versie())
+    bereken_sleutel = memo.sleutel("berekeningen", data=data, options=options)
+    uitkomsten = memo.get(bereken_sleutel)
+    berekeningen_hergebruikt = uitkomsten is not None
+    if berekeningen_hergebruikt:
+        logger.info("Berekeningen hergebruikt (sectiecache)")
+    else:
+        uitkomsten, _, mislukt = rekengraaf.voer_uit(knopen)
+        logger.info("Risico-scenario's: %s", reken_context.stats())
+        if not mislukt:
+            memo.put(bereken_sleutel, uitkomsten)
+
+    max_hypotheek, toetsrente_start = uitkomsten["max_hypotheek"]
+    logger.info("Max hypotheek: %.0f, toetsrente: %.3f%%", max_hypotheek, toetsrente_start * 100)
+    bruto_maandlast, netto_maandlast = uitkomsten["maandlasten"]
+    logger.info("Maandlasten: bruto=%.0f, netto=%.0f", bruto_maandlast, netto_maandlast)
+    aow_scenarios = uitkomsten["aow"]
+    overlijden_scenarios = uitkomsten.get("overlijden", [])
+    ao_scenarios = uitkomsten.get("ao", [])
+    ww_scenarios = uitkomsten.get("ww", [])
+    max_hyp_aanvrager_alleen, max_hyp_partner_alleen = uitkomsten.get("relatie", (0, 0))
+    pensioen_chart_data = uitkomsten["pensioen_chart"]
+
     # --- Beschikbare buffer (spaargeld/beleggingen minus inbreng) ---
     beschikbare_buffer = data.beschikbare_buffer
     logger.info("Beschikbare buffer: %.0f", beschikbare_buffer)
 
-    # --- Stap 7: Betaalbaarheid chart data (was: Pensioen chart) ---
-    pensioen_chart_data = _build_pensioen_chart_data(
-        data=data,
-        aow_scenarios=aow_scenarios,
-        max_hypotheek_huidig=max_hypotheek,
-        hypotheek_delen_api=hypotheek_delen_api,
-        toetsrente=toetsrente_start,
-        inkomen_aanvrager_aow=inkomen_aanvrager_aow,
-        inkomen_partner_aow=inkomen_partner_aow,
-    )
-
     # --- Stap 8: Scenario checks ---
     scenario_checks = _bepaal_scenario_checks(
         data, max_hypotheek, aow_scenarios, overlijden_scenarios,
@@ -331,49 +366,50 @@ def generate_sections(
         pensioen_chart_data=pensioen_chart_data,
     )
 
-    # --- Stap 9: Bouw secties ---
-    sections = []
-
-    sections.append(build_summary_section(
-        data=data,
-        max_hypotheek=max_hypotheek,
-        netto_maandlast=netto_maandlast,
-        bruto_maandlast=bruto_maandlast,
-        scenario_checks=scenario_checks,
-    ))
-
-    sections.append(build_client_profile_section(
-        options=options,
-        alleenstaand=data.alleenstaand,
-        alle_personen_aow=_alle_personen_aow,
-    ))
-
-    sections.append(build_current_situation_section(
-        data,
-        aanvrager_is_aow=_aanvrager_is_aow,
-        partner_is_aow=_partner_is_aow,
-    ))
-
-    sections.append(build_financing_section(data, bruto_maandlast))
-
-    sections.append(build_retirement_section(
-        data=data,
-        aow_scenarios=aow_scenarios,
-        pensioen_chart_data=pensioen_chart_data,
-        max_hypotheek_huidig=max_hypotheek,
-        beschikbare_buffer=beschikbare_buffer,
-    ))
-
-    # Overlijden: altijd tonen (stel: inkomensperspectief, alleenstaand: LTV-perspectief)
-    sections.append(build_risk_death_section(
-        data=data,
-        overlijden_scenarios=overlijden_scenarios,
-        max_hypotheek_huidig=max_hypotheek,
-        beschikbare_buffer=beschikbare_buffer,
-    ))
+    # --- Stap 9: Bouw secties (alleen secties met gewijzigde invoer) ---
+    sections = [
+        memo.bouw(
+            build_summary_section,
+            data=data,
+            max_hypotheek=max_hypotheek,
+            netto_maandlast=netto_maandlast,
+            bruto_maandlast=bruto_maandlast,
+            scenario_checks=scenario_checks,
+        ),
+        memo.bouw(
+            build_client_profile_section,
+            options=options,
+            alleenstaand=data.alleenstaand,
+            alle_personen_aow=_alle_personen_aow,
+        ),
+        memo.bouw(
+            build_current_situation_section,
+            data=data,
+            aanvrager_is_aow=_aanvrager_is_aow,
+            partner_is_aow=_partner_is_aow,
+        ),
+        memo.bouw(build_financing_section, data=data, bruto_maandlast=bruto_maandlast),
+        memo.bouw(
+            build_retirement_section,
+            data=data,
+            aow_scenarios=aow_scenarios,
+            pensioen_chart_data=pensioen_chart_data,
+            max_hypotheek_huidig=max_hypotheek,
+            beschikbare_buffer=beschikbare_buffer,
+        ),
+        # Overlijden: altijd tonen (stel: inkomensperspectief, alleenstaand: LTV-perspectief)
+        memo.bouw(
+            build_risk_death_section,
+            data=data,
+            overlijden_scenarios=overlijden_scenarios,
+            max_hypotheek_huidig=max_hypotheek,
+            beschikbare_buffer=beschikbare_buffer,
+        ),
+    ]
 
     if ao_scenarios:
-        sections.append(build_risk_disability_section(
+        sections.append(memo.bouw(
+            build_risk_disability_section,
             data=data,
             ao_scenarios=ao_scenarios,
             max_hypotheek_huidig=max_hypotheek,
@@ -383,7 +419,8 @@ def generate_sections(
         ))
 
     if ww_scenarios:
-        sections.append(build_risk_unemployment_section(
+        sections.append(memo.bouw(
+            build_risk_unemployment_section,
             data=data,
             ww_scenarios=ww_scenarios,
             max_hypotheek_huidig=max_hypotheek,
@@ -391,19 +428,25 @@ def generate_sections(
             beschikbare_buffer=beschikbare_buffer,
         ))
 
-    relatie_section = build_risk_relationship_section(
+    relatie_section = memo.bouw(
+        build_risk_relationship_section,
         data=data,
         max_hyp_aanvrager_alleen=max_hyp_aanvrager_alleen,
         max_hyp_partner_alleen=max_hyp_partner_alleen,
         max_hypotheek_huidig=max_hypotheek,
         beschikbare_buffer=beschikbare_buffer,
-        inkomen_aanvrager=ink_a_relatie if not data.alleenstaand and data.partner else data.inkomen_aanvrager_huidig,
-        inkomen_partner=ink_p_relatie if not data.alleenstaand and data.partner else data.inkomen_partner_huidig,
+        inkomen_aanvrager=ink_a_relatie,
+        inkomen_partner=ink_p_relatie,
     )
     if relatie_section:
         sections.append(relatie_section)
 
-    sections.append(build_closing_section())
+    sections.append(memo.bouw(build_closing_section))
+    logger.info("Secties: %d hergebruikt (%s), %d gebouwd",
+                len(memo.hergebruikt), ", ".join(memo.hergebruikt), len(memo.gebouwd))
+
+    if text_overrides:
+        _apply_text_overrides(sections, text_overrides)
 
     # --- Context: tussenresultaten voor preview/PDF ---
     klantnaam = data.aanvrager.naam
@@ -423,6 +466,8 @@ def generate_sections(
         "ww_scenarios": ww_scenarios,
         "max_hyp_aanvrager_alleen": max_hyp_aanvrager_alleen,
         "max_hyp_partner_alleen": max_hyp_partner_alleen,
+        "secties_hergebruikt": memo.hergebruikt,
+        "berekeningen_hergebruikt": berekeningen_hergebruikt,
         "meta": {
             "title": "Persoonlijk Hypotheekadvies",
             "date": rapport_datum,
@@ -443,6 +488,7 @@ def generate_report(
     options: AdviesrapportOptions,
     text_overrides: dict | None = None,
     berekening: dict | None = None,
+    data: NormalizedDossierData | None = None,
 ) -> bytes:
     """Genereer adviesrapport PDF vanuit Supabase data.
 
@@ -452,14 +498,15 @@ def generate_report(
         options: Adviesrapport opties (uit Lovable dialog)
         text_overrides: Optioneel dict met aangepaste teksten per sectie-id
         berekening: Optioneel — rij uit `berekeningen` tabel
+        data: Optioneel — al genormaliseerde data (zie generate_sections)
 
     Returns:
         PDF bytes
     """
-    sections, ctx = generate_sections(dossier, aanvraag, options, berekening=berekening)
-
-    if text_overrides:
-        _apply_text_overrides(sections, text_overrides)
+    sections, ctx = generate_sections(
+        dossier, aanvraag, options,
+        berekening=berekening, data=data, text_overrides=text_overrides,
+    )
 
     rapport = {
         "meta": ctx["meta"],
@@ -516,6 +563,8 @@ def build_preview_response(sections: list[dict], ctx: dict) -> dict:
         "netto_maandlast": round(ctx["netto_maandlast"]),
         "scenario_checks": ctx["scenario_checks"],
         "sections": preview_sections,
+        "reused_sections": ctx.get("secties_hergebruikt", []),
+        "reused_calculations": ctx.get("berekeningen_hergebruikt", False),
     }
 
 
@@ -672,15 +721,6 @@ def _extract_per_person(
 # Helper functies
 # ═══════════════════════════════════════════════════════════════════════
 
-def _safe_call(label: str, func, **kwargs):
-    """Roep een functie aan en log fouten zonder te crashen."""
-    try:
-        return func(**kwargs)
-    except Exception as e:
-        logger.error("%s mislukt: %s", label, e, exc_info=True)
-        return None
-
-
 def _bereken_leeftijd(geboortedatum: str) -> int:
     """Bereken leeftijd uit geboortedatum string (YYYY-MM-DD). Fallback: 35."""
     if not geboortedatum:
@@ -722,6 +762,8 @@ def _bereken_max_hypotheek(data: NormalizedDossierData) -> tuple[float, float]:
     Returns:
         (max_hypotheek, toetsrente) — toetsrente is de gewogen rente
         die de calculator gebruikt (nodig voor pensioengrafiek).
+
+    Fouten van de calculator worden niet afgevangen (zie _bereken_maandlasten).
     """
     hypotheek_delen = [ld.to_api_dict() for ld in data.leningdelen_voor_api]
 
@@ -781,10 +823,7 @@ def _bereken_max_hypotheek(data: NormalizedDossierData) -> tuple[float, float]:
         "hypotheek_delen": hypotheek_delen,
     }
 
-    result = _safe_call("Max hypotheek", calculator_final.calculate, inputs=inputs)
-    if not result:
-        return 0, 0.05
-
+    result = calculator_final.calculate(inputs)
     scenario1 = result.get("scenario1")
     if not scenario1:
         return 0, 0.05
@@ -816,10 +855,7 @@ def _bereken_max_hypotheek_alleenstaand(inkomen: float, energielabel: str, ontva
         }],
     }
 
-    result = _safe_call("Max hypotheek alleenstaand", calculator_final.calculate, inputs=inputs)
-    if not result:
-        return 0
-
+    result = calculator_final.calculate(inputs)
     scenario1 = result.get("scenario1")
     if not scenario1:
         return 0
@@ -827,72 +863,78 @@ def _bereken_max_hypotheek_alleenstaand(inkomen: float, energielabel: str, ontva
     return max(0, scenario1["annuitair"]["max_box1"])
 
 
+def _maandlasten_regels_versie() -> str | None:
+    """Actieve versie van de fiscale regels voor de maandlasten (herladen zonder herstart)."""
+    try:
+        return load_rules(MAANDLASTEN_BELASTINGJAAR).version
+    except MortgageCalculatorError:
+        return None  # dan faalt _bereken_maandlasten zelf ook
+
+
 def _bereken_maandlasten(data: NormalizedDossierData) -> tuple[float, float]:
     """Bereken bruto en netto maandlasten via monthly_costs module.
 
+    Fouten worden niet afgevangen: in generate_sections levert de rekengraaf
+    dan (0, 0) op en wordt zo'n uitkomst niet gecachet.
+
     Returns:
         (bruto_maandlast, netto_maandlast)
     """
     if not data.leningdelen_voor_api:
         return 0, 0
 
-    try:
-        # Bouw loan parts
-        loan_parts = []
-        for i, ld in enumerate(data.leningdelen_voor_api):
-            loan_type = LOAN_TYPE_MAP.get(ld.aflos_type, LoanType.ANNUITY)
-            box = Box.BOX1 if ld.bedrag_box1 > 0 else Box.BOX3
-            principal = ld.bedrag_box1 if ld.bedrag_box1 > 0 else ld.bedrag_box3
-
-            if principal <= 0:
-                continue
+    # Bouw loan parts
+    loan_parts = []
+    for i, ld in enumerate(data.leningdelen_voor_api):
+        loan_type = LOAN_TYPE_MAP.get(ld.aflos_type, LoanType.ANNUITY)
+        box = Box.BOX1 if ld.bedrag_box1 > 0 else Box.BOX3
+        principal = ld.bedrag_box1 if ld.bedrag_box1 > 0 else ld.bedrag_box3
+
+        if principal <= 0:
+            continue
+
+        loan_parts.append(LoanPart(
+            id=f"deel_{i+1}",
+            principal=principal,
+            interest_rate=ld.werkelijke_rente * 100,  # Module verwacht percentage
+            term_years=ld.org_lpt / 12,
+            loan_type=loan_type,
+            box=box,
+        ))
+
+    if not loan_parts:
+        return 0, 0
 
-            loan_parts.append(LoanPart(
-                id=f"deel_{i+1}",
-                principal=principal,
-                interest_rate=ld.werkelijke_rente * 100,  # Module verwacht percentage
-                term_years=ld.org_lpt / 12,
-                loan_type=loan_type,
-                box=box,
-            ))
-
-        if not loan_parts:
-            return 0, 0
-
-        # Partners — bereken leeftijd uit geboortedatum
-        age_aanvrager = _bereken_leeftijd(data.aanvrager.geboortedatum)
-        partners = [Partner(
-            id="aanvrager",
-            taxable_income=data.inkomen_aanvrager_huidig,
-            age=age_aanvrager,
+    # Partners — bereken leeftijd uit geboortedatum
+    age_aanvrager = _bereken_leeftijd(data.aanvrager.geboortedatum)
+    partners = [Partner(
+        id="aanvrager",
+        taxable_income=data.inkomen_aanvrager_huidig,
+        age=age_aanvrager,
+        is_aow=False,
+    )]
+    if data.partner:
+        age_partner = _bereken_leeftijd(data.partner.geboortedatum)
+        partners.append(Partner(
+            id="partner",
+            taxable_income=data.inkomen_partner_huidig,
+            age=age_partner,
             is_aow=False,
-        )]
-        if data.partner:
-            age_partner = _bereken_leeftijd(data.partner.geboortedatum)
-            partners.append(Partner(
-                id="partner",
-                taxable_income=data.inkomen_partner_huidig,
-                age=age_partner,
-                is_aow=False,
-            ))
-
-        request = MonthlyCostsRequest(
-            fiscal_year=2026,
-            woz_value=data.financiering.woningwaarde or 300000,
-            loan_parts=loan_parts,
-            partners=partners,
-        )
+        ))
 
-        calc = MortgageCalculator(fiscal_year=2026)
-        response = calc.calculate(request)
+    request = MonthlyCostsRequest(
+        fiscal_year=MAANDLASTEN_BELASTINGJAAR,
+        woz_value=data.financiering.woningwaarde or 300000,
+        loan_parts=loan_parts,
+        partners=partners,
+    )
 
-        bruto = float(response.total_gross_monthly)
-        netto = float(response.net_monthly_cost)
-        return bruto, netto
+    calc = MortgageCalculator(fiscal_year=MAANDLASTEN_BELASTINGJAAR)
+    response = calc.calculate(request)
 
-    except Exception as e:
-        logger.error("Maandlasten berekening mislukt: %s", e, exc_info=True)
-        return 0, 0
+    bruto = float(response.total_gross_monthly)
+    netto = float(response.net_monthly_cost)
+    return bruto, netto
 
 
 def _bepaal_scenario_checks(
@@ -1104,28 +1146,21 @@ def _build_pensioen_chart_data(
         "c_actuele_10jr_rente": toetsrente,
     }
 
+    # Projectie en restschuld voor alle jaren in één pass
+    delen_api = hypotheek_delen_api or [ld.to_api_dict() for ld in data.leningdelen_voor_api]
+    elapsed_per_jaar = [y * 12 for y in range(n_jaren)]
+    tijdlijn = projecteer_tijdlijn(
+        delen_api, elapsed_per_jaar, [date(start_jaar + y, 1, 1) for y in range(n_jaren)],
+    )
+    restschulden = _restschuld_tijdlijn(data, elapsed_per_jaar)
+
     # Bouw jaren array
     jaren = []
-    delen_api = hypotheek_delen_api or [ld.to_api_dict() for ld in data.leningdelen_voor_api]
 
     for y in range(n_jaren):
         jaar = start_jaar + y
         elapsed_mnd = y * 12
 
-        # Restschuld: som van alle leningdelen
-        restschuld = sum(
-            _restschuld_leningdeel(ld, elapsed_mnd)
-            for ld in data.leningdelen_voor_api
-        )
-        # Bij wijziging: bestaande hypotheek(en) erbij tellen
-        # NIET als bestaande_in_leningdelen=True (dan zitten ze al in leningdelen)
-        if data.financiering.is_wijziging and not data.bestaande_in_leningdelen:
-            if data.financiering.is_oversluiten:
-                totaal_bestaand = sum(h.hoofdsom for h in data.bestaande_hypotheken)
-                restschuld += max(0, totaal_bestaand - data.financiering.koopsom)
-            else:
-                restschuld += data.financiering.koopsom
-
         # Max hypotheek: projecteer leningen + bereken met juist inkomen
         if y == 0:
             max_hyp = max_hypotheek_huidig
@@ -1139,7 +1174,7 @@ def _build_pensioen_chart_data(
                 inkomen_peildatum = aow_datum_aanvrager
             elif aow_datum_partner and jaar == aow_jaar_partner:
                 inkomen_peildatum = aow_datum_partner
-            projected = projecteer_hypotheekdelen(delen_api, elapsed_mnd, peildatum)
+            projected = tijdlijn.delen_op(y)
 
             # Renteaftrek: als restant_aftrekbaar verstreken, verplaats box1 → box3
             for i, ld in enumerate(data.leningdelen_voor_api):
@@ -1206,7 +1241,7 @@ def _build_pensioen_chart_data(
         jaren.append({
             "jaar": jaar,
             "max_hypotheek": round(max_hyp),
-            "restschuld": round(restschuld),
+            "restschuld": round(restschulden[y]),
         })
 
     # AOW markers voor verticale lijnen in de grafiek
@@ -1219,24 +1254,38 @@ def _build_pensioen_chart_data(
     }
 
 
-def _restschuld_leningdeel(ld: NormalizedLeningdeel, elapsed_mnd: int) -> float:
-    """Bereken restschuld na elapsed_mnd maanden."""
-    bedrag = ld.totaal_bedrag
-    if elapsed_mnd <= 0:
-        return bedrag
-    if ld.aflos_type in ("Aflosvrij",):
-        return bedrag
-    if ld.aflos_type == "Lineair":
-        if elapsed_mnd >= ld.org_lpt:
-            return 0
-        return max(0, bedrag - (bedrag / ld.org_lpt) * elapsed_mnd)
-    # Annuïteit
-    if elapsed_mnd >= ld.org_lpt:
-        return 0
-    r = ld.werkelijke_rente / 12
-    if r <= 0:
-        return max(0, bedrag - (bedrag / ld.org_lpt) * elapsed_mnd)
-    fn = (1 + r) ** ld.org_lpt
-    pmt = bedrag * (r * fn) / (fn - 1)
-    fe = (1 + r) ** elapsed_mnd
-    return max(0, bedrag * fe - pmt * (fe - 1) / r)
+def _restschuld_tijdlijn(data: NormalizedDossierData, elapsed_mnd: list[int]) -> list[float]:
+    """Totale restschuld per tijdstip (leningdelen plus bestaande hypotheek bij wijziging).
+
+    Per leningdeel vanaf aanvang over org_lpt: aflosvrij blijft gelijk,
+    lineair en annuïteit (of rente <= 0) lossen af; overige vormen als annuïteit.
+    """
+    delen = []
+    for ld in data.leningdelen_voor_api:
+        if ld.aflos_type == "Aflosvrij":
+            aflos_type = "Aflosvrij"
+        elif ld.aflos_type == "Lineair" or ld.werkelijke_rente <= 0:
+            aflos_type = "Lineair"
+        else:
+            aflos_type = "Annuïteit"
+        delen.append({
+            "aflos_type": aflos_type,
+            "org_lpt": ld.org_lpt,
+            "rest_lpt": ld.org_lpt,
+            "hoofdsom_box1": ld.totaal_bedrag,
+            "werkelijke_rente": ld.werkelijke_rente,
+        })
+    tijdlijn = projecteer_tijdlijn(delen, elapsed_mnd)
+    restschulden = [sum(kolom) for kolom in tijdlijn.restschuld.T.tolist()]
+
+    # Bij wijziging: bestaande hypotheek(en) erbij tellen
+    # NIET als bestaande_in_leningdelen=True (dan zitten ze al in leningdelen)
+    if data.financiering.is_wijziging and not data.bestaande_in_leningdelen:
+        if data.financiering.is_oversluiten:
+            totaal_bestaand = sum(h.hoofdsom for h in data.bestaande_hypotheken)
+            bestaand = max(0, totaal_bestaand - data.financiering.koopsom)
+        else:
+            bestaand = data.financiering.koopsom
+        restschulden = [r + bestaand for r in restschulden]
+    return restschulden
+
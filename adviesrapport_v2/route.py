@@ -5,9 +5,12 @@ import os
 
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import JSONResponse, Response
+from starlette.concurrency import run_in_threadpool
 
+import pdf_renderpool
 from adviesrapport_v2.schemas import AdviesrapportV2Request
-from adviesrapport_v2.supabase_client import lees_dossier, lees_aanvraag
+from adviesrapport_v2.supabase_client import lees_aanvraag, lees_dossier, lees_parallel
+from adviesrapport_v2.dossier_cache import laad_dossier
 from adviesrapport_v2.report_orchestrator import (
     generate_report, generate_sections, build_preview_response,
 )
@@ -29,6 +32,16 @@ def _extract_supabase_token(request: Request) -> str | None:
     return None
 
 
+def _text_overrides(request_body: AdviesrapportV2Request) -> dict | None:
+    """text_overrides omzetten van Pydantic naar dict."""
+    if not request_body.text_overrides:
+        return None
+    return {
+        k: v.model_dump(exclude_none=True)
+        for k, v in request_body.text_overrides.items()
+    }
+
+
 @router.post("/adviesrapport-pdf-v2")
 async def adviesrapport_pdf_v2(
     request_body: AdviesrapportV2Request,
@@ -53,23 +66,22 @@ async def adviesrapport_pdf_v2(
     )
 
     try:
-        # 1. Lees data uit Supabase (met user token voor RLS)
-        dossier = await lees_dossier(request_body.dossier_id, access_token)
-        aanvraag = await lees_aanvraag(request_body.aanvraag_id, access_token)
-
-        # 2. Genereer rapport (sync — alle berekeningen + PDF)
-        # text_overrides omzetten van Pydantic naar dict
-        overrides = None
-        if request_body.text_overrides:
-            overrides = {
-                k: v.model_dump(exclude_none=True)
-                for k, v in request_body.text_overrides.items()
-            }
-        pdf_bytes = generate_report(
+        # 1. Lees data uit Supabase (met user token voor RLS); ongewijzigde
+        #    dossiers komen genormaliseerd uit de dossiercache
+        geladen = await laad_dossier(
+            request_body.dossier_id, request_body.aanvraag_id, access_token,
+        )
+        dossier = geladen.dossier
+
+        # 2. Genereer rapport (sync — alle berekeningen + PDF), buiten de
+        #    event loop; de risico-scenario's gaan daarbinnen naar de rekenpool
+        pdf_bytes = await run_in_threadpool(
+            generate_report,
             dossier=dossier,
-            aanvraag=aanvraag,
+            aanvraag=geladen.aanvraag,
             options=request_body.options,
-            text_overrides=overrides,
+            text_overrides=_text_overrides(request_body),
+            data=geladen.data,
         )
 
         # 3. Return PDF met klantnaam
@@ -86,6 +98,12 @@ async def adviesrapport_pdf_v2(
     except ValueError as e:
         logger.warning("Adviesrapport V2 data niet gevonden: %s", e)
         raise HTTPException(status_code=404, detail=str(e))
+    except pdf_renderpool.RenderpoolVol as e:
+        logger.warning("Adviesrapport V2 geweigerd: %s", e)
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    except pdf_renderpool.RenderTimeout as e:
+        logger.error("Adviesrapport V2 timeout: %s", e)
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error("Adviesrapport V2 mislukt: %s", e, exc_info=True)
         raise HTTPException(
@@ -106,6 +124,10 @@ async def adviesrapport_preview_v2(
     JSON i.p.v. een PDF. De frontend kan hiermee:
     - Adviesteksten tonen in bewerkbare velden
     - Per-persoon bedragen tonen (max hypotheek, werkelijk, verschil)
+
+    Bij opnieuw opslaan met alleen gewijzigde text_overrides worden
+    berekeningen en secties uit de sectiecache hergebruikt; de response
+    meldt welke (reused_sections, reused_calculations).
     """
     origin = request.headers.get("origin", "onbekend")
     access_token = _extract_supabase_token(request)
@@ -116,17 +138,22 @@ async def adviesrapport_preview_v2(
     )
 
     try:
-        dossier = await lees_dossier(request_body.dossier_id, access_token)
-        aanvraag = await lees_aanvraag(request_body.aanvraag_id, access_token)
+        geladen = await laad_dossier(
+            request_body.dossier_id, request_body.aanvraag_id, access_token,
+        )
 
-        sections, ctx = generate_sections(
-            dossier=dossier,
-            aanvraag=aanvraag,
+        sections, ctx = await run_in_threadpool(
+            generate_sections,
+            dossier=geladen.dossier,
+            aanvraag=geladen.aanvraag,
             options=request_body.options,
+            data=geladen.data,
+            text_overrides=_text_overrides(request_body),
         )
 
         preview = build_preview_response(sections, ctx)
-        logger.info("Preview gegenereerd: %d secties", len(preview.get("sections", [])))
+        logger.info("Preview gegenereerd: %d secties, %d hergebruikt",
+                    len(preview.get("sections", [])), len(preview["reused_sections"]))
         return JSONResponse(preview)
 
     except ValueError as e:
@@ -165,11 +192,13 @@ async def debug_dossier_data(
     access_token = _extract_supabase_token(request)
 
     try:
-        dossier = await lees_dossier(dossier_id, access_token)
-
-        aanvraag = {}
         if aanvraag_id:
-            aanvraag = await lees_aanvraag(aanvraag_id, access_token)
+            dossier, aanvraag = await lees_parallel(
+                lambda: lees_dossier(dossier_id, access_token),
+                lambda: lees_aanvraag(aanvraag_id, access_token),
+            )
+        else:
+            dossier, aanvraag = await lees_dossier(dossier_id, access_token), {}
 
         invoer = dossier.get("invoer") or dossier
         klant = invoer.get("klantGegevens") or invoer.get("klant") or {}
@@ -0,0 +1,89 @@
+"""Sectiecache — rapportsecties en berekeningen hergebruiken bij gelijke invoer.
+
+Tijdens het bewerken van teksten in de preview wordt bij elke opslag de hele
+pipeline opnieuw gedraaid: risico-scenario's, grafiekdata en alle
+section_builders, terwijl alleen de teksten veranderen.
+
+Elke builder-aanroep krijgt een vingerafdruk van precies de invoer die de
+builder meekrijgt (hash over de canonieke JSON; dataclasses en Pydantic-
+modellen via hun repr, dus alle velden). Bij een gelijke vingerafdruk komt
+de sectie uit de cache; alleen secties met gewijzigde invoer worden opnieuw
+gebouwd. De rekengraaf van generate_sections wordt op dezelfde manier als
+geheel hergebruikt (sleutel: data + opties).
+
+- De datum van vandaag, de configversie van calculator_final en de
+  versies die de aanroeper meegeeft (zoals de fiscale regels van de
+  maandlasten, die zonder herstart herladen) zitten in elke sleutel:
+  leeftijden, AOW-status en tarieven volgen daaruit.
+- In- en uitgaande waarden worden gekopieerd; tekst-overrides worden pas
+  daarna toegepast en komen dus nooit in de cache.
+
+Configuratie via env:
+- NAT_SECTIE_CACHE_MAXSIZE: aantal entries (default 1024, 0 schakelt uit)
+- NAT_SECTIE_CACHE_TTL: seconden (default 3600)
+"""
+
+import copy
+import os
+from datetime import date
+from typing import Any, Callable, List, Optional
+
+import calculator_final
+from calculation_cache import ResultCache
+
+SECTIE_CACHE = ResultCache(
+    maxsize=int(os.environ.get("NAT_SECTIE_CACHE_MAXSIZE", "1024")),
+    ttl=float(os.environ.get("NAT_SECTIE_CACHE_TTL", "3600")),
+)
+
+
+class SectieMemo:
+    """Cachetoegang voor één generate_sections-aanroep; houdt bij wat hergebruikt is.
+
+    `data` wordt door bijna elke builder gelezen en daarom één keer gehasht;
+    `versies` komen naast datum en configversie in elke sleutel.
+    """
+
+    def __init__(self, data: Any, *versies: Any):
+        self._data = data
+        self._data_sleutel = ResultCache.sleutel({"data": data}).hex()
+        self._versies = (date.today().isoformat(), calculator_final.CONFIG_VERSIE, *versies)
+        self.hergebruikt: List[str] = []
+        self.gebouwd: List[str] = []
+
+    def sleutel(self, label: str, **invoer: Any) -> bytes:
+        invoer = {k: self._data_sleutel if v is self._data else v for k, v in invoer.items()}
+        return ResultCache.sleutel(invoer, label, *self._versies)
+
+    def get(self, sleutel: bytes) -> Optional[Any]:
+        """Kopie van de opgeslagen waarde, of None."""
+        if not SECTIE_CACHE.enabled:
+            return None
+        gevonden = SECTIE_CACHE.get(sleutel)
+        return copy.deepcopy(gevonden[0]) if gevonden is not None else None
+
+    def put(self, sleutel: bytes, waarde: Any) -> None:
+        if SECTIE_CACHE.enabled:
+            # In een tuple: ook None (sectie niet van toepassing) is een uitkomst
+            SECTIE_CACHE.put(sleutel, (copy.deepcopy(waarde),))
+
+    def bouw(self, builder: Callable[..., Optional[dict]], **invoer: Any) -> Optional[dict]:
+        """builder(**invoer), of de eerder gebouwde sectie bij gelijke invoer."""
+        sleutel = self.sleutel(builder.__name__, **invoer)
+        if SECTIE_CACHE.enabled:
+            gevonden = SECTIE_CACHE.get(sleutel)
+            if gevonden is not None:
+                sectie = copy.deepcopy(gevonden[0])
+                if sectie is not None:
+                    self.hergebruikt.append(sectie.get("id", builder.__name__))
+                return sectie
+
+        sectie = builder(**invoer)
+        self.put(sleutel, sectie)
+        if sectie is not None:
+            self.gebouwd.append(sectie.get("id", builder.__name__))
+        return sectie
+
+
+def stats() -> dict:
+    return SECTIE_CACHE.stats()
@@ -10,10 +10,17 @@ Auth strategie:
   Lovable stuurt de Supabase session token mee in de Authorization header.
   De backend forwardt die naar Supabase, zodat RLS gewoon werkt.
   Geen service_role key nodig (die is niet beschikbaar bij Lovable-managed projecten).
+
+Verbindingen:
+  Alle lees-functies delen één httpx.AsyncClient per event loop (keep-alive
+  pool), zodat niet elke read een nieuwe TLS-handshake kost. Onafhankelijke
+  reads gaan gelijktijdig via lees_parallel.
 """
 
+import asyncio
 import os
 import logging
+from typing import Any, Awaitable, Callable
 
 import httpx
 
@@ -23,6 +30,98 @@ SUPABASE_URL = os.environ.get("SUPABASE_URL", "")
 SUPABASE_ANON_KEY = os.environ.get("SUPABASE_ANON_KEY", "")
 # Backward compatibility: als SUPABASE_SERVICE_KEY gezet is, gebruik die als fallback
 _FALLBACK_KEY = os.environ.get("SUPABASE_SERVICE_KEY", "")
+# Kolom met het laatste wijzigingstijdstip (versie van een rij, zie lees_versie)
+SUPABASE_VERSIE_KOLOM = os.environ.get("SUPABASE_VERSIE_KOLOM", "updated_at")
+
+
+# Gedeelde client (zie _get_client); NAT_SUPABASE_MAX_CONNECTIONS begrenst de pool
+_MAX_CONNECTIONS = int(os.environ.get("NAT_SUPABASE_MAX_CONNECTIONS", "20"))
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _maak_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=10.0,
+        limits=httpx.Limits(
+            max_connections=_MAX_CONNECTIONS,
+            max_keepalive_connections=_MAX_CONNECTIONS,
+            keepalive_expiry=60.0,
+        ),
+    )
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Gedeelde keep-alive client voor de lopende event loop.
+
+    Verbindingen horen bij de loop waarin ze zijn geopend; bij een andere
+    loop (bijv. asyncio.run in scripts/tests) wordt een nieuwe client gemaakt
+    en de oude gesloten.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        if _client is not None and not _client.is_closed:
+            _sluit_vervangen_client(_client, _client_loop)
+        _client, _client_loop = _maak_client(), loop
+    return _client
+
+
+# Lopende aclose()-taken van vervangen clients (de loop houdt alleen zwakke referenties)
+_sluitend: set[asyncio.Task] = set()
+
+
+def _sluit_vervangen_client(
+    client: httpx.AsyncClient, client_loop: asyncio.AbstractEventLoop | None
+) -> None:
+    """Sluit een vervangen client zonder de aanroeper te laten wachten.
+
+    Draait zijn loop nog (andere thread), dan sluit hij daar; anders in de
+    huidige loop, de sockets van een gestopte loop zijn dan nog gewoon te sluiten.
+    """
+    if client_loop is not None and client_loop.is_running() and not client_loop.is_closed():
+        asyncio.run_coroutine_threadsafe(client.aclose(), client_loop)
+        return
+    taak = asyncio.get_running_loop().create_task(client.aclose())
+    _sluitend.add(taak)
+    taak.add_done_callback(_sluitend.discard)
+
+
+async def sluit_client() -> None:
+    """Sluit de gedeelde client (bij het afsluiten van de app)."""
+    global _client, _client_loop
+    client, _client, _client_loop = _client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+async def lees_parallel(*reads: Callable[[], Awaitable[Any]]) -> list:
+    """Voer onafhankelijke reads gelijktijdig uit over de gedeelde client.
+
+    Elke read is een functie zonder argumenten die een coroutine geeft
+    (bijv. `lambda: lees_dossier(dossier_id, token)`), zodat hij opnieuw
+    gestart kan worden. Een read die strandt op de verbinding (transport-
+    fout, timeout) wordt nog één keer los geprobeerd; niet gevonden
+    (ValueError) en HTTP-statusfouten gaan direct door.
+
+    Returns:
+        Resultaten in de volgorde van reads.
+
+    Raises:
+        De eerste fout in de volgorde van reads.
+    """
+    resultaten = list(await asyncio.gather(*(read() for read in reads), return_exceptions=True))
+    for i, (read, resultaat) in enumerate(zip(reads, resultaten)):
+        if isinstance(resultaat, httpx.TransportError):
+            logger.warning("Supabase read mislukt (%s), opnieuw los: %s", type(resultaat).__name__, resultaat)
+            try:
+                resultaten[i] = await read()
+            except Exception as e:
+                resultaten[i] = e
+    for resultaat in resultaten:
+        if isinstance(resultaat, BaseException):
+            raise resultaat
+    return resultaten
 
 
 def _get_api_key() -> str:
@@ -70,9 +169,10 @@ async def lees_dossier(dossier_id: str, access_token: str | None = None) -> dict
         "id": f"eq.{dossier_id}",
     }
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        resp = await client.get(url, headers=_headers(access_token), params=params)
-        resp.raise_for_status()
+    resp = await _get_client().get(
+        url, headers=_headers(access_token), params=params, timeout=10.0,
+    )
+    resp.raise_for_status()
 
     rows = resp.json()
     if not rows:
@@ -102,9 +202,10 @@ async def lees_aanvraag(aanvraag_id: str, access_token: str | None = None) -> di
         "id": f"eq.{aanvraag_id}",
     }
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        resp = await client.get(url, headers=_headers(access_token), params=params)
-        resp.raise_for_status()
+    resp = await _get_client().get(
+        url, headers=_headers(access_token), params=params, timeout=10.0,
+    )
+    resp.raise_for_status()
 
     rows = resp.json()
     if not rows:
@@ -114,6 +215,42 @@ async def lees_aanvraag(aanvraag_id: str, access_token: str | None = None) -> di
     return rows[0]
 
 
+async def lees_versie(tabel: str, rij_id: str, access_token: str | None = None) -> str | None:
+    """Lees alleen het wijzigingstijdstip van een rij (goedkope versie-probe).
+
+    Haalt `id` + SUPABASE_VERSIE_KOLOM op in plaats van de volledige rij,
+    zodat een cache kan beslissen of opnieuw ophalen nodig is. Gaat via
+    RLS, dus alleen rijen die de gebruiker ook volledig mag lezen.
+
+    Args:
+        tabel: Supabase tabel (bijv. `dossiers`, `aanvragen`)
+        rij_id: UUID van de rij
+        access_token: Supabase session JWT (optioneel, voor RLS)
+
+    Returns:
+        Tijdstempel als string, of None als de kolom leeg is.
+
+    Raises:
+        ValueError: Als de rij niet gevonden wordt.
+        httpx.HTTPStatusError: Bij Supabase API fouten (bijv. onbekende kolom).
+    """
+    url = f"{SUPABASE_URL}/rest/v1/{tabel}"
+    params = {
+        "select": f"id,{SUPABASE_VERSIE_KOLOM}",
+        "id": f"eq.{rij_id}",
+    }
+
+    resp = await _get_client().get(
+        url, headers=_headers(access_token), params=params, timeout=5.0,
+    )
+    resp.raise_for_status()
+
+    rows = resp.json()
+    if not rows:
+        raise ValueError(f"Niet gevonden in {tabel}: {rij_id}")
+    return rows[0].get(SUPABASE_VERSIE_KOLOM)
+
+
 async def lees_berekeningen(dossier_id: str, access_token: str | None = None) -> list[dict]:
     """Lees alle berekeningen van een dossier (tabel: berekeningen).
 
@@ -127,9 +264,10 @@ async def lees_berekeningen(dossier_id: str, access_token: str | None = None) ->
         "order": "aanmaak_datum.asc",
     }
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        resp = await client.get(url, headers=_headers(access_token), params=params)
-        resp.raise_for_status()
+    resp = await _get_client().get(
+        url, headers=_headers(access_token), params=params, timeout=10.0,
+    )
+    resp.raise_for_status()
 
     rows = resp.json()
     logger.info("Berekeningen geladen voor dossier %s: %d stuks", dossier_id, len(rows))
@@ -148,9 +286,10 @@ async def lees_berekening(berekening_id: str, access_token: str | None = None) -
         "id": f"eq.{berekening_id}",
     }
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        resp = await client.get(url, headers=_headers(access_token), params=params)
-        resp.raise_for_status()
+    resp = await _get_client().get(
+        url, headers=_headers(access_token), params=params, timeout=10.0,
+    )
+    resp.raise_for_status()
 
     rows = resp.json()
     if not rows:
@@ -7,13 +7,22 @@ Categorieën:
 - BINNEN_10_JAAR: Klant bereikt AOW binnen 10 jaar
 - MEER_DAN_10_JAAR: Klant bereikt AOW over meer dan 10 jaar
 
-AOW-tabel wordt geladen uit config/aow.json
+AOW-tabel wordt geladen uit config/aow.json en bij het laden gecompileerd
+tot gesorteerde grenzen (AOW_INDEX): een lookup is één bisect, en
+bereken_aow_data / bepaal_aow_categorieen doen hetzelfde voor een array
+geboortedata.
 Jaarlijks updaten in november wanneer nieuwe jaren worden aangekondigd
 """
 
 import os
 import json
+from bisect import bisect_left
+from calendar import monthrange
+from dataclasses import dataclass
 from datetime import date
+from typing import Iterable, Union
+
+import numpy as np
 from dateutil.relativedelta import relativedelta
 
 # AOW-config laden uit JSON
@@ -37,6 +46,81 @@ AOW_TABEL.append({
 })
 
 
+@dataclass(frozen=True)
+class AOWIndex:
+    """
+    AOW_TABEL als gesorteerde grenzen voor bisect.
+
+    Geboortedatum g valt in interval i als grenzen[i-1] < g <= grenzen[i];
+    leeftijd_maanden[i] is de AOW-leeftijd in maanden (de laatste: fallback).
+    Dezelfde gegevens staan ook als NumPy-arrays voor de gevectoriseerde
+    varianten.
+    """
+
+    grenzen: tuple  # date, oplopend
+    leeftijd_maanden: tuple  # int, len(grenzen) + 1
+    grenzen_np: np.ndarray  # datetime64[D]
+    leeftijd_maanden_np: np.ndarray  # int64
+
+    def leeftijd(self, geboortedatum: date) -> int:
+        """AOW-leeftijd in maanden voor een geboortedatum."""
+        return self.leeftijd_maanden[bisect_left(self.grenzen, geboortedatum)]
+
+
+def compileer_aow_tabel(tabel: list[dict]) -> AOWIndex:
+    """
+    Bouw de index. Net als de lineaire zoektocht wint bij overlap de eerste
+    regel in tabelvolgorde die past (geboren_tot None = altijd).
+    """
+    fallback = 67 * 12 + 3  # als geen enkele regel past
+    for regel in tabel:
+        if regel["geboren_tot"] is None:
+            fallback = regel["jaren"] * 12 + regel["maanden"]
+            break
+
+    # Alleen regels vóór de eerste None-regel kunnen nog winnen
+    begrensd = []
+    for volgorde, regel in enumerate(tabel):
+        if regel["geboren_tot"] is None:
+            break
+        begrensd.append((regel["geboren_tot"], volgorde, regel["jaren"] * 12 + regel["maanden"]))
+
+    # Per grens de regel met de laagste volgorde onder alle regels met een
+    # grens >= deze grens (van achter naar voren)
+    begrensd.sort()
+    grenzen, leeftijden = [], []
+    beste = None
+    for grens, volgorde, maanden in reversed(begrensd):
+        if beste is None or volgorde < beste[0]:
+            beste = (volgorde, maanden)
+        if grenzen and grenzen[-1] == grens:
+            leeftijden[-1] = beste[1]
+        else:
+            grenzen.append(grens)
+            leeftijden.append(beste[1])
+    grenzen.reverse()
+    leeftijden.reverse()
+    leeftijden.append(fallback)
+
+    return AOWIndex(
+        grenzen=tuple(grenzen),
+        leeftijd_maanden=tuple(leeftijden),
+        grenzen_np=np.array(grenzen, dtype="datetime64[D]"),
+        leeftijd_maanden_np=np.array(leeftijden, dtype=np.int64),
+    )
+
+
+AOW_INDEX = compileer_aow_tabel(AOW_TABEL)
+
+
+def _plus_maanden(datum: date, maanden: int) -> date:
+    """datum + relativedelta(months=maanden): dag afgekapt op het einde van de maand."""
+    jaar, maand = divmod(datum.month - 1 + maanden, 12)
+    jaar += datum.year
+    dag = min(datum.day, monthrange(jaar, maand + 1)[1])
+    return date(jaar, maand + 1, dag)
+
+
 def bereken_aow_datum(geboortedatum: date) -> date:
     """
     Bereken de AOW-ingangsdatum op basis van geboortedatum.
@@ -47,13 +131,7 @@ def bereken_aow_datum(geboortedatum: date) -> date:
     Returns:
         Datum waarop de klant AOW-gerechtigd wordt
     """
-    for regel in AOW_TABEL:
-        if regel["geboren_tot"] is None or geboortedatum <= regel["geboren_tot"]:
-            aow_leeftijd = relativedelta(years=regel["jaren"], months=regel["maanden"])
-            return geboortedatum + aow_leeftijd
-
-    # Fallback (zou niet bereikt moeten worden)
-    return geboortedatum + relativedelta(years=67, months=3)
+    return _plus_maanden(geboortedatum, AOW_INDEX.leeftijd(geboortedatum))
 
 
 def bepaal_aow_categorie(geboortedatum: date, peildatum: date = None) -> dict:
@@ -95,3 +173,78 @@ def bepaal_aow_categorie(geboortedatum: date, peildatum: date = None) -> dict:
         "aow_datum": aow_datum.isoformat(),
         "jaren_tot_aow": round(jaren_tot_aow, 1)
     }
+
+
+# ============================================================
+# Gevectoriseerd (portefeuille- en batchberekeningen)
+# ============================================================
+
+Datums = Union[np.ndarray, Iterable[date]]
+
+
+def _plus_maanden_np(datums: np.ndarray, maanden: np.ndarray) -> np.ndarray:
+    """_plus_maanden over arrays (datetime64[D] + int maanden)."""
+    maand_van = datums.astype("datetime64[M]")
+    dag = (datums - maand_van.astype("datetime64[D]")).astype(np.int64)  # 0-based
+    doel = maand_van + maanden
+    dagen_in_maand = ((doel + 1).astype("datetime64[D]") - doel.astype("datetime64[D]")).astype(np.int64)
+    return doel.astype("datetime64[D]") + np.minimum(dag, dagen_in_maand - 1)
+
+
+def bereken_aow_data(geboortedata: Datums) -> np.ndarray:
+    """
+    bereken_aow_datum voor een array geboortedata.
+
+    Args:
+        geboortedata: datetime64-array of reeks date-objecten
+
+    Returns:
+        datetime64[D]-array met de AOW-ingangsdata
+    """
+    geboortedata = np.asarray(geboortedata, dtype="datetime64[D]")
+    index = np.searchsorted(AOW_INDEX.grenzen_np, geboortedata, side="left")
+    return _plus_maanden_np(geboortedata, AOW_INDEX.leeftijd_maanden_np[index])
+
+
+def bepaal_aow_categorieen(geboortedata: Datums, peildatum: date = None) -> dict:
+    """
+    bepaal_aow_categorie voor een array geboortedata.
+
+    Returns:
+        Dict met arrays (zelfde volgorde als de invoer):
+        - categorie: str-array
+        - aow_datum: datetime64[D]-array
+        - jaren_tot_aow: float-array (afgerond op 1 decimaal)
+    """
+    if peildatum is None:
+        peildatum = date.today()
+
+    aow_data = bereken_aow_data(geboortedata)
+    peil = np.datetime64(peildatum, "D")
+    grens_10_jaar = np.datetime64(peildatum + relativedelta(years=10), "D")
+
+    categorie = np.where(
+        aow_data <= peil, "AOW_BEREIKT",
+        np.where(aow_data <= grens_10_jaar, "BINNEN_10_JAAR", "MEER_DAN_10_JAAR"),
+    )
+
+    # relativedelta(aow_datum, peildatum): hele maanden, daarna resterende dagen
+    maanden = (aow_data.astype("datetime64[M]") - peil.astype("datetime64[M]")).astype(np.int64)
+    tussen = _plus_maanden_np(np.full(aow_data.shape, peil), maanden)
+    maanden = np.where(tussen > aow_data, maanden - 1, maanden)
+    tussen = _plus_maanden_np(np.full(aow_data.shape, peil), maanden)
+    dagen = (aow_data - tussen).astype(np.int64)
+    jaren = maanden // 12 + (maanden % 12) / 12 + dagen / 365.25
+
+    # Python-round per element, zodat afronding gelijk is aan bepaal_aow_categorie
+    jaren_tot_aow = np.array(
+        [0.0 if bereikt else round(j, 1)
+         for j, bereikt in zip(jaren.tolist(), (aow_data <= peil).tolist())],
+        dtype=np.float64,
+    )
+
+    return {
+        "categorie": categorie,
+        "aow_datum": aow_data,
+        "jaren_tot_aow": jaren_tot_aow,
+    }
@@ -7,14 +7,19 @@ import os
 import sys
 import time
 import json
+import itertools
+import collections
 import logging
 import asyncio
+import tempfile
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Request, Depends, Security
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.security import APIKeyHeader
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List, Dict, Any, Literal
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field, create_model, field_validator, model_validator
+from typing import Annotated, Optional, List, Dict, Any, Literal
 from datetime import date
 from decimal import Decimal
 try:
@@ -31,16 +36,22 @@ except ImportError:
     pass  # Sentry niet geïnstalleerd — geen monitoring
 
 import calculator_final
+import calculator_batch
+import benodigd_inkomen
+import rekenpool
 import aow_calculator
 import pdf_generator
+import pdf_renderpool
 import graph_client
 import email_templates
 
-# --- Fiscale defaults laden uit config (centraal beheer voor jaarwisseling) ---
-_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-with open(os.path.join(_BASE_DIR, 'config', 'fiscaal.json'), 'r', encoding='utf-8') as _f:
-    _FISCAAL_CONFIG = json.load(_f)
-_FISCAAL_DEFAULTS = _FISCAAL_CONFIG["defaults"]
+# --- Fiscale defaults uit config (centraal beheer voor jaarwisseling) ---
+def _fiscaal_default(naam: str, standaard: Any):
+    """
+    default_factory voor request-velden: de actuele waarde uit
+    calculator_final._FISCAAL_DEFAULTS, dus ook na PUT /config/fiscaal.
+    """
+    return lambda: calculator_final._FISCAAL_DEFAULTS.get(naam, standaard)
 
 # --- Logging ---
 logging.basicConfig(
@@ -65,11 +76,24 @@ except ImportError:
     RATE_LIMITING_ENABLED = False
     logger.warning("slowapi not installed - rate limiting disabled")
 
+# --- Opstarten en afsluiten ---
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Workers nu starten (en de PDF-workers opwarmen), niet bij het eerste request
+    rekenpool.start()
+    pdf_renderpool.start()
+    yield
+    await supabase_client.sluit_client()
+    pdf_renderpool.afsluiten()
+    rekenpool.afsluiten()
+
+
 # --- App ---
 app = FastAPI(
     title="NAT Hypotheeknormen Calculator 2026",
     description="Bereken maximale hypotheek volgens NAT normen 2026",
     version="1.1.0",
+    lifespan=lifespan,
 )
 
 # Rate limiting setup
@@ -104,14 +128,20 @@ logger.info(f"CORS allowed origins: {ALLOWED_ORIGINS} + *.lovable.app + *.lovabl
 
 # --- Monthly costs calculator ---
 from monthly_costs.routes.calculate import router as monthly_costs_router
+from monthly_costs.routes.rules import router as monthly_costs_rules_router
 from monthly_costs.exceptions.handlers import register_exception_handlers
+from monthly_costs.rules.loader import get_store as get_rules_store
 
 app.include_router(monthly_costs_router)
+app.include_router(monthly_costs_rules_router)
+# Fiscale regels vooraf laden: de eerste requests hoeven niet te compileren
+get_rules_store().warm_up()
 register_exception_handlers(app)
 logger.info("Monthly costs calculator endpoint registered: POST /calculate/monthly-costs")
 
 # --- Adviesrapport V2 (backend-driven) ---
 from adviesrapport_v2.route import router as adviesrapport_v2_router
+from adviesrapport_v2 import dossier_cache, sectie_cache, supabase_client
 app.include_router(adviesrapport_v2_router)
 logger.info("Adviesrapport V2 endpoints registered: POST /adviesrapport-pdf-v2, POST /adviesrapport-preview-v2")
 
@@ -202,13 +232,13 @@ VALID_AFLOS_TYPES = ["Annuïteit", "Lineair", "Aflosvrij", "Spaarhypotheek"]
 class HypotheekDeel(BaseModel):
     """Hypotheek deel input met invoercontrole"""
     aflos_type: str = "Annuïteit"
-    org_lpt: int = Field(default=_FISCAAL_DEFAULTS.get("c_lpt", 360), ge=1, le=600)
-    rest_lpt: int = Field(default=_FISCAAL_DEFAULTS.get("c_lpt", 360), ge=1, le=600)
+    org_lpt: int = Field(default_factory=_fiscaal_default("c_lpt", 360), ge=1, le=600)
+    rest_lpt: int = Field(default_factory=_fiscaal_default("c_lpt", 360), ge=1, le=600)
     hoofdsom_box1: float = Field(default=0, ge=0)
     hoofdsom_box3: float = Field(default=0, ge=0)
-    rvp: int = Field(default=_FISCAAL_DEFAULTS.get("c_rvp_toets_rente", 120), ge=0, le=600)
+    rvp: int = Field(default_factory=_fiscaal_default("c_rvp_toets_rente", 120), ge=0, le=600)
     inleg_overig: float = Field(default=0, ge=0)
-    werkelijke_rente: float = Field(default=_FISCAAL_DEFAULTS.get("c_toets_rente", 0.05), ge=0, le=0.20)
+    werkelijke_rente: float = Field(default_factory=_fiscaal_default("c_toets_rente", 0.05), ge=0, le=0.20)
 
     @field_validator("aflos_type")
     @classmethod
@@ -262,14 +292,14 @@ class CalculateRequest(BaseModel):
     inkomen_overige_aanvragers_min2: float = Field(default=0, ge=0, le=10_000_000)
 
     # Constanten (optioneel overschrijven — defaults uit config/fiscaal.json)
-    c_toets_rente: float = Field(default=_FISCAAL_DEFAULTS.get("c_toets_rente", 0.05), ge=0, le=0.20)
-    c_actuele_10jr_rente: float = Field(default=_FISCAAL_DEFAULTS.get("c_actuele_10jr_rente", 0.05), ge=0, le=0.20)
-    c_rvp_toets_rente: int = Field(default=_FISCAAL_DEFAULTS.get("c_rvp_toets_rente", 120), ge=0, le=600)
-    c_factor_2e_inkomen: float = Field(default=_FISCAAL_DEFAULTS.get("c_factor_2e_inkomen", 1.0), ge=0, le=2.0)
-    c_lpt: int = Field(default=_FISCAAL_DEFAULTS.get("c_lpt", 360), ge=1, le=600)
-    c_alleen_grens_o: float = Field(default=_FISCAAL_DEFAULTS.get("c_alleen_grens_o", 30000), ge=0)
-    c_alleen_grens_b: float = Field(default=_FISCAAL_DEFAULTS.get("c_alleen_grens_b", 29000), ge=0)
-    c_alleen_factor: float = Field(default=_FISCAAL_DEFAULTS.get("c_alleen_factor", 17000), ge=0)
+    c_toets_rente: float = Field(default_factory=_fiscaal_default("c_toets_rente", 0.05), ge=0, le=0.20)
+    c_actuele_10jr_rente: float = Field(default_factory=_fiscaal_default("c_actuele_10jr_rente", 0.05), ge=0, le=0.20)
+    c_rvp_toets_rente: int = Field(default_factory=_fiscaal_default("c_rvp_toets_rente", 120), ge=0, le=600)
+    c_factor_2e_inkomen: float = Field(default_factory=_fiscaal_default("c_factor_2e_inkomen", 1.0), ge=0, le=2.0)
+    c_lpt: int = Field(default_factory=_fiscaal_default("c_lpt", 360), ge=1, le=600)
+    c_alleen_grens_o: float = Field(default_factory=_fiscaal_default("c_alleen_grens_o", 30000), ge=0)
+    c_alleen_grens_b: float = Field(default_factory=_fiscaal_default("c_alleen_grens_b", 29000), ge=0)
+    c_alleen_factor: float = Field(default_factory=_fiscaal_default("c_alleen_factor", 17000), ge=0)
 
     @field_validator("alleenstaande")
     @classmethod
@@ -314,34 +344,13 @@ def root():
     }
 
 
-@app.post("/calculate")
-async def calculate(
-    request_body: CalculateRequest,
-    request: Request,
-    api_key: Optional[str] = Depends(verify_api_key),
-) -> Dict[str, Any]:
-    """
-    Bereken maximale hypotheek
-
-    Request body: CalculateRequest model (zie schema)
-    Response: {"scenario1": {...}, "scenario2": {...} | null, "debug": {...}}
-
-    Vereist X-API-Key header als NAT_API_KEY is geconfigureerd op de server.
-    """
-    origin = request.headers.get("origin", "onbekend")
-    logger.info(
-        "Berekening gestart: origin=%s, alleenstaande=%s, ontvangt_aow=%s, delen=%d",
-        origin,
-        request_body.alleenstaande,
-        request_body.ontvangt_aow,
-        len(request_body.hypotheek_delen),
-    )
-
+def _calculate_inputs(request_body: CalculateRequest) -> Dict[str, Any]:
+    """Zet een CalculateRequest om naar de inputs-dict voor calculator_final."""
     # Convert Pydantic models to dict for calculator
     hypotheek_delen_dict = [deel.model_dump() for deel in request_body.hypotheek_delen]
 
     # Build inputs dict
-    inputs = {
+    return {
         "hoofd_inkomen_aanvrager": request_body.hoofd_inkomen_aanvrager,
         "hoofd_inkomen_partner": request_body.hoofd_inkomen_partner,
         "inkomen_uit_lijfrente_aanvrager": request_body.inkomen_uit_lijfrente_aanvrager,
@@ -377,6 +386,32 @@ async def calculate(
         "c_alleen_factor": request_body.c_alleen_factor,
     }
 
+
+@app.post("/calculate")
+async def calculate(
+    request_body: CalculateRequest,
+    request: Request,
+    api_key: Optional[str] = Depends(verify_api_key),
+) -> Dict[str, Any]:
+    """
+    Bereken maximale hypotheek
+
+    Request body: CalculateRequest model (zie schema)
+    Response: {"scenario1": {...}, "scenario2": {...} | null, "debug": {...}}
+
+    Vereist X-API-Key header als NAT_API_KEY is geconfigureerd op de server.
+    """
+    origin = request.headers.get("origin", "onbekend")
+    logger.info(
+        "Berekening gestart: origin=%s, alleenstaande=%s, ontvangt_aow=%s, delen=%d",
+        origin,
+        request_body.alleenstaande,
+        request_body.ontvangt_aow,
+        len(request_body.hypotheek_delen),
+    )
+
+    inputs = _calculate_inputs(request_body)
+
     try:
         result = calculator_final.calculate(inputs)
         logger.info("Berekening geslaagd")
@@ -394,6 +429,351 @@ if RATE_LIMITING_ENABLED:
     calculate = limiter.limit("30/minute")(calculate)
 
 
+# --- Batch endpoint ---
+
+class CalculateBatchRequest(BaseModel):
+    """Batch van calculate-requests (maximaal 10.000 per call)"""
+    items: List[CalculateRequest] = Field(..., min_length=1, max_length=10_000)
+
+
+@app.post("/calculate/batch")
+async def calculate_batch(
+    request_body: CalculateBatchRequest,
+    request: Request,
+    api_key: Optional[str] = Depends(verify_api_key),
+) -> JSONResponse:
+    """
+    Bereken maximale hypotheek voor een batch invoeren in één gevectoriseerde pass.
+
+    Response: {"results": [...], "count": N, "errors": K}
+    Elk resultaat is identiek aan de /calculate-response voor dezelfde invoer,
+    of {"error": "..."} als die invoer een rekenfout geeft. Volgorde = invoervolgorde.
+    """
+    origin = request.headers.get("origin", "onbekend")
+    logger.info("Batchberekening gestart: origin=%s, aantal=%d", origin, len(request_body.items))
+
+    # model_dump levert per item dezelfde dict als _calculate_inputs, maar in
+    # één aanroep voor de hele batch
+    inputs_list = request_body.model_dump()["items"]
+
+    try:
+        # Buiten de event loop: een grote batch duurt tientallen ms
+        results = await run_in_threadpool(calculator_batch.calculate_batch, inputs_list)
+    except Exception as e:
+        logger.error(f"Rekenfout batch: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Rekenfout: {str(e)}",
+        )
+
+    errors = sum(1 for r in results if "error" in r)
+    logger.info("Batchberekening geslaagd: aantal=%d, fouten=%d", len(results), errors)
+    # Direct als JSON: de resultaten zijn al plain dicts, validatie via het
+    # response model kost bij 10.000 items meer dan de berekening zelf
+    return JSONResponse({"results": results, "count": len(results), "errors": errors})
+
+
+if RATE_LIMITING_ENABLED:
+    calculate_batch = limiter.limit("10/minute")(calculate_batch)
+
+
+# --- Kolom-batch endpoint ---
+
+_JA_NEE = Literal["JA", "NEE"]
+
+
+def _kolom_velden(model: type, soorten: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Velden van `model` als optionele lijsten (één waarde per berekening).
+
+    Elke waarde krijgt dezelfde grenzen als het veld in `model`; velden met
+    een eigen validator krijgen hun soort uit `soorten`.
+    """
+    velden = {}
+    for naam, info in model.model_fields.items():
+        if naam == "hypotheek_delen":
+            continue
+        if naam in soorten:
+            soort = soorten[naam]
+        elif info.metadata:
+            soort = Annotated[(info.annotation, *info.metadata)]
+        else:
+            soort = info.annotation
+        velden[naam] = (Optional[List[soort]], None)
+    return velden
+
+
+HypotheekDelenKolommen = create_model(
+    "HypotheekDelenKolommen",
+    __doc__="Hypotheekdelen in lang formaat: per deel de index van zijn berekening plus de deelvelden",
+    rij=(List[Annotated[int, Field(ge=0)]], ...),
+    **_kolom_velden(HypotheekDeel, {"aflos_type": Literal[tuple(VALID_AFLOS_TYPES)]}),
+)
+
+_CalculateKolommen = create_model(
+    "_CalculateKolommen",
+    **_kolom_velden(CalculateRequest, {
+        "alleenstaande": _JA_NEE,
+        "ontvangt_aow": _JA_NEE,
+        "energielabel": Optional[Literal[tuple(VALID_ENERGIELABELS)]],
+        "gewijzigd_hoofd_inkomen_aow2": Optional[_JA_NEE],
+    }),
+)
+
+
+class CalculateBatchKolommenRequest(_CalculateKolommen):
+    """
+    Batch van calculate-requests per veld (maximaal 10.000 berekeningen per call).
+
+    Elk veld uit CalculateRequest is een lijst met één waarde per berekening;
+    een weggelaten veld krijgt voor alle berekeningen de default van /calculate.
+    """
+    hypotheek_delen: Optional[HypotheekDelenKolommen] = None
+
+    @model_validator(mode="after")
+    def validate_lengtes(self) -> "CalculateBatchKolommenRequest":
+        lengtes = {
+            len(waarden) for naam, waarden in self if naam != "hypotheek_delen" and waarden is not None
+        }
+        if len(lengtes) != 1:
+            raise ValueError("Geef minstens één veld op; alle velden moeten even lang zijn")
+        n = lengtes.pop()
+        if not 1 <= n <= 10_000:
+            raise ValueError("Aantal berekeningen moet tussen 1 en 10.000 liggen")
+        delen = self.hypotheek_delen
+        if delen is not None:
+            m = len(delen.rij)
+            if any(w is not None and len(w) != m for naam, w in delen if naam != "rij"):
+                raise ValueError("Alle velden van hypotheek_delen moeten even lang zijn als 'rij'")
+            if delen.rij and max(delen.rij) >= n:
+                raise ValueError(f"hypotheek_delen.rij verwijst naar een berekening buiten 0..{n - 1}")
+            if delen.rij and max(collections.Counter(delen.rij).values()) > 10:
+                raise ValueError("Maximaal 10 hypotheekdelen per berekening")
+        return self
+
+    @property
+    def aantal(self) -> int:
+        return next(len(w) for naam, w in self if naam != "hypotheek_delen" and w is not None)
+
+
+def _met_defaults(model: type, kolommen: Dict[str, Any], n: int) -> Dict[str, Any]:
+    """Vul weggelaten kolommen met de default van het bijbehorende veld in `model`."""
+    return {
+        naam: waarden if waarden is not None
+        else [model.model_fields[naam].get_default(call_default_factory=True)] * n
+        for naam, waarden in kolommen.items()
+    }
+
+
+@app.post("/calculate/batch/kolommen")
+async def calculate_batch_kolommen(
+    request_body: CalculateBatchKolommenRequest,
+    request: Request,
+    api_key: Optional[str] = Depends(verify_api_key),
+) -> JSONResponse:
+    """
+    Bereken maximale hypotheek voor een batch invoeren per veld (kolommen).
+
+    Zelfde berekening als /calculate/batch, maar invoer en uitkomst blijven
+    lijsten per veld: geen model en dict per berekening.
+
+    Response: {"count": N, "errors": K, "error": [...], "scenario1": {...},
+               "scenario2": {...}, "debug": {...}, "debug_scenario2": {...}}
+    Elke uitkomstlijst heeft N waarden; waarde i is gelijk aan de
+    /calculate-response voor berekening i, of None als die berekening een
+    rekenfout geeft (melding in "error") of geen scenario 2 heeft.
+    """
+    n = request_body.aantal
+    origin = request.headers.get("origin", "onbekend")
+    logger.info("Kolom-batchberekening gestart: origin=%s, aantal=%d", origin, n)
+
+    kolommen = _met_defaults(
+        CalculateRequest,
+        {naam: waarden for naam, waarden in request_body if naam != "hypotheek_delen"},
+        n,
+    )
+    delen = None
+    if request_body.hypotheek_delen is not None:
+        m = len(request_body.hypotheek_delen.rij)
+        delen = dict(
+            _met_defaults(
+                HypotheekDeel,
+                {naam: w for naam, w in request_body.hypotheek_delen if naam != "rij"},
+                m,
+            ),
+            rij=request_body.hypotheek_delen.rij,
+        )
+
+    try:
+        results = await run_in_threadpool(calculator_batch.calculate_kolommen, n, kolommen, delen)
+    except Exception as e:
+        logger.error(f"Rekenfout kolom-batch: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Rekenfout: {str(e)}",
+        )
+
+    errors = n - results["error"].count(None)
+    logger.info("Kolom-batchberekening geslaagd: aantal=%d, fouten=%d", n, errors)
+    return JSONResponse({"count": n, "errors": errors, **results})
+
+
+if RATE_LIMITING_ENABLED:
+    calculate_batch_kolommen = limiter.limit("10/minute")(calculate_batch_kolommen)
+
+
+# --- Gevoeligheidsanalyse endpoint ---
+
+# Velden die niet als as mogen dienen (lijst of alleen scenario 2)
+_NIET_VARIEERBAAR = {
+    "hypotheek_delen",
+    "gewijzigd_hoofd_inkomen_aanvrager2",
+    "gewijzigd_hoofd_inkomen_partner2",
+    "gewijzigd_hoofd_inkomen_aow2",
+    "inkomen_overige_aanvragers_min2",
+}
+
+
+class SensitivityAxis(BaseModel):
+    """Eén as van het gevoeligheidsgrid"""
+    field: str
+    values: List[Any] = Field(..., min_length=1, max_length=100)
+
+    @field_validator("field")
+    @classmethod
+    def validate_field(cls, v: str) -> str:
+        if v not in CalculateRequest.model_fields or v in _NIET_VARIEERBAAR:
+            raise ValueError(f"Veld '{v}' kan niet als as gebruikt worden")
+        return v
+
+
+class SensitivityRequest(BaseModel):
+    """Basisinvoer plus 1–3 assen (maximaal 10.000 cellen)"""
+    base: CalculateRequest
+    axes: List[SensitivityAxis] = Field(..., min_length=1, max_length=3)
+
+    @model_validator(mode="after")
+    def validate_axes(self) -> "SensitivityRequest":
+        velden = [axis.field for axis in self.axes]
+        if len(set(velden)) != len(velden):
+            raise ValueError("Elk veld mag maar op één as voorkomen")
+        cellen = 1
+        for axis in self.axes:
+            cellen *= len(axis.values)
+        if cellen > 10_000:
+            raise ValueError(f"Grid te groot: {cellen} cellen (maximaal 10.000)")
+        # Aswaarden valideren/converteren met dezelfde regels als CalculateRequest
+        basis = self.base.model_dump()
+        for axis in self.axes:
+            axis.values = [
+                getattr(CalculateRequest.model_validate({**basis, axis.field: waarde}), axis.field)
+                for waarde in axis.values
+            ]
+        return self
+
+
+@app.post("/calculate/sensitivity")
+async def calculate_sensitivity(
+    request_body: SensitivityRequest,
+    request: Request,
+    api_key: Optional[str] = Depends(verify_api_key),
+) -> Dict[str, Any]:
+    """
+    Gevoeligheidsanalyse: max hypotheek (scenario 1) over een grid van aswaarden.
+
+    Voorbeeld: axes = [{"field": "c_toets_rente", "values": [0.04, 0.045, 0.05]},
+                       {"field": "hoofd_inkomen_aanvrager", "values": [50000, 60000]}]
+    Response: matrices met vorm [len(as1), len(as2), ...]; cellen met een
+    rekenfout zijn null en staan met melding in "errors".
+    """
+    origin = request.headers.get("origin", "onbekend")
+    logger.info(
+        "Gevoeligheidsanalyse gestart: origin=%s, assen=%s",
+        origin,
+        [(axis.field, len(axis.values)) for axis in request_body.axes],
+    )
+
+    try:
+        grid = await run_in_threadpool(
+            calculator_batch.calculate_grid,
+            _calculate_inputs(request_body.base),
+            [(axis.field, axis.values) for axis in request_body.axes],
+        )
+    except Exception as e:
+        logger.error(f"Rekenfout gevoeligheidsanalyse: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Rekenfout: {str(e)}",
+        )
+
+    return {
+        "axes": [{"field": axis.field, "values": axis.values} for axis in request_body.axes],
+        **grid,
+    }
+
+
+if RATE_LIMITING_ENABLED:
+    calculate_sensitivity = limiter.limit("30/minute")(calculate_sensitivity)
+
+
+# --- Benodigd inkomen endpoint ---
+
+class BenodigdInkomenRequest(BaseModel):
+    """Basisinvoer plus gewenste maximale hypotheek (box 1)"""
+    base: CalculateRequest
+    doel_bedrag: float = Field(..., gt=0, le=100_000_000)
+    variant: Literal["annuitair", "niet_annuitair"] = "annuitair"
+    onbekende: Literal["aanvrager", "partner"] = "aanvrager"
+
+    @model_validator(mode="after")
+    def validate_onbekende(self) -> "BenodigdInkomenRequest":
+        if self.onbekende == "partner" and self.base.alleenstaande == "JA":
+            raise ValueError("onbekende 'partner' kan niet bij alleenstaande 'JA'")
+        return self
+
+
+@app.post("/calculate/benodigd-inkomen")
+async def calculate_benodigd_inkomen(
+    request_body: BenodigdInkomenRequest,
+    request: Request,
+    api_key: Optional[str] = Depends(verify_api_key),
+) -> Dict[str, Any]:
+    """
+    Minimaal hoofdinkomen (aanvrager of partner) voor een gewenste maximale hypotheek.
+
+    Lost max_box1 (scenario 1) per woonquote-segment analytisch op in één request;
+    het hoofdinkomen van de onbekende in "base" wordt genegeerd.
+    Response: {"benodigd_inkomen": float | null, "max_box1": ..., "toets_inkomen": ..., ...}
+    """
+    origin = request.headers.get("origin", "onbekend")
+    logger.info(
+        "Benodigd inkomen gestart: origin=%s, variant=%s, onbekende=%s",
+        origin,
+        request_body.variant,
+        request_body.onbekende,
+    )
+
+    try:
+        return benodigd_inkomen.bereken_benodigd_inkomen(
+            _calculate_inputs(request_body.base),
+            request_body.doel_bedrag,
+            variant=request_body.variant,
+            onbekende=request_body.onbekende,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Rekenfout benodigd inkomen: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Rekenfout: {str(e)}",
+        )
+
+
+if RATE_LIMITING_ENABLED:
+    calculate_benodigd_inkomen = limiter.limit("30/minute")(calculate_benodigd_inkomen)
+
+
 # --- Aflosschema endpoint ---
 
 class AflosschemaLoanPart(BaseModel):
@@ -408,56 +788,149 @@ class AflosschemaRequest(BaseModel):
     loan_parts: List[AflosschemaLoanPart] = Field(..., min_length=1, max_length=10)
 
 
-@app.post("/aflosschema")
-async def aflosschema(request_body: AflosschemaRequest, request: Request):
+# Regels per chunk in de gestreamde response
+AFLOSSCHEMA_CHUNK_MAANDEN = 120
+
+_AFLOSSCHEMA_KOLOMMEN = ("interest", "principal_payment", "gross_payment", "remaining_principal")
+
+
+def _aflosschema_json(waarde) -> str:
+    # Zelfde serialisatie als JSONResponse
+    return json.dumps(waarde, ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+
+def _aflosschema_regels(part: AflosschemaLoanPart, granularity: str, totals: dict):
     """
-    Genereer een volledig aflosschema per leningdeel.
+    Schemaregels van één leningdeel, incrementeel uit de calculator.
 
-    Retourneert per leningdeel een maandelijks schema (rente, aflossing, restschuld)
-    en totalen over de gehele looptijd.
+    granularity "month": calc.iter_schedule, één regel per maand.
+    granularity "year": calc.iter_years, jaartotalen zonder maandregels.
+
+    Vult totals (total_interest, total_principal, total_payments) zodra
+    alle regels zijn opgeleverd.
     """
     from monthly_costs.domain.loan_calc import get_calculator
 
-    result_parts = []
-
-    for part in request_body.loan_parts:
-        calc = get_calculator(part.loan_type)
-        principal = Decimal(str(part.principal))
-        annual_rate = Decimal(str(part.interest_rate)) / 100
-        total_months = part.term_years * 12
-
-        schedule = []
-        total_interest = Decimal("0")
-        total_principal_paid = Decimal("0")
-
-        for month in range(1, total_months + 1):
-            payment = calc.calculate_month(principal, annual_rate, part.term_years, month)
-            schedule.append({
-                "month": month,
-                "interest": float(payment.interest_payment),
-                "principal_payment": float(payment.principal_payment),
-                "gross_payment": float(payment.gross_payment),
-                "remaining_principal": float(payment.remaining_principal),
-            })
-            total_interest += payment.interest_payment
-            total_principal_paid += payment.principal_payment
-
-        result_parts.append({
-            "id": part.id,
-            "loan_type": part.loan_type,
-            "principal": part.principal,
-            "interest_rate": part.interest_rate,
-            "term_years": part.term_years,
-            "total_months": total_months,
-            "schedule": schedule,
-            "totals": {
-                "total_interest": float(total_interest),
-                "total_principal": float(total_principal_paid),
-                "total_payments": float(total_interest + total_principal_paid),
-            },
-        })
+    calc = get_calculator(part.loan_type)
+    principal = Decimal(str(part.principal))
+    annual_rate = Decimal(str(part.interest_rate)) / 100
+
+    if granularity == "year":
+        regels = ((p.year, p) for p in calc.iter_years(principal, annual_rate, part.term_years))
+    else:
+        regels = enumerate(calc.iter_schedule(principal, annual_rate, part.term_years), start=1)
+
+    total_interest = Decimal("0")
+    total_principal_paid = Decimal("0")
+    for periode, payment in regels:
+        yield {
+            granularity: periode,
+            "interest": float(payment.interest_payment),
+            "principal_payment": float(payment.principal_payment),
+            "gross_payment": float(payment.gross_payment),
+            "remaining_principal": float(payment.remaining_principal),
+        }
+        total_interest += payment.interest_payment
+        total_principal_paid += payment.principal_payment
+
+    totals.update({
+        "total_interest": float(total_interest),
+        "total_principal": float(total_principal_paid),
+        "total_payments": float(total_interest + total_principal_paid),
+    })
 
-    return {"loan_parts": result_parts}
+
+def _aflosschema_kop(part: AflosschemaLoanPart) -> dict:
+    return {
+        "id": part.id,
+        "loan_type": part.loan_type,
+        "principal": part.principal,
+        "interest_rate": part.interest_rate,
+        "term_years": part.term_years,
+        "total_months": part.term_years * 12,
+    }
+
+
+def _aflosschema_stream_json(loan_parts: List[AflosschemaLoanPart], granularity: str = "month"):
+    """Zelfde document als voorheen ({"loan_parts": [...]}), in stukken opgebouwd."""
+    yield '{"loan_parts":['
+    for i, part in enumerate(loan_parts):
+        totals = {}
+        yield ("," if i else "") + _aflosschema_json(_aflosschema_kop(part))[:-1] + ',"schedule":['
+        regels = _aflosschema_regels(part, granularity, totals)
+        eerste = True
+        while chunk := list(itertools.islice(regels, AFLOSSCHEMA_CHUNK_MAANDEN)):
+            # Eén dumps per chunk; zonder de lijsthaken past het in "schedule"
+            yield ("" if eerste else ",") + _aflosschema_json(chunk)[1:-1]
+            eerste = False
+        yield '],"totals":' + _aflosschema_json(totals) + "}"
+    yield "]}"
+
+
+def _aflosschema_stream_columnar(loan_parts: List[AflosschemaLoanPart], granularity: str):
+    """Als json, maar "schedule" is een object met één array per veld."""
+    yield '{"loan_parts":['
+    for i, part in enumerate(loan_parts):
+        totals = {}
+        kolommen = {granularity: [], **{k: [] for k in _AFLOSSCHEMA_KOLOMMEN}}
+        for regel in _aflosschema_regels(part, granularity, totals):
+            for k, kolom in kolommen.items():
+                kolom.append(regel[k])
+        yield ("," if i else "") + _aflosschema_json(
+            {**_aflosschema_kop(part), "schedule": kolommen, "totals": totals})
+    yield "]}"
+
+
+def _aflosschema_stream_ndjson(loan_parts: List[AflosschemaLoanPart], granularity: str = "month"):
+    """Eén regel per leningdeel-kop, per maand (of jaar) en per leningdeel-totaal."""
+    for part in loan_parts:
+        totals = {}
+        kop = _aflosschema_kop(part)
+        yield _aflosschema_json({"type": "part", **kop}) + "\n"
+        regels = _aflosschema_regels(part, granularity, totals)
+        while chunk := list(itertools.islice(regels, AFLOSSCHEMA_CHUNK_MAANDEN)):
+            yield "".join(
+                _aflosschema_json({"type": granularity, "id": part.id, **r}) + "\n" for r in chunk
+            )
+        yield _aflosschema_json({"type": "totals", "id": part.id, **totals}) + "\n"
+
+
+@app.post("/aflosschema")
+async def aflosschema(
+    request_body: AflosschemaRequest,
+    request: Request,
+    granularity: Literal["month", "year"] = "month",
+    format: Literal["json", "ndjson", "columnar"] = "json",
+):
+    """
+    Genereer een volledig aflosschema per leningdeel.
+
+    Retourneert per leningdeel een maandelijks schema (rente, aflossing, restschuld)
+    en totalen over de gehele looptijd. Het schema wordt maand voor maand
+    berekend en gestreamd, niet eerst volledig in geheugen opgebouwd.
+
+    granularity=month (default): één regel per maand ("month").
+    granularity=year: jaartotalen ("year") uit gesloten formules, zonder
+        maandregels; kan enkele centen afwijken van de som van de maanden.
+    format=json (default): {"loan_parts": [...]} zoals voorheen.
+    format=columnar: idem, maar "schedule" is een object met arrays
+        (month/year, interest, principal_payment, gross_payment, remaining_principal).
+    format=ndjson: regels met type "part", "month"/"year" (met id) en "totals".
+    """
+    if format == "ndjson":
+        return StreamingResponse(
+            _aflosschema_stream_ndjson(request_body.loan_parts, granularity),
+            media_type="application/x-ndjson",
+        )
+    if format == "columnar":
+        return StreamingResponse(
+            _aflosschema_stream_columnar(request_body.loan_parts, granularity),
+            media_type="application/json",
+        )
+    return StreamingResponse(
+        _aflosschema_stream_json(request_body.loan_parts, granularity),
+        media_type="application/json",
+    )
 
 
 if RATE_LIMITING_ENABLED:
@@ -482,6 +955,8 @@ def health():
         "rate_limiting": RATE_LIMITING_ENABLED,
         "api_key_configured": API_KEY is not None,
         "cors_origins": ALLOWED_ORIGINS,
+        "reken_executor": rekenpool.stats(),
+        "pdf_renderpool": pdf_renderpool.stats(),
     }
 
 
@@ -518,6 +993,19 @@ def health_deep():
         return {"status": "unhealthy", "reason": str(e)}
 
 
+@app.get("/cache/stats")
+def cache_stats():
+    """Hit/miss-statistieken van de resultaatcache van calculate(), de dossier- en de sectiecache."""
+    return {
+        "calculate": {
+            **calculator_final.RESULTAAT_CACHE.stats(),
+            "config_versie": calculator_final.CONFIG_VERSIE,
+        },
+        "dossier": dossier_cache.stats(),
+        "secties": sectie_cache.stats(),
+    }
+
+
 @app.get("/aow-categorie")
 def aow_categorie(geboortedatum: str):
     """
@@ -670,6 +1158,10 @@ async def update_config(
     origin = request.headers.get("origin", "onbekend")
     logger.info("Config '%s' bijgewerkt via %s", config_name, origin)
 
+    # Nieuwe fiscale defaults direct actief maken (leegt ook de resultaatcache)
+    if config_name == "fiscaal":
+        calculator_final.herlaad_fiscaal_defaults()
+
     # Commit naar GitHub (async)
     commit_msg = f"Config update: {config_name} (via admin UI)"
     github_ok = await github_sync.commit_config_to_github(
@@ -827,7 +1319,8 @@ async def samenvatting_pdf(
 
     try:
         data = request_body.model_dump()
-        pdf_bytes = pdf_generator.genereer_samenvatting_pdf(data)
+        # Template + WeasyPrint buiten de event loop; de render zelf op de renderpool
+        pdf_bytes = await run_in_threadpool(pdf_generator.genereer_samenvatting_pdf, data)
         return Response(
             content=pdf_bytes,
             media_type="application/pdf",
@@ -835,6 +1328,12 @@ async def samenvatting_pdf(
                 "Content-Disposition": f'attachment; filename="Samenvatting hypotheekberekening - {request_body.klant_naam or "Klant"}.pdf"',
             },
         )
+    except pdf_renderpool.RenderpoolVol as e:
+        logger.warning("PDF generatie geweigerd: %s", e)
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    except pdf_renderpool.RenderTimeout as e:
+        logger.error("PDF generatie timeout: %s", e)
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error("PDF generatie mislukt: %s", e, exc_info=True)
         raise HTTPException(
@@ -926,7 +1425,7 @@ async def adviesrapport_pdf(
 
     try:
         data = request_body.model_dump(exclude_none=True)
-        pdf_bytes = pdf_generator.genereer_adviesrapport_pdf(data)
+        pdf_bytes = await run_in_threadpool(pdf_generator.genereer_adviesrapport_pdf, data)
         klant_naam = request_body.meta.customerName or "klant"
         filename = f"Adviesrapport hypotheek - {klant_naam}.pdf"
         return Response(
@@ -936,6 +1435,12 @@ async def adviesrapport_pdf(
                 "Content-Disposition": f'attachment; filename="{filename}"',
             },
         )
+    except pdf_renderpool.RenderpoolVol as e:
+        logger.warning("Adviesrapport PDF geweigerd: %s", e)
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    except pdf_renderpool.RenderTimeout as e:
+        logger.error("Adviesrapport PDF timeout: %s", e)
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error("Adviesrapport PDF mislukt: %s", e, exc_info=True)
         raise HTTPException(
@@ -957,13 +1462,13 @@ import risk_scenarios
 class RiskHypotheekDeel(BaseModel):
     """Hypotheekdeel met rente_aftrekbaar_tot voor risk scenarios."""
     aflos_type: str = "Annuïteit"
-    org_lpt: int = Field(default=_FISCAAL_DEFAULTS.get("c_lpt", 360), ge=1, le=600)
-    rest_lpt: int = Field(default=_FISCAAL_DEFAULTS.get("c_lpt", 360), ge=1, le=600)
+    org_lpt: int = Field(default_factory=_fiscaal_default("c_lpt", 360), ge=1, le=600)
+    rest_lpt: int = Field(default_factory=_fiscaal_default("c_lpt", 360), ge=1, le=600)
     hoofdsom_box1: float = Field(default=0, ge=0)
     hoofdsom_box3: float = Field(default=0, ge=0)
-    rvp: int = Field(default=_FISCAAL_DEFAULTS.get("c_rvp_toets_rente", 120), ge=0, le=600)
+    rvp: int = Field(default_factory=_fiscaal_default("c_rvp_toets_rente", 120), ge=0, le=600)
     inleg_overig: float = Field(default=0, ge=0)
-    werkelijke_rente: float = Field(default=_FISCAAL_DEFAULTS.get("c_toets_rente", 0.05), ge=0, le=0.20)
+    werkelijke_rente: float = Field(default_factory=_fiscaal_default("c_toets_rente", 0.05), ge=0, le=0.20)
     rente_aftrekbaar_tot: Optional[str] = None  # YYYY-MM-DD
 
     @field_validator("aflos_type")
@@ -1053,7 +1558,7 @@ class RiskScenariosRequest(BaseModel):
     arbeidsverleden_vanaf2016_boven10_partner: int = Field(default=0, ge=0, le=20)
 
     # Berekening parameters
-    toetsrente: float = Field(default=_FISCAAL_DEFAULTS.get("c_toets_rente", 0.05), ge=0, le=0.20)
+    toetsrente: float = Field(default_factory=_fiscaal_default("c_toets_rente", 0.05), ge=0, le=0.20)
     geadviseerd_hypotheekbedrag: float = Field(default=0, ge=0)
 
     # Woning / verplichtingen
@@ -1095,10 +1600,16 @@ async def calculate_risk_scenarios(
         # Hypotheekdelen naar dict formaat
         delen = [d.model_dump() for d in request_body.hypotheek_delen]
 
-        all_scenarios = []
+        # Eén rekencontext voor alle families: identieke NAT-berekeningen 1x.
+        # De families draaien gelijktijdig op de rekenpool (rekenpool.py),
+        # zodat de event loop vrij blijft voor andere requests.
+        context = risk_scenarios.RekenContext()
+        families = []
 
         # --- AOW scenario's ---
-        aow_result = risk_scenarios.bereken_aow_scenarios(
+        families.append(risk_scenarios.start_familie(
+            risk_scenarios.bereken_aow_scenarios,
+            context=context,
             hypotheek_delen=delen,
             ingangsdatum_hypotheek=request_body.ingangsdatum_hypotheek,
             geboortedatum_aanvrager=request_body.geboortedatum_aanvrager,
@@ -1116,13 +1627,14 @@ async def calculate_risk_scenarios(
             erfpachtcanon_per_jaar=request_body.erfpachtcanon_per_jaar,
             jaarlast_overige_kredieten=request_body.jaarlast_overige_kredieten,
             geadviseerd_hypotheekbedrag=request_body.geadviseerd_hypotheekbedrag,
-        )
-        all_scenarios.extend(aow_result.get('scenarios', []))
+        ))
 
         # --- Overlijdensscenario's (alleen bij stel) ---
         if (request_body.alleenstaande == "NEE"
                 and request_body.geboortedatum_partner):
-            overlijden_result = risk_scenarios.bereken_overlijdens_scenarios(
+            families.append(risk_scenarios.start_familie(
+                risk_scenarios.bereken_overlijdens_scenarios,
+                context=context,
                 hypotheek_delen=delen,
                 geboortedatum_aanvrager=request_body.geboortedatum_aanvrager,
                 inkomen_aanvrager_huidig=request_body.inkomen_aanvrager_huidig,
@@ -1140,8 +1652,7 @@ async def calculate_risk_scenarios(
                 erfpachtcanon_per_jaar=request_body.erfpachtcanon_per_jaar,
                 jaarlast_overige_kredieten=request_body.jaarlast_overige_kredieten,
                 geadviseerd_hypotheekbedrag=request_body.geadviseerd_hypotheekbedrag,
-            )
-            all_scenarios.extend(overlijden_result.get('scenarios', []))
+            ))
 
         # --- AO-scenario's ---
         # Alleen als er inkomensverdeling is opgegeven (loondienst/onderneming/roz)
@@ -1154,7 +1665,9 @@ async def calculate_risk_scenarios(
             or request_body.inkomen_roz_partner > 0
         )
         if has_ao_income:
-            ao_result = risk_scenarios.bereken_ao_scenarios(
+            families.append(risk_scenarios.start_familie(
+                risk_scenarios.bereken_ao_scenarios,
+                context=context,
                 hypotheek_delen=delen,
                 ingangsdatum_hypotheek=request_body.ingangsdatum_hypotheek,
                 geboortedatum_aanvrager=request_body.geboortedatum_aanvrager,
@@ -1187,12 +1700,13 @@ async def calculate_risk_scenarios(
                 erfpachtcanon_per_jaar=request_body.erfpachtcanon_per_jaar,
                 jaarlast_overige_kredieten=request_body.jaarlast_overige_kredieten,
                 geadviseerd_hypotheekbedrag=request_body.geadviseerd_hypotheekbedrag,
-            )
-            all_scenarios.extend(ao_result.get('scenarios', []))
+            ))
 
         # --- Werkloosheidsscenario's ---
         if has_ao_income:
-            ww_result = risk_scenarios.bereken_werkloosheid_scenarios(
+            families.append(risk_scenarios.start_familie(
+                risk_scenarios.bereken_werkloosheid_scenarios,
+                context=context,
                 hypotheek_delen=delen,
                 ingangsdatum_hypotheek=request_body.ingangsdatum_hypotheek,
                 geboortedatum_aanvrager=request_body.geboortedatum_aanvrager,
@@ -1221,16 +1735,25 @@ async def calculate_risk_scenarios(
                 erfpachtcanon_per_jaar=request_body.erfpachtcanon_per_jaar,
                 jaarlast_overige_kredieten=request_body.jaarlast_overige_kredieten,
                 geadviseerd_hypotheekbedrag=request_body.geadviseerd_hypotheekbedrag,
-            )
-            all_scenarios.extend(ww_result.get('scenarios', []))
+            ))
+
+        # Resultaten in vaste volgorde: AOW, overlijden, AO, WW
+        all_scenarios = []
+        for familie in families:
+            result = await asyncio.wrap_future(familie)
+            all_scenarios.extend(result.get('scenarios', []))
 
+        berekeningen = context.stats()
         logger.info(
-            "Risk scenarios klaar: %d scenario's",
+            "Risk scenarios klaar: %d scenario's, %d berekeningen (%d hergebruikt)",
             len(all_scenarios),
+            berekeningen["uitgevoerd"],
+            berekeningen["hergebruikt"],
         )
         return {
             "scenarios": all_scenarios,
             "geadviseerd_hypotheekbedrag": request_body.geadviseerd_hypotheekbedrag,
+            "berekeningen": berekeningen,
         }
 
     except Exception as e:
@@ -1246,6 +1769,84 @@ if RATE_LIMITING_ENABLED:
     calculate_risk_scenarios = limiter.limit("10/minute")(calculate_risk_scenarios)
 
 
+# --- Portefeuille-stresstest endpoint ---
+
+import portfolio_stress
+
+
+@app.post("/portfolio/stress-test")
+async def portfolio_stress_test(
+    request: Request,
+    naam: str = "stress",
+    toetsrente_delta: float = 0.0,
+    inkomen_factor_aanvrager: float = 1.0,
+    inkomen_factor_partner: float = 1.0,
+    horizon_maanden: int = 0,
+    api_key: Optional[str] = Depends(verify_api_key),
+):
+    """
+    Stresstest over een portefeuille dossiers (NDJSON in, NDJSON uit).
+
+    Body: één dossier per regel, velden als /calculate/risk-scenarios
+    (hypotheek_delen, inkomen_aanvrager_huidig, inkomen_partner_huidig,
+    alleenstaande, toetsrente, ...) plus optioneel id. De schok komt uit de
+    query parameters, bijv. ?toetsrente_delta=0.01&inkomen_factor_partner=0.
+
+    Response (application/x-ndjson, gestreamd, in invoervolgorde): per dossier
+    max_hypotheek_basis, max_hypotheek_annuitair na de schok, verschil en
+    tekort t.o.v. de huidige schuld; of een regel met error.
+    """
+    try:
+        schok = portfolio_stress.Schok(
+            naam=naam,
+            toetsrente_delta=toetsrente_delta,
+            inkomen_factor_aanvrager=inkomen_factor_aanvrager,
+            inkomen_factor_partner=inkomen_factor_partner,
+            horizon_maanden=horizon_maanden,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    origin = request.headers.get("origin", "onbekend")
+    logger.info("Portefeuille-stresstest gestart: origin=%s, schok=%s", origin, schok)
+
+    # Body eerst volledig ontvangen: zodra de StreamingResponse start, leest
+    # Starlette zelf receive() voor disconnects en raken body-stukken zoek.
+    # Grote portefeuilles gaan naar een tijdelijk bestand, niet in geheugen.
+    # Schrijven en lezen gaan via de threadpool: boven max_size is dit schijf-I/O.
+    body = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+    try:
+        async for stuk in request.stream():
+            await run_in_threadpool(body.write, stuk)
+        await run_in_threadpool(body.seek, 0)
+    except BaseException:
+        body.close()
+        raise
+
+    async def body_stukken():
+        while stuk := await run_in_threadpool(body.read, 64 * 1024):
+            yield stuk
+
+    async def ndjson():
+        aantal = fouten = 0
+        try:
+            regels = portfolio_stress.alees_ndjson(body_stukken())
+            async for resultaat in portfolio_stress.stress_test_async(regels, schok):
+                aantal += 1
+                fouten += "error" in resultaat
+                yield portfolio_stress.naar_ndjson(resultaat)
+        finally:
+            # Ook bij een afgebroken verbinding of fout halverwege
+            body.close()
+        logger.info("Portefeuille-stresstest klaar: %d dossiers, %d fouten", aantal, fouten)
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+if RATE_LIMITING_ENABLED:
+    portfolio_stress_test = limiter.limit("5/minute")(portfolio_stress_test)
+
+
 # --- E-mail draft endpoint ---
 
 class DraftEmailRequest(BaseModel):
@@ -1287,7 +1888,13 @@ async def email_draft_samenvatting(
     # Stap 1: Genereer PDF (hergebruik bestaande code)
     try:
         pdf_data = request_body.pdf_data.model_dump()
-        pdf_bytes = pdf_generator.genereer_samenvatting_pdf(pdf_data)
+        pdf_bytes = await run_in_threadpool(pdf_generator.genereer_samenvatting_pdf, pdf_data)
+    except pdf_renderpool.RenderpoolVol as e:
+        logger.warning("PDF generatie geweigerd voor e-mail draft: %s", e)
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    except pdf_renderpool.RenderTimeout as e:
+        logger.error("PDF generatie timeout voor e-mail draft: %s", e)
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error("PDF generatie mislukt voor e-mail draft: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"PDF generatie mislukt: {str(e)}")
@@ -0,0 +1,126 @@
+"""
+Benchmark: POST /aflosschema met 10 leningdelen van 50 jaar (6.000 maanden).
+
+Vergelijkt:
+- voor: per maand calc.calculate_month (annuïteit: twee Decimal ``**`` per
+        maand), volledig schema als lijst, daarna één JSONResponse
+- na:   calc.iter_schedule (groeifactor doorgeschoven per maand) via de
+        gestreamde response van app.py, chunk voor chunk
+
+Meet tijd en piekgeheugen (tracemalloc) en controleert vooraf dat beide
+byte-identiek zijn. Daarnaast tijd en responsgrootte van de uitvoermodi
+granularity=year (jaartotalen uit gesloten formules) en format=columnar.
+
+Gebruik (vanuit project root):
+    python benchmarks/bench_aflosschema.py [aantal_delen] [looptijd_jaren]
+"""
+
+import os
+import sys
+import timeit
+import tracemalloc
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from monthly_costs.domain.loan_calc import get_calculator  # noqa: E402
+
+
+def voor(loan_parts) -> bytes:
+    """De oude implementatie van /aflosschema."""
+    result_parts = []
+    for part in loan_parts:
+        calc = get_calculator(part.loan_type)
+        principal = Decimal(str(part.principal))
+        annual_rate = Decimal(str(part.interest_rate)) / 100
+        total_months = part.term_years * 12
+
+        schedule = []
+        total_interest = Decimal("0")
+        total_principal_paid = Decimal("0")
+        for month in range(1, total_months + 1):
+            payment = calc.calculate_month(principal, annual_rate, part.term_years, month)
+            schedule.append({
+                "month": month,
+                "interest": float(payment.interest_payment),
+                "principal_payment": float(payment.principal_payment),
+                "gross_payment": float(payment.gross_payment),
+                "remaining_principal": float(payment.remaining_principal),
+            })
+            total_interest += payment.interest_payment
+            total_principal_paid += payment.principal_payment
+
+        result_parts.append({
+            "id": part.id,
+            "loan_type": part.loan_type,
+            "principal": part.principal,
+            "interest_rate": part.interest_rate,
+            "term_years": part.term_years,
+            "total_months": total_months,
+            "schedule": schedule,
+            "totals": {
+                "total_interest": float(total_interest),
+                "total_principal": float(total_principal_paid),
+                "total_payments": float(total_interest + total_principal_paid),
+            },
+        })
+    return JSONResponse({"loan_parts": result_parts}).body
+
+
+def main() -> None:
+    aantal = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    jaren = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    import app as app_module
+
+    typen = ["annuity", "annuity", "linear", "interest_only"]
+    request = app_module.AflosschemaRequest(loan_parts=[{
+        "id": f"deel-{i}",
+        "principal": 50_000 + 12_345.67 * i,
+        "interest_rate": 3.5 + 0.25 * i,
+        "term_years": jaren,
+        "loan_type": typen[i % len(typen)],
+    } for i in range(aantal)])
+
+    def na() -> bytes:
+        return "".join(app_module._aflosschema_stream_json(request.loan_parts)).encode("utf-8")
+
+    def na_chunks() -> int:
+        # Zoals de StreamingResponse: elk stuk wordt verstuurd en vrijgegeven
+        return sum(len(stuk) for stuk in app_module._aflosschema_stream_json(request.loan_parts))
+
+    assert voor(request.loan_parts) == na()
+    print(f"Voor == na voor {aantal} delen x {jaren} jaar")
+
+    def piek(functie) -> float:
+        tracemalloc.start()
+        functie()
+        _, piek_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return piek_bytes / 1e6
+
+    t_voor = min(timeit.repeat(lambda: voor(request.loan_parts), number=1, repeat=3))
+    t_na = min(timeit.repeat(na_chunks, number=1, repeat=3))
+    print(f"Voor {t_voor * 1e3:8.1f} ms  piek {piek(lambda: voor(request.loan_parts)):6.1f} MB")
+    print(f"Na   {t_na * 1e3:8.1f} ms  piek {piek(na_chunks):6.1f} MB  {t_voor / t_na:5.1f}x")
+
+    print()
+    print(f"{'granularity/format':<20} {'tijd':>9} {'grootte':>10}")
+    for granularity, stream in (
+        ("month", app_module._aflosschema_stream_json),
+        ("month", app_module._aflosschema_stream_columnar),
+        ("year", app_module._aflosschema_stream_json),
+        ("year", app_module._aflosschema_stream_columnar),
+    ):
+        def modus() -> int:
+            return sum(len(stuk) for stuk in stream(request.loan_parts, granularity))
+
+        t = min(timeit.repeat(modus, number=1, repeat=3))
+        label = f"{granularity}/{'columnar' if stream is app_module._aflosschema_stream_columnar else 'json'}"
+        print(f"{label:<20} {t * 1e3:6.1f} ms {modus() / 1e3:7.1f} kB  {t_voor / t:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
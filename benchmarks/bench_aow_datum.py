@@ -0,0 +1,62 @@
+"""
+Benchmark: AOW-datum via de gecompileerde AOW-tabel vs de lineaire zoektocht.
+
+Over willekeurige geboortedata:
+- voor: de oude bereken_aow_datum (tabel aflopen + relativedelta)
+- na:   bereken_aow_datum (bisect op AOW_INDEX + maandoptelling)
+- array: bereken_aow_data voor alle geboortedata in één aanroep
+
+Controleert vooraf dat alle varianten exact dezelfde datums opleveren.
+
+Gebruik (vanuit project root):
+    python benchmarks/bench_aow_datum.py [aantal]
+"""
+
+import os
+import random
+import sys
+import timeit
+from datetime import date, timedelta
+
+import numpy as np
+from dateutil.relativedelta import relativedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aow_calculator import AOW_TABEL, bereken_aow_data, bereken_aow_datum  # noqa: E402
+
+
+def aow_datum_voor(geboortedatum: date) -> date:
+    """De oude lookup: AOW_TABEL lineair aflopen."""
+    for regel in AOW_TABEL:
+        if regel["geboren_tot"] is None or geboortedatum <= regel["geboren_tot"]:
+            return geboortedatum + relativedelta(years=regel["jaren"], months=regel["maanden"])
+    return geboortedatum + relativedelta(years=67, months=3)
+
+
+def _tijd(fn) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=5))
+
+
+def main() -> None:
+    aantal = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(0)
+    data = [date(1940, 1, 1) + timedelta(days=rng.randint(0, 25_000)) for _ in range(aantal)]
+    data_np = np.array(data, dtype="datetime64[D]")
+
+    voor = [aow_datum_voor(g) for g in data]
+    assert [bereken_aow_datum(g) for g in data] == voor
+    assert bereken_aow_data(data_np).tolist() == voor
+
+    t_voor = _tijd(lambda: [aow_datum_voor(g) for g in data])
+    t_na = _tijd(lambda: [bereken_aow_datum(g) for g in data])
+    t_array = _tijd(lambda: bereken_aow_data(data_np))
+
+    print(f"{aantal} geboortedata")
+    print(f"{'variant':<22} {'tijd (ms)':>10} {'factor':>7}")
+    for naam, t in (("voor (lineair)", t_voor), ("na (bisect)", t_na), ("array (NumPy)", t_array)):
+        print(f"{naam:<22} {t * 1e3:>10.1f} {t_voor / t:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark: calculator_final._calculate met invoer-dict vs BerekeningInvoer.
+
+Meet (zonder resultaatcache):
+- dict:          _calculate(invoer) — record wordt per aanroep opgebouwd
+- record:        _calculate(record) met vooraf opgebouwd record
+- record + met:  inkomensvarianten op één record (patroon van de
+                 risicoscenario's: zelfde delen, ander inkomen), leningaggregaten
+                 hergebruikt
+- aggregaten:    aggregeer_leningdelen los (één doorgang over de delen)
+
+en controleert vooraf dat record en dict exact gelijk zijn.
+
+Gebruik (vanuit project root):
+    python benchmarks/bench_berekening_invoer.py [aantal]
+"""
+
+import os
+import sys
+import timeit
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_calculate_batch import genereer_invoeren  # noqa: E402
+from calculator_final import BerekeningInvoer, _calculate, aggregeer_leningdelen  # noqa: E402
+
+
+def main() -> None:
+    aantal = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    invoeren = genereer_invoeren(aantal)
+    records = [BerekeningInvoer.uit_dict(i) for i in invoeren]
+
+    assert [repr(_calculate(r)) for r in records] == [repr(_calculate(i)) for i in invoeren]
+    print(f"Record == dict voor {aantal} invoeren")
+
+    for r in records:
+        r.aggregaten   # eenmalig, zoals bij hergebruik van een record
+
+    varianten = [dict(i, hoofd_inkomen_aanvrager=i['hoofd_inkomen_aanvrager'] // 2) for i in invoeren]
+    delen = [(r.hypotheek_delen, r.c_toets_rente, r.c_rvp_toets_rente) for r in records]
+
+    def meet(f) -> float:
+        return min(timeit.repeat(f, number=1, repeat=7)) / aantal
+
+    t_dict = meet(lambda: [_calculate(i) for i in invoeren])
+    t_opbouw = meet(lambda: [BerekeningInvoer.uit_dict(i) for i in invoeren])
+    t_record = meet(lambda: [_calculate(r) for r in records])
+    t_variant_dict = meet(lambda: [_calculate(v) for v in varianten])
+    t_variant_met = meet(lambda: [
+        _calculate(r.met(hoofd_inkomen_aanvrager=v['hoofd_inkomen_aanvrager']))
+        for r, v in zip(records, varianten)
+    ])
+    t_aggregaten = meet(lambda: [aggregeer_leningdelen(*d) for d in delen])
+
+    def regel(label: str, t: float, basis: Optional[float] = None) -> str:
+        versnelling = f"  {basis / t:5.2f}x" if basis else ""
+        return f"{label:<22} {t * 1e6:7.2f} µs/berekening{versnelling}"
+
+    print(regel("Dict", t_dict, t_dict))
+    print(regel("Opbouw record", t_opbouw))
+    print(regel("Record", t_record, t_dict))
+    print(regel("Variant (dict)", t_variant_dict, t_variant_dict))
+    print(regel("Variant (record.met)", t_variant_met, t_variant_dict))
+    print(regel("Aggregaten", t_aggregaten))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Benchmark: calculator_final.calculate in een lus vs calculator_batch.
+
+Meet vier lagen:
+- scalair:        [calculate(i) for i in invoeren]
+- batch (dicts):  calculate_batch(invoeren) — inclusief inpakken en
+                  terugzetten naar calculate()-dicts (wat /calculate/batch doet)
+- kolommen:       calculate_kolommen() van lijsten per veld naar lijsten per
+                  veld (wat /calculate/batch/kolommen doet)
+- batch (kern):   calculate_arrays(pack_inputs(invoeren)) met vooraf
+                  ingepakte kolommen — de gevectoriseerde rekenkern zelf
+
+en end-to-end via de API (TestClient, rate limiting uit): /calculate per
+invoer tegen één /calculate/batch en één /calculate/batch/kolommen. Daar
+tellen JSON en validatie mee; bij /calculate/batch ook een model en dict
+per item, bij de kolomvariant niet.
+
+en controleert vooraf dat batch en scalair exact gelijk zijn.
+
+Gebruik (vanuit project root):
+    python benchmarks/bench_calculate_batch.py [aantal]
+"""
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculator_batch import calculate_arrays, calculate_batch, calculate_kolommen, pack_inputs  # noqa: E402
+from calculator_final import calculate  # noqa: E402
+
+
+def genereer_invoeren(aantal: int, seed: int = 42) -> list:
+    """Realistische mix: 1–3 leningdelen, stellen en alleenstaanden, deels scenario 2."""
+    rng = random.Random(seed)
+    invoeren = []
+    for _ in range(aantal):
+        alleenstaande = rng.choice(['JA', 'NEE'])
+        delen = [{
+            'aflos_type': rng.choice(['Annuïteit', 'Lineair', 'Aflosvrij']),
+            'org_lpt': 360,
+            'rest_lpt': rng.choice([240, 300, 360]),
+            'hoofdsom_box1': rng.randint(50_000, 300_000),
+            'hoofdsom_box3': 0,
+            'rvp': rng.choice([60, 120, 240]),
+            'inleg_overig': 0,
+            'werkelijke_rente': rng.choice([0.0375, 0.0399, 0.0415, 0.0432]),
+        } for _ in range(rng.randint(1, 3))]
+        invoer = {
+            'hoofd_inkomen_aanvrager': rng.randint(30_000, 120_000),
+            'hoofd_inkomen_partner': 0 if alleenstaande == 'JA' else rng.randint(0, 80_000),
+            'alleenstaande': alleenstaande,
+            'ontvangt_aow': 'NEE',
+            'energielabel': rng.choice(['A', 'B', 'C', 'E']),
+            'verduurzamings_maatregelen': rng.choice([0, 10_000]),
+            'hypotheek_delen': delen,
+        }
+        if rng.random() < 0.3:
+            invoer['gewijzigd_hoofd_inkomen_aanvrager2'] = rng.randint(20_000, 60_000)
+        invoeren.append(invoer)
+    return invoeren
+
+
+def naar_kolommen(invoeren: list) -> tuple:
+    """Invoeren → (kolommen, delen in lang formaat); alle invoeren hebben dezelfde velden."""
+    velden = set().union(*invoeren) - {'hypotheek_delen', 'gewijzigd_hoofd_inkomen_aanvrager2'}
+    kolommen = {veld: [i[veld] for i in invoeren] for veld in velden}
+    kolommen['gewijzigd_hoofd_inkomen_aanvrager2'] = [
+        i.get('gewijzigd_hoofd_inkomen_aanvrager2') for i in invoeren]
+    delen = {'rij': [rij for rij, i in enumerate(invoeren) for _ in i['hypotheek_delen']]}
+    for veld in invoeren[0]['hypotheek_delen'][0]:
+        delen[veld] = [d[veld] for i in invoeren for d in i['hypotheek_delen']]
+    return kolommen, delen
+
+
+def main() -> None:
+    aantal = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    invoeren = genereer_invoeren(aantal)
+
+    assert calculate_batch(invoeren) == [calculate(i) for i in invoeren]
+    print(f"Batch == scalair voor {aantal} invoeren")
+
+    ingepakt = pack_inputs(invoeren)
+    kolommen, delen = naar_kolommen(invoeren)
+
+    t_scalair = min(timeit.repeat(lambda: [calculate(i) for i in invoeren], number=1, repeat=3))
+    t_batch = min(timeit.repeat(lambda: calculate_batch(invoeren), number=1, repeat=3))
+    t_kolommen = min(timeit.repeat(lambda: calculate_kolommen(aantal, kolommen, delen),
+                                   number=1, repeat=3))
+    t_pack = min(timeit.repeat(lambda: pack_inputs(invoeren), number=1, repeat=3))
+    t_kern = min(timeit.repeat(lambda: calculate_arrays(ingepakt), number=1, repeat=3))
+
+    def regel(label: str, t: float) -> str:
+        return (f"{label:<16} {t * 1e3:9.1f} ms  {t / aantal * 1e6:7.2f} µs/berekening  "
+                f"{t_scalair / t:6.1f}x")
+
+    print(regel("Scalair", t_scalair))
+    print(regel("Batch (dicts)", t_batch))
+    print(regel("Kolommen", t_kolommen))
+    print(regel("Inpakken", t_pack))
+    print(regel("Batch (kern)", t_kern))
+
+    t_item, t_endpoint, t_kolom_endpoint = meet_endpoints(invoeren)
+    print(f"{'/calculate':<25} {t_item * 1e3:9.1f} ms  (per invoer, geëxtrapoleerd)")
+    print(f"{'/calculate/batch':<25} {t_endpoint * 1e3:9.1f} ms  {t_item / t_endpoint:6.1f}x")
+    print(f"{'/calculate/batch/kolommen':<25} {t_kolom_endpoint * 1e3:9.1f} ms  "
+          f"{t_item / t_kolom_endpoint:6.1f}x")
+
+
+def meet_endpoints(invoeren: list, steekproef: int = 300) -> tuple:
+    """Tijd voor /calculate per invoer, één /calculate/batch en één /calculate/batch/kolommen."""
+    from fastapi.testclient import TestClient
+
+    import app as api
+
+    if api.RATE_LIMITING_ENABLED:
+        api.limiter.enabled = False
+    client = TestClient(api.app)
+    # Verse invoeren (de resultaatcache van /calculate mag niet meetellen),
+    # met energielabels in de notatie van de API
+    labels = {'A': 'A,B', 'B': 'A,B', 'C': 'C,D', 'E': 'E,F,G'}
+    verse = [dict(i, c_actuele_10jr_rente=0.0301, energielabel=labels[i['energielabel']])
+             for i in invoeren]
+
+    start = timeit.default_timer()
+    for invoer in verse[:steekproef]:
+        assert client.post("/calculate", json=invoer).status_code == 200
+    t_item = (timeit.default_timer() - start) / min(steekproef, len(verse)) * len(verse)
+
+    def batch():
+        assert client.post("/calculate/batch", json={"items": verse}).status_code == 200
+
+    kolommen, delen = naar_kolommen(verse)
+    body = dict(kolommen, hypotheek_delen=delen)
+
+    def kolom_batch():
+        assert client.post("/calculate/batch/kolommen", json=body).status_code == 200
+
+    batch()
+    kolom_batch()
+    t_endpoint = min(timeit.repeat(batch, number=1, repeat=3))
+    t_kolom_endpoint = min(timeit.repeat(kolom_batch, number=1, repeat=3))
+    return t_item, t_endpoint, t_kolom_endpoint
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark: monthly_costs tijdlijn, Decimal-engine vs float/NumPy-engine.
+
+Draait MortgageCalculator.calculate_timeline en
+FastMortgageCalculator.calculate_timeline over een willekeurig corpus
+(zelfde generator als tests/monthly_costs/unit/test_fast_calculator.py) en
+rapporteert:
+- tijd per engine en de versnelling, en de tijd van de float-rekenkern
+  zonder het opbouwen van de response (Decimal-conversie, validatie)
+- grootste afwijking per veld en het aandeel exact gelijke bedragen
+
+Faalt (exit 1) als een bedrag meer dan 1 cent afwijkt.
+
+Gebruik (vanuit project root):
+    python benchmarks/bench_fast_calculator.py [aantal_requests] [seed]
+"""
+
+import os
+import random
+import sys
+import time
+from decimal import Decimal
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from monthly_costs.domain.calculator import MortgageCalculator  # noqa: E402
+from monthly_costs.domain.fast_calculator import FastMortgageCalculator  # noqa: E402
+from monthly_costs.schemas.input import MonthlyCostsTimelineRequest  # noqa: E402
+from tests.monthly_costs.unit.test_fast_calculator import (  # noqa: E402
+    TIMELINE_FIELDS,
+    random_request,
+)
+
+
+def _meet(engine_cls, requests) -> tuple[float, list]:
+    engines = {jaar: engine_cls(jaar) for jaar in (2025, 2026)}
+    start = time.perf_counter()
+    resultaten = [engines[r.fiscal_year].calculate_timeline(r) for r in requests]
+    return time.perf_counter() - start, resultaten
+
+
+def _meet_kern(requests) -> float:
+    """Alleen FastMortgageCalculator._evaluate (arrays, geen response)."""
+    engines = {jaar: FastMortgageCalculator(jaar) for jaar in (2025, 2026)}
+    start = time.perf_counter()
+    for r in requests:
+        engine = engines[r.fiscal_year]
+        eind = r.end_month or max(int(p.term_years * 12) for p in r.loan_parts)
+        partner_info = engine._build_partner_info(r)
+        engine._evaluate(r, np.arange(r.start_month, eind + 1), partner_info,
+                         engine._calculate_combined_marginal_rate(partner_info),
+                         engine._calculate_ewf(r))
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    aantal = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    rng = random.Random(seed)
+    requests = [MonthlyCostsTimelineRequest(**random_request(rng)) for _ in range(aantal)]
+    maanden = sum(
+        (r.end_month or max(int(p.term_years * 12) for p in r.loan_parts)) - r.start_month + 1
+        for r in requests
+    )
+
+    t_decimal, exact = _meet(MortgageCalculator, requests)
+    t_fast, fast = _meet(FastMortgageCalculator, requests)
+    t_kern = _meet_kern(requests)
+
+    print(f"{aantal} requests, {maanden} maanden")
+    print(f"decimal: {t_decimal * 1e3:8.1f} ms")
+    print(f"fast:    {t_fast * 1e3:8.1f} ms  ({t_decimal / t_fast:.1f}x)")
+    print(f"kern:    {t_kern * 1e3:8.1f} ms  ({t_decimal / t_kern:.1f}x)")
+    print(f"{'veld':<30} {'max afwijking':>14} {'exact gelijk':>13}")
+
+    fout = False
+    for veld in TIMELINE_FIELDS:
+        afwijkingen = [
+            abs(Decimal(f) - Decimal(e))
+            for rf, re in zip(fast, exact)
+            for f, e in zip(getattr(rf, veld), getattr(re, veld))
+        ]
+        grootste = max(afwijkingen)
+        gelijk = sum(a == 0 for a in afwijkingen) / len(afwijkingen)
+        print(f"{veld:<30} {grootste:>14} {gelijk:>12.4%}")
+        fout |= grootste > Decimal("0.01")
+
+    if fout:
+        print("FOUT: afwijking groter dan 1 cent")
+    return 1 if fout else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
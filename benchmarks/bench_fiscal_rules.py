@@ -0,0 +1,82 @@
+"""
+Benchmark: gecompileerde FiscalRules (bisect + prefixsommen) vs lijst-walk.
+
+Vergelijkt per functie, over willekeurige inkomens/WOZ-waarden:
+- voor: de oude implementatie (per aanroep sorteren en de lijst aflopen)
+- na:   de gecompileerde tabellen uit load_rules() (bisect, prefixsom)
+
+Controleert vooraf dat beide exact dezelfde Decimal opleveren.
+
+Gebruik (vanuit project root):
+    python benchmarks/bench_fiscal_rules.py [aantal]
+"""
+
+import os
+import random
+import sys
+import timeit
+from decimal import ROUND_HALF_UP, Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from monthly_costs.domain.ewf import calculate_ewf  # noqa: E402
+from monthly_costs.domain.tax_calc import (  # noqa: E402
+    calculate_marginal_rate,
+    calculate_tax_on_income,
+)
+from monthly_costs.rules.compiled import (  # noqa: E402
+    _walk_marginal_rate,
+    _walk_tax_on_income,
+)
+from monthly_costs.rules.loader import load_rules  # noqa: E402
+
+
+def ewf_voor(woz_value, ewf_table):
+    """De oude band-lookup van calculate_ewf (sorteren + lineair zoeken)."""
+    sorted_bands = sorted(ewf_table, key=lambda b: b.lower)
+    for band in sorted_bands:
+        upper = band.upper if band.upper is not None else Decimal("Infinity")
+        if band.lower <= woz_value <= upper:
+            if band.fixed_amount is not None and band.excess_percentage is not None:
+                threshold = band.threshold if band.threshold is not None else band.lower
+                excess = max(Decimal("0"), woz_value - threshold)
+                return (band.fixed_amount + excess * band.excess_percentage).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+            if band.percentage is not None:
+                return (woz_value * band.percentage).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+            return Decimal("0")
+    raise ValueError(woz_value)
+
+
+def _tijd(fn, waarden) -> float:
+    return min(timeit.repeat(lambda: [fn(w) for w in waarden], number=1, repeat=5))
+
+
+def main() -> None:
+    aantal = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    rng = random.Random(0)
+    rules = load_rules(2026)
+    inkomens = [Decimal(rng.randint(0, 25_000_000)) / 100 for _ in range(aantal)]
+    wozen = [Decimal(rng.randint(0, 3_000_000)) for _ in range(aantal)]
+
+    paren = [
+        ("marginaal tarief",
+         lambda i: _walk_marginal_rate(i, rules.tax_brackets_box1),
+         lambda i: calculate_marginal_rate(i, rules.tax_table_box1), inkomens),
+        ("belasting op inkomen",
+         lambda i: _walk_tax_on_income(i, rules.tax_brackets_box1),
+         lambda i: calculate_tax_on_income(i, rules.tax_table_box1), inkomens),
+        ("eigenwoningforfait",
+         lambda w: ewf_voor(w, rules.ewf_table),
+         lambda w: calculate_ewf(w, rules.ewf_lookup, 2026), wozen),
+    ]
+
+    print(f"{aantal} aanroepen per functie")
+    print(f"{'functie':<22} {'voor (ms)':>10} {'na (ms)':>10} {'factor':>7}")
+    for naam, voor, na, waarden in paren:
+        assert [voor(w) for w in waarden] == [na(w) for w in waarden], naam
+        t_voor, t_na = _tijd(voor, waarden), _tijd(na, waarden)
+        print(f"{naam:<22} {t_voor * 1e3:>10.1f} {t_na * 1e3:>10.1f} {t_voor / t_na:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
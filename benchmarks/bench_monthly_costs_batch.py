@@ -0,0 +1,89 @@
+"""
+Benchmark: POST /calculate/monthly-costs/batch vs losse /calculate/monthly-costs.
+
+Eén huishouden (twee partners) tegen N leningstructuren met verschillende
+rentes, splitsingen en WOZ-waarden, zoals het vergelijkingsscherm ze stuurt.
+Meet via de app in-process (TestClient):
+- voor: N losse requests (elk valideert partners en rekent EWF/tarieven)
+- na:   één batch-request (Decimal- en fast-engine)
+
+Controleert vooraf dat de batch-resultaten gelijk zijn aan de losse
+responses en rapporteert de kosten per variant.
+
+Gebruik (vanuit project root):
+    python benchmarks/bench_monthly_costs_batch.py [aantal_varianten]
+"""
+
+import logging
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HUISHOUDEN = {
+    "fiscal_year": 2026,
+    "woz_value": 450000,
+    "partners": [
+        {"id": "partner1", "taxable_income": 90000, "age": 38},
+        {"id": "partner2", "taxable_income": 45000, "age": 36},
+    ],
+    "partner_distribution": {"method": "optimize"},
+}
+
+
+def varianten(aantal: int) -> list[dict]:
+    """Leningstructuren: rente, verhouding annuïtair/lineair en WOZ variëren."""
+    result = []
+    for i in range(aantal):
+        annuitair = 350000 - 25000 * (i % 6)
+        result.append({
+            "woz_value": 425000 + 25000 * (i % 3),
+            "loan_parts": [
+                {"id": "annuiteit", "principal": annuitair, "interest_rate": 3.5 + 0.1 * i,
+                 "term_years": 30, "loan_type": "annuity"},
+                {"id": "lineair", "principal": 400000 - annuitair, "interest_rate": 3.9,
+                 "term_years": 30, "loan_type": "linear"},
+            ],
+        })
+    return result
+
+
+def main() -> None:
+    aantal = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    # Pas hier importeren: de app laadt alle routers
+    from fastapi.testclient import TestClient
+
+    import app as app_module
+
+    if getattr(app_module, "limiter", None) is not None:
+        app_module.limiter.enabled = False
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    client = TestClient(app_module.app)
+
+    batch = {**HUISHOUDEN, "variants": varianten(aantal)}
+    losse = [{**HUISHOUDEN, **v} for v in batch["variants"]]
+
+    def voor():
+        return [client.post("/calculate/monthly-costs", json=body).json() for body in losse]
+
+    def na(engine="decimal"):
+        return client.post(f"/calculate/monthly-costs/batch?engine={engine}", json=batch).json()
+
+    assert na()["results"] == voor()
+
+    t_voor = min(timeit.repeat(voor, number=1, repeat=5))
+    t_na = min(timeit.repeat(na, number=1, repeat=5))
+    t_fast = min(timeit.repeat(lambda: na("fast"), number=1, repeat=5))
+
+    print(f"{aantal} varianten")
+    print(f"losse requests:  {t_voor * 1e3:7.1f} ms  ({t_voor / aantal * 1e3:.2f} ms per variant)")
+    print(f"batch (decimal): {t_na * 1e3:7.1f} ms  ({t_na / aantal * 1e3:.2f} ms per variant, "
+          f"{t_voor / t_na:.1f}x)")
+    print(f"batch (fast):    {t_fast * 1e3:7.1f} ms  ({t_fast / aantal * 1e3:.2f} ms per variant, "
+          f"{t_voor / t_fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark: portefeuille-stresstest per dossier vs in chunks.
+
+Vergelijkt:
+- scalair:  per dossier twee maal risk_scenarios._bereken_scenario (basis en
+            schok) met projecteer_hypotheekdelen — wat een lus over
+            /calculate/risk-scenarios zou doen
+- chunks:   portfolio_stress.stress_test (projecteer_batch +
+            calculate_batch per chunk, chunks op de rekenpool)
+
+en controleert vooraf dat beide dezelfde stressuitkomst geven. De
+resultaatcache van calculate() staat uit.
+
+Gebruik (vanuit project root):
+    python benchmarks/bench_portfolio_stress.py [aantal]
+"""
+
+import json
+import os
+import sys
+import timeit
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dateutil.relativedelta import relativedelta  # noqa: E402
+
+import calculator_final  # noqa: E402
+from bench_calculate_batch import genereer_invoeren  # noqa: E402
+from loan_projection import projecteer_hypotheekdelen  # noqa: E402
+from portfolio_stress import Schok, lees_ndjson, stress_test  # noqa: E402
+from risk_scenarios import _bereken_scenario  # noqa: E402
+
+SCHOK = Schok(toetsrente_delta=0.01, inkomen_factor_partner=0.0, horizon_maanden=12)
+
+
+def genereer_dossiers(aantal: int) -> list[str]:
+    return [json.dumps({
+        "id": i,
+        "hypotheek_delen": invoer["hypotheek_delen"],
+        "inkomen_aanvrager_huidig": invoer["hoofd_inkomen_aanvrager"],
+        "inkomen_partner_huidig": invoer["hoofd_inkomen_partner"],
+        "alleenstaande": invoer["alleenstaande"],
+        "energielabel": invoer["energielabel"],
+        "verduurzamings_maatregelen": invoer["verduurzamings_maatregelen"],
+        "toetsrente": 0.05,
+    }) for i, invoer in enumerate(genereer_invoeren(aantal))]
+
+
+def scalair(regels: list[str]) -> list[dict]:
+    vandaag = date.today()
+    peildatum = vandaag + relativedelta(months=SCHOK.horizon_maanden)
+    uitkomsten = []
+    for tekst in regels:
+        d = json.loads(tekst)
+        delen = d["hypotheek_delen"]
+        args = dict(alleenstaande=d["alleenstaande"], ontvangt_aow="NEE",
+                    energielabel=d["energielabel"],
+                    verduurzamings_maatregelen=d["verduurzamings_maatregelen"], limieten_bkr=0,
+                    studievoorschot=0, erfpacht=0, jaarlast=0,
+                    geadviseerd=sum(deel["hoofdsom_box1"] for deel in delen))
+        _bereken_scenario("basis", "basis", "dossier", delen, d["inkomen_aanvrager_huidig"],
+                          d["inkomen_partner_huidig"], toetsrente=d["toetsrente"],
+                          peildatum=vandaag, **args)
+        stress = _bereken_scenario(
+            SCHOK.naam, "stress", "dossier",
+            projecteer_hypotheekdelen(delen, SCHOK.horizon_maanden, peildatum),
+            d["inkomen_aanvrager_huidig"] * SCHOK.inkomen_factor_aanvrager,
+            d["inkomen_partner_huidig"] * SCHOK.inkomen_factor_partner,
+            toetsrente=d["toetsrente"] + SCHOK.toetsrente_delta, peildatum=peildatum, **args,
+        )
+        uitkomsten.append(stress)
+    return uitkomsten
+
+
+def main() -> None:
+    aantal = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    calculator_final.RESULTAAT_CACHE.maxsize = 0
+    regels = genereer_dossiers(aantal)
+
+    verwacht = scalair(regels)
+    chunks = list(stress_test(lees_ndjson(regels), SCHOK))
+    assert [c["max_hypotheek_annuitair"] for c in chunks] == [
+        v["max_hypotheek_annuitair"] for v in verwacht]
+    print(f"Chunks == scalair voor {aantal} dossiers")
+
+    t_scalair = min(timeit.repeat(lambda: scalair(regels), number=1, repeat=3))
+    t_chunks = min(timeit.repeat(lambda: list(stress_test(lees_ndjson(regels), SCHOK)),
+                                 number=1, repeat=3))
+    for label, t in (("Scalair", t_scalair), ("Chunks", t_chunks)):
+        print(f"{label:<8} {t * 1e3:9.1f} ms  {t / aantal * 1e6:8.2f} µs/dossier  "
+              f"{t_scalair / t:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark: gevoeligheidsgrid (calculator_batch.calculate_grid) vs
+calculate() per cel, voor een 20×20 grid toetsrente × inkomen.
+
+Gebruik (vanuit project root):
+    python benchmarks/bench_sensitivity.py
+"""
+
+import json
+import os
+import sys
+import timeit
+from itertools import product
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from calculator_batch import calculate_grid  # noqa: E402
+from calculator_final import calculate  # noqa: E402
+
+
+def main() -> None:
+    with open(os.path.join(ROOT, 'docs', 'example_request.json'), encoding='utf-8') as f:
+        basis = json.load(f)
+
+    assen = [
+        ('c_toets_rente', [0.03 + i * 0.0025 for i in range(20)]),
+        ('hoofd_inkomen_aanvrager', [30_000 + i * 5_000 for i in range(20)]),
+    ]
+
+    def per_cel():
+        return [calculate(dict(basis, c_toets_rente=r, hoofd_inkomen_aanvrager=i))
+                for r, i in product(*(w for _, w in assen))]
+
+    grid = calculate_grid(basis, assen)
+    referentie = [c['scenario1']['annuitair']['max_box1'] for c in per_cel()]
+    assert [x for rij in grid['annuitair']['max_box1'] for x in rij] == referentie
+    print("Grid == calculate() per cel (400 cellen)")
+
+    n = 20
+    t_cel = min(timeit.repeat(per_cel, number=n, repeat=5)) / n
+    t_grid = min(timeit.repeat(lambda: calculate_grid(basis, assen), number=n, repeat=5)) / n
+
+    print(f"Per cel: {t_cel * 1e3:7.2f} ms")
+    print(f"Grid:    {t_grid * 1e3:7.2f} ms")
+    print(f"Speedup: {t_cel / t_grid:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark: WIA/WW-uitkering per persoon in risk_scenarios, voor en na de tijdlijn.
+
+Per persoon (willekeurig inkomen, AO%, arbeidsverleden):
+- voor: wat bereken_ao_scenarios / bereken_werkloosheid_scenarios vroeger
+  deden: bereken_wia_bruto_jaar voor "lgu" en "na_lgu" plus
+  _bereken_lgu_duur, resp. bereken_ww_duur plus bereken_ww_bruto_jaar
+- na (koud): één wia_tijdlijn / ww_tijdlijn opbouwen en de fasen samplen
+- na (cache): idem met de tijdlijn al in de cache (zelfde persoon in een
+  volgende familie of request); houd aantal onder de cachegrootte (1024)
+
+Controleert vooraf dat de gebruikte bedragen exact gelijk zijn.
+
+Gebruik (vanuit project root):
+    python benchmarks/bench_uitkering_tijdlijn.py [aantal]
+"""
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from uitkering_tijdlijn import wia_tijdlijn, ww_tijdlijn  # noqa: E402
+from wia_calculator import _bereken_lgu_duur, bereken_wia_bruto_jaar  # noqa: E402
+from ww_calculator import bereken_ww_bruto_jaar, bereken_ww_duur  # noqa: E402
+
+WIA_VELDEN = ("status", "uwv_uitkering_bruto_jaar", "totaal_bruto_jaar")
+WW_VELDEN = ("ww_month_wage", "ww_benefit_gross_year")
+
+
+def wia_voor(p):
+    lgu = bereken_wia_bruto_jaar(fase="lgu", **p)
+    na_lgu = bereken_wia_bruto_jaar(fase="na_lgu", **p)
+    duur = _bereken_lgu_duur(p["employment_history_years_to_2015"],
+                             p["employment_history_years_from_2016"])
+    return [lgu[k] for k in WIA_VELDEN], [na_lgu[k] for k in WIA_VELDEN], duur
+
+
+def wia_na(p, bouw=wia_tijdlijn):
+    tijdlijn = bouw(**p)
+    lgu, na_lgu = tijdlijn.fase("lgu"), tijdlijn.fase("na_lgu")
+    return [lgu[k] for k in WIA_VELDEN], [na_lgu[k] for k in WIA_VELDEN], tijdlijn.lgu_duur
+
+
+def ww_voor(p):
+    duur = bereken_ww_duur(**{k: v for k, v in p.items() if k != "sv_loon_jaar"})
+    result = bereken_ww_bruto_jaar(ww_maand_nummer=3, **p)
+    return [result[k] for k in WW_VELDEN], duur
+
+
+def ww_na(p, bouw=ww_tijdlijn):
+    tijdlijn = bouw(**p)
+    result = tijdlijn.bruto_jaar(3)
+    return [result[k] for k in WW_VELDEN], tijdlijn.duur
+
+
+def _tijd(fn, personen) -> float:
+    return min(timeit.repeat(lambda: [fn(p) for p in personen], number=1, repeat=5))
+
+
+def main() -> None:
+    aantal = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    rng = random.Random(0)
+    wia_personen, ww_personen = [], []
+    for _ in range(aantal):
+        sv_loon = rng.randint(20_000, 120_000)
+        ao = rng.choice([40, 50, 60, 70])
+        wia_personen.append(dict(
+            ao_percentage=ao, sv_loon_jaar=sv_loon,
+            feitelijk_loon_maand=sv_loon / 12 * (1 - ao / 100) * 0.5,
+            employment_history_years_to_2015=rng.randint(0, 20),
+            employment_history_years_from_2016=rng.randint(0, 10),
+        ))
+        ww_personen.append(dict(
+            sv_loon_jaar=sv_loon,
+            employment_years_total_relevant=rng.randint(0, 30),
+            employment_years_pre2016_above10=rng.randint(0, 10),
+            employment_years_from2016_above10=rng.randint(0, 10),
+        ))
+
+    paren = [
+        ("WIA (lgu + na_lgu)", wia_voor, wia_na, wia_tijdlijn, wia_personen),
+        ("WW (duur + maand 3)", ww_voor, ww_na, ww_tijdlijn, ww_personen),
+    ]
+
+    print(f"{aantal} personen")
+    print(f"{'uitkering':<22} {'voor (ms)':>10} {'koud (ms)':>10} {'cache (ms)':>11} {'factor':>7}")
+    for naam, voor, na, bouw, personen in paren:
+        assert [voor(p) for p in personen] == [na(p) for p in personen], naam
+        koud = lambda p: na(p, bouw=bouw.__wrapped__)  # noqa: E731
+        t_voor, t_koud, t_cache = _tijd(voor, personen), _tijd(koud, personen), _tijd(na, personen)
+        print(f"{naam:<22} {t_voor * 1e3:>10.1f} {t_koud * 1e3:>10.1f} {t_cache * 1e3:>11.1f} "
+              f"{t_voor / t_koud:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Micro-benchmark: woonquote lookup (lineaire scan vs bisect-index).
+
+Vergelijkt de oorspronkelijke implementatie van lookup_woonquote (sorteren
++ lineair zoeken per call) met de gecompileerde WOONQUOTE_INDEX, en
+controleert dat beide voor elke tabelcel hetzelfde antwoord geven.
+
+Gebruik (vanuit project root):
+    python benchmarks/bench_woonquote.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculator_final import WOONQUOTE_TABLES, lookup_woonquote  # noqa: E402
+
+
+def lookup_woonquote_lineair(toets_inkomen: float, toets_rente: float, ontvangt_aow: str, is_box3: bool) -> float:
+    """Oorspronkelijke implementatie (vóór WOONQUOTE_INDEX), ter referentie."""
+    if ontvangt_aow == 'JA':
+        table_key = 'cWqVnfAowCons' if is_box3 else 'cWqVnfAow'
+    else:
+        table_key = 'cWqTotAowCons' if is_box3 else 'cWqTotAow'
+
+    table = WOONQUOTE_TABLES[table_key]
+
+    income_keys = sorted([float(k) for k in table.keys()])
+    selected_income = income_keys[0]
+    for income in income_keys:
+        if toets_inkomen >= income:
+            selected_income = income
+        else:
+            break
+
+    row_data = None
+    for key in table.keys():
+        if float(key) == selected_income:
+            row_data = table[key]
+            break
+
+    rate_keys = sorted([float(k) for k in row_data.keys()])
+    selected_rate = rate_keys[-1]
+    for rate in rate_keys:
+        if toets_rente <= rate:
+            selected_rate = rate
+            break
+
+    for key in row_data.keys():
+        if float(key) == selected_rate:
+            return row_data[key]
+
+    raise KeyError(f"Rate {selected_rate} not found")
+
+
+TABLES = [('NEE', False), ('NEE', True), ('JA', False), ('JA', True)]
+
+
+def verifieer_alle_cellen() -> int:
+    """Controleer elke cel (en de randen ertussen) in alle vier tabellen."""
+    gecontroleerd = 0
+    for ontvangt_aow, is_box3 in TABLES:
+        if ontvangt_aow == 'JA':
+            table = WOONQUOTE_TABLES['cWqVnfAowCons' if is_box3 else 'cWqVnfAow']
+        else:
+            table = WOONQUOTE_TABLES['cWqTotAowCons' if is_box3 else 'cWqTotAow']
+        for income_key, row in table.items():
+            inkomen = float(income_key)
+            for rate_key in row:
+                rente = float(rate_key)
+                for ink in (inkomen, inkomen + 0.5, inkomen - 0.5):
+                    for r in (rente, rente - 0.0001, rente + 0.0001):
+                        oud = lookup_woonquote_lineair(ink, r, ontvangt_aow, is_box3)
+                        nieuw = lookup_woonquote(ink, r, ontvangt_aow, is_box3)
+                        if oud != nieuw:
+                            raise AssertionError(
+                                f"Verschil bij inkomen={ink}, rente={r}, "
+                                f"aow={ontvangt_aow}, box3={is_box3}: {oud} != {nieuw}"
+                            )
+                        gecontroleerd += 1
+    return gecontroleerd
+
+
+def main() -> None:
+    aantal = verifieer_alle_cellen()
+    print(f"Gelijk voor {aantal} lookups (alle cellen + randen, 4 tabellen)")
+
+    # Typische toets-inkomens/rentes uit risico-scenario's en grafieken
+    args = [(ink, r, aow, box3)
+            for ink in (24000, 52000, 87500, 140000)
+            for r in (0.01, 0.0466, 0.0625, 0.08)
+            for aow, box3 in TABLES]
+
+    def run(fn):
+        for a in args:
+            fn(*a)
+
+    n = 200
+    t_oud = min(timeit.repeat(lambda: run(lookup_woonquote_lineair), number=n, repeat=5))
+    t_nieuw = min(timeit.repeat(lambda: run(lookup_woonquote), number=n, repeat=5))
+    per_call = n * len(args)
+
+    print(f"Lineair: {t_oud / per_call * 1e6:8.2f} µs/lookup")
+    print(f"Bisect:  {t_nieuw / per_call * 1e6:8.2f} µs/lookup")
+    print(f"Speedup: {t_oud / t_nieuw:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""
+Golden-master benchmarkharnas (pytest-benchmark-stijl, zonder externe plugin).
+
+De fixture ``benchmark`` meet per functie:
+- latency: min/max/mean/median/stddev over een aantal rondes, elke ronde
+  gekalibreerd op minimaal ``--bench-min-time`` seconden
+- geheugen: piek aan traced allocaties (tracemalloc) en aantal blokken dat
+  na de aanroep nog leeft, over één aanroep
+- golden master: sha256 over de canonieke JSON van de uitkomst
+
+De golden master (sha256 per benchmark) is machine-onafhankelijk en staat in
+git: benchmarks/golden_master.json. Een benchmark faalt als zijn uitkomst
+daarvan afwijkt of als hij er niet in staat. "Vandaag" staat tijdens de
+benchmarks vast op PEILDATUM, zodat de uitkomsten niet met de datum meelopen.
+
+Resultaten gaan naar benchmarks/results/latest.json. Met ``--bench-save``
+worden ze ook de latency-baseline (default benchmarks/results/baseline.json,
+niet in git) en wordt de golden master bijgewerkt. Bestaat er een baseline,
+dan faalt een benchmark ook als latency (min) of geheugenpiek meer dan
+``--bench-threshold`` (default 0.25, of env BENCH_THRESHOLD) boven de
+baseline ligt; zonder baseline meldt de samenvatting dat alleen de golden
+master gecontroleerd is.
+
+Latency is machine-afhankelijk: leg de baseline vast op dezelfde machine als
+waarop vergeleken wordt, en verhoog de drempel op gedeelde of drukke hosts.
+
+Gebruik (vanuit project root):
+    python -m pytest benchmarks --bench-save     # baseline en golden master vastleggen
+    python -m pytest benchmarks                  # vergelijken
+"""
+
+import gc
+import hashlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+import anw_nabestaanden
+import aow_calculator
+import calculator_final
+import risk_scenarios
+
+RESULTS_DIR = Path(__file__).parent / "results"
+GOLDEN_MASTER = Path(__file__).parent / "golden_master.json"
+PEILDATUM = date(2026, 1, 1)
+
+_resultaten: dict = {}
+_zonder_baseline: list = []
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("bench", "golden-master benchmarks")
+    group.addoption("--bench-save", action="store_true",
+                    help="Sla de resultaten op als nieuwe baseline")
+    group.addoption("--bench-baseline", default=str(RESULTS_DIR / "baseline.json"),
+                    help="Pad van de baseline (JSON)")
+    group.addoption("--bench-threshold", type=float,
+                    default=float(os.environ.get("BENCH_THRESHOLD", "0.25")),
+                    help="Toegestane relatieve regressie (0.25 = 25%%)")
+    group.addoption("--bench-rounds", type=int, default=20,
+                    help="Aantal meetrondes per benchmark")
+    group.addoption("--bench-min-time", type=float, default=0.01,
+                    help="Minimale duur van één ronde in seconden")
+
+
+def _digest(uitkomst) -> str:
+    """sha256 over de canonieke JSON van een uitkomst (pydantic-modellen via model_dump)."""
+    if hasattr(uitkomst, "model_dump"):
+        uitkomst = uitkomst.model_dump(mode="json")
+    canoniek = json.dumps(uitkomst, sort_keys=True, separators=(",", ":"), default=repr)
+    return hashlib.sha256(canoniek.encode("utf-8")).hexdigest()
+
+
+def _laad_golden_master() -> dict:
+    try:
+        with open(GOLDEN_MASTER, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _laad_baseline(pad: str) -> dict:
+    try:
+        with open(pad, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+class Benchmark:
+    """Callable fixture: ``benchmark(func, *args, **kwargs)`` meet en geeft de uitkomst terug."""
+
+    def __init__(self, naam: str, rounds: int, min_time: float,
+                 basis: Optional[dict] = None, drempel: float = 0.25,
+                 golden: Optional[str] = None, opslaan: bool = False):
+        self.naam = naam
+        self.rounds = rounds
+        self.min_time = min_time
+        self.basis = basis
+        self.drempel = drempel
+        self.golden = golden
+        self.opslaan = opslaan
+        self.stats = None
+
+    def _kalibreer(self, aanroep) -> int:
+        iteraties = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(iteraties):
+                aanroep()
+            if time.perf_counter() - start >= self.min_time:
+                return iteraties
+            iteraties *= 2
+
+    def __call__(self, func, *args, **kwargs):
+        def aanroep():
+            return func(*args, **kwargs)
+
+        uitkomst = aanroep()          # warm-up en golden master
+        iteraties = self._kalibreer(aanroep)
+
+        tijden = []
+        for _ in range(self.rounds):
+            start = time.perf_counter()
+            for _ in range(iteraties):
+                aanroep()
+            tijden.append((time.perf_counter() - start) / iteraties)
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            voor, _ = tracemalloc.get_traced_memory()
+            blokken_voor = sys.getallocatedblocks()
+            behouden = aanroep()
+            blokken_na = sys.getallocatedblocks()
+            _, piek = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del behouden
+
+        self.stats = {
+            "min": min(tijden),
+            "max": max(tijden),
+            "mean": statistics.fmean(tijden),
+            "median": statistics.median(tijden),
+            "stddev": statistics.stdev(tijden) if len(tijden) > 1 else 0.0,
+            "rounds": self.rounds,
+            "iterations": iteraties,
+            "peak_bytes": piek - voor,
+            "retained_blocks": blokken_na - blokken_voor,
+            "output_sha256": _digest(uitkomst),
+        }
+        _resultaten[self.naam] = self.stats
+        if not self.opslaan:
+            self._vergelijk()
+        return uitkomst
+
+    def _vergelijk(self) -> None:
+        """Faal bij afwijkende uitkomst of regressie boven de drempel t.o.v. de baseline."""
+        fouten = []
+        if self.golden is None:
+            fouten.append(f"geen golden master in {GOLDEN_MASTER.name}; "
+                          "leg vast met --bench-save")
+        elif self.stats["output_sha256"] != self.golden:
+            fout = "uitkomst wijkt af van de golden master"
+            if _laad_golden_master().get("config_versie") != calculator_final.CONFIG_VERSIE:
+                fout += " (andere configversie: na een bewuste configwijziging --bench-save)"
+            fouten.append(fout)
+        if self.basis is None:
+            _zonder_baseline.append(self.naam)
+        else:
+            fouten.extend(self._regressies())
+        if fouten:
+            pytest.fail(f"{self.naam}: " + "; ".join(fouten), pytrace=False)
+
+    def _regressies(self) -> list:
+        """Latency en geheugenpiek boven de drempel t.o.v. de baseline."""
+        basis, drempel = self.basis, self.drempel
+        fouten = []
+        if self.stats["min"] > basis["min"] * (1 + drempel):
+            fouten.append(f"latency {self.stats['min'] * 1e6:.1f} µs > "
+                          f"baseline {basis['min'] * 1e6:.1f} µs + {drempel:.0%}")
+        if self.stats["peak_bytes"] > basis["peak_bytes"] * (1 + drempel):
+            fouten.append(f"geheugenpiek {self.stats['peak_bytes']} B > "
+                          f"baseline {basis['peak_bytes']} B + {drempel:.0%}")
+        return fouten
+
+
+@pytest.fixture(autouse=True)
+def _zonder_resultaatcache(monkeypatch):
+    """Meet de rekenkern, niet de LRU-cache van calculate()."""
+    monkeypatch.setattr(calculator_final.RESULTAAT_CACHE, "maxsize", 0)
+
+
+class _VasteDatum(date):
+    """date met een vaste today() (PEILDATUM)."""
+
+    @classmethod
+    def today(cls) -> date:
+        return PEILDATUM
+
+
+@pytest.fixture(autouse=True)
+def _vaste_peildatum(monkeypatch):
+    """Risico-scenario's rekenen vanaf vandaag; de golden master mag daar niet van afhangen."""
+    for module in (risk_scenarios, aow_calculator, anw_nabestaanden):
+        monkeypatch.setattr(module, "date", _VasteDatum)
+
+
+@pytest.fixture
+def benchmark(request):
+    config = request.config
+    opslaan = config.getoption("--bench-save")
+    baseline = {} if opslaan else _laad_baseline(config.getoption("--bench-baseline"))
+    return Benchmark(
+        request.node.name, config.getoption("--bench-rounds"), config.getoption("--bench-min-time"),
+        basis=baseline.get("benchmarks", {}).get(request.node.name),
+        drempel=config.getoption("--bench-threshold"),
+        golden=_laad_golden_master().get("output_sha256", {}).get(request.node.name),
+        opslaan=opslaan,
+    )
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not _resultaten:
+        return
+    config = session.config
+    inhoud = {
+        "machine_info": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "datetime": datetime.now(timezone.utc).isoformat(),
+        "config_versie": calculator_final.CONFIG_VERSIE,
+        "benchmarks": dict(sorted(_resultaten.items())),
+    }
+    RESULTS_DIR.mkdir(exist_ok=True)
+    paden = [RESULTS_DIR / "latest.json"]
+    if config.getoption("--bench-save"):
+        paden.append(Path(config.getoption("--bench-baseline")))
+        golden = _laad_golden_master()
+        golden["peildatum"] = PEILDATUM.isoformat()
+        golden["config_versie"] = calculator_final.CONFIG_VERSIE
+        golden.setdefault("output_sha256", {}).update(
+            {naam: s["output_sha256"] for naam, s in _resultaten.items()})
+        golden["output_sha256"] = dict(sorted(golden["output_sha256"].items()))
+        with open(GOLDEN_MASTER, "w", encoding="utf-8") as f:
+            json.dump(golden, f, indent=2)
+            f.write("\n")
+    for pad in paden:
+        with open(pad, "w", encoding="utf-8") as f:
+            json.dump(inhoud, f, indent=2)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if not _resultaten:
+        return
+    terminalreporter.section("golden-master benchmarks")
+    terminalreporter.write_line(
+        f"{'naam':<44} {'min (µs)':>10} {'median (µs)':>12} {'piek (KiB)':>11} {'iter':>6}")
+    for naam, s in sorted(_resultaten.items()):
+        terminalreporter.write_line(
+            f"{naam:<44} {s['min'] * 1e6:>10.1f} {s['median'] * 1e6:>12.1f} "
+            f"{s['peak_bytes'] / 1024:>11.1f} {s['iterations']:>6}")
+    terminalreporter.write_line(f"Resultaten: {RESULTS_DIR / 'latest.json'}")
+    if _zonder_baseline:
+        terminalreporter.write_line(
+            f"Geen latency-baseline voor {len(_zonder_baseline)} benchmark(s): latency en "
+            f"geheugen niet vergeleken, alleen de golden master "
+            f"(leg een baseline vast met --bench-save).", yellow=True)
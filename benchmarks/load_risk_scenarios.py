@@ -0,0 +1,161 @@
+"""
+Loadtest: latency van andere endpoints terwijl /calculate/risk-scenarios belast wordt.
+
+Draait de app in-process (httpx ASGITransport, zelfde event loop als een
+uvicorn-worker) en meet per executor-modus (rekenpool.py):
+- p50/p99 van GET /health zonder belasting
+- p50/p99 van GET /health terwijl ``--gelijktijdig`` clients continu
+  risk-scenarios posten
+- doorvoer van risk-scenarios (requests/s)
+
+Modus "inline" is het oude gedrag (rekenen op de event loop) en dient als
+referentie. Faalt (exit 1) als de p99 van /health onder belasting in een
+gecontroleerde modus meer dan ``--max-factor`` keer de onbelaste p99 is
+(met een ondergrens van ``--min-p99-ms``).
+
+Rate limiting en de resultaatcache van calculate() worden voor de duur van
+de test uitgezet (anders meet elke herhaling van de payload de cache).
+
+Gebruik (vanuit project root):
+    python benchmarks/load_risk_scenarios.py [--modi inline,thread,process]
+        [--duur 5] [--gelijktijdig 4] [--max-factor 3] [--min-p99-ms 25]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+
+import calculator_final  # noqa: E402
+import rekenpool  # noqa: E402
+
+RISK_PAYLOAD = {
+    "hypotheek_delen": [
+        {"aflos_type": "Aflosvrij", "org_lpt": 360, "rest_lpt": 360, "hoofdsom_box1": 145000,
+         "rvp": 120, "werkelijke_rente": 0.05, "rente_aftrekbaar_tot": "2056-03-01"},
+        {"aflos_type": "Annuïteit", "org_lpt": 360, "rest_lpt": 360, "hoofdsom_box1": 120000,
+         "rvp": 120, "werkelijke_rente": 0.05, "rente_aftrekbaar_tot": "2056-03-01"},
+        {"aflos_type": "Lineair", "org_lpt": 300, "rest_lpt": 300, "hoofdsom_box1": 85000,
+         "rvp": 120, "werkelijke_rente": 0.03, "rente_aftrekbaar_tot": "2051-03-01"},
+    ],
+    "ingangsdatum_hypotheek": "2026-03-01",
+    "geboortedatum_aanvrager": "1980-04-01",
+    "inkomen_aanvrager_huidig": 80000,
+    "inkomen_aanvrager_aow": 34342,
+    "alleenstaande": "NEE",
+    "geboortedatum_partner": "1985-06-15",
+    "inkomen_partner_huidig": 40000,
+    "inkomen_partner_aow": 23342,
+    "nabestaandenpensioen_bij_overlijden_aanvrager": 18000,
+    "nabestaandenpensioen_bij_overlijden_partner": 7500,
+    "inkomen_loondienst_aanvrager": 80000,
+    "inkomen_loondienst_partner": 40000,
+    "arbeidsverleden_jaren_totaal_aanvrager": 15,
+    "arbeidsverleden_pre2016_boven10_aanvrager": 1,
+    "arbeidsverleden_vanaf2016_boven10_aanvrager": 4,
+    "arbeidsverleden_jaren_totaal_partner": 8,
+    "toetsrente": 0.04664,
+    "geadviseerd_hypotheekbedrag": 338173,
+}
+
+
+def _percentiel(waarden: list[float], p: float) -> float:
+    if len(waarden) < 2:
+        return waarden[0] if waarden else 0.0
+    return statistics.quantiles(waarden, n=100, method="inclusive")[int(p) - 1]
+
+
+async def _probe(client: httpx.AsyncClient, stop: asyncio.Event, interval: float) -> list[float]:
+    """GET /health met vaste tussenpozen tot stop; latencies in seconden."""
+    latencies = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        r = await client.get("/health")
+        latencies.append(time.perf_counter() - start)
+        assert r.status_code == 200, r.text
+        await asyncio.sleep(interval)
+    return latencies
+
+
+async def _belast(client: httpx.AsyncClient, stop: asyncio.Event) -> int:
+    aantal = 0
+    while not stop.is_set():
+        r = await client.post("/calculate/risk-scenarios", json=RISK_PAYLOAD)
+        assert r.status_code == 200, r.text
+        aantal += 1
+    return aantal
+
+
+async def _meet(app, duur: float, gelijktijdig: int, interval: float) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+        r = await client.post("/calculate/risk-scenarios", json=RISK_PAYLOAD)   # warm-up (en pool starten)
+        assert r.status_code == 200, r.text
+
+        stop = asyncio.Event()
+        probe = asyncio.create_task(_probe(client, stop, interval))
+        await asyncio.sleep(duur)
+        stop.set()
+        onbelast = await probe
+
+        stop = asyncio.Event()
+        probe = asyncio.create_task(_probe(client, stop, interval))
+        belasters = [asyncio.create_task(_belast(client, stop)) for _ in range(gelijktijdig)]
+        start = time.perf_counter()
+        await asyncio.sleep(duur)
+        stop.set()
+        belast = await probe
+        requests = sum(await asyncio.gather(*belasters))
+        verstreken = time.perf_counter() - start
+
+    return {
+        "onbelast_p50": _percentiel(onbelast, 50), "onbelast_p99": _percentiel(onbelast, 99),
+        "belast_p50": _percentiel(belast, 50), "belast_p99": _percentiel(belast, 99),
+        "risk_per_s": requests / verstreken,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--modi", default="inline,thread,process")
+    parser.add_argument("--duur", type=float, default=5.0, help="Seconden per meetfase")
+    parser.add_argument("--gelijktijdig", type=int, default=4, help="Aantal belastende clients")
+    parser.add_argument("--interval", type=float, default=0.01, help="Pauze tussen probes (s)")
+    parser.add_argument("--workers", type=int, default=None, help="NAT_REKEN_WORKERS (default: env)")
+    parser.add_argument("--max-factor", type=float, default=3.0)
+    parser.add_argument("--min-p99-ms", type=float, default=25.0)
+    args = parser.parse_args()
+
+    # Pas hier importeren: spawn-workers van de process pool laden dit script
+    # opnieuw en hebben de app niet nodig.
+    import app as app_module
+
+    if getattr(app_module, "limiter", None) is not None:
+        app_module.limiter.enabled = False
+    calculator_final.RESULTAAT_CACHE.maxsize = 0
+
+    print(f"{'modus':<8} {'health p50/p99 onbelast (ms)':>30} {'health p50/p99 belast (ms)':>28} {'risk req/s':>11}")
+    fouten = []
+    for modus in args.modi.split(","):
+        rekenpool.configureer(modus, args.workers)
+        r = asyncio.run(_meet(app_module.app, args.duur, args.gelijktijdig, args.interval))
+        print(f"{modus:<8} {r['onbelast_p50'] * 1e3:>14.2f} / {r['onbelast_p99'] * 1e3:<13.2f}"
+              f"{r['belast_p50'] * 1e3:>14.2f} / {r['belast_p99'] * 1e3:<11.2f} {r['risk_per_s']:>11.1f}")
+        grens = max(args.max_factor * r["onbelast_p99"], args.min_p99_ms / 1e3)
+        if modus != "inline" and r["belast_p99"] > grens:
+            fouten.append(f"{modus}: p99 {r['belast_p99'] * 1e3:.1f} ms > {grens * 1e3:.1f} ms")
+    rekenpool.afsluiten()
+
+    for fout in fouten:
+        print(f"FOUT {fout}")
+    return 1 if fouten else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+Golden-master benchmarks voor de NAT-rekenkern.
+
+Invoer: docs/example_request.json, de Harry Slinger-data uit tests/domain en
+de payloads van de monthly-costs integratietests. Zie benchmarks/conftest.py
+voor meting, opslag en regressiedrempel.
+
+Gebruik (vanuit project root):
+    python -m pytest benchmarks [--bench-save]
+"""
+
+import json
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+import calculator_final
+from loan_projection import projecteer_hypotheekdelen
+from monthly_costs.domain.calculator import MortgageCalculator
+from monthly_costs.schemas.input import MonthlyCostsRequest
+from risk_scenarios import (
+    bereken_ao_scenarios,
+    bereken_aow_scenarios,
+    bereken_overlijdens_scenarios,
+    bereken_werkloosheid_scenarios,
+)
+from tests.domain.test_risk_scenarios import HARRY_SLINGER_DELEN
+
+ROOT = Path(__file__).parent.parent
+
+with open(ROOT / "docs" / "example_request.json", "r", encoding="utf-8") as f:
+    EXAMPLE_REQUEST = json.load(f)
+
+# Hypotheekdelen uit de AO-, overlijdens- en werkloosheidstests
+SLINGER_DELEN_2026 = [
+    {"aflos_type": "Aflosvrij", "org_lpt": 360, "rest_lpt": 360, "hoofdsom_box1": 145000,
+     "hoofdsom_box3": 0, "rvp": 120, "inleg_overig": 0, "werkelijke_rente": 0.05},
+    {"aflos_type": "Annuiteit", "org_lpt": 360, "rest_lpt": 360, "hoofdsom_box1": 120000,
+     "hoofdsom_box3": 0, "rvp": 120, "inleg_overig": 0, "werkelijke_rente": 0.05},
+    {"aflos_type": "Lineair", "org_lpt": 300, "rest_lpt": 300, "hoofdsom_box1": 85000,
+     "hoofdsom_box3": 0, "rvp": 120, "inleg_overig": 0, "werkelijke_rente": 0.03},
+]
+
+MONTHLY_COSTS_REQUESTS = {
+    "single": {
+        "fiscal_year": 2026, "woz_value": 400000,
+        "loan_parts": [{"id": "main", "principal": 300000, "interest_rate": 4.5,
+                        "term_years": 30, "loan_type": "annuity", "box": 1}],
+        "partners": [{"id": "owner", "taxable_income": 60000, "age": 35}],
+    },
+    "two_partners": {
+        "fiscal_year": 2026, "woz_value": 450000,
+        "loan_parts": [{"id": "hypotheek", "principal": 350000, "interest_rate": 4.2,
+                        "term_years": 30, "loan_type": "annuity", "box": 1}],
+        "partners": [{"id": "partner1", "taxable_income": 90000, "age": 38},
+                     {"id": "partner2", "taxable_income": 45000, "age": 36}],
+        "partner_distribution": {"method": "optimize"},
+    },
+    "mixed_box1_box3": {
+        "fiscal_year": 2026, "woz_value": 500000,
+        "loan_parts": [
+            {"id": "box1_loan", "principal": 250000, "interest_rate": 4.0,
+             "term_years": 30, "loan_type": "annuity", "box": 1},
+            {"id": "box3_loan", "principal": 100000, "interest_rate": 4.5,
+             "term_years": 30, "loan_type": "interest_only", "box": 3},
+        ],
+        "partners": [{"id": "owner", "taxable_income": 80000, "age": 40}],
+    },
+}
+
+
+def test_calculate_example_request(benchmark):
+    resultaat = benchmark(calculator_final.calculate, EXAMPLE_REQUEST)
+    assert resultaat["scenario1"]["annuitair"]["max_box1"] > 0
+
+
+def test_calculate_stel_slinger(benchmark):
+    inputs = {
+        "hoofd_inkomen_aanvrager": 80000, "hoofd_inkomen_partner": 40000,
+        "alleenstaande": "NEE", "hypotheek_delen": HARRY_SLINGER_DELEN,
+        "gewijzigd_hoofd_inkomen_aanvrager2": 34342, "gewijzigd_hoofd_inkomen_partner2": 40000,
+    }
+    resultaat = benchmark(calculator_final.calculate, inputs)
+    assert resultaat["scenario2"] is not None
+
+
+def test_projecteer_hypotheekdelen(benchmark):
+    resultaat = benchmark(projecteer_hypotheekdelen, HARRY_SLINGER_DELEN, 255, date(2047, 4, 1))
+    assert len(resultaat) == 3
+
+
+def test_aow_scenarios(benchmark):
+    resultaat = benchmark(
+        bereken_aow_scenarios,
+        hypotheek_delen=HARRY_SLINGER_DELEN, ingangsdatum_hypotheek="2026-01-01",
+        geboortedatum_aanvrager="1980-01-01", inkomen_aanvrager_huidig=80000,
+        inkomen_aanvrager_aow=34342, alleenstaande="NEE", geboortedatum_partner="1985-01-01",
+        inkomen_partner_huidig=40000, inkomen_partner_aow=23342, toetsrente=0.04664,
+        energielabel="Geen (geldig) Label", geadviseerd_hypotheekbedrag=350000,
+    )
+    assert len(resultaat["scenarios"]) == 2
+
+
+def test_overlijdens_scenarios(benchmark):
+    resultaat = benchmark(
+        bereken_overlijdens_scenarios,
+        hypotheek_delen=SLINGER_DELEN_2026, geboortedatum_aanvrager="1980-04-01",
+        inkomen_aanvrager_huidig=80000, geboortedatum_partner="1985-06-15",
+        inkomen_partner_huidig=40000, nabestaandenpensioen_bij_overlijden_aanvrager=18000,
+        nabestaandenpensioen_bij_overlijden_partner=7500, heeft_kind_onder_18=True,
+        geboortedatum_jongste_kind="2018-03-20", toetsrente=0.04664,
+        geadviseerd_hypotheekbedrag=338173,
+    )
+    assert len(resultaat["scenarios"]) == 2
+
+
+def test_ao_scenarios(benchmark):
+    resultaat = benchmark(
+        bereken_ao_scenarios,
+        hypotheek_delen=SLINGER_DELEN_2026, ingangsdatum_hypotheek="2026-03-01",
+        geboortedatum_aanvrager="1980-04-01", alleenstaande="NEE",
+        geboortedatum_partner="1985-06-15", inkomen_loondienst_aanvrager=80000,
+        inkomen_loondienst_partner=40000, ao_percentage=50, benutting_rvc_percentage=50,
+        loondoorbetaling_pct_jaar2_aanvrager=0.70, loondoorbetaling_pct_jaar2_partner=0.70,
+        toetsrente=0.04664, geadviseerd_hypotheekbedrag=338173,
+    )
+    assert len(resultaat["scenarios"]) == 6
+
+
+def test_werkloosheid_scenarios(benchmark):
+    resultaat = benchmark(
+        bereken_werkloosheid_scenarios,
+        hypotheek_delen=SLINGER_DELEN_2026, ingangsdatum_hypotheek="2026-03-01",
+        geboortedatum_aanvrager="1980-04-01", alleenstaande="NEE",
+        geboortedatum_partner="1985-06-15", inkomen_loondienst_aanvrager=80000,
+        inkomen_loondienst_partner=40000, arbeidsverleden_jaren_totaal_aanvrager=15,
+        arbeidsverleden_pre2016_boven10_aanvrager=1, arbeidsverleden_vanaf2016_boven10_aanvrager=4,
+        arbeidsverleden_jaren_totaal_partner=8, arbeidsverleden_pre2016_boven10_partner=0,
+        arbeidsverleden_vanaf2016_boven10_partner=0, toetsrente=0.04664,
+        geadviseerd_hypotheekbedrag=338173,
+    )
+    assert resultaat["scenarios"]
+
+
+@pytest.mark.parametrize("naam", sorted(MONTHLY_COSTS_REQUESTS))
+def test_monthly_costs(benchmark, naam):
+    calculator = MortgageCalculator(2026)
+    request = MonthlyCostsRequest.model_validate(MONTHLY_COSTS_REQUESTS[naam])
+    resultaat = benchmark(calculator.calculate, request)
+    assert resultaat.fiscal_year == 2026
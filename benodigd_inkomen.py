@@ -0,0 +1,239 @@
+"""
+Benodigd inkomen — inverse van calculator_final voor max_box1
+
+Zoekt het minimale hoofdinkomen (aanvrager of partner) waarbij de maximale
+hypotheek box 1 (scenario 1) een doelbedrag haalt.
+
+Bij vaste leningdelen zijn toetsrente, correctie (F44), PMT-factor en
+T19–Y19 onafhankelijk van het inkomen. Per segment waarin de woonquote-rij
+(via het toets-inkomen) en de alleenstaand-correctie (C26/D26) constant zijn,
+is max_box1 dan affien in het inkomen:
+
+    max_box1 = N19 + O19 + (inkomen_totaal × WoonquoteBox1 + K) / D
+
+Het solver loopt de segmenten van laag naar hoog af, lost per segment exact
+op en verifieert de kandidaat met calculator_final.calculate.
+"""
+
+import math
+from typing import Any, Dict, List, Optional
+
+from calculator_final import (
+    WOONQUOTE_INDEX,
+    BerekeningInvoer,
+    _calculate,
+    calculate_c26_d26,
+    calculate_c73,
+    calculate_energielabel_bonus,
+    lookup_woonquote,
+    pmt,
+)
+
+# Velden die scenario 2 aansturen; voor het solver niet nodig
+_SCENARIO2_VELDEN = (
+    'gewijzigd_hoofd_inkomen_aanvrager2',
+    'gewijzigd_hoofd_inkomen_partner2',
+    'gewijzigd_hoofd_inkomen_aow2',
+    'inkomen_overige_aanvragers_min2',
+)
+
+# Maximaal aantal verfijningsstappen bij verificatie (afrondingsverschillen
+# en open segmentgrenzen zoals C26: inkomen > grens)
+_MAX_VERFIJNINGEN = 64
+
+
+def _toets_stukken(alleenstaande: str, a: tuple, p: tuple, factor: float) -> List[tuple]:
+    """
+    Toets-inkomen (M25) als lineaire stukken (c0, c1) van het onbekende inkomen x.
+
+    Alleenstaand: F16. Anders MAX(F16 + G16 × factor, G16 + F16 × factor).
+    """
+    if alleenstaande == 'JA':
+        return [a]
+    return [
+        (a[0] + p[0] * factor, a[1] + p[1] * factor),
+        (p[0] + a[0] * factor, p[1] + a[1] * factor),
+    ]
+
+
+def _segmentgrenzen(stukken: List[tuple], table_keys: tuple, alleenstaande: str,
+                    onbekend_basis: float, grenzen_c26: tuple) -> List[float]:
+    """Alle x >= 0 waar woonquote-rij, toets-stuk of C26/D26 kan wisselen."""
+    grenzen = set()
+    for table_key in table_keys:
+        inkomens, _ = WOONQUOTE_INDEX[table_key]
+        for c0, c1 in stukken:
+            if c1 > 0:
+                grenzen.update((k - c0) / c1 for k in inkomens)
+    if len(stukken) == 2:
+        (c0a, c1a), (c0b, c1b) = stukken
+        if c1a != c1b:
+            grenzen.add((c0b - c0a) / (c1a - c1b))
+    if alleenstaande == 'JA':
+        grenzen.update(g - onbekend_basis for g in grenzen_c26)
+    return sorted(g for g in grenzen if g > 0 and math.isfinite(g))
+
+
+def bereken_benodigd_inkomen(
+    inputs: Dict[str, Any],
+    doel_bedrag: float,
+    variant: str = 'annuitair',
+    onbekende: str = 'aanvrager',
+) -> Dict[str, Any]:
+    """
+    Minimaal hoofdinkomen waarbij max_box1 (scenario 1) >= doel_bedrag.
+
+    Args:
+        inputs: calculate()-invoer; het hoofdinkomen van de onbekende wordt genegeerd
+        doel_bedrag: gewenste maximale hypotheek (box 1)
+        variant: 'annuitair' of 'niet_annuitair'
+        onbekende: 'aanvrager' (hoofd_inkomen_aanvrager) of 'partner' (hoofd_inkomen_partner)
+
+    Returns:
+        Dict met benodigd_inkomen (None als onbereikbaar), toets_inkomen,
+        inkomen_totaal en max_box1 bij dat inkomen, en segmenten_doorzocht.
+
+    Raises:
+        ValueError: bij ongeldige combinatie of dezelfde rekenfouten als calculate()
+    """
+    if variant not in ('annuitair', 'niet_annuitair'):
+        raise ValueError(f"Onbekende variant '{variant}'")
+    if onbekende not in ('aanvrager', 'partner'):
+        raise ValueError(f"Onbekende '{onbekende}': kies 'aanvrager' of 'partner'")
+
+    alleenstaande = inputs.get('alleenstaande', 'JA')
+    ontvangt_aow = inputs.get('ontvangt_aow', 'NEE')
+    if onbekende == 'partner' and alleenstaande == 'JA':
+        raise ValueError("Partnerinkomen telt niet mee bij een alleenstaande aanvrager")
+
+    veld = f"hoofd_inkomen_{onbekende}"
+    basis = {k: v for k, v in inputs.items() if k not in _SCENARIO2_VELDEN}
+    basis[veld] = 0
+
+    invoer = BerekeningInvoer.uit_dict(basis)
+
+    # Inkomensonafhankelijke delen van calculate / calculate_scenario
+    delen = invoer.aggregaten
+    som_box1, som_box3 = delen.som_box1, delen.som_box3
+    aantal_niet_annuitair = delen.aantal_niet_annuitair
+
+    if som_box1 + som_box3 == 0:
+        toets_rente = round(invoer.c_actuele_10jr_rente, 5)
+    else:
+        toets_rente = round(round(delen.gewogen_rente, 25), 5)
+
+    if variant == 'niet_annuitair' and aantal_niet_annuitair > 0 and toets_rente == 0:
+        raise ValueError("Toetsrente is 0 — kan niet delen. Controleer invoer.")
+
+    studievoorschot = invoer.studievoorschot_studielening
+    correctie = (invoer.limieten_bkr_geregistreerd * 0.24 +
+                 invoer.limieten_niet_bkr_geregistreerd * 0.24 +
+                 invoer.erfpachtcanon_per_jaar * 12 +
+                 invoer.jaarlast_overige_kredieten * 12)
+    correctie += studievoorschot * 12 if som_box1 == 0 else calculate_c73(toets_rente, studievoorschot)
+
+    energielabel_bonus = calculate_energielabel_bonus(
+        invoer.energielabel, invoer.verduurzamings_maatregelen)
+    pmt_factor = -pmt(toets_rente / 12, invoer.c_lpt, 1, 0)
+
+    # Inkomens als lineaire functies (c0, c1) van x = hoofdinkomen van de onbekende
+    a0, p0, i0 = invoer.inkomens()
+    a = (a0, 1.0 if onbekende == 'aanvrager' else 0.0)
+    p = (p0, 1.0 if onbekende == 'partner' else 0.0)
+    onbekend_basis = a0 if onbekende == 'aanvrager' else p0
+
+    stukken = _toets_stukken(alleenstaande, a, p, invoer.c_factor_2e_inkomen)
+    table_keys = ('cWqVnfAow', 'cWqVnfAowCons') if ontvangt_aow == 'JA' else ('cWqTotAow', 'cWqTotAowCons')
+    grenzen = [0.0] + _segmentgrenzen(
+        stukken, table_keys, alleenstaande, onbekend_basis,
+        (0.0, invoer.c_alleen_grens_o, invoer.c_alleen_grens_b),
+    )
+
+    # Proefpunten gaan buiten RESULTAAT_CACHE om: ze zijn eenmalig en zouden
+    # echte resultaten uit de cache verdringen. Herhaalde punten via de memo.
+    proeven: Dict[float, Optional[Dict[str, Any]]] = {}
+
+    def vooruit(x: float) -> Optional[Dict[str, Any]]:
+        """Scenario 1 via _calculate() bij hoofdinkomen x (leningaggregaten hergebruikt)."""
+        if x not in proeven:
+            try:
+                proeven[x] = _calculate(invoer.met(**{veld: x}))
+            except ValueError:
+                proeven[x] = None
+        return proeven[x]
+
+    def haalt_doel(resultaat: Optional[Dict[str, Any]]) -> bool:
+        return resultaat is not None and resultaat['scenario1'][variant]['max_box1'] >= doel_bedrag
+
+    for nr, ondergrens in enumerate(grenzen):
+        bovengrens = grenzen[nr + 1] if nr + 1 < len(grenzen) else math.inf
+        x_repr = (ondergrens + bovengrens) / 2 if math.isfinite(bovengrens) else ondergrens + 1.0
+
+        # Segmentconstanten bij een representatief punt
+        ink_a = a[0] + a[1] * x_repr
+        ink_p = p[0] + p[1] * x_repr
+        toets_inkomen = max(c0 + c1 * x_repr for c0, c1 in stukken)
+        woonquote_box1 = lookup_woonquote(toets_inkomen, toets_rente, ontvangt_aow, False)
+        woonquote_box3 = lookup_woonquote(toets_inkomen, toets_rente, ontvangt_aow, True)
+        if woonquote_box1 <= 0 or woonquote_box3 == 0:
+            continue
+        wq_ratio = woonquote_box1 / woonquote_box3
+
+        c26, d26 = calculate_c26_d26(ink_a, ink_p, alleenstaande, invoer.c_alleen_grens_o,
+                                     invoer.c_alleen_grens_b, invoer.c_alleen_factor)
+        c52 = energielabel_bonus + (d26 if ontvangt_aow == "JA" else c26)
+        c53 = c52 * pmt_factor * 12
+        d53 = c52 * toets_rente
+
+        # max_box1 = N19 + O19 + (inkomen_totaal × WoonquoteBox1 + K) / D
+        hoofd_k = c53 - correctie - delen.T19 - delen.U19 * wq_ratio
+        alt_const = d53 if aantal_niet_annuitair > 0 else c53
+        alt_k = alt_const - correctie - delen.V19 - delen.X19 - (delen.W19 + delen.Y19) * wq_ratio
+        if variant == 'annuitair':
+            k, d = hoofd_k, pmt_factor * 12
+        elif aantal_niet_annuitair > 0:
+            k, d = (hoofd_k if som_box1 + som_box3 == 0 else alt_k), toets_rente
+        else:
+            k, d = alt_k, pmt_factor * 12
+
+        inkomen_totaal_nodig = ((doel_bedrag - som_box1 - som_box3) * d - k) / woonquote_box1
+        kandidaat = max(ondergrens, inkomen_totaal_nodig - i0)
+        if kandidaat >= bovengrens:
+            continue
+
+        # Verificatie met de voorwaartse berekening; bij afrondingsverschil of
+        # open ondergrens in kleine, verdubbelende stappen omhoog
+        stap = max(math.ulp(kandidaat), 1e-9)
+        for _ in range(_MAX_VERFIJNINGEN):
+            resultaat = vooruit(kandidaat)
+            if haalt_doel(resultaat):
+                debug = resultaat['debug']
+                return {
+                    'benodigd_inkomen': kandidaat,
+                    'veld': veld,
+                    'variant': variant,
+                    'doel_bedrag': doel_bedrag,
+                    'max_box1': resultaat['scenario1'][variant]['max_box1'],
+                    'toets_inkomen': debug['toets_inkomen'],
+                    'inkomen_totaal': debug['inkomen_totaal'],
+                    'toets_rente': debug['toets_rente'],
+                    'woonquote_box1': debug['woonquote_box1'],
+                    'segmenten_doorzocht': nr + 1,
+                }
+            kandidaat += stap
+            stap *= 2
+            if kandidaat >= bovengrens:
+                break
+
+    return {
+        'benodigd_inkomen': None,
+        'veld': veld,
+        'variant': variant,
+        'doel_bedrag': doel_bedrag,
+        'max_box1': None,
+        'toets_inkomen': None,
+        'inkomen_totaal': None,
+        'toets_rente': toets_rente,
+        'woonquote_box1': None,
+        'segmenten_doorzocht': len(grenzen),
+    }
@@ -0,0 +1,92 @@
+"""
+Begrensde LRU/TTL-cache voor rekenresultaten
+
+Sleutel = hash over de canonieke JSON van de invoer (gesorteerde keys,
+int en float blijven onderscheiden) plus de geladen configversie. Een
+gewijzigde config levert dus automatisch andere sleutels op; clear()
+ruimt daarnaast de oude entries direct op.
+
+Thread-safe: sync endpoints draaien in de threadpool van FastAPI.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class ResultCache:
+    """LRU-cache met maximale grootte, TTL en hit/miss-tellers."""
+
+    def __init__(self, maxsize: int = 2048, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    @staticmethod
+    def sleutel(inputs: Dict[str, Any], *versies: str) -> bytes:
+        """Canonieke hash van een invoer-dict plus configversie(s)."""
+        canoniek = json.dumps(inputs, sort_keys=True, separators=(',', ':'), default=repr)
+        h = hashlib.blake2b(canoniek.encode('utf-8'), digest_size=16)
+        for versie in versies:
+            h.update(b'|' + versie.encode('utf-8'))
+        return h.digest()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Waarde bij key, of None bij miss of verlopen entry."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            opgeslagen, waarde = entry
+            if self.ttl and time.monotonic() - opgeslagen > self.ttl:
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return waarde
+
+    def put(self, key: Hashable, waarde: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic(), waarde)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Leeg de cache (bijv. na een config-wijziging)."""
+        with self._lock:
+            self._data.clear()
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            totaal = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'ttl_seconds': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / totaal, 4) if totaal else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+            }
@@ -0,0 +1,1004 @@
+"""
+NAT Calculator - gevectoriseerde batch-variant van calculator_final
+
+Rekent N berekeningen in één NumPy-pass door. Elke stap volgt
+calculator_final.calculate / calculate_scenario operatie-voor-operatie
+(zelfde volgorde van optellen, vermenigvuldigen en delen), zodat de
+uitkomst bit-identiek is aan de scalaire route.
+
+Twee plekken waar NumPy afwijkt van Python-floats worden bewust via
+Python gerekend:
+- Machtsverheffing (PMT): per unieke (basis, exponent) via float ** float
+- ROUND(x, 5) van de toetsrente: Python round() (correct afgerond)
+
+Lagen:
+1. pack_inputs()      — lijst van input-dicts → kolommen (BatchInputs)
+2. calculate_arrays() — kolommen → kolommen (de eigenlijke vectorberekening)
+3. calculate_batch()  — lijst van input-dicts → lijst van calculate()-resultaten
+4. calculate_kolommen() — kolommen per veld → uitkomstkolommen per veld
+   (pack_kolommen() + laag 2, zonder dicts per rij)
+5. calculate_grid()   — één basisinvoer × assen → max-hypotheek-matrices
+"""
+
+from dataclasses import dataclass
+from itertools import product
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from calculator_final import (
+    ENERGIELABEL_CONFIG,
+    ENERGIELABEL_MAP,
+    STUDIELENING_CONFIG,
+    WOONQUOTE_INDEX,
+    _FISCAAL_DEFAULTS,
+    is_filled,
+)
+
+# Aflostype-codes voor de leningdelen-matrix
+_GEEN = 0        # padding (deel bestaat niet)
+_ANNUITEIT = 1
+_LINEAIR = 2
+_OVERIG = 3      # Aflosvrij, Spaarhypotheek, onbekend → aflossingsvrij-tak
+
+_AFLOS_CODES = {'Annuïteit': _ANNUITEIT, 'Lineair': _LINEAIR}
+
+# Foutmeldingen gelijk aan calculate_scenario()
+FOUT_WOONQUOTE_BOX3 = "Woonquote Box3 is 0 — kan niet delen. Controleer invoer (inkomen/toetsrente)."
+FOUT_TOETSRENTE = "Toetsrente is 0 — kan niet delen. Controleer invoer."
+FOUT_ONGELDIG = "Berekening levert geen eindig resultaat op. Controleer invoer (looptijden)."
+
+
+def _compileer_woonquote_matrix(inkomens: list, rijen: list) -> tuple:
+    """Zet een WOONQUOTE_INDEX-tabel om naar (inkomens, rentes, quotes[n, m])."""
+    rentes = rijen[0][0]
+    if any(r != rentes for r, _ in rijen):
+        raise ValueError("Woonquote-tabel heeft geen uniforme rente-as; batch-lookup niet mogelijk")
+    return (
+        np.array(inkomens, dtype=float),
+        np.array(rentes, dtype=float),
+        np.array([q for _, q in rijen], dtype=float),
+    )
+
+
+WOONQUOTE_MATRIX = {
+    table_key: _compileer_woonquote_matrix(inkomens, rijen)
+    for table_key, (inkomens, rijen) in WOONQUOTE_INDEX.items()
+}
+
+_STUDIE_GRENZEN = np.array(
+    [b["rente_tot"] for b in STUDIELENING_CONFIG["correctie_brackets"]], dtype=float
+)
+_STUDIE_FACTOREN = np.array(
+    [b["factor"] for b in STUDIELENING_CONFIG["correctie_brackets"]]
+    + [STUDIELENING_CONFIG["default_factor"]],
+    dtype=float,
+)
+
+
+@dataclass
+class BatchInputs:
+    """Kolomsgewijze invoer voor N berekeningen (één element per berekening)."""
+
+    n: int
+    # Constanten
+    c_toets_rente: np.ndarray
+    c_actuele_10jr_rente: np.ndarray
+    c_rvp_toets_rente: np.ndarray
+    c_factor_2e_inkomen: np.ndarray
+    c_lpt: np.ndarray
+    c_alleen_grens_o: np.ndarray
+    c_alleen_grens_b: np.ndarray
+    c_alleen_factor: np.ndarray
+    # Inkomen (F16, G16, F18)
+    inkomen_aanvrager: np.ndarray
+    inkomen_partner: np.ndarray
+    inkomen_totaal: np.ndarray
+    alleenstaande: np.ndarray        # bool: alleenstaande == 'JA'
+    ontvangt_aow: np.ndarray         # bool: ontvangt_aow == 'JA'
+    # Leningdelen [n, max_delen]
+    aflos_code: np.ndarray
+    org_lpt: np.ndarray
+    rest_lpt: np.ndarray
+    hoofdsom_box1: np.ndarray
+    hoofdsom_box3: np.ndarray
+    rvp: np.ndarray
+    inleg_overig: np.ndarray
+    werkelijke_rente: np.ndarray
+    # Verplichtingen / woning
+    limieten_bkr: np.ndarray
+    limieten_niet_bkr: np.ndarray
+    erfpacht: np.ndarray
+    jaarlast: np.ndarray
+    studievoorschot: np.ndarray
+    energielabel_basis: np.ndarray
+    energielabel_cap: np.ndarray
+    verduurzamings_maatregelen: np.ndarray
+    # Scenario 2
+    heeft_scenario2: np.ndarray      # bool
+    inkomen_aanvrager2: np.ndarray
+    inkomen_partner2: np.ndarray
+    inkomen_totaal2: np.ndarray
+    ontvangt_aow2: np.ndarray        # bool
+
+
+def pack_inputs(inputs_list: List[Dict[str, Any]]) -> BatchInputs:
+    """
+    Zet een lijst van calculate()-input-dicts om naar kolommen.
+
+    Defaults en inkomensopbouw zijn identiek aan calculator_final.calculate().
+    """
+    n = len(inputs_list)
+    max_delen = max((min(len(i.get('hypotheek_delen', [])), 10) for i in inputs_list), default=0)
+    max_delen = max(max_delen, 1)
+
+    kol = {naam: np.zeros(n) for naam in (
+        'c_toets_rente', 'c_actuele_10jr_rente', 'c_rvp_toets_rente', 'c_factor_2e_inkomen',
+        'c_lpt', 'c_alleen_grens_o', 'c_alleen_grens_b', 'c_alleen_factor',
+        'inkomen_aanvrager', 'inkomen_partner', 'inkomen_totaal',
+        'limieten_bkr', 'limieten_niet_bkr', 'erfpacht', 'jaarlast', 'studievoorschot',
+        'energielabel_basis', 'energielabel_cap', 'verduurzamings_maatregelen',
+        'inkomen_aanvrager2', 'inkomen_partner2', 'inkomen_totaal2',
+    )}
+    vlag = {naam: np.zeros(n, dtype=bool) for naam in (
+        'alleenstaande', 'ontvangt_aow', 'heeft_scenario2', 'ontvangt_aow2',
+    )}
+    # Padding-delen: bedragen 0 en looptijd 1, zodat ze in elke kolom exact
+    # 0.0 bijdragen (geen maskers nodig, geen deling door nul)
+    delen = {naam: np.zeros((n, max_delen)) for naam in (
+        'hoofdsom_box1', 'hoofdsom_box3', 'rvp', 'inleg_overig', 'werkelijke_rente',
+    )}
+    delen['org_lpt'] = np.ones((n, max_delen))
+    delen['rest_lpt'] = np.ones((n, max_delen))
+    aflos_code = np.zeros((n, max_delen), dtype=np.int8)
+
+    base_bonus = ENERGIELABEL_CONFIG["base_bonus"]
+    verduurzaming_cap = ENERGIELABEL_CONFIG["verduurzaming_cap"]
+    constanten = ('c_toets_rente', 'c_actuele_10jr_rente', 'c_rvp_toets_rente', 'c_factor_2e_inkomen',
+                  'c_lpt', 'c_alleen_grens_o', 'c_alleen_grens_b', 'c_alleen_factor')
+
+    for i, inputs in enumerate(inputs_list):
+        for naam in constanten:
+            kol[naam][i] = inputs.get(naam, _FISCAAL_DEFAULTS[naam])
+
+        alleenstaande = inputs.get('alleenstaande', 'JA')
+        ontvangt_aow = inputs.get('ontvangt_aow', 'NEE')
+        vlag['alleenstaande'][i] = alleenstaande == 'JA'
+        vlag['ontvangt_aow'][i] = ontvangt_aow == 'JA'
+
+        inkomen_aanvrager = (
+            inputs.get('hoofd_inkomen_aanvrager', 0) +
+            inputs.get('inkomen_uit_lijfrente_aanvrager', 0) +
+            inputs.get('ontvangen_partneralimentatie_aanvrager', 0) +
+            inputs.get('inkomsten_uit_vermogen_aanvrager', 0) +
+            inputs.get('huurinkomsten_aanvrager', 0) -
+            inputs.get('te_betalen_partneralimentatie_aanvrager', 0)
+        )
+        inkomen_partner = (
+            inputs.get('hoofd_inkomen_partner', 0) +
+            inputs.get('inkomen_uit_lijfrente_partner', 0) +
+            inputs.get('ontvangen_partneralimentatie_partner', 0) -
+            inputs.get('te_betalen_partneralimentatie_partner', 0)
+        )
+        inkomen_overige = inputs.get('inkomen_overige_aanvragers', 0)
+        if alleenstaande == 'JA':
+            inkomen_totaal = inkomen_aanvrager + inkomen_overige
+        else:
+            inkomen_totaal = inkomen_aanvrager + inkomen_partner + inkomen_overige
+        kol['inkomen_aanvrager'][i] = inkomen_aanvrager
+        kol['inkomen_partner'][i] = inkomen_partner
+        kol['inkomen_totaal'][i] = inkomen_totaal
+
+        for j, deel in enumerate(inputs.get('hypotheek_delen', [])[:10]):
+            aflos_code[i, j] = _AFLOS_CODES.get(deel.get('aflos_type', ''), _OVERIG)
+            delen['org_lpt'][i, j] = deel.get('org_lpt', 0)
+            delen['rest_lpt'][i, j] = deel.get('rest_lpt', 0)
+            delen['hoofdsom_box1'][i, j] = deel.get('hoofdsom_box1', 0)
+            delen['hoofdsom_box3'][i, j] = deel.get('hoofdsom_box3', 0)
+            delen['rvp'][i, j] = deel.get('rvp', 0)
+            delen['inleg_overig'][i, j] = deel.get('inleg_overig', 0)
+            delen['werkelijke_rente'][i, j] = deel.get('werkelijke_rente', 0)
+
+        kol['limieten_bkr'][i] = inputs.get('limieten_bkr_geregistreerd', 0)
+        kol['limieten_niet_bkr'][i] = inputs.get('limieten_niet_bkr_geregistreerd', 0)
+        kol['erfpacht'][i] = inputs.get('erfpachtcanon_per_jaar', 0)
+        kol['jaarlast'][i] = inputs.get('jaarlast_overige_kredieten', 0)
+        kol['studievoorschot'][i] = inputs.get('studievoorschot_studielening', 0)
+        kol['verduurzamings_maatregelen'][i] = inputs.get('verduurzamings_maatregelen', 0)
+
+        energielabel = inputs.get('energielabel')
+        if energielabel is None:
+            energielabel = ""
+        energielabel = ENERGIELABEL_MAP.get(energielabel, energielabel)
+        kol['energielabel_basis'][i] = base_bonus.get(energielabel, 0)
+        kol['energielabel_cap'][i] = verduurzaming_cap.get(energielabel, 0)
+
+        gewijzigd_aanvrager2 = inputs.get('gewijzigd_hoofd_inkomen_aanvrager2')
+        gewijzigd_partner2 = inputs.get('gewijzigd_hoofd_inkomen_partner2')
+        if is_filled(gewijzigd_aanvrager2) or is_filled(gewijzigd_partner2):
+            gewijzigd_aanvrager2 = gewijzigd_aanvrager2 if gewijzigd_aanvrager2 is not None else 0
+            gewijzigd_partner2 = gewijzigd_partner2 if gewijzigd_partner2 is not None else 0
+            inkomen_overige_min2 = inputs.get('inkomen_overige_aanvragers_min2', 0)
+            if alleenstaande == 'JA':
+                inkomen_min2_totaal = gewijzigd_aanvrager2 + inkomen_overige_min2
+            else:
+                inkomen_min2_totaal = gewijzigd_aanvrager2 + gewijzigd_partner2 + inkomen_overige_min2
+            vlag['heeft_scenario2'][i] = True
+            vlag['ontvangt_aow2'][i] = inputs.get('gewijzigd_hoofd_inkomen_aow2', ontvangt_aow) == 'JA'
+            kol['inkomen_aanvrager2'][i] = gewijzigd_aanvrager2
+            kol['inkomen_partner2'][i] = gewijzigd_partner2
+            kol['inkomen_totaal2'][i] = inkomen_min2_totaal
+
+    return BatchInputs(n=n, aflos_code=aflos_code, **kol, **vlag, **delen)
+
+
+def _kolom(kolommen: Dict[str, Sequence], naam: str, n: int, standaard: float) -> np.ndarray:
+    """Kolom als float-array; ontbrekend veld → overal de default."""
+    waarden = kolommen.get(naam)
+    if waarden is None:
+        return np.full(n, standaard, dtype=float)
+    return np.asarray(waarden, dtype=float)
+
+
+def pack_kolommen(n: int, kolommen: Dict[str, Sequence],
+                  delen: Optional[Dict[str, Sequence]] = None) -> BatchInputs:
+    """
+    Zet kolomsgewijze invoer om naar BatchInputs, zonder lus per berekening.
+
+    Args:
+        n: aantal berekeningen
+        kolommen: per calculate()-veld een lijst met n waarden; een
+            ontbrekend veld krijgt overal de default van calculate().
+            Scenario 2-velden zijn getallen of None.
+        delen: leningdelen in lang formaat: 'rij' (index van de berekening)
+            plus per deelveld een lijst met één waarde per deel. Volgorde
+            binnen een rij = invoervolgorde; maximaal 10 delen per rij.
+
+    Uitkomst is identiek aan pack_inputs() voor dezelfde invoer als dicts.
+    """
+    for naam, waarden in kolommen.items():
+        if len(waarden) != n:
+            raise ValueError(f"Kolom '{naam}' heeft {len(waarden)} waarden, verwacht {n}")
+
+    kol = {naam: _kolom(kolommen, naam, n, _FISCAAL_DEFAULTS[naam]) for naam in (
+        'c_toets_rente', 'c_actuele_10jr_rente', 'c_rvp_toets_rente', 'c_factor_2e_inkomen',
+        'c_lpt', 'c_alleen_grens_o', 'c_alleen_grens_b', 'c_alleen_factor',
+    )}
+    for naam, veld in (
+        ('limieten_bkr', 'limieten_bkr_geregistreerd'),
+        ('limieten_niet_bkr', 'limieten_niet_bkr_geregistreerd'),
+        ('erfpacht', 'erfpachtcanon_per_jaar'),
+        ('jaarlast', 'jaarlast_overige_kredieten'),
+        ('studievoorschot', 'studievoorschot_studielening'),
+        ('verduurzamings_maatregelen', 'verduurzamings_maatregelen'),
+    ):
+        kol[naam] = _kolom(kolommen, veld, n, 0)
+
+    def vlag(naam: str, standaard: str) -> np.ndarray:
+        waarden = kolommen.get(naam)
+        if waarden is None:
+            return np.full(n, standaard == 'JA')
+        return np.asarray(waarden, dtype=object) == 'JA'
+
+    alleenstaande = vlag('alleenstaande', 'JA')
+    ontvangt_aow = vlag('ontvangt_aow', 'NEE')
+
+    # Zelfde optelvolgorde als calculate()
+    inkomen_aanvrager = (
+        _kolom(kolommen, 'hoofd_inkomen_aanvrager', n, 0) +
+        _kolom(kolommen, 'inkomen_uit_lijfrente_aanvrager', n, 0) +
+        _kolom(kolommen, 'ontvangen_partneralimentatie_aanvrager', n, 0) +
+        _kolom(kolommen, 'inkomsten_uit_vermogen_aanvrager', n, 0) +
+        _kolom(kolommen, 'huurinkomsten_aanvrager', n, 0) -
+        _kolom(kolommen, 'te_betalen_partneralimentatie_aanvrager', n, 0)
+    )
+    inkomen_partner = (
+        _kolom(kolommen, 'hoofd_inkomen_partner', n, 0) +
+        _kolom(kolommen, 'inkomen_uit_lijfrente_partner', n, 0) +
+        _kolom(kolommen, 'ontvangen_partneralimentatie_partner', n, 0) -
+        _kolom(kolommen, 'te_betalen_partneralimentatie_partner', n, 0)
+    )
+    inkomen_overige = _kolom(kolommen, 'inkomen_overige_aanvragers', n, 0)
+    inkomen_totaal = np.where(alleenstaande, inkomen_aanvrager + inkomen_overige,
+                              inkomen_aanvrager + inkomen_partner + inkomen_overige)
+
+    base_bonus = ENERGIELABEL_CONFIG["base_bonus"]
+    verduurzaming_cap = ENERGIELABEL_CONFIG["verduurzaming_cap"]
+    energielabels = kolommen.get('energielabel')
+    if energielabels is None:
+        energielabels = [None] * n
+    # Per uniek label één keer opzoeken, daarna alleen nog een dict-lookup per rij
+    basis_per_label = {}
+    cap_per_label = {}
+    for label in set(energielabels):
+        e = "" if label is None else label
+        e = ENERGIELABEL_MAP.get(e, e)
+        basis_per_label[label] = base_bonus.get(e, 0)
+        cap_per_label[label] = verduurzaming_cap.get(e, 0)
+    kol['energielabel_basis'] = np.fromiter(map(basis_per_label.__getitem__, energielabels),
+                                            dtype=float, count=n)
+    kol['energielabel_cap'] = np.fromiter(map(cap_per_label.__getitem__, energielabels),
+                                          dtype=float, count=n)
+
+    # Scenario 2: rijen waar een gewijzigd hoofdinkomen is ingevuld
+    nul = [None] * n
+    aanvrager2 = kolommen.get('gewijzigd_hoofd_inkomen_aanvrager2', nul)
+    partner2 = kolommen.get('gewijzigd_hoofd_inkomen_partner2', nul)
+    heeft_scenario2 = (np.fromiter(map(is_filled, aanvrager2), dtype=bool, count=n) |
+                       np.fromiter(map(is_filled, partner2), dtype=bool, count=n))
+    gewijzigd_aanvrager2 = np.array([0 if a is None else a for a in aanvrager2], dtype=float)
+    gewijzigd_partner2 = np.array([0 if p is None else p for p in partner2], dtype=float)
+    inkomen_overige_min2 = _kolom(kolommen, 'inkomen_overige_aanvragers_min2', n, 0)
+    inkomen_min2_totaal = np.where(alleenstaande, gewijzigd_aanvrager2 + inkomen_overige_min2,
+                                   gewijzigd_aanvrager2 + gewijzigd_partner2 + inkomen_overige_min2)
+    if 'gewijzigd_hoofd_inkomen_aow2' in kolommen:
+        ontvangt_aow2 = vlag('gewijzigd_hoofd_inkomen_aow2', 'NEE')
+    else:
+        ontvangt_aow2 = ontvangt_aow
+
+    return BatchInputs(
+        n=n, **kol,
+        inkomen_aanvrager=inkomen_aanvrager,
+        inkomen_partner=inkomen_partner,
+        inkomen_totaal=inkomen_totaal,
+        alleenstaande=alleenstaande,
+        ontvangt_aow=ontvangt_aow,
+        heeft_scenario2=heeft_scenario2,
+        inkomen_aanvrager2=np.where(heeft_scenario2, gewijzigd_aanvrager2, 0.0),
+        inkomen_partner2=np.where(heeft_scenario2, gewijzigd_partner2, 0.0),
+        inkomen_totaal2=np.where(heeft_scenario2, inkomen_min2_totaal, 0.0),
+        ontvangt_aow2=ontvangt_aow2 & heeft_scenario2,
+        **_pack_delen_kolommen(n, delen or {'rij': []}),
+    )
+
+
+def _pack_delen_kolommen(n: int, delen: Dict[str, Sequence]) -> Dict[str, np.ndarray]:
+    """Leningdelen in lang formaat → [n, max_delen]-matrices zoals pack_inputs()."""
+    rij = np.asarray(delen['rij'], dtype=np.int64)
+    m = rij.shape[0]
+    for naam, waarden in delen.items():
+        if len(waarden) != m:
+            raise ValueError(f"Deelkolom '{naam}' heeft {len(waarden)} waarden, verwacht {m}")
+    if m and (rij.min() < 0 or rij.max() >= n):
+        raise ValueError(f"Deel verwijst naar een rij buiten 0..{n - 1}")
+
+    # Positie van elk deel binnen zijn rij: stabiel sorteren houdt de
+    # invoervolgorde per rij aan, daarna afstand tot het begin van de groep
+    volgorde = np.argsort(rij, kind='stable')
+    gesorteerd = rij[volgorde]
+    index = np.arange(m)
+    begin = np.ones(m, dtype=bool)
+    begin[1:] = gesorteerd[1:] != gesorteerd[:-1]
+    positie = index - np.maximum.accumulate(np.where(begin, index, 0))
+    houden = positie < 10
+    volgorde, doel_rij, doel_kolom = volgorde[houden], gesorteerd[houden], positie[houden]
+    max_delen = max(int(doel_kolom.max()) + 1 if doel_kolom.size else 0, 1)
+
+    # Padding-delen: bedragen 0 en looptijd 1 (zie pack_inputs)
+    matrices = {}
+    for naam in ('org_lpt', 'rest_lpt', 'hoofdsom_box1', 'hoofdsom_box3', 'rvp',
+                 'inleg_overig', 'werkelijke_rente'):
+        matrix = np.ones((n, max_delen)) if naam in ('org_lpt', 'rest_lpt') else np.zeros((n, max_delen))
+        waarden = delen.get(naam)
+        matrix[doel_rij, doel_kolom] = 0.0 if waarden is None else np.asarray(waarden, dtype=float)[volgorde]
+        matrices[naam] = matrix
+
+    aflos_types = delen.get('aflos_type')
+    if aflos_types is None:
+        codes = np.full(m, _OVERIG, dtype=np.int8)
+    else:
+        code_per_type = {t: _AFLOS_CODES.get(t, _OVERIG) for t in set(aflos_types)}
+        codes = np.fromiter(map(code_per_type.__getitem__, aflos_types), dtype=np.int8, count=m)
+    aflos_code = np.zeros((n, max_delen), dtype=np.int8)
+    aflos_code[doel_rij, doel_kolom] = codes[volgorde]
+    matrices['aflos_code'] = aflos_code
+    return matrices
+
+
+def _pow_exact(basis: np.ndarray, exponent: np.ndarray) -> np.ndarray:
+    """
+    Elementsgewijs basis ** exponent, bit-identiek aan Python float-pow.
+
+    np.power mag SIMD-benaderingen gebruiken; daarom per unieke combinatie
+    via Python. In de praktijk zijn er weinig unieke (rente, looptijd)-paren.
+    """
+    if basis.size == 0:
+        return np.zeros(basis.shape)
+    unieke_basis, bi = np.unique(basis.ravel(), return_inverse=True)
+    unieke_exp, ei = np.unique(exponent.ravel(), return_inverse=True)
+    if len(unieke_exp) == 1:
+        e = unieke_exp[0].item()
+        waarden = np.array([x ** e for x in unieke_basis.tolist()], dtype=float)
+        return waarden[bi].reshape(basis.shape)
+    if len(unieke_basis) * len(unieke_exp) <= 1_000_000:
+        # Tabel basis × exponent; alleen voorkomende cellen uitrekenen
+        nodig = np.zeros((len(unieke_basis), len(unieke_exp)), dtype=bool)
+        nodig[bi, ei] = True
+        rij, kolom = np.nonzero(nodig)
+        tabel = np.empty(nodig.shape)
+        tabel[rij, kolom] = [x ** y for x, y in zip(unieke_basis[rij].tolist(), unieke_exp[kolom].tolist())]
+        return tabel[bi, ei].reshape(basis.shape)
+    sleutel = bi.astype(np.int64) * len(unieke_exp) + ei
+    unieke_sleutels, terug = np.unique(sleutel, return_inverse=True)
+    b = unieke_basis[unieke_sleutels // len(unieke_exp)].tolist()
+    e = unieke_exp[unieke_sleutels % len(unieke_exp)].tolist()
+    waarden = np.array([x ** y for x, y in zip(b, e)], dtype=float)
+    return waarden[terug].reshape(basis.shape)
+
+
+def _pmt(rate: np.ndarray, nper: np.ndarray, pv: np.ndarray,
+         pvif: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Gevectoriseerde calculator_final.pmt met fv=0.
+
+    pvif = (1 + rate) ** nper kan vooraf berekend worden meegegeven als
+    meerdere PMT's dezelfde rente en looptijd delen.
+    """
+    if pvif is None:
+        pvif = _pow_exact(1 + rate, nper)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # fv=0: pv * pvif + 0 == pv * pvif
+        return np.where(rate == 0, -pv / nper, -(rate * (pv * pvif)) / (pvif - 1))
+
+
+def _round_exact(x: np.ndarray, decimalen: int) -> np.ndarray:
+    """
+    Gevectoriseerde Python round(x, decimalen), bit-identiek.
+
+    x * 10**d wijkt hooguit een halve ulp af van de exacte waarde; alleen
+    als dat nabij een .5-grens valt kan rint anders afronden dan Python.
+    Die twijfelgevallen (en niet-eindige/zeer grote waarden) gaan via round().
+    """
+    schaal = 10.0 ** decimalen
+    with np.errstate(invalid='ignore', over='ignore'):
+        y = x * schaal
+        resultaat = np.rint(y) / schaal
+        twijfel = ~(np.abs(y) < 2.0 ** 30) | (np.abs(y - np.floor(y) - 0.5) < 1e-6)
+    for i in np.flatnonzero(twijfel).tolist():
+        resultaat[i] = round(float(x[i]), decimalen)
+    return resultaat
+
+
+def _round25(x: np.ndarray) -> np.ndarray:
+    """
+    Gevectoriseerde Python round(x, 25).
+
+    Voor 0 en |x| >= 1e-8 is een halve ulp groter dan 0.5e-25, dus geeft
+    round(x, 25) x zelf terug; alleen kleinere waarden gaan via round().
+    """
+    resultaat = x.copy()
+    for i in np.flatnonzero((x != 0) & ~(np.abs(x) >= 1e-8)).tolist():
+        resultaat[i] = round(float(x[i]), 25)
+    return resultaat
+
+
+def _som(matrix: np.ndarray) -> np.ndarray:
+    """Som per rij, links-naar-rechts (zelfde volgorde als Python sum())."""
+    acc = np.zeros(matrix.shape[0])
+    for j in range(matrix.shape[1]):
+        acc = acc + matrix[:, j]
+    return acc
+
+
+def _lookup_woonquotes(toets_inkomen: np.ndarray, toets_rente: np.ndarray,
+                       ontvangt_aow: np.ndarray) -> tuple:
+    """
+    Gevectoriseerde MATCH/XMATCH op WOONQUOTE_MATRIX.
+
+    Returns:
+        (woonquote_box1, woonquote_box3). Box1- en box3-tabel van dezelfde
+        AOW-status delen in de praktijk hun assen; dan worden de indices
+        één keer bepaald.
+    """
+    n = toets_inkomen.shape[0]
+    box1 = np.zeros(n)
+    box3 = np.zeros(n)
+    for aow, sleutels in ((False, ('cWqTotAow', 'cWqTotAowCons')),
+                          (True, ('cWqVnfAow', 'cWqVnfAowCons'))):
+        mask = ontvangt_aow == aow
+        if not mask.any():
+            continue
+        alles = mask.all()
+        inkomen = toets_inkomen if alles else toets_inkomen[mask]
+        rente = toets_rente if alles else toets_rente[mask]
+        assen = None
+        for resultaat, table_key in zip((box1, box3), sleutels):
+            inkomens, rentes, quotes = WOONQUOTE_MATRIX[table_key]
+            if assen is None or not (np.array_equal(assen[0], inkomens) and np.array_equal(assen[1], rentes)):
+                assen = (inkomens, rentes)
+                rij = np.maximum(np.searchsorted(inkomens, inkomen, side='right') - 1, 0)
+                kolom = np.minimum(np.searchsorted(rentes, rente, side='left'), len(rentes) - 1)
+            if alles:
+                resultaat[:] = quotes[rij, kolom]
+            else:
+                resultaat[mask] = quotes[rij, kolom]
+    return box1, box3
+
+
+def _c26_d26(inkomen: np.ndarray, inkomen_partner: np.ndarray, alleenstaande: np.ndarray,
+             grens: np.ndarray, factor: np.ndarray) -> np.ndarray:
+    """Gevectoriseerde C26 (grens O) of D26 (grens B) uit calculate_c26_d26."""
+    return np.select(
+        [
+            (inkomen > 0) & (inkomen_partner > 0) & alleenstaande,
+            (inkomen == 0) & (inkomen_partner > grens) & alleenstaande,
+            (inkomen > grens) & (inkomen_partner == 0) & alleenstaande,
+        ],
+        [0.0, factor, factor],
+        default=0.0,
+    )
+
+
+def calculate_scenario_arrays(
+    inkomen_totaal: np.ndarray, inkomen_aanvrager: np.ndarray, inkomen_partner: np.ndarray,
+    alleenstaande: np.ndarray, ontvangt_aow: np.ndarray, gewogen_rente: np.ndarray,
+    som_box1: np.ndarray, som_box3: np.ndarray,
+    T19: np.ndarray, U19: np.ndarray, V19: np.ndarray, W19: np.ndarray,
+    X19: np.ndarray, Y19: np.ndarray,
+    aantal_niet_annuitair: np.ndarray,
+    limieten_bkr: np.ndarray, limieten_niet_bkr: np.ndarray, erfpacht: np.ndarray,
+    jaarlast: np.ndarray, studievoorschot: np.ndarray,
+    energielabel_basis: np.ndarray, energielabel_cap: np.ndarray,
+    verduurzamings_maatregelen: np.ndarray,
+    c_actuele_10jr_rente: np.ndarray, c_factor_2e_inkomen: np.ndarray, c_lpt: np.ndarray,
+    c_alleen_grens_o: np.ndarray, c_alleen_grens_b: np.ndarray, c_alleen_factor: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """
+    Gevectoriseerde calculator_final.calculate_scenario.
+
+    Returns:
+        Dict met kolommen voor alle scenario- en debugwaarden, plus
+        'fout' (object-array met foutmelding of None per rij).
+    """
+    n = inkomen_totaal.shape[0]
+    fout = np.full(n, None, dtype=object)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # M25 - ToetsInkomen
+        toets_inkomen = np.where(
+            alleenstaande,
+            inkomen_aanvrager,
+            np.maximum(inkomen_aanvrager + inkomen_partner * c_factor_2e_inkomen,
+                       inkomen_partner + inkomen_aanvrager * c_factor_2e_inkomen),
+        )
+
+        # M26 - ToetsRente
+        geen_lening = (som_box1 + som_box3) == 0
+        toets_rente = np.where(
+            geen_lening,
+            _round_exact(c_actuele_10jr_rente, 5),
+            _round_exact(_round25(gewogen_rente), 5),
+        )
+
+        # M27, M28 - Woonquote
+        woonquote_box1, woonquote_box3 = _lookup_woonquotes(toets_inkomen, toets_rente, ontvangt_aow)
+
+        # C26, D26 - Alleenstaand correctie
+        c26 = _c26_d26(inkomen_aanvrager, inkomen_partner, alleenstaande, c_alleen_grens_o, c_alleen_factor)
+        d26 = _c26_d26(inkomen_aanvrager, inkomen_partner, alleenstaande, c_alleen_grens_b, c_alleen_factor)
+
+        # C33:C50 - Energielabel bonus
+        verduurzaming_bonus = np.where(
+            (verduurzamings_maatregelen > 0) & (energielabel_cap > 0),
+            np.minimum(verduurzamings_maatregelen, energielabel_cap),
+            0.0,
+        )
+        c33_c50_sum = energielabel_basis + verduurzaming_bonus
+
+        # C52
+        c52 = np.where(ontvangt_aow, c33_c50_sum + d26, c33_c50_sum + c26)
+
+        # C53 / D53
+        pmt_factor = -_pmt(toets_rente / 12, c_lpt, np.ones(n))
+        c53 = c52 * pmt_factor * 12
+        d53 = c52 * toets_rente
+
+        # C73 - Studielening correctie
+        bracket = np.searchsorted(_STUDIE_GRENZEN, toets_rente, side='left')
+        c73 = (studievoorschot * 12) * _STUDIE_FACTOREN[bracket]
+
+        # F44 - Correctie
+        basis_correctie = limieten_bkr * 0.24 + limieten_niet_bkr * 0.24 + erfpacht * 12 + jaarlast * 12
+        correctie = np.where(som_box1 == 0, basis_correctie + studievoorschot * 12, basis_correctie + c73)
+
+        fout[woonquote_box3 == 0] = FOUT_WOONQUOTE_BOX3
+
+        wq_ratio = woonquote_box1 / woonquote_box3
+
+        # M34, M35 - Woonlast Box1/Box3
+        basis = (inkomen_totaal * woonquote_box1) + c53 - correctie - T19
+        woonlast_box1 = ((basis / wq_ratio) - U19) * wq_ratio
+        woonlast_box3 = (basis / wq_ratio) - U19
+
+        # M36, M37 - Alternatieve woonlast
+        const_for_alt = np.where(aantal_niet_annuitair > 0, d53, c53)
+        basis_alt = (inkomen_totaal * woonquote_box1) + const_for_alt - correctie - V19 - X19
+        woonlast_box1_alt = ((basis_alt / wq_ratio) - W19 - Y19) * wq_ratio
+        woonlast_box3_alt = (basis_alt / wq_ratio) - W19 - Y19
+
+        # M42, M43 / M40, M41 - Annuitair
+        ruimte_box1_annuitair = woonlast_box1 / pmt_factor / 12
+        ruimte_box3_annuitair = woonlast_box3 / pmt_factor / 12
+        max_hyp_annuitair_box1 = som_box1 + som_box3 + ruimte_box1_annuitair
+        max_hyp_annuitair_box3 = som_box1 + som_box3 + ruimte_box3_annuitair
+
+        # M48, M49 / M46, M47 - Niet-annuitair
+        niet_annuitair = aantal_niet_annuitair > 0
+        fout[niet_annuitair & (toets_rente == 0) & (fout == None)] = FOUT_TOETSRENTE  # noqa: E711
+        ruimte_box1_niet_annuitair = np.where(
+            niet_annuitair,
+            np.where(geen_lening, woonlast_box1 / toets_rente, woonlast_box1_alt / toets_rente),
+            woonlast_box1_alt / pmt_factor / 12,
+        )
+        ruimte_box3_niet_annuitair = np.where(
+            niet_annuitair,
+            np.where(geen_lening, woonlast_box3 / toets_rente, woonlast_box3_alt / toets_rente),
+            woonlast_box3_alt / pmt_factor / 12,
+        )
+        max_hyp_niet_annuitair_box1 = som_box1 + som_box3 + ruimte_box1_niet_annuitair
+        max_hyp_niet_annuitair_box3 = som_box1 + som_box3 + ruimte_box3_niet_annuitair
+
+    uitkomsten = (max_hyp_annuitair_box1, max_hyp_annuitair_box3,
+                  max_hyp_niet_annuitair_box1, max_hyp_niet_annuitair_box3)
+    eindig = np.logical_and.reduce([np.isfinite(u) for u in uitkomsten])
+    fout[~eindig & (fout == None)] = FOUT_ONGELDIG  # noqa: E711
+
+    return {
+        'annuitair_max_box1': max_hyp_annuitair_box1,
+        'annuitair_max_box3': max_hyp_annuitair_box3,
+        'annuitair_ruimte_box1': ruimte_box1_annuitair,
+        'annuitair_ruimte_box3': ruimte_box3_annuitair,
+        'niet_annuitair_max_box1': max_hyp_niet_annuitair_box1,
+        'niet_annuitair_max_box3': max_hyp_niet_annuitair_box3,
+        'niet_annuitair_ruimte_box1': ruimte_box1_niet_annuitair,
+        'niet_annuitair_ruimte_box3': ruimte_box3_niet_annuitair,
+        'toets_inkomen': toets_inkomen,
+        'toets_rente': toets_rente,
+        'woonquote_box1': woonquote_box1,
+        'woonquote_box3': woonquote_box3,
+        'gewogen_rente': gewogen_rente,
+        'energielabel_bonus': c33_c50_sum,
+        'correctie': correctie,
+        'c26': c26,
+        'd26': d26,
+        'inkomen_totaal': inkomen_totaal,
+        'inkomen_aanvrager': inkomen_aanvrager,
+        'inkomen_partner': inkomen_partner,
+        'fout': fout,
+    }
+
+
+def _lening_aggregaten(b: BatchInputs) -> Dict[str, np.ndarray]:
+    """Gevectoriseerde K19, N19, O19, S19 en T19–Y19 uit calculate()."""
+    aanwezig = b.aflos_code != _GEEN
+    is_annuitair_linear = (b.aflos_code == _ANNUITEIT) | (b.aflos_code == _LINEAIR)
+    c_toets = b.c_toets_rente[:, None]
+
+    rente = np.where(b.rvp < b.c_rvp_toets_rente[:, None], c_toets, b.werkelijke_rente)
+    box1, box3, rest_lpt = b.hoofdsom_box1, b.hoofdsom_box3, b.rest_lpt
+
+    aantal_niet_annuitair = np.sum(aanwezig & ~is_annuitair_linear, axis=1)
+    som_box1 = _som(box1)
+    som_box3 = _som(box3)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # S19 - Gewogen rente
+        numerator = _som(rente * box1 * rest_lpt + rente * box3 * rest_lpt)
+        denominator = _som(box1 * rest_lpt + box3 * rest_lpt)
+        geen = (som_box1 == 0) & (som_box3 == 0)
+        gewogen_rente = np.where(
+            geen | ~(denominator > 0), b.c_toets_rente, numerator / denominator
+        )
+
+        num_werk = _som(b.werkelijke_rente * (box1 + box3) * rest_lpt)
+        den_werk = _som((box1 + box3) * rest_lpt)
+        gewogen_werkelijke_rente = np.where(geen | ~(den_werk > 0), 0.0, num_werk / den_werk)
+
+        # T-Y kolommen
+        lpt = np.where(is_annuitair_linear, rest_lpt, b.org_lpt)
+        maandrente = rente / 12
+
+        pvif_lpt = _pow_exact(1 + maandrente, lpt)
+        T = -_pmt(maandrente, lpt, box1, pvif_lpt) * 12
+        U = -_pmt(maandrente, lpt, box3, pvif_lpt) * 12
+
+        is_annuiteit = b.aflos_code == _ANNUITEIT
+        is_lineair = b.aflos_code == _LINEAIR
+        # Annuïteit: lpt == rest_lpt, dus dezelfde pvif
+        pvif_rest = np.where(is_annuiteit, pvif_lpt, 1.0)
+        V = np.select(
+            [is_annuiteit, is_lineair],
+            [-12 * _pmt(maandrente, rest_lpt, box1, pvif_rest),
+             box1 * (rente + 12 / rest_lpt)],
+            default=box1 * rente,
+        )
+        W = np.select(
+            [is_annuiteit, is_lineair],
+            [-12 * _pmt(maandrente, rest_lpt, box3, pvif_rest),
+             box3 * (rente + 12 / rest_lpt)],
+            default=box3 * rente,
+        )
+        X = np.where(T > 0, b.inleg_overig, 0.0)
+        Y = np.where(U > 0, b.inleg_overig, 0.0)
+
+    return {
+        'aantal_niet_annuitair': aantal_niet_annuitair,
+        'som_box1': som_box1,
+        'som_box3': som_box3,
+        'gewogen_rente': gewogen_rente,
+        'gewogen_werkelijke_rente': gewogen_werkelijke_rente,
+        'T19': _som(T), 'U19': _som(U), 'V19': _som(V),
+        'W19': _som(W), 'X19': _som(X), 'Y19': _som(Y),
+    }
+
+
+def calculate_arrays(b: BatchInputs) -> Dict[str, Any]:
+    """
+    Gevectoriseerde calculator_final.calculate op kolommen.
+
+    Returns:
+        {
+            'scenario1': kolommen uit calculate_scenario_arrays (alle rijen),
+            'scenario2': idem voor rijen met heeft_scenario2 (of None),
+            'scenario2_index': rij-indices die bij 'scenario2' horen,
+            'gewogen_werkelijke_rente': kolom,
+            'fout': foutmelding of None per rij (eerste fout, scenario 1 vóór 2),
+        }
+    """
+    agg = _lening_aggregaten(b)
+
+    gedeeld = dict(
+        som_box1=agg['som_box1'], som_box3=agg['som_box3'],
+        T19=agg['T19'], U19=agg['U19'], V19=agg['V19'],
+        W19=agg['W19'], X19=agg['X19'], Y19=agg['Y19'],
+        aantal_niet_annuitair=agg['aantal_niet_annuitair'],
+        gewogen_rente=agg['gewogen_rente'],
+        alleenstaande=b.alleenstaande,
+        limieten_bkr=b.limieten_bkr, limieten_niet_bkr=b.limieten_niet_bkr,
+        erfpacht=b.erfpacht, jaarlast=b.jaarlast, studievoorschot=b.studievoorschot,
+        energielabel_basis=b.energielabel_basis, energielabel_cap=b.energielabel_cap,
+        verduurzamings_maatregelen=b.verduurzamings_maatregelen,
+        c_actuele_10jr_rente=b.c_actuele_10jr_rente, c_factor_2e_inkomen=b.c_factor_2e_inkomen,
+        c_lpt=b.c_lpt, c_alleen_grens_o=b.c_alleen_grens_o,
+        c_alleen_grens_b=b.c_alleen_grens_b, c_alleen_factor=b.c_alleen_factor,
+    )
+
+    scenario1 = calculate_scenario_arrays(
+        inkomen_totaal=b.inkomen_totaal,
+        inkomen_aanvrager=b.inkomen_aanvrager,
+        inkomen_partner=b.inkomen_partner,
+        ontvangt_aow=b.ontvangt_aow,
+        **gedeeld,
+    )
+    fout = scenario1['fout'].copy()
+
+    scenario2 = None
+    index2 = np.flatnonzero(b.heeft_scenario2)
+    if index2.size:
+        scenario2 = calculate_scenario_arrays(
+            inkomen_totaal=b.inkomen_totaal2[index2],
+            inkomen_aanvrager=b.inkomen_aanvrager2[index2],
+            inkomen_partner=b.inkomen_partner2[index2],
+            ontvangt_aow=b.ontvangt_aow2[index2],
+            **{k: v[index2] for k, v in gedeeld.items()},
+        )
+        for i, f in zip(index2.tolist(), scenario2['fout'].tolist()):
+            if fout[i] is None and f is not None:
+                fout[i] = f
+
+    return {
+        'scenario1': scenario1,
+        'scenario2': scenario2,
+        'scenario2_index': index2,
+        'gewogen_werkelijke_rente': agg['gewogen_werkelijke_rente'],
+        'fout': fout,
+    }
+
+
+_SCENARIO_VELDEN = (
+    ('annuitair', 'max_box1'), ('annuitair', 'max_box3'),
+    ('annuitair', 'ruimte_box1'), ('annuitair', 'ruimte_box3'),
+    ('niet_annuitair', 'max_box1'), ('niet_annuitair', 'max_box3'),
+    ('niet_annuitair', 'ruimte_box1'), ('niet_annuitair', 'ruimte_box3'),
+)
+_DEBUG_VELDEN = (
+    'toets_inkomen', 'toets_rente', 'woonquote_box1', 'woonquote_box3',
+    'gewogen_rente', 'energielabel_bonus', 'correctie', 'c26', 'd26',
+    'inkomen_totaal', 'inkomen_aanvrager', 'inkomen_partner',
+)
+
+
+def _scenario_rijen(kolommen: Dict[str, np.ndarray], gewogen_werkelijke_rente: list) -> tuple:
+    """Zet scenario-kolommen om naar (scenario-dicts, debug-dicts) per rij."""
+    scen = {f"{groep}_{veld}": kolommen[f"{groep}_{veld}"].tolist() for groep, veld in _SCENARIO_VELDEN}
+    dbg = {veld: kolommen[veld].tolist() for veld in _DEBUG_VELDEN}
+    scenarios = []
+    debugs = []
+    for i in range(len(gewogen_werkelijke_rente)):
+        scenarios.append({
+            'annuitair': {
+                'max_box1': scen['annuitair_max_box1'][i],
+                'max_box3': scen['annuitair_max_box3'][i],
+                'ruimte_box1': scen['annuitair_ruimte_box1'][i],
+                'ruimte_box3': scen['annuitair_ruimte_box3'][i],
+            },
+            'niet_annuitair': {
+                'max_box1': scen['niet_annuitair_max_box1'][i],
+                'max_box3': scen['niet_annuitair_max_box3'][i],
+                'ruimte_box1': scen['niet_annuitair_ruimte_box1'][i],
+                'ruimte_box3': scen['niet_annuitair_ruimte_box3'][i],
+            },
+        })
+        debug = {veld: dbg[veld][i] for veld in _DEBUG_VELDEN}
+        debug['gewogen_werkelijke_rente'] = gewogen_werkelijke_rente[i]
+        debugs.append(debug)
+    return scenarios, debugs
+
+
+def calculate_batch(inputs_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Bereken N input-dicts in één gevectoriseerde pass.
+
+    Returns:
+        Lijst in invoervolgorde. Per rij hetzelfde dict als
+        calculator_final.calculate(), of {'error': melding} als de scalaire
+        route voor die invoer een ValueError zou geven.
+    """
+    if not inputs_list:
+        return []
+
+    res = calculate_arrays(pack_inputs(inputs_list))
+    gwr = res['gewogen_werkelijke_rente'].tolist()
+    scenarios1, debugs1 = _scenario_rijen(res['scenario1'], gwr)
+
+    scenario2_per_rij: Dict[int, tuple] = {}
+    if res['scenario2'] is not None:
+        index2 = res['scenario2_index'].tolist()
+        scenarios2, debugs2 = _scenario_rijen(res['scenario2'], [gwr[i] for i in index2])
+        scenario2_per_rij = {i: (s, d) for i, s, d in zip(index2, scenarios2, debugs2)}
+
+    resultaten: List[Dict[str, Any]] = []
+    for i, fout in enumerate(res['fout'].tolist()):
+        if fout is not None:
+            resultaten.append({'error': fout})
+            continue
+        scenario2, debug2 = scenario2_per_rij.get(i, (None, None))
+        resultaten.append({
+            'scenario1': scenarios1[i],
+            'scenario2': scenario2,
+            'debug': debugs1[i],
+            'debug_scenario2': debug2,
+        })
+    return resultaten
+
+
+def _kolom_met_gaten(waarden: np.ndarray, index: np.ndarray, n: int) -> list:
+    """Waarden voor rijen `index` → lijst van lengte n, overige rijen None."""
+    uit = np.full(n, None, dtype=object)
+    uit[index] = waarden
+    return uit.tolist()
+
+
+def _scenario_kolommen(kolommen: Dict[str, np.ndarray], gewogen_werkelijke_rente: np.ndarray,
+                       index: np.ndarray, n: int) -> tuple:
+    """Scenario-kolommen van rijen `index` → (scenario, debug) als lijsten van lengte n."""
+    if index.size == n:
+        def lijst(waarden):
+            return waarden.tolist()
+    else:
+        def lijst(waarden):
+            return _kolom_met_gaten(waarden, index, n)
+    scenario = {
+        groep: {veld: lijst(kolommen[f"{groep}_{veld}"]) for g, veld in _SCENARIO_VELDEN if g == groep}
+        for groep in ('annuitair', 'niet_annuitair')
+    }
+    debug = {veld: lijst(kolommen[veld]) for veld in _DEBUG_VELDEN}
+    debug['gewogen_werkelijke_rente'] = lijst(gewogen_werkelijke_rente)
+    return scenario, debug
+
+
+def calculate_kolommen(n: int, kolommen: Dict[str, Sequence],
+                       delen: Optional[Dict[str, Sequence]] = None) -> Dict[str, Any]:
+    """
+    Bereken N berekeningen van kolommen naar kolommen (zie pack_kolommen).
+
+    Slaat de dicts per rij van calculate_batch() over: invoer en uitkomst
+    blijven lijsten per veld.
+
+    Returns:
+        {
+            'error': foutmelding of None per rij,
+            'scenario1': {'annuitair': {'max_box1': [...], ...}, 'niet_annuitair': {...}},
+            'scenario2': idem; None in rijen zonder scenario 2,
+            'debug': {'toets_inkomen': [...], ..., 'gewogen_werkelijke_rente': [...]},
+            'debug_scenario2': idem; None in rijen zonder scenario 2,
+        }
+        Rijen met een fout hebben None in alle uitkomstkolommen. Per rij
+        gelijk aan calculate_batch() voor dezelfde invoer.
+    """
+    res = calculate_arrays(pack_kolommen(n, kolommen, delen))
+    fout = res['fout']
+    ok = fout == None  # noqa: E711
+    gwr = res['gewogen_werkelijke_rente']
+
+    index1 = np.flatnonzero(ok)
+    scenario1 = {k: v[index1] for k, v in res['scenario1'].items()}
+    scenario1, debug1 = _scenario_kolommen(scenario1, gwr[index1], index1, n)
+
+    index2 = res['scenario2_index']
+    if res['scenario2'] is not None:
+        ok2 = ok[index2]
+        index2 = index2[ok2]
+        scenario2 = {k: v[ok2] for k, v in res['scenario2'].items()}
+    else:
+        scenario2 = {k: np.zeros(0) for k in res['scenario1']}
+    scenario2, debug2 = _scenario_kolommen(scenario2, gwr[index2], index2, n)
+
+    return {
+        'error': fout.tolist(),
+        'scenario1': scenario1,
+        'scenario2': scenario2,
+        'debug': debug1,
+        'debug_scenario2': debug2,
+    }
+
+
+# Velden die scenario 2 aansturen; in een gevoeligheidsgrid niet nodig
+_SCENARIO2_VELDEN = (
+    'gewijzigd_hoofd_inkomen_aanvrager2',
+    'gewijzigd_hoofd_inkomen_partner2',
+    'gewijzigd_hoofd_inkomen_aow2',
+    'inkomen_overige_aanvragers_min2',
+)
+
+
+def _matrix(kolom: np.ndarray, ok: np.ndarray, vorm: tuple) -> list:
+    """Kolom → geneste lijst met vorm `vorm`; foutcellen worden None."""
+    waarden = kolom.astype(object)
+    waarden[~ok] = None
+    return waarden.reshape(vorm).tolist()
+
+
+def calculate_grid(base_inputs: Dict[str, Any],
+                   assen: Sequence[Tuple[str, Sequence[Any]]]) -> Dict[str, Any]:
+    """
+    Gevoeligheidsanalyse: scenario 1 voor elke combinatie van aswaarden.
+
+    Args:
+        base_inputs: calculate()-invoer als basis
+        assen: [(veldnaam, waarden), ...]; elke cel = basis met per as
+            één waarde overschreven (cartesisch product, eerste as = buitenste)
+
+    Returns:
+        {
+            'shape': [len(waarden) per as],
+            'annuitair': {'max_box1': matrix, 'max_box3': matrix},
+            'niet_annuitair': {'max_box1': matrix, 'max_box3': matrix},
+            'errors': matrix met foutmelding of None per cel,
+        }
+    """
+    basis = {k: v for k, v in base_inputs.items() if k not in _SCENARIO2_VELDEN}
+    velden = [veld for veld, _ in assen]
+    vorm = tuple(len(waarden) for _, waarden in assen)
+
+    # Elke cel apart inpakken: een as kan afhankelijk van een andere as wel
+    # of niet meetellen (partnerinkomen alleen bij alleenstaande="NEE"),
+    # dus kolommen per as uitspreiden over het grid is niet veilig
+    cellen = [dict(basis, **dict(zip(velden, combinatie)))
+              for combinatie in product(*(waarden for _, waarden in assen))]
+    scenario1 = calculate_arrays(pack_inputs(cellen))['scenario1']
+    fout = scenario1['fout']
+    ok = fout == None  # noqa: E711
+
+    return {
+        'shape': list(vorm),
+        'annuitair': {
+            'max_box1': _matrix(scenario1['annuitair_max_box1'], ok, vorm),
+            'max_box3': _matrix(scenario1['annuitair_max_box3'], ok, vorm),
+        },
+        'niet_annuitair': {
+            'max_box1': _matrix(scenario1['niet_annuitair_max_box1'], ok, vorm),
+            'max_box3': _matrix(scenario1['niet_annuitair_max_box3'], ok, vorm),
+        },
+        'errors': fout.reshape(vorm).tolist(),
+    }
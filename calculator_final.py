@@ -4,13 +4,19 @@ Alle berekeningen exact volgens NAT-sheet 2026.xlsm
 Geen placeholders, geen simplificaties
 """
 
+import hashlib
 import json
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from operator import attrgetter
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, NamedTuple, Optional, Any, Union
+from dataclasses import dataclass, asdict, field, fields, replace
 
 # Load woonquote tables
 import os
 
+from calculation_cache import ResultCache
+import rekenpool
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 with open(
@@ -63,52 +69,52 @@ def pmt(rate: float, nper: float, pv: float, fv: float = 0) -> float:
     pvif = (1 + rate) ** nper
     return -(rate * (pv * pvif + fv)) / (pvif - 1)
 
+def _compileer_woonquote_tabel(table: Dict[str, Dict[str, float]]) -> tuple:
+    """
+    Compileer een woonquote-tabel naar gesorteerde numerieke arrays.
+
+    Returns:
+        (inkomens, rijen) waarbij rijen[i] = (rentes, woonquotes) voor
+        inkomens[i]. Elke rij heeft zijn eigen rente-as (in de huidige
+        tabellen identiek, maar de JSON garandeert dat niet).
+    """
+    inkomens = []
+    rijen = []
+    for income_key in sorted(table.keys(), key=float):
+        row = table[income_key]
+        rate_keys = sorted(row.keys(), key=float)
+        inkomens.append(float(income_key))
+        rijen.append((
+            [float(k) for k in rate_keys],
+            [row[k] for k in rate_keys],
+        ))
+    return inkomens, rijen
+
+
+# Eenmalig bij laden: tabellen als gesorteerde arrays voor bisect-lookup
+WOONQUOTE_INDEX = {
+    table_key: _compileer_woonquote_tabel(table)
+    for table_key, table in WOONQUOTE_TABLES.items()
+}
+
+
 def lookup_woonquote(toets_inkomen: float, toets_rente: float, ontvangt_aow: str, is_box3: bool) -> float:
-    """Woonquote lookup exact volgens Excel MATCH/XMATCH"""
+    """Woonquote lookup exact volgens Excel MATCH/XMATCH (bisect op WOONQUOTE_INDEX)"""
     if ontvangt_aow == 'JA':
         table_key = 'cWqVnfAowCons' if is_box3 else 'cWqVnfAow'
     else:
         table_key = 'cWqTotAowCons' if is_box3 else 'cWqTotAow'
 
-    table = WOONQUOTE_TABLES[table_key]
-
-    # MATCH: vind hoogste inkomen <= toets_inkomen
-    income_keys = sorted([float(k) for k in table.keys()])
-    selected_income = income_keys[0]
-    for income in income_keys:
-        if toets_inkomen >= income:
-            selected_income = income
-        else:
-            break
-
-    row_data = None
-    for key in table.keys():
-        if float(key) == selected_income:
-            row_data = table[key]
-            break
+    inkomens, rijen = WOONQUOTE_INDEX[table_key]
 
-    if row_data is None:
-        raise KeyError(f"Income {selected_income} not found in table {table_key}")
+    # MATCH: vind hoogste inkomen <= toets_inkomen (onder laagste → eerste rij)
+    row_idx = max(0, bisect_right(inkomens, toets_inkomen) - 1)
+    rentes, quotes = rijen[row_idx]
 
     # XMATCH: vind laagste rente >= toets_rente, or laatste kolom
-    rate_keys = sorted([float(k) for k in row_data.keys()])
-    selected_rate = rate_keys[-1]  # default laatste
+    col_idx = min(bisect_left(rentes, toets_rente), len(rentes) - 1)
 
-    for rate in rate_keys:
-        if toets_rente <= rate:
-            selected_rate = rate
-            break
-
-    rate_value = None
-    for key in row_data.keys():
-        if float(key) == selected_rate:
-            rate_value = row_data[key]
-            break
-
-    if rate_value is None:
-        raise KeyError(f"Rate {selected_rate} not found")
-
-    return rate_value
+    return quotes[col_idx]
 
 ENERGIELABEL_MAP = {
     "geen_label": "Geen (geldig) Label",
@@ -182,159 +188,366 @@ def calculate_c73(toets_rente: float, studievoorschot: float) -> float:
 
     return jaar_bedrag * STUDIELENING_CONFIG["default_factor"]
 
-def calculate(inputs: Dict[str, Any]) -> Dict[str, Any]:
-    """Main calculation - Excel exact"""
+class _NietOpgegeven:
+    """Sentinel: veld niet opgegeven (onderscheidt "ontbreekt" van een expliciete None)."""
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return 'NIET_OPGEGEVEN'
+
+
+_NIET_OPGEGEVEN = _NietOpgegeven()
+
+
+class Leningdeel(NamedTuple):
+    """Eén hypotheekdeel (J–R van de NAT-sheet); onveranderlijk."""
+    aflos_type: str = ''
+    org_lpt: float = 0
+    rest_lpt: float = 0
+    hoofdsom_box1: float = 0
+    hoofdsom_box3: float = 0
+    rvp: float = 0
+    inleg_overig: float = 0
+    werkelijke_rente: float = 0
+
+    @classmethod
+    def uit_dict(cls, deel: Dict[str, Any]) -> 'Leningdeel':
+        return cls(
+            deel.get('aflos_type', ''),
+            deel.get('org_lpt', 0),
+            deel.get('rest_lpt', 0),
+            deel.get('hoofdsom_box1', 0),
+            deel.get('hoofdsom_box3', 0),
+            deel.get('rvp', 0),
+            deel.get('inleg_overig', 0),
+            deel.get('werkelijke_rente', 0),
+        )
 
-    # Constanten (defaults uit config/fiscaal.json)
-    c_toets_rente = inputs.get('c_toets_rente', _FISCAAL_DEFAULTS["c_toets_rente"])
-    c_actuele_10jr_rente = inputs.get('c_actuele_10jr_rente', _FISCAAL_DEFAULTS["c_actuele_10jr_rente"])
-    c_rvp_toets_rente = inputs.get('c_rvp_toets_rente', _FISCAAL_DEFAULTS["c_rvp_toets_rente"])
-    c_factor_2e_inkomen = inputs.get('c_factor_2e_inkomen', _FISCAAL_DEFAULTS["c_factor_2e_inkomen"])
-    c_lpt = inputs.get('c_lpt', _FISCAAL_DEFAULTS["c_lpt"])
-    c_alleen_grens_o = inputs.get('c_alleen_grens_o', _FISCAAL_DEFAULTS["c_alleen_grens_o"])
-    c_alleen_grens_b = inputs.get('c_alleen_grens_b', _FISCAAL_DEFAULTS["c_alleen_grens_b"])
-    c_alleen_factor = inputs.get('c_alleen_factor', _FISCAAL_DEFAULTS["c_alleen_factor"])
 
-    # Inputs
-    hoofd_inkomen_aanvrager = inputs.get('hoofd_inkomen_aanvrager', 0)
-    hoofd_inkomen_partner = inputs.get('hoofd_inkomen_partner', 0)
-    alleenstaande = inputs.get('alleenstaande', 'JA')
-    ontvangt_aow = inputs.get('ontvangt_aow', 'NEE')
-
-    # F16, G16 - Inkomen berekening
-    inkomen_aanvrager = (
-        hoofd_inkomen_aanvrager +
-        inputs.get('inkomen_uit_lijfrente_aanvrager', 0) +
-        inputs.get('ontvangen_partneralimentatie_aanvrager', 0) +
-        inputs.get('inkomsten_uit_vermogen_aanvrager', 0) +
-        inputs.get('huurinkomsten_aanvrager', 0) -
-        inputs.get('te_betalen_partneralimentatie_aanvrager', 0)
-    )
+@dataclass(frozen=True, slots=True)
+class LeningAggregaten:
+    """Inkomensonafhankelijke aggregaten over de hypotheekdelen (K19, N19, O19, S19, T19–Y19)."""
+    aantal_niet_annuitair: int
+    som_box1: float
+    som_box3: float
+    gewogen_rente: float
+    gewogen_werkelijke_rente: float
+    T19: float
+    U19: float
+    V19: float
+    W19: float
+    X19: float
+    Y19: float
+
+
+def aggregeer_leningdelen(delen: tuple, c_toets_rente: float,
+                          c_rvp_toets_rente: float) -> LeningAggregaten:
+    """
+    K19, N19, O19, S19 en T19–Y19 in één doorgang over de delen.
 
-    inkomen_partner = (
-        hoofd_inkomen_partner +
-        inputs.get('inkomen_uit_lijfrente_partner', 0) +
-        inputs.get('ontvangen_partneralimentatie_partner', 0) -
-        inputs.get('te_betalen_partneralimentatie_partner', 0)
-    )
+    Sommen lopen van links naar rechts vanaf int 0, net als sum(), zodat
+    de uitkomst bit-identiek is aan de kolomsgewijze sheetberekening.
+    """
+    aantal_niet_annuitair = 0
+    som_box1 = som_box3 = 0
+    numerator = denominator = 0
+    num_werk = den_werk = 0
+    T19 = U19 = V19 = W19 = X19 = Y19 = 0
+
+    for d in delen:
+        box1, box3, rest_lpt = d.hoofdsom_box1, d.hoofdsom_box3, d.rest_lpt
+
+        # K9:K18 - Is annuitair/lineair?  S9:S18 - Rente per deel
+        is_annuitair_linear = d.aflos_type in ['Annuïteit', 'Lineair']
+        if not is_annuitair_linear:
+            aantal_niet_annuitair += 1
+        rente = c_toets_rente if d.rvp < c_rvp_toets_rente else d.werkelijke_rente
+
+        # N19, O19 en tellers/noemers voor S19 en de gewogen werkelijke rente
+        som_box1 = som_box1 + box1
+        som_box3 = som_box3 + box3
+        numerator = numerator + (rente * box1 * rest_lpt + rente * box3 * rest_lpt)
+        denominator = denominator + (box1 * rest_lpt + box3 * rest_lpt)
+        num_werk = num_werk + d.werkelijke_rente * (box1 + box3) * rest_lpt
+        den_werk = den_werk + (box1 + box3) * rest_lpt
 
-    # F18 - Inkomen totaal
-    inkomen_overige = inputs.get('inkomen_overige_aanvragers', 0)
-    if alleenstaande == 'JA':
-        inkomen_totaal = inkomen_aanvrager + inkomen_overige
-    else:
-        inkomen_totaal = inkomen_aanvrager + inkomen_partner + inkomen_overige
-
-    # Hypotheek delen
-    hypotheek_delen_raw = inputs.get('hypotheek_delen', [])
-    hypotheek_delen = []
-    for deel in hypotheek_delen_raw[:10]:
-        hypotheek_delen.append({
-            'aflos_type': deel.get('aflos_type', ''),
-            'org_lpt': deel.get('org_lpt', 0),
-            'rest_lpt': deel.get('rest_lpt', 0),
-            'hoofdsom_box1': deel.get('hoofdsom_box1', 0),
-            'hoofdsom_box3': deel.get('hoofdsom_box3', 0),
-            'rvp': deel.get('rvp', 0),
-            'inleg_overig': deel.get('inleg_overig', 0),
-            'werkelijke_rente': deel.get('werkelijke_rente', 0),
-        })
-
-    # K9:K18 - Is annuitair/lineair?
-    # S9:S18 - Rente per deel
-    delen_processed = []
-    for deel in hypotheek_delen:
-        is_annuitair_linear = deel['aflos_type'] in ['Annuïteit', 'Lineair']
-        k_value = 0 if is_annuitair_linear else 1
-        rente = c_toets_rente if deel['rvp'] < c_rvp_toets_rente else deel['werkelijke_rente']
-
-        delen_processed.append({
-            **deel,
-            'k_value': k_value,
-            'rente': rente,
-            'is_annuitair_linear': is_annuitair_linear,
-        })
-
-    # K19 - Aantal NIET-annuitair (LET OP: variabele naam!)
-    aantal_niet_annuitair = sum(d['k_value'] for d in delen_processed)
-
-    # N19, O19 - Som hoofdsommen
-    som_box1 = sum(d['hoofdsom_box1'] for d in delen_processed)
-    som_box3 = sum(d['hoofdsom_box3'] for d in delen_processed)
-
-    # S19 - Gewogen rente
+        # T, U - Excel: =PMT(S9/12,IF(OR(J9="Annuïteit", J9="Lineair"),M9,L9),-N9)*12
+        lpt = rest_lpt if is_annuitair_linear else d.org_lpt
+        T = -pmt(rente / 12, lpt, box1) * 12
+        U = -pmt(rente / 12, lpt, box3) * 12
+
+        # V, W - Excel: =IF(J9="Annuïteit",12*PMT(S9/12,M9,-N9,0),IF(J9="Lineair",(N9)*(S9+12/M9),(N9)*S9))
+        if d.aflos_type == 'Annuïteit':
+            V = -12 * pmt(rente / 12, rest_lpt, box1, 0)
+            W = -12 * pmt(rente / 12, rest_lpt, box3, 0)
+        elif d.aflos_type == 'Lineair':
+            V = box1 * (rente + 12 / rest_lpt)
+            W = box3 * (rente + 12 / rest_lpt)
+        else:  # Aflossingsvrij
+            V = box1 * rente
+            W = box3 * rente
+
+        # X, Y - Excel: =IF(T9>0,Deel1InlegOverig,"0")
+        T19 = T19 + T
+        U19 = U19 + U
+        V19 = V19 + V
+        W19 = W19 + W
+        X19 = X19 + (d.inleg_overig if T > 0 else 0)
+        Y19 = Y19 + (d.inleg_overig if U > 0 else 0)
+
+    # S19 - Gewogen rente; gewogen werkelijke rente (UI, gewogen op bedrag × rest_lpt)
     if som_box1 == 0 and som_box3 == 0:
         gewogen_rente = c_toets_rente
+        gewogen_werkelijke_rente = 0.0
     else:
-        numerator = sum(
-            d['rente'] * d['hoofdsom_box1'] * d['rest_lpt'] +
-            d['rente'] * d['hoofdsom_box3'] * d['rest_lpt']
-            for d in delen_processed
-        )
-        denominator = sum(
-            d['hoofdsom_box1'] * d['rest_lpt'] +
-            d['hoofdsom_box3'] * d['rest_lpt']
-            for d in delen_processed
-        )
         gewogen_rente = numerator / denominator if denominator > 0 else c_toets_rente
+        gewogen_werkelijke_rente = num_werk / den_werk if den_werk > 0 else 0.0
 
-    # Gewogen werkelijke rente (voor UI weergave, gewogen op bedrag × rest_lpt)
-    if som_box1 == 0 and som_box3 == 0:
-        gewogen_werkelijke_rente = 0.0
-    else:
-        num_werk = sum(
-            d['werkelijke_rente'] * (d['hoofdsom_box1'] + d['hoofdsom_box3']) * d['rest_lpt']
-            for d in delen_processed
+    return LeningAggregaten(
+        aantal_niet_annuitair, som_box1, som_box3, gewogen_rente, gewogen_werkelijke_rente,
+        T19, U19, V19, W19, X19, Y19,
+    )
+
+
+def _fiscaal_default(naam: str):
+    """Dataclass-default uit config/fiscaal.json, gelezen bij opbouw (volgt herladen)."""
+    return field(default_factory=lambda: _FISCAAL_DEFAULTS[naam])
+
+
+@dataclass(frozen=True, slots=True)
+class BerekeningInvoer:
+    """
+    Invoer voor calculate(), eenmalig opgebouwd uit een request of dict.
+
+    Ontbrekende constanten krijgen bij opbouw de waarde uit config/fiscaal.json.
+    De leningaggregaten worden bij eerste gebruik in één doorgang berekend en
+    blijven via met() behouden zolang delen en toetsrente-constanten gelijk zijn.
+    """
+    hoofd_inkomen_aanvrager: float = 0
+    hoofd_inkomen_partner: float = 0
+    inkomen_uit_lijfrente_aanvrager: float = 0
+    inkomen_uit_lijfrente_partner: float = 0
+    ontvangen_partneralimentatie_aanvrager: float = 0
+    ontvangen_partneralimentatie_partner: float = 0
+    inkomsten_uit_vermogen_aanvrager: float = 0
+    huurinkomsten_aanvrager: float = 0
+    te_betalen_partneralimentatie_aanvrager: float = 0
+    te_betalen_partneralimentatie_partner: float = 0
+    inkomen_overige_aanvragers: float = 0
+    alleenstaande: str = 'JA'
+    ontvangt_aow: str = 'NEE'
+    energielabel: Optional[str] = None
+    verduurzamings_maatregelen: float = 0
+    limieten_bkr_geregistreerd: float = 0
+    limieten_niet_bkr_geregistreerd: float = 0
+    studievoorschot_studielening: float = 0
+    erfpachtcanon_per_jaar: float = 0
+    jaarlast_overige_kredieten: float = 0
+    hypotheek_delen: tuple = ()
+    gewijzigd_hoofd_inkomen_aanvrager2: Optional[float] = None
+    gewijzigd_hoofd_inkomen_partner2: Optional[float] = None
+    gewijzigd_hoofd_inkomen_aow2: Any = _NIET_OPGEGEVEN   # default: ontvangt_aow
+    inkomen_overige_aanvragers_min2: float = 0
+    c_toets_rente: float = _fiscaal_default('c_toets_rente')
+    c_actuele_10jr_rente: float = _fiscaal_default('c_actuele_10jr_rente')
+    c_rvp_toets_rente: float = _fiscaal_default('c_rvp_toets_rente')
+    c_factor_2e_inkomen: float = _fiscaal_default('c_factor_2e_inkomen')
+    c_lpt: float = _fiscaal_default('c_lpt')
+    c_alleen_grens_o: float = _fiscaal_default('c_alleen_grens_o')
+    c_alleen_grens_b: float = _fiscaal_default('c_alleen_grens_b')
+    c_alleen_factor: float = _fiscaal_default('c_alleen_factor')
+    _aggregaten: Optional[LeningAggregaten] = field(default=None, init=False, repr=False, compare=False)
+    _sleutel: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Maximaal 10 delen (sheet-rijen 9–18); al omgezette tuples blijven hetzelfde object
+        delen = self.hypotheek_delen
+        if (type(delen) is not tuple or len(delen) > 10
+                or any(type(d) is not Leningdeel for d in delen)):
+            object.__setattr__(self, 'hypotheek_delen', tuple(
+                d if isinstance(d, Leningdeel) else Leningdeel.uit_dict(d)
+                for d in delen[:10]
+            ))
+
+    @classmethod
+    def uit_dict(cls, inputs: Dict[str, Any]) -> 'BerekeningInvoer':
+        """Record uit een calculate()-invoerdict; onbekende keys worden genegeerd."""
+        return cls(**{naam: inputs[naam] for naam in _INVOER_VELDEN if naam in inputs})
+
+    @property
+    def aggregaten(self) -> LeningAggregaten:
+        if self._aggregaten is None:
+            object.__setattr__(self, '_aggregaten', aggregeer_leningdelen(
+                self.hypotheek_delen, self.c_toets_rente, self.c_rvp_toets_rente))
+        return self._aggregaten
+
+    def met(self, **wijzigingen) -> 'BerekeningInvoer':
+        """Kopie met gewijzigde velden; leningaggregaten worden hergebruikt als dat kan."""
+        nieuw = replace(self, **wijzigingen)
+        if (self._aggregaten is not None
+                and nieuw.hypotheek_delen is self.hypotheek_delen
+                and nieuw.c_toets_rente is self.c_toets_rente
+                and nieuw.c_rvp_toets_rente is self.c_rvp_toets_rente):
+            object.__setattr__(nieuw, '_aggregaten', self._aggregaten)
+        return nieuw
+
+    def cache_sleutel(self, *versies: str) -> tuple:
+        """Cachesleutel: hash over de repr van alle velden (int/float blijven onderscheiden) plus configversie(s)."""
+        if self._sleutel is None:
+            object.__setattr__(self, '_sleutel', hashlib.blake2b(
+                repr(_invoer_waarden(self)).encode('utf-8'), digest_size=16).digest())
+        return (self._sleutel,) + versies
+
+    def inkomens(self) -> tuple:
+        """
+        Inkomens volgens F16, G16 en F18
+
+        Returns:
+            (inkomen_aanvrager, inkomen_partner, inkomen_totaal)
+        """
+        # F16, G16 - Inkomen berekening
+        inkomen_aanvrager = (
+            self.hoofd_inkomen_aanvrager +
+            self.inkomen_uit_lijfrente_aanvrager +
+            self.ontvangen_partneralimentatie_aanvrager +
+            self.inkomsten_uit_vermogen_aanvrager +
+            self.huurinkomsten_aanvrager -
+            self.te_betalen_partneralimentatie_aanvrager
         )
-        den_werk = sum(
-            (d['hoofdsom_box1'] + d['hoofdsom_box3']) * d['rest_lpt']
-            for d in delen_processed
+
+        inkomen_partner = (
+            self.hoofd_inkomen_partner +
+            self.inkomen_uit_lijfrente_partner +
+            self.ontvangen_partneralimentatie_partner -
+            self.te_betalen_partneralimentatie_partner
         )
-        gewogen_werkelijke_rente = num_werk / den_werk if den_werk > 0 else 0.0
 
-    # T-Y kolommen - Rente lasten
-    rente_betalingen = []
-    for d in delen_processed:
-        lpt = d['rest_lpt'] if d['is_annuitair_linear'] else d['org_lpt']
-        rente = d['rente']
+        # F18 - Inkomen totaal
+        if self.alleenstaande == 'JA':
+            inkomen_totaal = inkomen_aanvrager + self.inkomen_overige_aanvragers
+        else:
+            inkomen_totaal = inkomen_aanvrager + inkomen_partner + self.inkomen_overige_aanvragers
 
-        # T, U - Excel: =PMT(S9/12,IF(OR(J9="Annuïteit", J9="Lineair"),M9,L9),-N9)*12
-        T = -pmt(rente / 12, lpt, d['hoofdsom_box1']) * 12
-        U = -pmt(rente / 12, lpt, d['hoofdsom_box3']) * 12
+        return inkomen_aanvrager, inkomen_partner, inkomen_totaal
 
-        # V, W - Excel: =IF(J9="Annuïteit",12*PMT(S9/12,M9,-N9,0),IF(J9="Lineair",(N9)*(S9+12/M9),(N9)*S9))
-        if d['aflos_type'] == 'Annuïteit':
-            V = -12 * pmt(rente / 12, d['rest_lpt'], d['hoofdsom_box1'], 0)
-            W = -12 * pmt(rente / 12, d['rest_lpt'], d['hoofdsom_box3'], 0)
-        elif d['aflos_type'] == 'Lineair':
-            V = d['hoofdsom_box1'] * (rente + 12 / d['rest_lpt'])
-            W = d['hoofdsom_box3'] * (rente + 12 / d['rest_lpt'])
-        else:  # Aflossingsvrij
-            V = d['hoofdsom_box1'] * rente
-            W = d['hoofdsom_box3'] * rente
 
-        # X, Y - Excel: =IF(T9>0,Deel1InlegOverig,"0")
-        X = d['inleg_overig'] if T > 0 else 0
-        Y = d['inleg_overig'] if U > 0 else 0
+_INVOER_VELDEN = tuple(f.name for f in fields(BerekeningInvoer) if f.init)
+_invoer_waarden = attrgetter(*_INVOER_VELDEN)
+
+
+def _als_invoer(inputs) -> BerekeningInvoer:
+    return inputs if isinstance(inputs, BerekeningInvoer) else BerekeningInvoer.uit_dict(inputs)
+
+
+def _bereken_config_versie() -> str:
+    """Hash over de geladen configuratie (woonquote, energielabel, studielening, fiscaal)."""
+    inhoud = json.dumps(
+        [WOONQUOTE_TABLES, ENERGIELABEL_CONFIG, STUDIELENING_CONFIG, _FISCAAL_DEFAULTS],
+        sort_keys=True,
+    )
+    return hashlib.sha256(inhoud.encode('utf-8')).hexdigest()[:16]
+
+
+CONFIG_VERSIE = _bereken_config_versie()
 
-        rente_betalingen.append({'T': T, 'U': U, 'V': V, 'W': W, 'X': X, 'Y': Y})
+# Resultaatcache voor calculate() (CALC_CACHE_MAXSIZE=0 schakelt uit)
+RESULTAAT_CACHE = ResultCache(
+    maxsize=int(os.environ.get("CALC_CACHE_MAXSIZE", "2048")),
+    ttl=float(os.environ.get("CALC_CACHE_TTL", "3600")),
+)
 
-    # Sommen T19, U19, V19, W19, X19, Y19
-    T19 = sum(r['T'] for r in rente_betalingen)
-    U19 = sum(r['U'] for r in rente_betalingen)
-    V19 = sum(r['V'] for r in rente_betalingen)
-    W19 = sum(r['W'] for r in rente_betalingen)
-    X19 = sum(r['X'] for r in rente_betalingen)
-    Y19 = sum(r['Y'] for r in rente_betalingen)
+
+def herlaad_fiscaal_defaults() -> None:
+    """
+    Herlaad config/fiscaal.json na een wijziging (PUT /config/fiscaal).
+
+    _FISCAAL_DEFAULTS wordt in-place bijgewerkt zodat modules die de dict
+    geïmporteerd hebben de nieuwe waarden zien; de resultaatcache wordt geleegd.
+    Workers van een process pool lezen de config alleen bij het opstarten en
+    worden daarom eerst vervangen (rekenpool.herstart), vóór CONFIG_VERSIE
+    wijzigt: zo komt er nooit een oud resultaat onder de nieuwe versie.
+    """
+    global CONFIG_VERSIE
+    rekenpool.herstart()
+    with open(os.path.join(BASE_DIR, 'config', 'fiscaal.json'), 'r', encoding='utf-8') as f:
+        nieuw = json.load(f)["defaults"]
+    _FISCAAL_DEFAULTS.clear()
+    _FISCAAL_DEFAULTS.update(nieuw)
+    CONFIG_VERSIE = _bereken_config_versie()
+    RESULTAAT_CACHE.clear()
+
+
+def _kopieer_resultaat(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Kopie van een calculate()-resultaat, zodat aanroepers de cache niet muteren."""
+    def scenario(s):
+        return {k: dict(v) for k, v in s.items()} if s is not None else None
+
+    return {
+        'scenario1': scenario(result['scenario1']),
+        'scenario2': scenario(result['scenario2']),
+        'debug': dict(result['debug']),
+        'debug_scenario2': dict(result['debug_scenario2']) if result['debug_scenario2'] is not None else None,
+    }
+
+
+def calculate(inputs: Union[Dict[str, Any], BerekeningInvoer]) -> Dict[str, Any]:
+    """Main calculation - Excel exact (met resultaatcache, zie RESULTAAT_CACHE)"""
+    invoer = _als_invoer(inputs)
+    if not RESULTAAT_CACHE.enabled:
+        return _calculate(invoer)
+
+    sleutel = invoer.cache_sleutel(CONFIG_VERSIE)
+    gevonden = RESULTAAT_CACHE.get(sleutel)
+    if gevonden is not None:
+        return _kopieer_resultaat(gevonden)
+
+    result = _calculate(invoer)
+    RESULTAAT_CACHE.put(sleutel, _kopieer_resultaat(result))
+    return result
+
+
+def _calculate(inputs: Union[Dict[str, Any], BerekeningInvoer]) -> Dict[str, Any]:
+    """Main calculation - Excel exact"""
+    invoer = _als_invoer(inputs)
+
+    # Constanten (defaults uit config/fiscaal.json, ingevuld bij opbouw van de invoer)
+    c_toets_rente = invoer.c_toets_rente
+    c_actuele_10jr_rente = invoer.c_actuele_10jr_rente
+    c_factor_2e_inkomen = invoer.c_factor_2e_inkomen
+    c_lpt = invoer.c_lpt
+    c_alleen_grens_o = invoer.c_alleen_grens_o
+    c_alleen_grens_b = invoer.c_alleen_grens_b
+    c_alleen_factor = invoer.c_alleen_factor
+
+    # Inputs
+    alleenstaande = invoer.alleenstaande
+    ontvangt_aow = invoer.ontvangt_aow
+
+    # F16, G16, F18 - Inkomen berekening
+    inkomen_aanvrager, inkomen_partner, inkomen_totaal = invoer.inkomens()
+
+    # Hypotheek delen (K19, N19, O19, S19, T19–Y19)
+    leningdelen = invoer.aggregaten
+    aantal_niet_annuitair = leningdelen.aantal_niet_annuitair
+    som_box1 = leningdelen.som_box1
+    som_box3 = leningdelen.som_box3
+    gewogen_rente = leningdelen.gewogen_rente
+    gewogen_werkelijke_rente = leningdelen.gewogen_werkelijke_rente
+    T19 = leningdelen.T19
+    U19 = leningdelen.U19
+    V19 = leningdelen.V19
+    W19 = leningdelen.W19
+    X19 = leningdelen.X19
+    Y19 = leningdelen.Y19
 
     # F44 inputs
-    limieten_bkr = inputs.get('limieten_bkr_geregistreerd', 0)
-    limieten_niet_bkr = inputs.get('limieten_niet_bkr_geregistreerd', 0)
-    erfpacht = inputs.get('erfpachtcanon_per_jaar', 0)
-    jaarlast = inputs.get('jaarlast_overige_kredieten', 0)
-    studievoorschot = inputs.get('studievoorschot_studielening', 0)
-    energielabel = inputs.get('energielabel')
-    verduurzamings_maatregelen = inputs.get('verduurzamings_maatregelen', 0)
+    limieten_bkr = invoer.limieten_bkr_geregistreerd
+    limieten_niet_bkr = invoer.limieten_niet_bkr_geregistreerd
+    erfpacht = invoer.erfpachtcanon_per_jaar
+    jaarlast = invoer.jaarlast_overige_kredieten
+    studievoorschot = invoer.studievoorschot_studielening
+    energielabel = invoer.energielabel
+    verduurzamings_maatregelen = invoer.verduurzamings_maatregelen
 
     # Scenario 1
     scenario1_result = calculate_scenario(
@@ -355,20 +568,22 @@ def calculate(inputs: Dict[str, Any]) -> Dict[str, Any]:
     # Scenario 2 - alleen als F29 EN/OF G29 gevuld
     scenario2 = None
     debug2 = None
-    gewijzigd_aanvrager2 = inputs.get('gewijzigd_hoofd_inkomen_aanvrager2')
-    gewijzigd_partner2 = inputs.get('gewijzigd_hoofd_inkomen_partner2')
+    gewijzigd_aanvrager2 = invoer.gewijzigd_hoofd_inkomen_aanvrager2
+    gewijzigd_partner2 = invoer.gewijzigd_hoofd_inkomen_partner2
 
     if is_filled(gewijzigd_aanvrager2) or is_filled(gewijzigd_partner2):
         gewijzigd_aanvrager2 = gewijzigd_aanvrager2 if gewijzigd_aanvrager2 is not None else 0
         gewijzigd_partner2 = gewijzigd_partner2 if gewijzigd_partner2 is not None else 0
-        inkomen_overige_min2 = inputs.get('inkomen_overige_aanvragers_min2', 0)
+        inkomen_overige_min2 = invoer.inkomen_overige_aanvragers_min2
 
         if alleenstaande == 'JA':
             inkomen_min2_totaal = gewijzigd_aanvrager2 + inkomen_overige_min2
         else:
             inkomen_min2_totaal = gewijzigd_aanvrager2 + gewijzigd_partner2 + inkomen_overige_min2
 
-        ontvangt_aow2 = inputs.get('gewijzigd_hoofd_inkomen_aow2', ontvangt_aow)
+        ontvangt_aow2 = invoer.gewijzigd_hoofd_inkomen_aow2
+        if ontvangt_aow2 is _NIET_OPGEGEVEN:
+            ontvangt_aow2 = ontvangt_aow
 
         scenario2_result = calculate_scenario(
             inkomen_min2_totaal, gewijzigd_aanvrager2, gewijzigd_partner2,
@@ -14,10 +14,17 @@ Regels:
 - Geen extra vrijwillige aflossingen aangenomen
 - Box1→Box3 transitie op basis van rente_aftrekbaar_tot datum
 - rest_lpt: restant voor annuïteit/lineair, org_lpt voor aflossingsvrij/spaar
+
+projecteer_batch() projecteert veel sets delen tegelijk (portefeuille) en
+projecteer_tijdlijn() één set delen op veel tijdstippen (grafieken,
+AOW-momenten), beide met NumPy en bit-identiek aan projecteer_hypotheekdelen().
 """
 
+from dataclasses import dataclass
 from datetime import date
 
+import numpy as np
+
 
 def projecteer_hypotheekdelen(delen: list[dict], elapsed_months: int,
                               peildatum: date = None) -> list[dict]:
@@ -169,3 +176,258 @@ def _lineair_restant(hoofdsom: float, rest_lpt: int, elapsed: int) -> float:
     maandelijkse_aflossing = hoofdsom / rest_lpt
     restant = hoofdsom - maandelijkse_aflossing * elapsed
     return round(max(0, restant), 2)
+
+
+def projecteer_batch(delen_per_item: list[list[dict]], elapsed_months: list[int],
+                     peildata: list[date] = None) -> list[list[dict]]:
+    """
+    Projecteer N sets hypotheekdelen in één gevectoriseerde pass.
+
+    Per item hetzelfde resultaat als
+    projecteer_hypotheekdelen(delen_per_item[i], elapsed_months[i], peildata[i]):
+    restant (PMT en closed-form annuïteit) en box-verdeling worden als
+    kolommen over alle delen uitgerekend, machtsverheffing en afronding via
+    de exacte helpers van calculator_batch.
+    """
+    from calculator_batch import _pow_exact, _round_exact
+
+    if peildata is None:
+        peildata = [None] * len(delen_per_item)
+
+    # Delen die geprojecteerd moeten worden, platgeslagen
+    vlak = []            # (item, deel, aflos_type, box1, box3, hoofdsom, rente, rest_lpt, org_lpt, elapsed)
+    for i, (delen, elapsed) in enumerate(zip(delen_per_item, elapsed_months)):
+        if elapsed <= 0:
+            continue
+        for deel in delen:
+            hoofdsom_box1 = deel.get('hoofdsom_box1', 0)
+            hoofdsom_box3 = deel.get('hoofdsom_box3', 0)
+            rest_lpt = deel.get('rest_lpt', deel.get('org_lpt', 360))
+            vlak.append((i, deel, deel.get('aflos_type', ''), hoofdsom_box1, hoofdsom_box3,
+                         hoofdsom_box1 + hoofdsom_box3, deel.get('werkelijke_rente', 0),
+                         rest_lpt, deel.get('org_lpt', rest_lpt), elapsed))
+
+    n = len(vlak)
+    restant = np.empty(n)
+    new_rest_lpt = [0] * n
+    aflossend = np.zeros(n, dtype=bool)     # annuïteit/lineair binnen de looptijd
+    annuitair = np.zeros(n, dtype=bool)
+    for k, (_, _, aflos_type, _, _, hoofdsom, _, rest_lpt, org_lpt, elapsed) in enumerate(vlak):
+        if aflos_type in ('Annuïteit', 'Lineair'):
+            if elapsed >= rest_lpt:
+                restant[k] = 0.0
+            else:
+                aflossend[k] = True
+                annuitair[k] = aflos_type == 'Annuïteit'
+                new_rest_lpt[k] = rest_lpt - elapsed
+        elif aflos_type in ('Spaar', 'Spaarhypotheek') and elapsed >= rest_lpt:
+            restant[k] = 0.0
+        else:
+            # Aflossingsvrij, spaar binnen looptijd, onbekend: geen aflossing
+            restant[k] = hoofdsom
+            new_rest_lpt[k] = org_lpt
+
+    if aflossend.any():
+        idx = np.flatnonzero(aflossend)
+        kolom = lambda pos: np.array([vlak[k][pos] for k in idx.tolist()], dtype=float)  # noqa: E731
+        hoofdsom, rente, rest_lpt, elapsed = kolom(5), kolom(6), kolom(7), kolom(9)
+        ann = annuitair[idx]
+        r = rente / 12
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            # Annuïteit (r != 0): B_n = P(1+r)^n - A * ((1+r)^n - 1) / r
+            factor_n = _pow_exact(1 + r, rest_lpt)
+            maandlast = hoofdsom * (r * factor_n) / (factor_n - 1)
+            factor_e = _pow_exact(1 + r, elapsed)
+            ann_restant = hoofdsom * factor_e - maandlast * (factor_e - 1) / r
+            # Lineair, en annuïteit met rente 0
+            lin_restant = hoofdsom - hoofdsom / rest_lpt * elapsed
+        waarde = np.where(ann & (r != 0), ann_restant, lin_restant)
+        restant[idx] = _round_exact(np.maximum(0, waarde), 2)
+
+    # Box1/box3 verdeling naar rato van het restant
+    hoofdsommen = np.array([v[5] for v in vlak], dtype=float)
+    positief = (hoofdsommen > 0) & (restant > 0)
+    box1 = np.zeros(n)
+    box3 = np.zeros(n)
+    if positief.any():
+        idx = np.flatnonzero(positief)
+        ratio = restant[idx] / hoofdsommen[idx]
+        box1[idx] = _round_exact(np.array([vlak[k][3] for k in idx.tolist()], dtype=float) * ratio, 2)
+        box3[idx] = _round_exact(np.array([vlak[k][4] for k in idx.tolist()], dtype=float) * ratio, 2)
+
+    resultaat = [
+        [dict(d) for d in delen] if elapsed <= 0 else []
+        for delen, elapsed in zip(delen_per_item, elapsed_months)
+    ]
+    box1_l, box3_l, positief_l = box1.tolist(), box3.tolist(), positief.tolist()
+    for k, (i, deel, aflos_type, _, _, _, rente, _, org_lpt, elapsed) in enumerate(vlak):
+        if not positief_l[k]:
+            continue        # volledig afgelost (of hoofdsom 0): uitfilteren
+        b1, b3 = box1_l[k], box3_l[k]
+        peildatum = peildata[i]
+        if peildatum and 'rente_aftrekbaar_tot' in deel and deel['rente_aftrekbaar_tot']:
+            aftrekbaar_tot = deel['rente_aftrekbaar_tot']
+            if isinstance(aftrekbaar_tot, str):
+                aftrekbaar_tot = date.fromisoformat(aftrekbaar_tot)
+            if peildatum > aftrekbaar_tot:
+                b3 = round(b1 + b3, 2)
+                b1 = 0.0
+        if b1 + b3 > 0:
+            resultaat[i].append({
+                'aflos_type': aflos_type,
+                'org_lpt': org_lpt,
+                'rest_lpt': new_rest_lpt[k],
+                'hoofdsom_box1': b1,
+                'hoofdsom_box3': b3,
+                'rvp': max(0, deel.get('rvp', 120) - elapsed),
+                'werkelijke_rente': rente,
+                'inleg_overig': deel.get('inleg_overig', 0),
+            })
+    return resultaat
+
+
+@dataclass(frozen=True)
+class Tijdlijn:
+    """
+    Projectie van één set hypotheekdelen op T tijdstippen.
+
+    Arrays hebben vorm (aantal delen, T); kolom t hoort bij elapsed[t].
+    hoofdsom_box1/box3 zijn afgerond zoals in projecteer_hypotheekdelen
+    (inclusief box1→box3 na rente_aftrekbaar_tot), restschuld is het
+    onafgeronde restant volgens de closed-form formules.
+    """
+
+    delen: list
+    elapsed: np.ndarray
+    restschuld: np.ndarray
+    hoofdsom_box1: np.ndarray
+    hoofdsom_box3: np.ndarray
+    rest_lpt: np.ndarray
+    rvp: np.ndarray
+
+    def totale_restschuld(self) -> np.ndarray:
+        """Som van de restschuld over alle delen, per tijdstip."""
+        return self.restschuld.sum(axis=0) if len(self.delen) else np.zeros(len(self.elapsed))
+
+    def delen_op(self, t: int) -> list[dict]:
+        """Delen op tijdstip t; gelijk aan projecteer_hypotheekdelen(delen, elapsed[t], peildatum[t])."""
+        elapsed = int(self.elapsed[t])
+        if elapsed <= 0:
+            return [dict(d) for d in self.delen]
+
+        result = []
+        for i, deel in enumerate(self.delen):
+            box1 = float(self.hoofdsom_box1[i, t])
+            box3 = float(self.hoofdsom_box3[i, t])
+            if box1 + box3 <= 0:
+                continue
+            aflos_type = deel.get('aflos_type', '')
+            rest_lpt = deel.get('rest_lpt', deel.get('org_lpt', 360))
+            org_lpt = deel.get('org_lpt', rest_lpt)
+            result.append({
+                'aflos_type': aflos_type,
+                'org_lpt': org_lpt,
+                'rest_lpt': rest_lpt - elapsed if aflos_type in ('Annuïteit', 'Lineair') else org_lpt,
+                'hoofdsom_box1': box1,
+                'hoofdsom_box3': box3,
+                'rvp': max(0, deel.get('rvp', 120) - elapsed),
+                'werkelijke_rente': deel.get('werkelijke_rente', 0),
+                'inleg_overig': deel.get('inleg_overig', 0),
+            })
+        return result
+
+
+def projecteer_tijdlijn(delen: list[dict], elapsed_months: list[int],
+                        peildata: list[date] = None) -> Tijdlijn:
+    """
+    Projecteer één set hypotheekdelen op alle tijdstippen in één pass.
+
+    Per deel worden restant (closed-form annuïteit/lineair), rest_lpt en
+    box-verdeling als vector over de tijd uitgerekend; machtsverheffing en
+    afronding via de exacte helpers van calculator_batch. Tijdstippen met
+    elapsed <= 0 geven de delen ongewijzigd terug.
+
+    Args:
+        delen: Hypotheekdelen als bij projecteer_hypotheekdelen
+        elapsed_months: Maanden vooruit per tijdstip
+        peildata: Peildatum per tijdstip voor de box1/box3 check (optioneel)
+    """
+    from calculator_batch import _pow_exact, _round_exact
+
+    e = np.asarray(elapsed_months, dtype=float).reshape(-1)
+    n_tijd = len(e)
+    geprojecteerd = e > 0
+    if peildata is None:
+        peildata = [None] * n_tijd
+
+    vorm = (len(delen), n_tijd)
+    restschuld, box1, box3 = np.zeros(vorm), np.zeros(vorm), np.zeros(vorm)
+    rest_lpts, rvps = np.zeros(vorm, dtype=np.int64), np.zeros(vorm, dtype=np.int64)
+
+    for i, deel in enumerate(delen):
+        aflos_type = deel.get('aflos_type', '')
+        hoofdsom_box1 = deel.get('hoofdsom_box1', 0)
+        hoofdsom_box3 = deel.get('hoofdsom_box3', 0)
+        hoofdsom = hoofdsom_box1 + hoofdsom_box3
+        rente = deel.get('werkelijke_rente', 0)
+        rest_lpt = deel.get('rest_lpt', deel.get('org_lpt', 360))
+        org_lpt = deel.get('org_lpt', rest_lpt)
+        afgelost = e >= rest_lpt
+
+        if aflos_type in ('Annuïteit', 'Lineair'):
+            r = rente / 12
+            with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+                if aflos_type == 'Annuïteit' and r != 0:
+                    # B_n = P(1+r)^n - A * ((1+r)^n - 1) / r
+                    factor_n = (1 + r) ** rest_lpt
+                    maandlast = hoofdsom * (r * factor_n) / (factor_n - 1)
+                    factor_e = _pow_exact(np.full(n_tijd, 1 + r), e)
+                    waarde = hoofdsom * factor_e - maandlast * (factor_e - 1) / r
+                else:
+                    waarde = hoofdsom - hoofdsom / rest_lpt * e
+            onafgerond = np.where(afgelost, 0.0, np.maximum(0, waarde))
+            restant = np.where(afgelost, 0.0, _round_exact(np.maximum(0, waarde), 2))
+            nieuw_lpt = np.where(afgelost, 0, rest_lpt - e)
+        elif aflos_type in ('Spaar', 'Spaarhypotheek'):
+            onafgerond = restant = np.where(afgelost, 0.0, float(hoofdsom))
+            nieuw_lpt = np.where(afgelost, 0, org_lpt)
+        else:
+            # Aflossingsvrij en onbekend type: geen aflossing
+            onafgerond = restant = np.full(n_tijd, float(hoofdsom))
+            nieuw_lpt = np.full(n_tijd, org_lpt)
+
+        # Box1/box3 verdeling naar rato van het restant
+        b1, b3 = np.zeros(n_tijd), np.zeros(n_tijd)
+        if hoofdsom > 0:
+            positief = restant > 0
+            with np.errstate(divide='ignore', invalid='ignore'):
+                ratio = restant / hoofdsom
+            b1 = np.where(positief, _round_exact(hoofdsom_box1 * ratio, 2), 0.0)
+            b3 = np.where(positief, _round_exact(hoofdsom_box3 * ratio, 2), 0.0)
+
+            aftrekbaar_tot = deel.get('rente_aftrekbaar_tot')
+            if aftrekbaar_tot:
+                if isinstance(aftrekbaar_tot, str):
+                    aftrekbaar_tot = date.fromisoformat(aftrekbaar_tot)
+                verlopen = positief & np.array(
+                    [p is not None and p > aftrekbaar_tot for p in peildata], dtype=bool)
+                if verlopen.any():
+                    b3 = np.where(verlopen, _round_exact(b1 + b3, 2), b3)
+                    b1 = np.where(verlopen, 0.0, b1)
+
+        # elapsed <= 0: deel ongewijzigd
+        restschuld[i] = np.where(geprojecteerd, onafgerond, hoofdsom)
+        box1[i] = np.where(geprojecteerd, b1, hoofdsom_box1)
+        box3[i] = np.where(geprojecteerd, b3, hoofdsom_box3)
+        rest_lpts[i] = np.where(geprojecteerd, nieuw_lpt, rest_lpt)
+        rvps[i] = np.where(geprojecteerd, np.maximum(0, deel.get('rvp', 120) - e), deel.get('rvp', 120))
+
+    return Tijdlijn(
+        delen=delen,
+        elapsed=e.astype(np.int64),
+        restschuld=restschuld,
+        hoofdsom_box1=box1,
+        hoofdsom_box3=box3,
+        rest_lpt=rest_lpts,
+        rvp=rvps,
+    )
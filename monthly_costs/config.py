@@ -1,6 +1,7 @@
 """Configuration for monthly costs calculator."""
 
 import json
+import os
 from pathlib import Path
 
 RULES_DIR = Path(__file__).parent / "rules"
@@ -9,3 +10,7 @@ RULES_DIR = Path(__file__).parent / "rules"
 _CONFIG_DIR = Path(__file__).parent.parent / "config"
 with open(_CONFIG_DIR / "fiscaal.json", "r", encoding="utf-8") as _f:
     DEFAULT_FISCAL_YEAR = int(json.load(_f)["versie"])
+
+# Seconds between checks of a rules file for changes (0 = on every request).
+# A changed file is loaded and swapped in without a restart.
+RULES_RELOAD_INTERVAL = float(os.environ.get("NAT_RULES_RELOAD_INTERVAL", "2"))
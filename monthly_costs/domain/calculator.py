@@ -1,23 +1,35 @@
 """Main calculator orchestrator - combines all calculation modules."""
 
+from collections.abc import Iterator
 from decimal import ROUND_HALF_UP, Decimal
+from itertools import chain, count
 
 from monthly_costs.schemas.input import (
     Box,
+    LoanPart,
     LoanType,
+    MonthlyCostsBase,
+    MonthlyCostsBatchRequest,
     MonthlyCostsRequest,
+    MonthlyCostsTimelineRequest,
     PartnerDistributionMethod,
 )
 from monthly_costs.schemas.output import (
     LoanPartResult,
+    MonthlyCostsBatchResponse,
     MonthlyCostsResponse,
+    MonthlyCostsTimelineResponse,
     PartnerResult,
     TaxBreakdown,
 )
-from monthly_costs.schemas.rules import FiscalRules
+from monthly_costs.schemas.rules import FiscalRules, HillenConfig
 from monthly_costs.domain.ewf import calculate_ewf
-from monthly_costs.domain.hillen import calculate_hillen_deduction, calculate_net_ewf_addition
-from monthly_costs.domain.loan_calc import get_calculator
+from monthly_costs.domain.hillen import (
+    calculate_hillen_deduction,
+    calculate_net_ewf_addition,
+    hillen_config_for_year,
+)
+from monthly_costs.domain.loan_calc import MonthlyPayment, get_calculator
 from monthly_costs.domain.partner import (
     DistributionMethod,
     PartnerTaxInfo,
@@ -46,55 +58,62 @@ class MortgageCalculator:
 
     def calculate(self, request: MonthlyCostsRequest) -> MonthlyCostsResponse:
         """Perform full monthly costs calculation."""
-        # 1. Calculate loan parts
-        loan_results = self._calculate_loan_parts(request)
+        # 1. Calculate partner tax info and marginal rate (needed for EWF and Hillen)
+        partner_info = self._build_partner_info(request)
+        marginal_rate = self._calculate_combined_marginal_rate(partner_info)
 
-        # 2. Sum up totals
-        totals = self._calculate_totals(loan_results)
+        # 2. Calculate EWF
+        ewf_annual = self._calculate_ewf(request)
 
-        # 3. Calculate EWF
-        ewf_annual = Decimal("0")
-        if request.include_ewf:
-            ewf_annual = calculate_ewf(
-                request.woz_value, self.rules.ewf_table, self.fiscal_year
-            )
-        ewf_monthly = _round_currency(ewf_annual / 12)
+        return self._calculate_month(request, partner_info, marginal_rate, ewf_annual)
 
-        # 4. Calculate partner tax info and distribution
-        partner_info = self._build_partner_info(request)
-        distribution = self._calculate_distribution(
-            request, partner_info, totals["interest_box1_annual"]
-        )
+    def calculate_batch(self, request: MonthlyCostsBatchRequest) -> MonthlyCostsBatchResponse:
+        """Calculate every variant of a batch for one household.
 
-        # 5. Calculate effective rate (weighted if multiple partners)
-        effective_rate = self._calculate_weighted_effective_rate(distribution)
+        Partner tax info and the marginal rate are computed once for the
+        batch, the EWF once per distinct WOZ value; each variant only adds
+        its loan parts, distribution and tax step.
+        """
+        variants = request.variant_requests()
+        partner_info = self._build_partner_info(request)
+        marginal_rate = self._calculate_combined_marginal_rate(partner_info)
 
-        # 6. Calculate interest deduction
-        interest_deduction_annual = calculate_total_tax_benefit(
-            distribution, totals["interest_box1_annual"]
-        )
-        interest_deduction_monthly = _round_currency(interest_deduction_annual / 12)
+        ewf_by_woz: dict[Decimal, Decimal] = {}
+        results = []
+        for variant in variants:
+            if variant.woz_value not in ewf_by_woz:
+                ewf_by_woz[variant.woz_value] = self._calculate_ewf(variant)
+            results.append(
+                self._calculate_month(
+                    variant, partner_info, marginal_rate, ewf_by_woz[variant.woz_value]
+                )
+            )
 
-        # 7. Calculate marginal rate (needed for EWF and Hillen)
-        marginal_rate = self._calculate_combined_marginal_rate(partner_info)
+        return MonthlyCostsBatchResponse(fiscal_year=self.fiscal_year, results=results)
 
-        # 8. Calculate Hillen
-        hillen_applicable = False
-        hillen_deduction_annual = Decimal("0")
-        hillen_benefit_monthly = Decimal("0")
+    def _calculate_month(
+        self,
+        request: MonthlyCostsRequest,
+        partner_info: list[PartnerTaxInfo],
+        marginal_rate: Decimal,
+        ewf_annual: Decimal,
+    ) -> MonthlyCostsResponse:
+        """Monthly costs for one request, given the household's tax info and EWF."""
+        # 3. Calculate loan parts
+        loan_results = self._calculate_loan_parts(request)
 
-        if request.include_hillen and self.rules.hillen.enabled:
-            hillen_deduction_annual = calculate_hillen_deduction(
-                ewf_annual, totals["interest_box1_annual"], self.rules.hillen
-            )
-            hillen_applicable = hillen_deduction_annual > 0
-            hillen_benefit_monthly = _round_currency(
-                hillen_deduction_annual * marginal_rate / 12
-            )
+        # 4. Sum up totals
+        totals = self._calculate_totals(loan_results)
+        ewf_monthly = _round_currency(ewf_annual / 12)
 
-        # 9. Calculate net EWF addition (taxed at marginal rate)
-        net_ewf_addition_annual = ewf_annual - hillen_deduction_annual
-        ewf_tax_monthly = _round_currency(net_ewf_addition_annual * marginal_rate / 12)
+        # 5-9. Distribution, interest deduction, Hillen and EWF tax
+        tax = self._calculate_tax(
+            request, partner_info, marginal_rate, ewf_annual,
+            totals["interest_box1_annual"],
+        )
+        distribution = tax["distribution"]
+        interest_deduction_monthly = tax["interest_deduction_monthly"]
+        ewf_tax_monthly = tax["ewf_tax_monthly"]
 
         # 10. Build tax breakdown
         tax_breakdown = TaxBreakdown(
@@ -103,13 +122,13 @@ class MortgageCalculator:
             total_interest_box1_annual=totals["interest_box1_annual"],
             total_interest_box1_monthly=totals["interest_box1_monthly"],
             marginal_rate=marginal_rate,
-            effective_deduction_rate=effective_rate,
-            interest_deduction_annual=interest_deduction_annual,
+            effective_deduction_rate=tax["effective_rate"],
+            interest_deduction_annual=tax["interest_deduction_annual"],
             interest_deduction_monthly=interest_deduction_monthly,
-            hillen_applicable=hillen_applicable,
-            hillen_deduction_annual=hillen_deduction_annual,
-            hillen_benefit_monthly=hillen_benefit_monthly,
-            net_ewf_addition_annual=net_ewf_addition_annual,
+            hillen_applicable=tax["hillen_applicable"],
+            hillen_deduction_annual=tax["hillen_deduction_annual"],
+            hillen_benefit_monthly=tax["hillen_benefit_monthly"],
+            net_ewf_addition_annual=tax["net_ewf_addition_annual"],
             ewf_tax_monthly=ewf_tax_monthly,
             total_tax_benefit_monthly=interest_deduction_monthly,
             total_tax_cost_monthly=ewf_tax_monthly,
@@ -132,6 +151,7 @@ class MortgageCalculator:
 
         return MonthlyCostsResponse(
             fiscal_year=self.fiscal_year,
+            rules_version=self.rules.version,
             month_number=request.month_number,
             woz_value=request.woz_value,
             loan_parts=loan_results,
@@ -145,6 +165,202 @@ class MortgageCalculator:
             net_monthly_cost=_round_currency(net_monthly),
         )
 
+    def calculate_timeline(
+        self, request: MonthlyCostsTimelineRequest
+    ) -> MonthlyCostsTimelineResponse:
+        """Calculate monthly costs for a range of months in one pass.
+
+        EWF, partner tax info and the marginal rate do not depend on the
+        month and are computed once; per month only the loan payments
+        (walked incrementally), the interest distribution and Hillen are
+        updated. Month 1 falls in ``first_calendar_month`` of ``fiscal_year``.
+        The Hillen percentage follows the phase-out of the rules per calendar
+        year; all other rules of ``fiscal_year`` apply to the whole series.
+        Months within ``fiscal_year`` equal ``calculate()`` for that
+        ``month_number``.
+        """
+        start_month = request.start_month
+        end_month = request.end_month or max(
+            int(loan_part.term_years * 12) for loan_part in request.loan_parts
+        )
+
+        ewf_annual = self._calculate_ewf(request)
+        partner_info = self._build_partner_info(request)
+        marginal_rate = self._calculate_combined_marginal_rate(partner_info)
+
+        series: dict[str, list] = {
+            "months": [],
+            "total_gross_monthly": [],
+            "total_interest_monthly": [],
+            "total_principal_monthly": [],
+            "total_interest_box1_monthly": [],
+            "total_remaining_principal": [],
+            "interest_deduction_monthly": [],
+            "hillen_benefit_monthly": [],
+            "ewf_tax_monthly": [],
+            "net_monthly_cost": [],
+        }
+        schedules = [self._iter_payments(loan_part) for loan_part in request.loan_parts]
+        hillen_by_year: dict[int, HillenConfig] = {}
+
+        for month_number, payments in enumerate(zip(*schedules), start=1):
+            if month_number > end_month:
+                break
+            if month_number < start_month:
+                continue
+
+            year = self._timeline_year(request, month_number)
+            if year not in hillen_by_year:
+                hillen_by_year[year] = hillen_config_for_year(
+                    self.rules.hillen, self.fiscal_year, year
+                )
+
+            loan_results = [
+                self._loan_part_result(loan_part, payment, month_number)
+                for loan_part, payment in zip(request.loan_parts, payments)
+            ]
+            totals = self._calculate_totals(loan_results)
+            tax = self._calculate_tax(
+                request, partner_info, marginal_rate, ewf_annual,
+                totals["interest_box1_annual"], hillen_by_year[year],
+            )
+            net_monthly = (
+                totals["gross_monthly"]
+                - tax["interest_deduction_monthly"]
+                + tax["ewf_tax_monthly"]
+            )
+
+            series["months"].append(month_number)
+            series["total_gross_monthly"].append(totals["gross_monthly"])
+            series["total_interest_monthly"].append(totals["interest_monthly"])
+            series["total_principal_monthly"].append(totals["principal_monthly"])
+            series["total_interest_box1_monthly"].append(totals["interest_box1_monthly"])
+            series["total_remaining_principal"].append(
+                _round_currency(sum(r.remaining_principal for r in loan_results))
+            )
+            series["interest_deduction_monthly"].append(tax["interest_deduction_monthly"])
+            series["hillen_benefit_monthly"].append(tax["hillen_benefit_monthly"])
+            series["ewf_tax_monthly"].append(tax["ewf_tax_monthly"])
+            series["net_monthly_cost"].append(_round_currency(net_monthly))
+
+        return MonthlyCostsTimelineResponse(
+            fiscal_year=self.fiscal_year,
+            rules_version=self.rules.version,
+            woz_value=request.woz_value,
+            ewf_annual=ewf_annual,
+            marginal_rate=marginal_rate,
+            **series,
+        )
+
+    def _timeline_year(self, request: MonthlyCostsTimelineRequest, month_number):
+        """Calendar year of a timeline month; also works on NumPy month arrays."""
+        return self.fiscal_year + (request.first_calendar_month + month_number - 2) // 12
+
+    def _iter_payments(self, loan_part: LoanPart) -> Iterator[MonthlyPayment]:
+        """Payments from month 1 onwards; after the term as ``calculate_month``."""
+        calculator = get_calculator(loan_part.loan_type.value)
+        months = int(loan_part.term_years * 12)
+        return chain(
+            calculator.iter_schedule(
+                loan_part.principal, loan_part.interest_rate, loan_part.term_years
+            ),
+            (
+                calculator.calculate_month(
+                    loan_part.principal, loan_part.interest_rate,
+                    loan_part.term_years, month_number,
+                )
+                for month_number in count(months + 1)
+            ),
+        )
+
+    def _loan_part_result(
+        self, loan_part: LoanPart, payment: MonthlyPayment, month_number: int
+    ) -> LoanPartResult:
+        """Result for one loan part in one month.
+
+        A box 1 part with ``box1_end_month`` counts as box 3 after that month.
+        """
+        box = loan_part.box
+        if (
+            box == Box.BOX1
+            and loan_part.box1_end_month is not None
+            and month_number > loan_part.box1_end_month
+        ):
+            box = Box.BOX3
+
+        return LoanPartResult(
+            loan_part_id=loan_part.id,
+            loan_type=loan_part.loan_type.value,
+            box=box.value,
+            principal=loan_part.principal,
+            remaining_principal=payment.remaining_principal,
+            interest_payment=payment.interest_payment,
+            principal_payment=payment.principal_payment,
+            gross_payment=payment.gross_payment,
+        )
+
+    def _calculate_ewf(self, request: MonthlyCostsBase) -> Decimal:
+        """Annual eigenwoningforfait (0 when excluded)."""
+        if not request.include_ewf:
+            return Decimal("0")
+        return calculate_ewf(request.woz_value, self.rules.ewf_lookup, self.fiscal_year)
+
+    def _calculate_tax(
+        self,
+        request: MonthlyCostsBase,
+        partner_info: list[PartnerTaxInfo],
+        marginal_rate: Decimal,
+        ewf_annual: Decimal,
+        interest_box1_annual: Decimal,
+        hillen: HillenConfig | None = None,
+    ) -> dict:
+        """Interest deduction, Hillen and EWF tax for one month's box 1 interest.
+
+        ``hillen`` overrides the Hillen configuration of ``fiscal_year``.
+        """
+        hillen = hillen or self.rules.hillen
+        # Distribution and effective rate (weighted if multiple partners)
+        distribution = self._calculate_distribution(
+            request, partner_info, interest_box1_annual
+        )
+        effective_rate = self._calculate_weighted_effective_rate(distribution)
+
+        # Interest deduction
+        interest_deduction_annual = calculate_total_tax_benefit(
+            distribution, interest_box1_annual
+        )
+        interest_deduction_monthly = _round_currency(interest_deduction_annual / 12)
+
+        # Hillen
+        hillen_applicable = False
+        hillen_deduction_annual = Decimal("0")
+        hillen_benefit_monthly = Decimal("0")
+
+        if request.include_hillen and hillen.enabled:
+            hillen_deduction_annual = calculate_hillen_deduction(
+                ewf_annual, interest_box1_annual, hillen
+            )
+            hillen_applicable = hillen_deduction_annual > 0
+            hillen_benefit_monthly = _round_currency(
+                hillen_deduction_annual * marginal_rate / 12
+            )
+
+        # Net EWF addition (taxed at marginal rate)
+        net_ewf_addition_annual = ewf_annual - hillen_deduction_annual
+        ewf_tax_monthly = _round_currency(net_ewf_addition_annual * marginal_rate / 12)
+
+        return {
+            "distribution": distribution,
+            "effective_rate": effective_rate,
+            "interest_deduction_annual": interest_deduction_annual,
+            "interest_deduction_monthly": interest_deduction_monthly,
+            "hillen_applicable": hillen_applicable,
+            "hillen_deduction_annual": hillen_deduction_annual,
+            "hillen_benefit_monthly": hillen_benefit_monthly,
+            "net_ewf_addition_annual": net_ewf_addition_annual,
+            "ewf_tax_monthly": ewf_tax_monthly,
+        }
+
     def _calculate_loan_parts(
         self, request: MonthlyCostsRequest
     ) -> list[LoanPartResult]:
@@ -159,18 +375,8 @@ class MortgageCalculator:
                 term_years=loan_part.term_years,
                 month_number=request.month_number,
             )
-
             results.append(
-                LoanPartResult(
-                    loan_part_id=loan_part.id,
-                    loan_type=loan_part.loan_type.value,
-                    box=loan_part.box.value,
-                    principal=loan_part.principal,
-                    remaining_principal=payment.remaining_principal,
-                    interest_payment=payment.interest_payment,
-                    principal_payment=payment.principal_payment,
-                    gross_payment=payment.gross_payment,
-                )
+                self._loan_part_result(loan_part, payment, request.month_number)
             )
 
         return results
@@ -206,15 +412,15 @@ class MortgageCalculator:
         }
 
     def _build_partner_info(
-        self, request: MonthlyCostsRequest
+        self, request: MonthlyCostsBase | MonthlyCostsBatchRequest
     ) -> list[PartnerTaxInfo]:
         """Build tax info for all partners."""
         partners = []
         for partner in request.partners:
             brackets = (
-                self.rules.tax_brackets_box1_aow
-                if partner.is_aow and self.rules.tax_brackets_box1_aow
-                else self.rules.tax_brackets_box1
+                self.rules.tax_table_box1_aow
+                if partner.is_aow and self.rules.tax_table_box1_aow
+                else self.rules.tax_table_box1
             )
             info = calculate_partner_tax_info(
                 partner_id=partner.id,
@@ -227,7 +433,7 @@ class MortgageCalculator:
 
     def _calculate_distribution(
         self,
-        request: MonthlyCostsRequest,
+        request: MonthlyCostsBase,
         partner_info: list[PartnerTaxInfo],
         total_interest_annual: Decimal,
     ):
@@ -0,0 +1,343 @@
+"""Float/NumPy engine mirroring MortgageCalculator.
+
+Same steps and the same rounding points as the Decimal calculator, but the
+month-dependent math (loan payments, totals, distribution, Hillen, EWF tax)
+runs on float64 arrays with one element per month. Amounts agree with the
+Decimal engine to the cent after final rounding; the differential test in
+tests/monthly_costs/unit/test_fast_calculator.py checks this over a
+randomized corpus.
+
+Opt-in only (bulk and preview use): official outputs stay on
+MortgageCalculator. Values that are constant for a request (EWF, partner
+marginal rates) still come from the Decimal domain functions.
+"""
+
+from decimal import Decimal
+from typing import Optional
+
+import numpy as np
+
+from monthly_costs.domain.calculator import MortgageCalculator, _round_currency
+from monthly_costs.domain.hillen import hillen_config_for_year
+from monthly_costs.domain.partner import DistributionMethod, PartnerTaxInfo
+from monthly_costs.schemas.input import (
+    LoanPart,
+    LoanType,
+    MonthlyCostsBase,
+    MonthlyCostsRequest,
+    MonthlyCostsTimelineRequest,
+)
+from monthly_costs.schemas.output import (
+    LoanPartResult,
+    MonthlyCostsResponse,
+    MonthlyCostsTimelineResponse,
+    PartnerResult,
+    TaxBreakdown,
+)
+
+# Bias (in cents) so that float images of exact half-cent amounts round up,
+# like Decimal ROUND_HALF_UP on the exact value.
+_TIE_EPS = 1e-6
+
+_CENT = Decimal("0.01")
+
+
+def _round_cents(x: np.ndarray) -> np.ndarray:
+    """Round to 2 decimal places using HALF_UP (away from zero on ties)."""
+    return np.copysign(np.floor(np.abs(x) * 100 + (0.5 + _TIE_EPS)), x) / 100
+
+
+def _to_decimals(values: np.ndarray) -> list[Decimal]:
+    """Float amounts to Decimals with 2 decimals, as quantize() gives them."""
+    return [Decimal(cents) * _CENT for cents in np.rint(values * 100).astype(np.int64).tolist()]
+
+
+def _to_decimal(value: float) -> Decimal:
+    return _to_decimals(np.array([value]))[0]
+
+
+def _part_payments(loan_part: LoanPart, months: np.ndarray) -> dict[str, np.ndarray]:
+    """Payments of one loan part for the given months (as calculate_month)."""
+    principal = float(loan_part.principal)
+    annual_rate = float(loan_part.interest_rate)
+    n = int(loan_part.term_years * 12)
+
+    if loan_part.loan_type == LoanType.ANNUITY:
+        r = annual_rate / 12
+        if r == 0:
+            annuity = principal / n
+            remaining_start = principal - annuity * (months - 1)
+        else:
+            factor = (1 + r) ** n
+            annuity = principal * (r * factor) / (factor - 1)
+            growth = np.power(1 + r, months - 1)
+            remaining_start = principal * growth - annuity * (growth - 1) / r
+        remaining_start = np.maximum(remaining_start, 0.0)
+        interest = _round_cents(remaining_start * r)
+        principal_payment = _round_cents(annuity - interest)
+        gross = np.full(months.shape, _round_cents(np.float64(annuity)))
+        remaining_end = np.maximum(remaining_start - principal_payment, 0.0)
+
+    elif loan_part.loan_type == LoanType.LINEAR:
+        monthly_principal = _round_cents(np.float64(principal / n))
+        remaining_start = np.maximum(principal - monthly_principal * (months - 1), 0.0)
+        interest = _round_cents(remaining_start * annual_rate / 12)
+        principal_payment = np.full(months.shape, monthly_principal)
+        gross = interest + monthly_principal
+        remaining_end = np.maximum(remaining_start - monthly_principal, 0.0)
+
+    else:
+        interest = np.full(months.shape, _round_cents(np.float64(principal * annual_rate / 12)))
+        principal_payment = np.zeros(months.shape)
+        gross = interest
+        remaining_end = np.full(months.shape, principal)
+
+    in_box1 = np.full(months.shape, loan_part.box.value == 1)
+    if loan_part.box1_end_month is not None:
+        in_box1 &= months <= loan_part.box1_end_month
+
+    return {
+        "interest": interest,
+        "principal_payment": principal_payment,
+        "gross": gross,
+        "remaining": remaining_end,
+        "in_box1": in_box1,
+    }
+
+
+class FastMortgageCalculator(MortgageCalculator):
+    """MortgageCalculator on float arrays; cent-level agreement, not bit-identical."""
+
+    def _calculate_month(
+        self,
+        request: MonthlyCostsRequest,
+        partner_info: list[PartnerTaxInfo],
+        marginal_rate: Decimal,
+        ewf_annual: Decimal,
+    ) -> MonthlyCostsResponse:
+        """Single month, same response as the Decimal engine (calculate and batch)."""
+        months = np.array([request.month_number])
+        parts, s = self._evaluate(request, months, partner_info, marginal_rate, ewf_annual)
+
+        loan_results = [
+            LoanPartResult(
+                loan_part_id=loan_part.id,
+                loan_type=loan_part.loan_type.value,
+                box=1 if part["in_box1"][0] else 3,
+                principal=loan_part.principal,
+                remaining_principal=_to_decimal(part["remaining"][0]),
+                interest_payment=_to_decimal(part["interest"][0]),
+                principal_payment=_to_decimal(part["principal_payment"][0]),
+                gross_payment=_to_decimal(part["gross"][0]),
+            )
+            for loan_part, part in zip(request.loan_parts, parts)
+        ]
+
+        interest_deduction_monthly = _to_decimal(s["interest_deduction_monthly"][0])
+        ewf_tax_monthly = _to_decimal(s["ewf_tax_monthly"][0])
+        hillen_deduction_annual = _to_decimal(s["hillen_deduction_annual"][0])
+        tax_breakdown = TaxBreakdown(
+            ewf_annual=ewf_annual,
+            ewf_monthly=_round_currency(ewf_annual / 12),
+            total_interest_box1_annual=_to_decimal(s["interest_box1_annual"][0]),
+            total_interest_box1_monthly=_to_decimal(s["interest_box1_monthly"][0]),
+            marginal_rate=marginal_rate,
+            effective_deduction_rate=_to_decimal(s["effective_rate"][0]),
+            interest_deduction_annual=_to_decimal(s["interest_deduction_annual"][0]),
+            interest_deduction_monthly=interest_deduction_monthly,
+            hillen_applicable=hillen_deduction_annual > 0,
+            hillen_deduction_annual=hillen_deduction_annual,
+            hillen_benefit_monthly=_to_decimal(s["hillen_benefit_monthly"][0]),
+            net_ewf_addition_annual=ewf_annual - hillen_deduction_annual,
+            ewf_tax_monthly=ewf_tax_monthly,
+            total_tax_benefit_monthly=interest_deduction_monthly,
+            total_tax_cost_monthly=ewf_tax_monthly,
+            net_tax_effect_monthly=interest_deduction_monthly - ewf_tax_monthly,
+        )
+
+        partner_results = None
+        if len(partner_info) > 1:
+            partner_results = [
+                PartnerResult(
+                    partner_id=info.partner_id,
+                    taxable_income=info.taxable_income,
+                    marginal_rate=info.marginal_rate,
+                    effective_rate=Decimal(repr(rate)),
+                    interest_share_annual=_to_decimal(share[0]),
+                    interest_deduction_annual=_to_decimal(_round_cents(share * rate)[0]),
+                    ewf_share_annual=ewf_annual / 2,
+                )
+                for info, share, rate in (
+                    (partner_info[0], s["partner1_share"], s["partner1_rate"]),
+                    (partner_info[1], s["partner2_share"], s["partner2_rate"]),
+                )
+            ]
+
+        return MonthlyCostsResponse(
+            fiscal_year=self.fiscal_year,
+            rules_version=self.rules.version,
+            month_number=request.month_number,
+            woz_value=request.woz_value,
+            loan_parts=loan_results,
+            total_gross_monthly=_to_decimal(s["gross_monthly"][0]),
+            total_interest_monthly=_to_decimal(s["interest_monthly"][0]),
+            total_principal_monthly=_to_decimal(s["principal_monthly"][0]),
+            total_interest_box1_monthly=_to_decimal(s["interest_box1_monthly"][0]),
+            total_interest_box3_monthly=_to_decimal(s["interest_box3_monthly"][0]),
+            tax_breakdown=tax_breakdown,
+            partner_results=partner_results,
+            net_monthly_cost=_to_decimal(s["net_monthly_cost"][0]),
+        )
+
+    def calculate_timeline(
+        self, request: MonthlyCostsTimelineRequest
+    ) -> MonthlyCostsTimelineResponse:
+        """Range of months in one vectorised pass, same response as the Decimal engine."""
+        end_month = request.end_month or max(
+            int(loan_part.term_years * 12) for loan_part in request.loan_parts
+        )
+        months = np.arange(request.start_month, end_month + 1)
+        ewf_annual = self._calculate_ewf(request)
+        partner_info = self._build_partner_info(request)
+        marginal_rate = self._calculate_combined_marginal_rate(partner_info)
+        years = self._timeline_year(request, months)
+        hillen_percentage = np.zeros(months.shape)
+        for year in np.unique(years):
+            hillen_percentage[years == year] = float(
+                hillen_config_for_year(self.rules.hillen, self.fiscal_year, int(year))
+                .reduction_percentage
+            )
+        parts, s = self._evaluate(
+            request, months, partner_info, marginal_rate, ewf_annual, hillen_percentage
+        )
+
+        return MonthlyCostsTimelineResponse(
+            fiscal_year=self.fiscal_year,
+            rules_version=self.rules.version,
+            woz_value=request.woz_value,
+            ewf_annual=ewf_annual,
+            marginal_rate=marginal_rate,
+            months=months.tolist(),
+            total_gross_monthly=_to_decimals(s["gross_monthly"]),
+            total_interest_monthly=_to_decimals(s["interest_monthly"]),
+            total_principal_monthly=_to_decimals(s["principal_monthly"]),
+            total_interest_box1_monthly=_to_decimals(s["interest_box1_monthly"]),
+            total_remaining_principal=_to_decimals(
+                _round_cents(sum(part["remaining"] for part in parts))
+            ),
+            interest_deduction_monthly=_to_decimals(s["interest_deduction_monthly"]),
+            hillen_benefit_monthly=_to_decimals(s["hillen_benefit_monthly"]),
+            ewf_tax_monthly=_to_decimals(s["ewf_tax_monthly"]),
+            net_monthly_cost=_to_decimals(s["net_monthly_cost"]),
+        )
+
+    def _evaluate(
+        self,
+        request: MonthlyCostsBase,
+        months: np.ndarray,
+        partner_info: list[PartnerTaxInfo],
+        marginal_rate: Decimal,
+        ewf_annual: Decimal,
+        hillen_percentage: Optional[np.ndarray] = None,
+    ) -> tuple[list[dict[str, np.ndarray]], dict[str, np.ndarray]]:
+        """Per-part payments and per-month totals/tax arrays.
+
+        ``hillen_percentage`` gives the Hillen percentage per month (default:
+        that of ``fiscal_year``).
+        """
+        parts = [_part_payments(loan_part, months) for loan_part in request.loan_parts]
+
+        # Totals
+        zeros = np.zeros(months.shape)
+        gross = sum((p["gross"] for p in parts), zeros)
+        interest = sum((p["interest"] for p in parts), zeros)
+        principal = sum((p["principal_payment"] for p in parts), zeros)
+        interest_box1 = sum((np.where(p["in_box1"], p["interest"], 0.0) for p in parts), zeros)
+        interest_box1_annual = _round_cents(interest_box1 * 12)
+
+        # Distribution and effective rate
+        p1_share, p2_share, p1_rate, p2_rate = self._distribute(
+            request, partner_info, interest_box1_annual
+        )
+        total_share = p1_share + p2_share
+        weighted = _round_cents(
+            (p1_share * p1_rate + p2_share * p2_rate) / np.where(total_share == 0, 1.0, total_share)
+        )
+        effective_rate = np.where((p2_share == 0) | (total_share == 0), p1_rate, weighted)
+
+        # Interest deduction
+        interest_deduction_annual = _round_cents(p1_share * p1_rate + p2_share * p2_rate)
+        interest_deduction_monthly = _round_cents(interest_deduction_annual / 12)
+
+        # Hillen and EWF tax
+        ewf = float(ewf_annual)
+        marginal = float(marginal_rate)
+        hillen_deduction_annual = zeros
+        if request.include_hillen and self.rules.hillen.enabled:
+            if hillen_percentage is None:
+                hillen_percentage = float(self.rules.hillen.reduction_percentage)
+            hillen_deduction_annual = np.where(
+                interest_box1_annual >= ewf,
+                0.0,
+                _round_cents((ewf - interest_box1_annual) * hillen_percentage),
+            )
+        hillen_benefit_monthly = _round_cents(hillen_deduction_annual * marginal / 12)
+        ewf_tax_monthly = _round_cents((ewf - hillen_deduction_annual) * marginal / 12)
+
+        gross_monthly = _round_cents(gross)
+        net_monthly = _round_cents(gross_monthly - interest_deduction_monthly + ewf_tax_monthly)
+
+        return parts, {
+            "gross_monthly": gross_monthly,
+            "interest_monthly": _round_cents(interest),
+            "principal_monthly": _round_cents(principal),
+            "interest_box1_monthly": _round_cents(interest_box1),
+            "interest_box3_monthly": _round_cents(interest - interest_box1),
+            "interest_box1_annual": interest_box1_annual,
+            "partner1_share": p1_share,
+            "partner2_share": p2_share,
+            "partner1_rate": p1_rate,
+            "partner2_rate": p2_rate,
+            "effective_rate": effective_rate,
+            "interest_deduction_annual": interest_deduction_annual,
+            "interest_deduction_monthly": interest_deduction_monthly,
+            "hillen_deduction_annual": hillen_deduction_annual,
+            "hillen_benefit_monthly": hillen_benefit_monthly,
+            "ewf_tax_monthly": ewf_tax_monthly,
+            "net_monthly_cost": net_monthly,
+        }
+
+    def _distribute(
+        self,
+        request: MonthlyCostsBase,
+        partner_info: list[PartnerTaxInfo],
+        total_interest: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, float, float]:
+        """Array version of distribute_interest: (share1, share2, rate1, rate2)."""
+        max_rate = self.rules.max_mortgage_interest_deduction_rate
+        p1_rate = float(min(partner_info[0].marginal_rate, max_rate))
+        zeros = np.zeros(total_interest.shape)
+        if len(partner_info) == 1:
+            return total_interest, zeros, p1_rate, 0.0
+
+        p2_rate = float(min(partner_info[1].marginal_rate, max_rate))
+        method = DistributionMethod.FIXED_PERCENT
+        parameter: Optional[Decimal] = Decimal("50")
+        if request.partner_distribution:
+            method = DistributionMethod(request.partner_distribution.method.value)
+            parameter = request.partner_distribution.parameter
+
+        if method == DistributionMethod.FIXED_PERCENT:
+            if parameter is None:
+                raise ValueError("fixed_percent requires a parameter (percentage 0-100)")
+            p1_share = _round_cents(total_interest * float(parameter / 100))
+        elif method == DistributionMethod.FIXED_AMOUNT:
+            if parameter is None:
+                raise ValueError("fixed_amount requires a parameter (amount)")
+            p1_share = _round_cents(np.minimum(float(parameter), total_interest))
+        elif p1_rate >= p2_rate:
+            p1_share = total_interest
+        else:
+            p1_share = zeros
+
+        return p1_share, total_interest - p1_share, p1_rate, p2_rate
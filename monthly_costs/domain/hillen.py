@@ -34,6 +34,27 @@ def calculate_hillen_deduction(
     return _round_currency(hillen_deduction)
 
 
+def hillen_config_for_year(
+    hillen_config: HillenConfig, fiscal_year: int, year: int
+) -> HillenConfig:
+    """
+    Hillen configuration for a later calendar year.
+
+    The reduction percentage of ``fiscal_year`` decreases by ``phase_out_step``
+    per year until it reaches zero. Without a phase_out_step the percentage
+    of ``fiscal_year`` is kept.
+    """
+    if year <= fiscal_year or hillen_config.phase_out_step is None:
+        return hillen_config
+
+    percentage = hillen_config.reduction_percentage - (
+        hillen_config.phase_out_step * (year - fiscal_year)
+    )
+    return hillen_config.model_copy(
+        update={"reduction_percentage": max(Decimal("0"), percentage)}
+    )
+
+
 def calculate_net_ewf_addition(
     ewf: Decimal,
     deductible_interest: Decimal,
@@ -1,9 +1,14 @@
 """Loan calculation module - annuity, linear, interest-only."""
 
+from collections.abc import Iterator
 from dataclasses import dataclass
-from decimal import ROUND_HALF_UP, Decimal
+from decimal import ROUND_CEILING, ROUND_HALF_UP, Decimal, getcontext
 from typing import Protocol
 
+# Extra digits for carrying (1+r)^k forward month by month. Rounded back to
+# the context precision the factor matches Decimal ``**`` to the last digit.
+_FACTOR_EXTRA_PRECISION = 20
+
 
 @dataclass(frozen=True)
 class MonthlyPayment:
@@ -15,6 +20,17 @@ class MonthlyPayment:
     remaining_principal: Decimal
 
 
+@dataclass(frozen=True)
+class YearlyPayment:
+    """Totals for one loan year (months 12*(year-1)+1 up to 12*year)."""
+
+    year: int
+    interest_payment: Decimal
+    principal_payment: Decimal
+    gross_payment: Decimal
+    remaining_principal: Decimal
+
+
 class LoanCalculator(Protocol):
     """Protocol for loan calculators."""
 
@@ -28,12 +44,36 @@ class LoanCalculator(Protocol):
         """Calculate payment for a specific month."""
         ...
 
+    def iter_schedule(
+        self,
+        principal: Decimal,
+        annual_rate: Decimal,
+        term_years: Decimal,
+    ) -> Iterator[MonthlyPayment]:
+        """Yield the payment for every month of the term, in order."""
+        ...
+
+    def iter_years(
+        self,
+        principal: Decimal,
+        annual_rate: Decimal,
+        term_years: Decimal,
+    ) -> Iterator[YearlyPayment]:
+        """Yield totals per loan year, without generating the monthly rows."""
+        ...
+
 
 def _round_currency(value: Decimal) -> Decimal:
     """Round to 2 decimal places using HALF_UP."""
     return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
 
 
+def _loan_years(n: int) -> Iterator[tuple[int, int, int]]:
+    """(year, first month, last month) for a term of n months."""
+    for year, first in enumerate(range(1, n + 1, 12), start=1):
+        yield year, first, min(first + 11, n)
+
+
 class AnnuityCalculator:
     """Annuity loan calculator - fixed monthly payment."""
 
@@ -47,14 +87,7 @@ class AnnuityCalculator:
         """Calculate annuity payment for a specific month."""
         n = int(term_years * 12)
         r = annual_rate / 12
-
-        # Calculate annuity (fixed monthly payment)
-        if r == 0:
-            annuity = principal / n
-        else:
-            # A = P * (r * (1+r)^n) / ((1+r)^n - 1)
-            factor = (1 + r) ** n
-            annuity = principal * (r * factor) / (factor - 1)
+        annuity = self._annuity(principal, r, n)
 
         # Calculate remaining principal at start of this month
         if month_number == 1:
@@ -62,10 +95,89 @@ class AnnuityCalculator:
         else:
             remaining_start = self._calculate_remaining(principal, r, annuity, month_number - 1)
 
+        return self._payment(remaining_start, r, annuity)
+
+    def iter_schedule(
+        self,
+        principal: Decimal,
+        annual_rate: Decimal,
+        term_years: Decimal,
+    ) -> Iterator[MonthlyPayment]:
+        """Yield every month of the term; same payments as calculate_month(1..n).
+
+        Instead of a Decimal ``**`` per month, (1+r)^k is carried forward
+        from the previous month at extra precision and rounded back before
+        the closed-form remaining balance is evaluated. Interest, principal
+        and gross payment are identical; the unrounded remaining balance can
+        differ in its last digit, never at cent or float precision.
+        """
+        n = int(term_years * 12)
+        r = annual_rate / 12
+        annuity = self._annuity(principal, r, n)
+        base = 1 + r
+        factor_exact = Decimal(1)
+        precise = getcontext().copy()
+        precise.prec += _FACTOR_EXTRA_PRECISION
+
+        for month_number in range(1, n + 1):
+            if month_number == 1:
+                remaining_start = principal
+            elif r == 0:
+                remaining_start = principal - (annuity * (month_number - 1))
+            else:
+                factor_exact = precise.multiply(factor_exact, base)
+                factor = +factor_exact
+                remaining_start = principal * factor - annuity * (factor - 1) / r
+            yield self._payment(remaining_start, r, annuity)
+
+    def iter_years(
+        self,
+        principal: Decimal,
+        annual_rate: Decimal,
+        term_years: Decimal,
+    ) -> Iterator[YearlyPayment]:
+        """Yield totals per loan year from the closed-form balance.
+
+        Principal repaid in a year is the drop in the balance between the
+        start and the end of the year; interest is the annuity paid minus
+        that drop. Both are rounded once per year, so they can differ a few
+        cents from the sum of the rounded monthly rows.
+        """
+        n = int(term_years * 12)
+        r = annual_rate / 12
+        annuity = self._annuity(principal, r, n)
+
+        balance_start = principal
+        for year, first, last in _loan_years(n):
+            balance_end = max(Decimal("0"), self._calculate_remaining(principal, r, annuity, last))
+            repaid = balance_start - balance_end
+            interest = _round_currency(annuity * (last - first + 1) - repaid)
+            principal_payment = _round_currency(repaid)
+            yield YearlyPayment(
+                year=year,
+                interest_payment=interest,
+                principal_payment=principal_payment,
+                gross_payment=interest + principal_payment,
+                remaining_principal=_round_currency(balance_end),
+            )
+            balance_start = balance_end
+
+    @staticmethod
+    def _annuity(principal: Decimal, monthly_rate: Decimal, n: int) -> Decimal:
+        """Fixed monthly payment."""
+        if monthly_rate == 0:
+            return principal / n
+        # A = P * (r * (1+r)^n) / ((1+r)^n - 1)
+        factor = (1 + monthly_rate) ** n
+        return principal * (monthly_rate * factor) / (factor - 1)
+
+    @staticmethod
+    def _payment(remaining_start: Decimal, monthly_rate: Decimal, annuity: Decimal) -> MonthlyPayment:
+        """Split the annuity into interest and principal for one month."""
         # Ensure we don't go negative
         remaining_start = max(Decimal("0"), remaining_start)
 
-        interest = _round_currency(remaining_start * r)
+        interest = _round_currency(remaining_start * monthly_rate)
         principal_payment = _round_currency(annuity - interest)
         remaining_end = remaining_start - principal_payment
 
@@ -120,6 +232,51 @@ class LinearCalculator:
             remaining_principal=max(Decimal("0"), remaining_end),
         )
 
+    def iter_schedule(
+        self,
+        principal: Decimal,
+        annual_rate: Decimal,
+        term_years: Decimal,
+    ) -> Iterator[MonthlyPayment]:
+        """Yield every month of the term; same payments as calculate_month(1..n)."""
+        n = int(term_years * 12)
+        for month_number in range(1, n + 1):
+            yield self.calculate_month(principal, annual_rate, term_years, month_number)
+
+    def iter_years(
+        self,
+        principal: Decimal,
+        annual_rate: Decimal,
+        term_years: Decimal,
+    ) -> Iterator[YearlyPayment]:
+        """Yield totals per loan year.
+
+        The balance drops by the same amount every month, so the interest
+        for a year is the rate times an arithmetic series of balances.
+        """
+        n = int(term_years * 12)
+        monthly_principal = _round_currency(principal / n)
+        # Last month that starts with a positive balance
+        if monthly_principal > 0:
+            last_positive = int((principal / monthly_principal).to_integral_value(rounding=ROUND_CEILING))
+        else:
+            last_positive = n
+
+        for year, first, last in _loan_years(n):
+            # Sum of (principal - monthly_principal * (m - 1)) for m = first..upto
+            upto = min(last, last_positive)
+            months = max(0, upto - first + 1)
+            balances = principal * months - monthly_principal * ((first + upto - 2) * months // 2)
+            interest = _round_currency(balances * annual_rate / 12)
+            principal_payment = monthly_principal * (last - first + 1)
+            yield YearlyPayment(
+                year=year,
+                interest_payment=interest,
+                principal_payment=principal_payment,
+                gross_payment=interest + principal_payment,
+                remaining_principal=max(Decimal("0"), principal - monthly_principal * last),
+            )
+
 
 class InterestOnlyCalculator:
     """Interest-only loan calculator - no principal repayment."""
@@ -141,6 +298,35 @@ class InterestOnlyCalculator:
             remaining_principal=principal,
         )
 
+    def iter_schedule(
+        self,
+        principal: Decimal,
+        annual_rate: Decimal,
+        term_years: Decimal,
+    ) -> Iterator[MonthlyPayment]:
+        """Yield every month of the term; the payment is the same each month."""
+        payment = self.calculate_month(principal, annual_rate, term_years, 1)
+        for _ in range(int(term_years * 12)):
+            yield payment
+
+    def iter_years(
+        self,
+        principal: Decimal,
+        annual_rate: Decimal,
+        term_years: Decimal,
+    ) -> Iterator[YearlyPayment]:
+        """Yield totals per loan year: twelve times the monthly interest."""
+        payment = self.calculate_month(principal, annual_rate, term_years, 1)
+        for year, first, last in _loan_years(int(term_years * 12)):
+            interest = payment.interest_payment * (last - first + 1)
+            yield YearlyPayment(
+                year=year,
+                interest_payment=interest,
+                principal_payment=Decimal("0"),
+                gross_payment=interest,
+                remaining_principal=principal,
+            )
+
 
 def get_calculator(loan_type: str) -> LoanCalculator:
     """Factory function to get the appropriate calculator."""
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from decimal import ROUND_HALF_UP, Decimal
 from enum import Enum
 
+from monthly_costs.rules.compiled import CompiledBrackets
 from monthly_costs.schemas.rules import TaxBracket
 from monthly_costs.domain.tax_calc import calculate_marginal_rate
 
@@ -103,7 +104,7 @@ def calculate_partner_tax_info(
     partner_id: str,
     taxable_income: Decimal,
     age: int,
-    brackets: list[TaxBracket],
+    brackets: list[TaxBracket] | CompiledBrackets,
     aow_age: int = 67,
 ) -> PartnerTaxInfo:
     """Calculate tax information for a partner."""
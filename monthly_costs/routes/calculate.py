@@ -1,10 +1,21 @@
 """Main calculation endpoint."""
 
+from typing import Literal
+
 from fastapi import APIRouter
 
-from monthly_costs.schemas.input import MonthlyCostsRequest
-from monthly_costs.schemas.output import MonthlyCostsResponse
+from monthly_costs.schemas.input import (
+    MonthlyCostsBatchRequest,
+    MonthlyCostsRequest,
+    MonthlyCostsTimelineRequest,
+)
+from monthly_costs.schemas.output import (
+    MonthlyCostsBatchResponse,
+    MonthlyCostsResponse,
+    MonthlyCostsTimelineResponse,
+)
 from monthly_costs.domain.calculator import MortgageCalculator
+from monthly_costs.domain.fast_calculator import FastMortgageCalculator
 
 router = APIRouter(prefix="/calculate", tags=["monthly-costs"])
 
@@ -41,3 +52,70 @@ async def calculate_monthly_costs(
     """Calculate monthly mortgage costs."""
     calculator = MortgageCalculator(request.fiscal_year)
     return calculator.calculate(request)
+
+
+@router.post(
+    "/monthly-costs/timeline",
+    response_model=MonthlyCostsTimelineResponse,
+    summary="Calculate monthly mortgage costs over a range of months",
+    description="""
+    Calculate gross and net monthly costs for every month from `start_month`
+    up to `end_month` (default: end of the longest loan part) in one request.
+
+    Each month gives the same figures as `/calculate/monthly-costs` with that
+    `month_number`. The series is returned as compact arrays, one entry per
+    month. A loan part with `box1_end_month` moves to box 3 after that month.
+
+    `engine=fast` computes the series on floats (NumPy) instead of Decimal:
+    much faster, amounts agree to the cent. Use it for previews and bulk
+    work; the default Decimal engine is the official outcome.
+    """,
+    responses={
+        200: {"description": "Successful calculation"},
+        404: {"description": "Fiscal rules not found for the requested year"},
+        422: {"description": "Validation error in request"},
+    },
+)
+def calculate_monthly_costs_timeline(
+    request: MonthlyCostsTimelineRequest,
+    engine: Literal["decimal", "fast"] = "decimal",
+) -> MonthlyCostsTimelineResponse:
+    """Calculate monthly mortgage costs for a range of months."""
+    # Sync handler: FastAPI runs it in the threadpool, a full term (600
+    # months) is enough work to otherwise hold up the event loop.
+    calculator_cls = FastMortgageCalculator if engine == "fast" else MortgageCalculator
+    calculator = calculator_cls(request.fiscal_year)
+    return calculator.calculate_timeline(request)
+
+
+@router.post(
+    "/monthly-costs/batch",
+    response_model=MonthlyCostsBatchResponse,
+    summary="Calculate monthly mortgage costs for several loan structures",
+    description="""
+    Calculate monthly costs for one household against several loan
+    structures (variants) in one request, e.g. for a comparison screen.
+
+    Partners, distribution, `include_ewf` and `include_hillen` are given once.
+    Each variant has its own loan parts and month number, and can override
+    `woz_value` and `partner_distribution`. The partner tax info is computed
+    once per batch and the EWF once per distinct WOZ value.
+
+    `results` holds one `/calculate/monthly-costs` response per variant, in
+    request order. `engine=fast` computes the variants on floats (see
+    `/calculate/monthly-costs/timeline`).
+    """,
+    responses={
+        200: {"description": "Successful calculation"},
+        404: {"description": "Fiscal rules not found for the requested year"},
+        422: {"description": "Validation error in request"},
+    },
+)
+def calculate_monthly_costs_batch(
+    request: MonthlyCostsBatchRequest,
+    engine: Literal["decimal", "fast"] = "decimal",
+) -> MonthlyCostsBatchResponse:
+    """Calculate monthly mortgage costs for all variants of a batch."""
+    calculator_cls = FastMortgageCalculator if engine == "fast" else MortgageCalculator
+    calculator = calculator_cls(request.fiscal_year)
+    return calculator.calculate_batch(request)
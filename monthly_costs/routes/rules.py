@@ -0,0 +1,37 @@
+"""Fiscal rules status endpoint."""
+
+from fastapi import APIRouter
+
+from monthly_costs.exceptions import MortgageCalculatorError
+from monthly_costs.rules.loader import get_available_years, get_store
+
+router = APIRouter(prefix="/calculate/monthly-costs", tags=["monthly-costs"])
+
+
+@router.get(
+    "/rules",
+    summary="Active fiscal rules versions",
+    description="""
+    Active version (content hash) of the fiscal rules per fiscal year, as
+    reported in `rules_version` of the monthly costs responses.
+
+    Every rules file is checked for changes first, so a file that was just
+    replaced shows its new version here (and is active from now on).
+    """,
+)
+def rules_status() -> dict:
+    """Check all rules files and report the active version per year."""
+    store = get_store()
+    errors = {}
+    for year in get_available_years(store.rules_dir):
+        try:
+            store.check(year)
+        except MortgageCalculatorError as e:
+            errors[year] = e.message
+
+    return {
+        "reload_interval_seconds": store.reload_interval,
+        "reloads": store.reloads,
+        "years": store.stats(),
+        "errors": errors,
+    }
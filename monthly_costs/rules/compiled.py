@@ -0,0 +1,214 @@
+"""Compiled fiscal rules - lookup structures built once per fiscal year.
+
+``load_rules`` returns ``CompiledFiscalRules``: the validated ``FiscalRules``
+plus sorted threshold tuples for the tax brackets and the EWF table, and
+cumulative-tax prefix sums. A marginal rate or EWF band is then one bisect,
+and tax on income is a prefix sum plus one bracket instead of a walk over
+the table.
+
+Tables that are not regular (unsorted overlaps, duplicate lower bounds, an
+unlimited bracket before the last) keep the original linear walk, so the
+outcome is the same for any table.
+"""
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import cached_property
+from typing import Optional, Sequence, Union
+
+from pydantic import PrivateAttr
+
+from monthly_costs.schemas.rules import EWFBand, FiscalRules, TaxBracket
+
+_INFINITY = Decimal("Infinity")
+
+
+def _is_regular(lowers: Sequence[Decimal], uppers: Sequence[Decimal]) -> bool:
+    """Strictly increasing lower bounds and every range ends before the next starts."""
+    return all(
+        lowers[i] <= uppers[i] <= lowers[i + 1] and lowers[i] < lowers[i + 1]
+        for i in range(len(lowers) - 1)
+    ) and (not lowers or lowers[-1] <= uppers[-1])
+
+
+@dataclass(frozen=True)
+class CompiledBrackets:
+    """Box 1 tax brackets as bisect-ready tuples (sorted by lower bound)."""
+
+    brackets: tuple[TaxBracket, ...]  # as given, for the linear fallback
+    lowers: tuple[Decimal, ...]
+    uppers: tuple[Decimal, ...]  # Infinity when unlimited
+    rates: tuple[Decimal, ...]
+    cumulative_tax: tuple[Decimal, ...]  # tax over all brackets below index i
+    regular: bool
+
+    def marginal_rate(self, taxable_income: Decimal) -> Decimal:
+        """Rate of the highest bracket whose lower bound is below the income."""
+        if not self.brackets:
+            return Decimal("0")
+        if not self.regular:
+            return _walk_marginal_rate(taxable_income, self.brackets)
+
+        i = bisect_left(self.lowers, taxable_income) - 1
+        return self.rates[max(i, 0)]
+
+    def tax_on_income(self, taxable_income: Decimal) -> Decimal:
+        """Total box 1 tax: prefix sum of the full brackets plus the current one."""
+        if taxable_income <= 0:
+            return Decimal("0")
+        if not self.regular:
+            return _walk_tax_on_income(taxable_income, self.brackets)
+
+        i = bisect_left(self.lowers, taxable_income) - 1
+        if i < 0:
+            return Decimal("0")
+        taxable_in_bracket = min(taxable_income, self.uppers[i]) - self.lowers[i]
+        return self.cumulative_tax[i] + taxable_in_bracket * self.rates[i]
+
+
+@dataclass(frozen=True)
+class CompiledEWFTable:
+    """EWF bands sorted by lower bound, with bisect-ready bounds."""
+
+    bands: tuple[EWFBand, ...]
+    lowers: tuple[Decimal, ...]
+    uppers: tuple[Decimal, ...]  # Infinity when unlimited
+    regular: bool
+
+    def find(self, woz_value: Decimal) -> Optional[EWFBand]:
+        """First band (by lower bound) containing the WOZ value, or None."""
+        if not self.regular:
+            for band, lower, upper in zip(self.bands, self.lowers, self.uppers):
+                if lower <= woz_value <= upper:
+                    return band
+            return None
+
+        i = bisect_right(self.lowers, woz_value) - 1
+        if i < 0:
+            return None
+        # A value on a shared boundary belongs to the lower band
+        if i > 0 and self.uppers[i - 1] >= woz_value:
+            return self.bands[i - 1]
+        return self.bands[i] if woz_value <= self.uppers[i] else None
+
+
+def compile_brackets(
+    brackets: Union[Sequence[TaxBracket], CompiledBrackets],
+) -> CompiledBrackets:
+    """Compile a bracket list (a compiled table is returned as is)."""
+    if isinstance(brackets, CompiledBrackets):
+        return brackets
+
+    ordered = sorted(brackets, key=lambda b: b.lower)
+    lowers = tuple(b.lower for b in ordered)
+    uppers = tuple(b.upper if b.upper is not None else _INFINITY for b in ordered)
+    rates = tuple(b.rate for b in ordered)
+
+    regular = _is_regular(lowers, uppers)
+
+    # Prefix sums only for regular tables (all brackets before the last are bounded)
+    cumulative = [Decimal("0")]
+    if regular:
+        for lower, upper, rate in zip(lowers[:-1], uppers[:-1], rates[:-1]):
+            cumulative.append(cumulative[-1] + (upper - lower) * rate)
+
+    return CompiledBrackets(
+        brackets=tuple(brackets),
+        lowers=lowers,
+        uppers=uppers,
+        rates=rates,
+        cumulative_tax=tuple(cumulative),
+        regular=regular,
+    )
+
+
+def compile_ewf_table(
+    ewf_table: Union[Sequence[EWFBand], CompiledEWFTable],
+) -> CompiledEWFTable:
+    """Compile an EWF table (a compiled table is returned as is)."""
+    if isinstance(ewf_table, CompiledEWFTable):
+        return ewf_table
+
+    ordered = tuple(sorted(ewf_table, key=lambda b: b.lower))
+    lowers = tuple(b.lower for b in ordered)
+    uppers = tuple(b.upper if b.upper is not None else _INFINITY for b in ordered)
+    return CompiledEWFTable(
+        bands=ordered, lowers=lowers, uppers=uppers, regular=_is_regular(lowers, uppers)
+    )
+
+
+class CompiledFiscalRules(FiscalRules):
+    """FiscalRules with compiled bracket and EWF lookups (built at load time).
+
+    The tables are cached properties: after the first access they are plain
+    instance attributes, without pydantic's private-attribute indirection.
+
+    ``version`` is the content hash of the rules file, passed by the loader
+    as validation context (``None`` for rules built in code).
+    """
+
+    _version: Optional[str] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context) -> None:
+        self._version = (__context or {}).get("version")
+        # Compile eagerly, so a broken table fails in load_rules
+        self.tax_table_box1, self.tax_table_box1_aow, self.ewf_lookup
+
+    @property
+    def version(self) -> Optional[str]:
+        return self._version
+
+    @cached_property
+    def tax_table_box1(self) -> CompiledBrackets:
+        return compile_brackets(self.tax_brackets_box1)
+
+    @cached_property
+    def tax_table_box1_aow(self) -> Optional[CompiledBrackets]:
+        """Compiled AOW brackets; None when the rules have none."""
+        if not self.tax_brackets_box1_aow:
+            return None
+        return compile_brackets(self.tax_brackets_box1_aow)
+
+    @cached_property
+    def ewf_lookup(self) -> CompiledEWFTable:
+        return compile_ewf_table(self.ewf_table)
+
+
+def _walk_marginal_rate(taxable_income: Decimal, brackets: Sequence[TaxBracket]) -> Decimal:
+    """Linear lookup for irregular bracket tables."""
+    sorted_brackets = sorted(brackets, key=lambda b: b.lower, reverse=True)
+
+    for bracket in sorted_brackets:
+        if taxable_income > bracket.lower:
+            return bracket.rate
+
+    return sorted_brackets[-1].rate
+
+
+def _walk_tax_on_income(taxable_income: Decimal, brackets: Sequence[TaxBracket]) -> Decimal:
+    """Bracket-by-bracket tax for irregular bracket tables."""
+    total_tax = Decimal("0")
+    remaining_income = taxable_income
+
+    sorted_brackets = sorted(brackets, key=lambda b: b.lower)
+
+    for bracket in sorted_brackets:
+        if remaining_income <= 0:
+            break
+
+        bracket_lower = bracket.lower
+        bracket_upper = bracket.upper if bracket.upper is not None else _INFINITY
+
+        if taxable_income <= bracket_lower:
+            continue
+
+        taxable_in_bracket = min(
+            taxable_income - bracket_lower,
+            bracket_upper - bracket_lower if bracket_upper != _INFINITY else remaining_income,
+        )
+
+        total_tax += taxable_in_bracket * bracket.rate
+        remaining_income -= taxable_in_bracket
+
+    return total_tax
@@ -1,33 +1,50 @@
-"""Fiscal rules loader with caching."""
+"""Fiscal rules loader with a hot-reloading, versioned store.
 
+Rules are kept per fiscal year in a ``RulesStore``. Each entry holds the
+compiled rules plus a version: a hash of the file contents. At most once per
+``RULES_RELOAD_INTERVAL`` seconds a request checks the file's mtime and size;
+when the file changed, the new rules are compiled and swapped in as a whole,
+so a calculation always sees one consistent version.
+
+While one thread reloads a year, other threads keep getting the previous
+version instead of waiting (or all loading the same file). Only the very
+first load of a year blocks, and then just one thread reads the file. A
+changed file that does not load keeps the previous version active.
+"""
+
+import hashlib
 import json
-from functools import lru_cache
+import logging
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
+from monthly_costs.rules.compiled import CompiledFiscalRules
 from monthly_costs.schemas.rules import FiscalRules
-from monthly_costs.config import RULES_DIR
+from monthly_costs.config import RULES_DIR, RULES_RELOAD_INTERVAL
 from monthly_costs.exceptions import FiscalRulesNotFoundError, InvalidFiscalRulesError
 
+logger = logging.getLogger(__name__)
 
-@lru_cache(maxsize=10)
-def load_rules(fiscal_year: int) -> FiscalRules:
-    """
-    Load fiscal rules for a specific year.
 
-    Rules are loaded from JSON files in the rules directory.
-    Results are cached for performance.
-    """
-    rules_file = RULES_DIR / f"{fiscal_year}.json"
+@dataclass(frozen=True)
+class RulesEntry:
+    """Active rules of one fiscal year, with the file state they came from."""
 
-    if not rules_file.exists():
-        raise FiscalRulesNotFoundError(fiscal_year)
+    rules: CompiledFiscalRules
+    version: str  # sha256 of the file contents (first 12 hex characters)
+    mtime_ns: int
+    size: int
+    loaded_at: float  # time.time() of the swap
 
-    try:
-        with open(rules_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
 
-        rules = FiscalRules.model_validate(data)
-        return rules
+def _parse_rules(content: bytes, fiscal_year: int, version: str) -> CompiledFiscalRules:
+    """Parse and compile a rules file."""
+    try:
+        data = json.loads(content)
+        return CompiledFiscalRules.model_validate(data, context={"version": version})
 
     except json.JSONDecodeError as e:
         raise InvalidFiscalRulesError(
@@ -41,13 +58,155 @@ def load_rules(fiscal_year: int) -> FiscalRules:
         )
 
 
-def get_available_years() -> list[int]:
+class RulesStore:
+    """Per-year compiled rules, reloaded when the rules file changes."""
+
+    def __init__(
+        self,
+        rules_dir: Optional[Path] = None,
+        reload_interval: Optional[float] = None,
+    ):
+        self._rules_dir = rules_dir
+        self.reload_interval = RULES_RELOAD_INTERVAL if reload_interval is None else reload_interval
+        self._entries: dict[int, RulesEntry] = {}
+        self._next_check: dict[int, float] = {}
+        self._locks: dict[int, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+        self.reloads = 0
+
+    @property
+    def rules_dir(self) -> Path:
+        return self._rules_dir if self._rules_dir is not None else RULES_DIR
+
+    def get(self, fiscal_year: int) -> RulesEntry:
+        """Active entry for a year; checks the file when the interval has passed."""
+        entry = self._entries.get(fiscal_year)
+        if entry is not None and time.monotonic() < self._next_check.get(fiscal_year, 0):
+            return entry
+
+        lock = self._lock(fiscal_year)
+        if entry is None:
+            # Cold load: one thread reads the file, the others wait for it
+            with lock:
+                entry = self._entries.get(fiscal_year)
+                if entry is None:
+                    entry = self._refresh(fiscal_year, None)
+            return entry
+
+        # Someone else is already checking: serve the current version
+        if not lock.acquire(blocking=False):
+            return entry
+        try:
+            return self._refresh(fiscal_year, self._entries.get(fiscal_year))
+        finally:
+            lock.release()
+
+    def check(self, fiscal_year: int) -> RulesEntry:
+        """Check the file now, regardless of the interval."""
+        with self._lock(fiscal_year):
+            return self._refresh(fiscal_year, self._entries.get(fiscal_year))
+
+    def warm_up(self) -> None:
+        """Load all available years, so the first requests find them compiled."""
+        for year in get_available_years(self.rules_dir):
+            try:
+                self.get(year)
+            except InvalidFiscalRulesError as e:
+                logger.error("Fiscal rules %s not loaded: %s", year, e.message)
+
+    def clear(self) -> None:
+        """Drop all entries; the next request loads from file."""
+        with self._locks_lock:
+            self._entries.clear()
+            self._next_check.clear()
+
+    def stats(self) -> list[dict]:
+        """Active version per loaded year."""
+        return [
+            {
+                "fiscal_year": year,
+                "version": entry.version,
+                "loaded_at": entry.loaded_at,
+                "file_mtime": entry.mtime_ns / 1e9,
+            }
+            for year, entry in sorted(self._entries.items())
+        ]
+
+    def _lock(self, fiscal_year: int) -> threading.Lock:
+        lock = self._locks.get(fiscal_year)
+        if lock is None:
+            with self._locks_lock:
+                lock = self._locks.setdefault(fiscal_year, threading.Lock())
+        return lock
+
+    def _refresh(self, fiscal_year: int, entry: Optional[RulesEntry]) -> RulesEntry:
+        """Reload the year if its file changed (caller holds the year's lock)."""
+        self._next_check[fiscal_year] = time.monotonic() + self.reload_interval
+        rules_file = self.rules_dir / f"{fiscal_year}.json"
+
+        try:
+            stat = rules_file.stat()
+        except FileNotFoundError:
+            if entry is None:
+                raise FiscalRulesNotFoundError(fiscal_year)
+            logger.warning("Rules file %s removed, version %s stays active",
+                           rules_file.name, entry.version)
+            return entry
+
+        if entry is not None and (stat.st_mtime_ns, stat.st_size) == (entry.mtime_ns, entry.size):
+            return entry
+
+        content = rules_file.read_bytes()
+        version = hashlib.sha256(content).hexdigest()[:12]
+        if entry is not None and version == entry.version:
+            # Touched but unchanged: keep the compiled rules
+            new_entry = RulesEntry(entry.rules, version, stat.st_mtime_ns, stat.st_size, entry.loaded_at)
+        else:
+            try:
+                rules = _parse_rules(content, fiscal_year, version)
+            except InvalidFiscalRulesError as e:
+                if entry is None:
+                    raise
+                logger.error("Rules file %s invalid, version %s stays active: %s",
+                             rules_file.name, entry.version, e.message)
+                return entry
+            new_entry = RulesEntry(rules, version, stat.st_mtime_ns, stat.st_size, time.time())
+            if entry is not None:
+                self.reloads += 1
+                logger.info("Fiscal rules %s reloaded: version %s -> %s",
+                            fiscal_year, entry.version, version)
+
+        self._entries[fiscal_year] = new_entry
+        return new_entry
+
+
+_store = RulesStore()
+
+
+def get_store() -> RulesStore:
+    """The process-wide rules store."""
+    return _store
+
+
+def load_rules(fiscal_year: int) -> CompiledFiscalRules:
+    """
+    Load fiscal rules for a specific year.
+
+    Rules are loaded from JSON files in the rules directory and compiled
+    into bracket/EWF lookup tables once per file version. A changed file is
+    picked up without a restart; ``rules.version`` identifies the version.
+    """
+    return _store.get(fiscal_year).rules
+
+
+def get_available_years(rules_dir: Optional[Path] = None) -> list[int]:
     """Get list of years for which rules are available."""
-    if not RULES_DIR.exists():
+    rules_dir = rules_dir if rules_dir is not None else RULES_DIR
+    if not rules_dir.exists():
         return []
 
     years = []
-    for file in RULES_DIR.glob("*.json"):
+    for file in rules_dir.glob("*.json"):
         try:
             year = int(file.stem)
             years.append(year)
@@ -66,11 +225,12 @@ def save_rules(rules: FiscalRules) -> Path:
     with open(rules_file, "w", encoding="utf-8") as f:
         json.dump(rules.model_dump(mode="json"), f, indent=2, ensure_ascii=False)
 
-    load_rules.cache_clear()
+    # Active right away, not after the reload interval
+    _store.check(rules.fiscal_year)
 
     return rules_file
 
 
 def clear_cache() -> None:
     """Clear the rules cache."""
-    load_rules.cache_clear()
+    _store.clear()
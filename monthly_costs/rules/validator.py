@@ -126,3 +126,9 @@ def _validate_hillen(rules: FiscalRules, result: RulesValidationResult) -> None:
             f"Hillen reduction_percentage {hillen.reduction_percentage} "
             "should be between 0 and 1"
         )
+
+    if hillen.phase_out_step is not None and hillen.phase_out_step > hillen.reduction_percentage:
+        result.add_warning(
+            f"Hillen phase_out_step {hillen.phase_out_step} is larger than "
+            f"reduction_percentage {hillen.reduction_percentage}"
+        )
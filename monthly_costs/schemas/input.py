@@ -4,7 +4,7 @@ from decimal import Decimal
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 class LoanType(str, Enum):
@@ -46,6 +46,14 @@ class LoanPart(BaseModel):
     term_years: Decimal = Field(..., gt=0, le=50, description="Loan term in years (e.g., 21.6667 for 260 months)")
     loan_type: LoanType = Field(..., description="Type of loan repayment")
     box: Box = Field(default=Box.BOX1, description="Fiscal box (1 or 3)")
+    box1_end_month: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description=(
+            "Last month with deductible (box 1) interest; box 3 afterwards "
+            "(optional, applies to single-month and timeline results)"
+        ),
+    )
 
     @field_validator("interest_rate")
     @classmethod
@@ -91,8 +99,8 @@ class PartnerDistribution(BaseModel):
         return v
 
 
-class MonthlyCostsRequest(BaseModel):
-    """Main request for monthly costs calculation."""
+class MonthlyCostsBase(BaseModel):
+    """Mortgage and partner input shared by the single-month and timeline requests."""
 
     model_config = {"frozen": True}
 
@@ -109,9 +117,6 @@ class MonthlyCostsRequest(BaseModel):
     partner_distribution: Optional[PartnerDistribution] = Field(
         default=None, description="Distribution config for 2 partners (optional)"
     )
-    month_number: int = Field(
-        default=1, ge=1, description="Month number for calculation (1 = first month)"
-    )
     include_ewf: bool = Field(
         default=True, description="Include eigenwoningforfait in calculation"
     )
@@ -126,3 +131,108 @@ class MonthlyCostsRequest(BaseModel):
     ) -> Optional[PartnerDistribution]:
         """Validate distribution config is provided when needed."""
         return v
+
+
+class MonthlyCostsRequest(MonthlyCostsBase):
+    """Main request for monthly costs calculation."""
+
+    month_number: int = Field(
+        default=1, ge=1, description="Month number for calculation (1 = first month)"
+    )
+
+
+class MonthlyCostsTimelineRequest(MonthlyCostsBase):
+    """Request for monthly costs over a range of months."""
+
+    start_month: int = Field(
+        default=1, ge=1, le=600, description="First month of the series (1 = first month)"
+    )
+    end_month: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=600,
+        description="Last month of the series (default: end of the longest loan part)",
+    )
+    first_calendar_month: int = Field(
+        default=1,
+        ge=1,
+        le=12,
+        description="Calendar month of month 1 in fiscal_year (for the Hillen phase-out)",
+    )
+
+    @model_validator(mode="after")
+    def validate_month_range(self) -> "MonthlyCostsTimelineRequest":
+        """end_month may not come before start_month."""
+        if self.end_month is not None and self.end_month < self.start_month:
+            raise ValueError("end_month must be greater than or equal to start_month")
+        return self
+
+
+class MonthlyCostsVariant(BaseModel):
+    """One loan structure within a batch request."""
+
+    model_config = {"frozen": True}
+
+    woz_value: Optional[Decimal] = Field(
+        default=None, gt=0, description="WOZ value (default: the batch woz_value)"
+    )
+    loan_parts: list[LoanPart] = Field(
+        ..., min_length=1, description="List of loan parts"
+    )
+    partner_distribution: Optional[PartnerDistribution] = Field(
+        default=None, description="Distribution config (default: the batch distribution)"
+    )
+    month_number: int = Field(
+        default=1, ge=1, description="Month number for calculation (1 = first month)"
+    )
+
+
+class MonthlyCostsBatchRequest(BaseModel):
+    """One household evaluated against several loan structures."""
+
+    model_config = {"frozen": True}
+
+    fiscal_year: int = Field(
+        ..., ge=2020, le=2050, description="Fiscal year for rules"
+    )
+    woz_value: Optional[Decimal] = Field(
+        default=None, gt=0, description="WOZ value for variants without their own"
+    )
+    partners: list[Partner] = Field(
+        ..., min_length=1, max_length=2, description="Partner(s) fiscal information"
+    )
+    partner_distribution: Optional[PartnerDistribution] = Field(
+        default=None, description="Distribution config for 2 partners (optional)"
+    )
+    include_ewf: bool = Field(
+        default=True, description="Include eigenwoningforfait in calculation"
+    )
+    include_hillen: bool = Field(
+        default=True, description="Apply Wet Hillen if applicable"
+    )
+    variants: list[MonthlyCostsVariant] = Field(
+        ..., min_length=1, max_length=50, description="Loan structures to compare"
+    )
+
+    @model_validator(mode="after")
+    def validate_woz_values(self) -> "MonthlyCostsBatchRequest":
+        """Every variant needs a WOZ value, its own or the batch value."""
+        if self.woz_value is None and any(v.woz_value is None for v in self.variants):
+            raise ValueError("woz_value is required for variants without their own woz_value")
+        return self
+
+    def variant_requests(self) -> list[MonthlyCostsRequest]:
+        """One MonthlyCostsRequest per variant, without validating the shared data again."""
+        return [
+            MonthlyCostsRequest.model_construct(
+                fiscal_year=self.fiscal_year,
+                woz_value=variant.woz_value or self.woz_value,
+                loan_parts=variant.loan_parts,
+                partners=self.partners,
+                partner_distribution=variant.partner_distribution or self.partner_distribution,
+                month_number=variant.month_number,
+                include_ewf=self.include_ewf,
+                include_hillen=self.include_hillen,
+            )
+            for variant in self.variants
+        ]
@@ -112,6 +112,9 @@ class MonthlyCostsResponse(BaseModel):
 
     # Request context
     fiscal_year: int = Field(description="Fiscal year used")
+    rules_version: Optional[str] = Field(
+        default=None, description="Version (content hash) of the fiscal rules used"
+    )
     month_number: int = Field(description="Month number calculated")
     woz_value: Decimal = Field(description="WOZ value of property")
 
@@ -147,3 +150,62 @@ class MonthlyCostsResponse(BaseModel):
         default="Indicatief - geen aangifteadvies. Wijzigingen in wetgeving, inkomen of rente kunnen de uitkomst beïnvloeden.",
         description="Legal disclaimer",
     )
+
+
+class MonthlyCostsTimelineResponse(BaseModel):
+    """Monthly costs over a range of months as compact arrays.
+
+    All lists have the same length; index ``i`` is month ``months[i]``.
+    """
+
+    model_config = {"frozen": True}
+
+    # Request context (constant over the series)
+    fiscal_year: int = Field(description="Fiscal year used")
+    rules_version: Optional[str] = Field(
+        default=None, description="Version (content hash) of the fiscal rules used"
+    )
+    woz_value: Decimal = Field(description="WOZ value of property")
+    ewf_annual: Decimal = Field(description="Annual eigenwoningforfait")
+    marginal_rate: Decimal = Field(
+        description="Marginal tax rate (highest of the partners)"
+    )
+
+    # Series
+    months: list[int] = Field(description="Month numbers")
+    total_gross_monthly: list[Decimal] = Field(description="Total gross monthly payment")
+    total_interest_monthly: list[Decimal] = Field(description="Total monthly interest")
+    total_principal_monthly: list[Decimal] = Field(description="Total monthly principal")
+    total_interest_box1_monthly: list[Decimal] = Field(
+        description="Monthly interest from box 1 loans only"
+    )
+    total_remaining_principal: list[Decimal] = Field(
+        description="Total remaining principal after the month"
+    )
+    interest_deduction_monthly: list[Decimal] = Field(
+        description="Monthly tax benefit from interest deduction"
+    )
+    hillen_benefit_monthly: list[Decimal] = Field(
+        description="Monthly tax benefit from Hillen"
+    )
+    ewf_tax_monthly: list[Decimal] = Field(description="Monthly tax cost from EWF")
+    net_monthly_cost: list[Decimal] = Field(
+        description="Net monthly cost after tax effects"
+    )
+
+    # Disclaimer
+    disclaimer: str = Field(
+        default="Indicatief - geen aangifteadvies. Wijzigingen in wetgeving, inkomen of rente kunnen de uitkomst beïnvloeden.",
+        description="Legal disclaimer",
+    )
+
+
+class MonthlyCostsBatchResponse(BaseModel):
+    """Results for all variants, in request order."""
+
+    model_config = {"frozen": True}
+
+    fiscal_year: int = Field(description="Fiscal year used")
+    results: list[MonthlyCostsResponse] = Field(
+        description="Result per variant, in the order of the request"
+    )
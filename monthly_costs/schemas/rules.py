@@ -67,6 +67,12 @@ class HillenConfig(BaseModel):
         le=1,
         description="Percentage of difference that can be deducted (phased out)",
     )
+    phase_out_step: Optional[Decimal] = Field(
+        default=None,
+        ge=0,
+        le=1,
+        description="Yearly decrease of reduction_percentage in later years (optional)",
+    )
 
 
 class FiscalRules(BaseModel):
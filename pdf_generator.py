@@ -1,6 +1,7 @@
 """
 PDF generator voor hypotheekrapporten.
 Rendert Jinja2 HTML-templates en converteert naar PDF via WeasyPrint.
+De WeasyPrint-render zelf draait op warme workers (zie pdf_renderpool.py).
 
 Ondersteunt:
 - Samenvatting Hypotheekberekening (samenvatting.html)
@@ -13,7 +14,8 @@ import logging
 from datetime import date
 
 from jinja2 import Environment, FileSystemLoader
-from weasyprint import HTML
+
+import pdf_renderpool
 
 logger = logging.getLogger("nat-api.pdf")
 
@@ -126,8 +128,9 @@ def genereer_samenvatting_pdf(data: dict) -> bytes:
     template = jinja_env.get_template("samenvatting.html")
     html_string = template.render(**data)
 
-    # Converteer naar PDF (base_url zodat relatieve paden zoals assets/logo.png werken)
-    pdf_bytes = HTML(string=html_string, base_url=TEMPLATES_DIR).write_pdf()
+    # Converteer naar PDF op de renderpool (base_url = TEMPLATES_DIR, zodat
+    # relatieve paden zoals assets/logo.png werken)
+    pdf_bytes = pdf_renderpool.render(html_string)
 
     logger.info(
         "PDF gegenereerd: %d bytes, klant=%s",
@@ -214,8 +217,8 @@ def genereer_adviesrapport_pdf(data: dict) -> bytes:
     template = jinja_env.get_template("adviesrapport.html")
     html_string = template.render(**data)
 
-    # Converteer naar PDF
-    pdf_bytes = HTML(string=html_string, base_url=TEMPLATES_DIR).write_pdf()
+    # Converteer naar PDF op de renderpool
+    pdf_bytes = pdf_renderpool.render(html_string)
 
     logger.info(
         "Adviesrapport PDF gegenereerd: %d bytes, klant=%s",
@@ -0,0 +1,380 @@
+"""
+Renderpool voor WeasyPrint (HTML → PDF)
+
+Een rapport renderen kost seconden CPU. Inline in een async endpoint
+blokkeert dat de event loop, en elke render laadt opnieuw de Google
+Fonts-stylesheet, de fontbestanden en de afbeeldingen uit templates/.
+pdf_generator rendert daarom alleen de Jinja-template zelf en stuurt de
+HTML-string naar deze pool.
+
+- Workers zijn warm: bij het starten laden ze WeasyPrint, halen ze de
+  stylesheets uit de templates en de afbeeldingen uit templates/assets op
+  en renderen ze één proefdocument. Opgehaalde bronnen, de fontconfiguratie
+  en de afbeeldingcache blijven per worker bewaard voor volgende renders.
+- Wachtrij begrensd: er staan hooguit NAT_PDF_WACHTRIJ jobs te wachten
+  naast de jobs die al draaien. Is die vol, dan volgt direct RenderpoolVol
+  (endpoints → 503) in plaats van een steeds langere rij.
+- Een render die niet binnen NAT_PDF_TIMEOUT klaar is geeft RenderTimeout;
+  een nog wachtende job wordt dan geannuleerd. Een lopende render kan niet
+  geannuleerd worden: in process-modus gaan nieuwe jobs dan naar een verse
+  pool en worden de processen van de oude pool beëindigd zodra die zijn
+  overige renders af heeft (hooguit één timeout later). De plek in de
+  wachtrij komt pas vrij als de worker echt klaar of beëindigd is.
+
+app.py start de pool bij het opstarten (start()), zodat het opwarmen niet
+ten koste gaat van de timeout van het eerste rapport; zonder start() gebeurt
+dat lazy bij de eerste render.
+
+Configuratie via env:
+- NAT_PDF_EXECUTOR: "process" (default), "thread" of "inline"
+- NAT_PDF_WORKERS: aantal workers (default min(2, cpu_count))
+- NAT_PDF_WACHTRIJ: maximaal aantal wachtende jobs (default 8)
+- NAT_PDF_TIMEOUT: seconden per render incl. wachttijd (default 60)
+"""
+
+import logging
+import multiprocessing
+import os
+import re
+import threading
+import time
+from concurrent.futures import CancelledError, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("nat-api.pdf_renderpool")
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+ASSETS_DIR = os.path.join(TEMPLATES_DIR, "assets")
+
+MODI = ("process", "thread", "inline")
+
+
+class RenderpoolVol(RuntimeError):
+    """Alle workers bezig en de wachtrij is vol."""
+
+
+class RenderTimeout(TimeoutError):
+    """Render niet binnen NAT_PDF_TIMEOUT klaar."""
+
+
+# --- In de worker ---
+
+_bronnen: Dict[str, dict] = {}  # url → opgehaalde bron (stylesheets, fonts, afbeeldingen)
+_worker = threading.local()     # fontconfiguratie en afbeeldingcache per worker-thread
+
+
+def _url_fetcher(url: str) -> dict:
+    """default_url_fetcher met geheugen: elke bron wordt één keer opgehaald."""
+    from weasyprint import default_url_fetcher
+
+    if url.startswith("data:"):
+        # Ingebedde afbeeldingen (base64) hoeven niet opgehaald te worden
+        return default_url_fetcher(url)
+    gevonden = _bronnen.get(url)
+    if gevonden is None:
+        gevonden = default_url_fetcher(url)
+        bestand = gevonden.pop("file_obj", None)
+        if bestand is not None:
+            gevonden["string"] = bestand.read()
+            bestand.close()
+        _bronnen[url] = gevonden
+    return dict(gevonden)
+
+
+def _stylesheet_urls() -> List[str]:
+    """Externe stylesheets (zoals Google Fonts) waar de templates naar linken."""
+    urls = set()
+    for naam in sorted(os.listdir(TEMPLATES_DIR)):
+        if naam.endswith(".html"):
+            with open(os.path.join(TEMPLATES_DIR, naam), encoding="utf-8") as f:
+                urls.update(re.findall(r'<link[^>]*href="([^"]+)"', f.read()))
+    return sorted(urls)
+
+
+def _warm_html() -> str:
+    """Proefdocument met alle stylesheets en afbeeldingen van de templates."""
+    links = "".join(f'<link href="{url}" rel="stylesheet">' for url in _stylesheet_urls())
+    afbeeldingen = "".join(
+        f'<img src="assets/{naam}">' for naam in sorted(os.listdir(ASSETS_DIR))
+    ) if os.path.isdir(ASSETS_DIR) else ""
+    return f"<html><head>{links}</head><body><p>Hondsrug Finance</p>{afbeeldingen}</body></html>"
+
+
+def _opwarmen() -> None:
+    """Laad WeasyPrint, fonts, stylesheets en afbeeldingen (initializer van de pool)."""
+    start = time.perf_counter()
+    _worker.font_config = None
+    _worker.afbeeldingen = {}
+    try:
+        _render(_warm_html())
+    except Exception as e:
+        # Opwarmen is een optimalisatie: een echte render meldt de fout zelf
+        logger.warning("PDF-worker opwarmen mislukt: %s", e)
+    logger.info(
+        "PDF-worker warm: %.0f ms, %d bronnen", (time.perf_counter() - start) * 1000, len(_bronnen),
+    )
+
+
+def _render(html: str) -> Tuple[bytes, float]:
+    """Render HTML naar PDF in deze worker; (pdf, renderduur in seconden)."""
+    from weasyprint import HTML
+    from weasyprint.text.fonts import FontConfiguration
+
+    start = time.perf_counter()
+    if getattr(_worker, "font_config", None) is None:
+        _worker.font_config = FontConfiguration()
+        _worker.afbeeldingen = {}
+    pdf = HTML(string=html, base_url=TEMPLATES_DIR, url_fetcher=_url_fetcher).write_pdf(
+        font_config=_worker.font_config, cache=_worker.afbeeldingen,
+    )
+    return pdf, time.perf_counter() - start
+
+
+# --- In het API-proces ---
+
+_lock = threading.Lock()
+_executor: Optional[Executor] = None
+_modus = "process"
+_workers = 1
+_wachtrij = 8
+_timeout = 60.0
+_actief = 0  # ingediende jobs waarvan de worker nog niet klaar is
+_lopend: Dict[Executor, set] = {}  # pool → futures die er nog niet klaar zijn
+_tellers: Dict[str, Any] = {}
+
+
+def _nieuwe_tellers() -> Dict[str, Any]:
+    return {
+        "renders": 0, "geweigerd": 0, "timeouts": 0, "fouten": 0,
+        "render_s": 0.0, "render_s_max": 0.0, "wacht_s": 0.0,
+    }
+
+
+def _standaard_workers() -> int:
+    return min(2, os.cpu_count() or 1)
+
+
+def configureer(
+    modus: Optional[str] = None,
+    workers: Optional[int] = None,
+    wachtrij: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> None:
+    """
+    (Her)configureer de pool. Zonder argumenten: uit env.
+
+    Een bestaande pool wordt afgesloten nadat lopende renders klaar zijn;
+    de tellers beginnen daarna opnieuw.
+    """
+    global _executor, _modus, _workers, _wachtrij, _timeout, _tellers
+
+    modus = (modus or os.environ.get("NAT_PDF_EXECUTOR") or "process").lower()
+    if modus not in MODI:
+        raise ValueError(f"Ongeldige NAT_PDF_EXECUTOR '{modus}'. Toegestaan: {', '.join(MODI)}")
+    if workers is None:
+        workers = int(os.environ.get("NAT_PDF_WORKERS") or _standaard_workers())
+    if workers < 1:
+        raise ValueError("NAT_PDF_WORKERS moet minimaal 1 zijn")
+    if wachtrij is None:
+        wachtrij = int(os.environ.get("NAT_PDF_WACHTRIJ") or 8)
+    if wachtrij < 0:
+        raise ValueError("NAT_PDF_WACHTRIJ mag niet negatief zijn")
+    if timeout is None:
+        timeout = float(os.environ.get("NAT_PDF_TIMEOUT") or 60)
+
+    with _lock:
+        oud = _executor
+        _executor, _modus, _workers, _wachtrij, _timeout = None, modus, workers, wachtrij, timeout
+        _lopend.pop(oud, None)
+    if oud is not None:
+        oud.shutdown(wait=True)
+    with _lock:
+        _tellers = _nieuwe_tellers()
+    logger.info(
+        "PDF-renderpool: %s, %d workers, wachtrij %d, timeout %.0fs", modus, workers, wachtrij, timeout,
+    )
+
+
+def _get_executor() -> Optional[Executor]:
+    """Pool lazy aanmaken; de workers warmen op bij het starten."""
+    global _executor
+    if _modus == "inline":
+        return None
+    with _lock:
+        if _executor is None:
+            if _modus == "process":
+                _executor = ProcessPoolExecutor(
+                    max_workers=_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_opwarmen,
+                )
+            else:
+                _executor = ThreadPoolExecutor(
+                    max_workers=_workers, thread_name_prefix="pdf", initializer=_opwarmen,
+                )
+        return _executor
+
+
+def _ping() -> None:
+    """Lege taak: laat de pool zijn workers starten (en dus opwarmen)."""
+
+
+def start() -> None:
+    """Start en warm de workers nu, zonder te wachten tot ze klaar zijn."""
+    executor = _get_executor()
+    if executor is not None:
+        for _ in range(_workers):
+            executor.submit(_ping)
+
+
+def _submit(executor: Optional[Executor], html: str) -> Future:
+    if executor is not None:
+        return executor.submit(_render, html)
+    future: Future = Future()
+    try:
+        future.set_result(_render(html))
+    except BaseException as e:
+        future.set_exception(e)
+    return future
+
+
+def _vrijgeven(future: Optional[Future] = None) -> None:
+    global _actief
+    with _lock:
+        _actief -= 1
+        for lopend in _lopend.values():
+            lopend.discard(future)
+
+
+def _pool_kapot(executor: Optional[Executor]) -> None:
+    """Een gecrashte worker maakt de hele process pool onbruikbaar: opnieuw starten."""
+    global _executor
+    with _lock:
+        if _executor is not executor:
+            return  # al vervangen door een andere render
+        _executor = None
+        _lopend.pop(executor, None)
+    executor.shutdown(wait=False)
+    logger.error("PDF-renderpool kapot (worker gecrasht), wordt opnieuw gestart")
+
+
+def _vervang_vastgelopen(executor: Executor) -> None:
+    """
+    Vervang een process pool met een vastgelopen render door een verse.
+
+    De oude pool krijgt één timeout om zijn overige renders af te maken;
+    daarna worden zijn processen beëindigd. De vastgelopen job krijgt dan
+    BrokenProcessPool en geeft zijn plek in de wachtrij vrij.
+    """
+    global _executor
+    with _lock:
+        if _executor is not executor:
+            return  # al vervangen door een andere render
+        _executor = None
+        lopend = set(_lopend.pop(executor, ()))
+    logger.error("PDF-render vastgelopen, renderpool wordt vervangen")
+    start()
+
+    def opruimen() -> None:
+        wait(lopend, timeout=_timeout)
+        # Geen publieke API om workers te beëindigen (pas vanaf Python 3.14)
+        for proces in list((getattr(executor, "_processes", None) or {}).values()):
+            proces.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    threading.Thread(target=opruimen, name="pdf-opruimen", daemon=True).start()
+
+
+def render(html: str) -> bytes:
+    """
+    Render een HTML-string (relatief aan templates/) naar PDF op de pool.
+
+    Raises:
+        RenderpoolVol: als alle workers bezig zijn en de wachtrij vol is.
+        RenderTimeout: als de render niet binnen de timeout klaar is.
+    """
+    global _actief
+
+    with _lock:
+        if _actief >= _workers + _wachtrij:
+            _tellers["geweigerd"] += 1
+            raise RenderpoolVol(
+                f"PDF-renderpool vol ({_actief} jobs, {_workers} workers), probeer het later opnieuw"
+            )
+        _actief += 1
+
+    start = time.perf_counter()
+    executor = _get_executor()
+    try:
+        future = _submit(executor, html)
+    except BaseException as e:
+        _vrijgeven()
+        if isinstance(e, BrokenProcessPool):
+            _pool_kapot(executor)
+        raise
+    if executor is not None:
+        with _lock:
+            _lopend.setdefault(executor, set()).add(future)
+    # De plek komt pas vrij als de worker klaar is, ook na een timeout
+    future.add_done_callback(_vrijgeven)
+
+    try:
+        pdf, render_s = future.result(timeout=_timeout)
+    except (FutureTimeoutError, CancelledError):
+        with _lock:
+            _tellers["timeouts"] += 1
+        if not future.cancel() and isinstance(executor, ProcessPoolExecutor):
+            # Loopt al: de worker blijft bezet tot WeasyPrint klaar is
+            _vervang_vastgelopen(executor)
+        raise RenderTimeout(f"PDF-render niet binnen {_timeout:.0f}s klaar") from None
+    except BaseException as e:
+        if isinstance(e, BrokenProcessPool):
+            _pool_kapot(executor)
+        with _lock:
+            _tellers["fouten"] += 1
+        raise
+
+    totaal_s = time.perf_counter() - start
+    with _lock:
+        _tellers["renders"] += 1
+        _tellers["render_s"] += render_s
+        _tellers["render_s_max"] = max(_tellers["render_s_max"], render_s)
+        _tellers["wacht_s"] += max(0.0, totaal_s - render_s)
+    logger.info("PDF gerenderd: %.0f ms (wachtrij %.0f ms)", render_s * 1000, (totaal_s - render_s) * 1000)
+    return pdf
+
+
+def afsluiten() -> None:
+    """Sluit de pool af (bijv. bij shutdown van de app)."""
+    global _executor
+    with _lock:
+        oud, _executor = _executor, None
+        _lopend.pop(oud, None)
+    if oud is not None:
+        oud.shutdown(wait=True)
+
+
+def stats() -> Dict[str, Any]:
+    with _lock:
+        actief, t = _actief, dict(_tellers)
+    renders = t["renders"]
+    return {
+        "modus": _modus,
+        "workers": _workers,
+        "gestart": _executor is not None,
+        "wachtrij_max": _wachtrij,
+        "in_wachtrij": max(0, actief - _workers),
+        "bezig": min(actief, _workers),
+        "renders": renders,
+        "geweigerd": t["geweigerd"],
+        "timeouts": t["timeouts"],
+        "fouten": t["fouten"],
+        "render_ms_gem": round(t["render_s"] / renders * 1000, 1) if renders else None,
+        "render_ms_max": round(t["render_s_max"] * 1000, 1),
+        "wacht_ms_gem": round(t["wacht_s"] / renders * 1000, 1) if renders else None,
+    }
+
+
+configureer()
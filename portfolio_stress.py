@@ -0,0 +1,372 @@
+"""
+Portefeuille-stresstest
+
+Past één schok (bijv. "toetsrente +1%, alle partners verliezen hun inkomen")
+toe op een stroom dossiers en levert per dossier de maximale hypotheek vóór
+en na de schok plus het tekort t.o.v. de huidige schuld.
+
+Opbouw:
+- Invoer: NDJSON, één dossier per regel (velden als /calculate/risk-scenarios:
+  hypotheek_delen, inkomen_aanvrager_huidig, inkomen_partner_huidig,
+  alleenstaande, toetsrente, energielabel, verplichtingen, en optioneel id
+  en geadviseerd_hypotheekbedrag — default de som van de hoofdsommen)
+- De renteschok geldt voor de rente waarop elk deel getoetst wordt: de
+  toetsrente, en voor delen met een rentevaste periode vanaf
+  c_rvp_toets_rente (die op hun werkelijke rente getoetst worden) ook
+  die werkelijke rente
+- Per chunk van dossiers: projectie via loan_projection.projecteer_batch,
+  basis- en schokberekening samen in één calculator_batch.calculate_batch,
+  resultaat per dossier via risk_scenarios._scenario_resultaat (zelfde
+  velden als een risico-scenario)
+- Chunks draaien parallel op de gedeelde rekenpool (rekenpool.py); er zijn
+  nooit meer dan max_in_vlucht chunks tegelijk in het geheugen
+- Uitvoer: NDJSON in invoervolgorde; een ongeldige regel levert een
+  foutregel op en stopt de stroom niet
+
+Gebruik als script (vanuit project root):
+    python portfolio_stress.py dossiers.ndjson --toetsrente-delta 0.01 \\
+        --inkomen-factor-partner 0 > resultaten.ndjson
+"""
+
+import asyncio
+import json
+import sys
+from collections import deque
+from dataclasses import asdict, dataclass, fields
+from datetime import date
+from itertools import islice
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, NamedTuple, Optional
+
+from dateutil.relativedelta import relativedelta
+
+import rekenpool
+from calculator_batch import calculate_batch
+from calculator_final import _FISCAAL_DEFAULTS
+from loan_projection import projecteer_batch
+from risk_scenarios import _scenario_invoer, _scenario_resultaat
+
+CHUNK_GROOTTE = 256
+
+
+@dataclass(frozen=True)
+class Schok:
+    """Schokdefinitie, toegepast op elk dossier."""
+
+    naam: str = "stress"
+    toetsrente_delta: float = 0.0          # absoluut, 0.01 = +1%-punt
+    inkomen_factor_aanvrager: float = 1.0  # 0 = inkomen valt volledig weg
+    inkomen_factor_partner: float = 1.0
+    horizon_maanden: int = 0               # delen zoveel maanden vooruit projecteren
+
+    def __post_init__(self):
+        if not -0.20 <= self.toetsrente_delta <= 0.20:
+            raise ValueError("toetsrente_delta moet tussen -0.20 en 0.20 liggen")
+        if self.inkomen_factor_aanvrager < 0 or self.inkomen_factor_partner < 0:
+            raise ValueError("inkomensfactoren mogen niet negatief zijn")
+        if not 0 <= self.horizon_maanden <= 600:
+            raise ValueError("horizon_maanden moet tussen 0 en 600 liggen")
+
+    @classmethod
+    def uit_dict(cls, definitie: dict) -> "Schok":
+        onbekend = set(definitie) - {f.name for f in fields(cls)}
+        if onbekend:
+            raise ValueError(f"Onbekende schokvelden: {', '.join(sorted(onbekend))}")
+        return cls(**definitie)
+
+
+class Regel(NamedTuple):
+    """Eén NDJSON-regel: geparsed dossier, of de reden waarom dat niet lukte."""
+
+    nummer: int
+    dossier: Optional[dict]
+    fout: Optional[str] = None
+
+
+def _parse_regel(nummer: int, tekst) -> Optional[Regel]:
+    tekst = tekst.strip()
+    if not tekst:
+        return None
+    try:
+        dossier = json.loads(tekst)
+    except ValueError as e:
+        return Regel(nummer, None, f"Ongeldige JSON: {e}")
+    if not isinstance(dossier, dict):
+        return Regel(nummer, None, "Regel is geen JSON-object")
+    return Regel(nummer, dossier)
+
+
+def lees_ndjson(regels: Iterable) -> Iterator[Regel]:
+    """NDJSON-regels (str of bytes, bijv. een open bestand) → Regels; lege regels overgeslagen."""
+    for nummer, tekst in enumerate(regels, start=1):
+        regel = _parse_regel(nummer, tekst)
+        if regel is not None:
+            yield regel
+
+
+async def alees_ndjson(stukken: AsyncIterable[bytes]) -> AsyncIterator[Regel]:
+    """Async variant voor een request body: willekeurige byte-stukken → Regels."""
+    buffer = b""
+    nummer = 0
+    async for stuk in stukken:
+        buffer += stuk
+        *volledig, buffer = buffer.split(b"\n")
+        for tekst in volledig:
+            nummer += 1
+            regel = _parse_regel(nummer, tekst)
+            if regel is not None:
+                yield regel
+    if buffer.strip():
+        regel = _parse_regel(nummer + 1, buffer)
+        if regel is not None:
+            yield regel
+
+
+def naar_ndjson(resultaat: dict) -> bytes:
+    return json.dumps(resultaat, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+_DEEL_GETALLEN = ("org_lpt", "rest_lpt", "hoofdsom_box1", "hoofdsom_box3", "rvp",
+                  "inleg_overig", "werkelijke_rente")
+
+
+def _is_getal(waarde) -> bool:
+    return isinstance(waarde, (int, float)) and not isinstance(waarde, bool) and waarde >= 0
+
+
+def _dossier_velden(dossier: dict) -> dict:
+    """Genormaliseerde dossiervelden; ValueError/TypeError bij ongeldige invoer."""
+    delen = dossier.get("hypotheek_delen")
+    if not isinstance(delen, list) or not all(isinstance(d, dict) for d in delen):
+        raise ValueError("hypotheek_delen ontbreekt of is geen lijst van objecten")
+    if len(delen) > 10:
+        raise ValueError("Maximaal 10 hypotheekdelen")
+    for deel in delen:
+        for veld in _DEEL_GETALLEN:
+            if veld in deel and not _is_getal(deel[veld]):
+                raise ValueError(f"hypotheekdeel: {veld} moet een niet-negatief getal zijn")
+        if deel.get("rente_aftrekbaar_tot"):
+            date.fromisoformat(deel["rente_aftrekbaar_tot"])
+    alleenstaande = dossier.get("alleenstaande", "JA")
+    if alleenstaande not in ("JA", "NEE"):
+        raise ValueError("alleenstaande moet 'JA' of 'NEE' zijn")
+    ontvangt_aow = dossier.get("ontvangt_aow", "NEE")
+    if ontvangt_aow not in ("JA", "NEE"):
+        raise ValueError("ontvangt_aow moet 'JA' of 'NEE' zijn")
+
+    getallen = {}
+    for veld, default in (
+        ("inkomen_aanvrager_huidig", 0), ("inkomen_partner_huidig", 0),
+        ("toetsrente", _FISCAAL_DEFAULTS["c_toets_rente"]),
+        ("verduurzamings_maatregelen", 0), ("limieten_bkr_geregistreerd", 0),
+        ("studievoorschot_studielening", 0), ("erfpachtcanon_per_jaar", 0),
+        ("jaarlast_overige_kredieten", 0),
+    ):
+        waarde = dossier.get(veld, default)
+        if not _is_getal(waarde):
+            raise ValueError(f"{veld} moet een niet-negatief getal zijn")
+        getallen[veld] = waarde
+
+    geadviseerd = dossier.get("geadviseerd_hypotheekbedrag")
+    if geadviseerd is None:
+        geadviseerd = sum(d.get("hoofdsom_box1", 0) + d.get("hoofdsom_box3", 0) for d in delen)
+
+    return dict(
+        getallen,
+        hypotheek_delen=delen,
+        alleenstaande=alleenstaande,
+        ontvangt_aow=ontvangt_aow,
+        energielabel=dossier.get("energielabel", "Geen (geldig) Label"),
+        geadviseerd=geadviseerd,
+    )
+
+
+def _invoer(v: dict, delen: list, inkomen_aanvrager: float, inkomen_partner: float,
+            toetsrente: float) -> dict:
+    return _scenario_invoer(
+        delen, inkomen_aanvrager, inkomen_partner, v["alleenstaande"], v["ontvangt_aow"],
+        toetsrente, v["energielabel"], v["verduurzamings_maatregelen"],
+        v["limieten_bkr_geregistreerd"], v["studievoorschot_studielening"],
+        v["erfpachtcanon_per_jaar"], v["jaarlast_overige_kredieten"],
+    )
+
+
+def _rente_schok(delen: list[dict], delta: float) -> list[dict]:
+    """
+    Verhoog de werkelijke rente van delen die daarop getoetst worden.
+
+    calculator_final toetst delen met rvp ≥ c_rvp_toets_rente op hun werkelijke
+    rente; alleen c_toets_rente verhogen laat die delen ongemoeid.
+    """
+    if not delta:
+        return delen
+    grens = _FISCAAL_DEFAULTS["c_rvp_toets_rente"]
+    return [
+        dict(deel, werkelijke_rente=max(0.0, deel.get("werkelijke_rente", 0) + delta))
+        if deel.get("rvp", 0) >= grens else deel
+        for deel in delen
+    ]
+
+
+def bereken_chunk(regels: list[Regel], schok: Schok, vandaag: date = None) -> list[dict]:
+    """
+    Stresstest voor één chunk dossiers (module-level, dus ook op een process pool).
+
+    Returns:
+        Eén resultaat per regel, in invoervolgorde: regel, id,
+        max_hypotheek_basis, verschil en de velden van een risico-scenario
+        (zonder de geprojecteerde delen); of regel, id en error.
+    """
+    vandaag = vandaag or date.today()
+    peildatum = vandaag + relativedelta(months=schok.horizon_maanden)
+
+    uitkomsten: list = [None] * len(regels)
+    geldig = []          # (positie, regel, velden)
+    for pos, regel in enumerate(regels):
+        dossier_id = regel.dossier.get("id") if regel.dossier else None
+        if regel.fout is not None:
+            uitkomsten[pos] = {"regel": regel.nummer, "id": None, "error": regel.fout}
+            continue
+        try:
+            geldig.append((pos, regel, _dossier_velden(regel.dossier)))
+        except (ValueError, TypeError, AttributeError) as e:
+            uitkomsten[pos] = {"regel": regel.nummer, "id": dossier_id, "error": str(e)}
+
+    geprojecteerd = projecteer_batch(
+        [v["hypotheek_delen"] for _, _, v in geldig],
+        [schok.horizon_maanden] * len(geldig),
+        [peildatum] * len(geldig),
+    )
+
+    invoeren = []
+    for (_, _, v), delen_schok in zip(geldig, geprojecteerd):
+        invoeren.append(_invoer(v, v["hypotheek_delen"], v["inkomen_aanvrager_huidig"],
+                                v["inkomen_partner_huidig"], v["toetsrente"]))
+        invoeren.append(_invoer(
+            v, _rente_schok(delen_schok, schok.toetsrente_delta),
+            v["inkomen_aanvrager_huidig"] * schok.inkomen_factor_aanvrager,
+            v["inkomen_partner_huidig"] * schok.inkomen_factor_partner,
+            v["toetsrente"] + schok.toetsrente_delta,
+        ))
+    try:
+        resultaten = calculate_batch(invoeren)
+    except (ValueError, TypeError, KeyError):
+        # Eén onbruikbaar dossier (bijv. tekst als hoofdsom) mag de chunk niet breken
+        resultaten = [_los(invoer) for invoer in invoeren]
+
+    for k, (pos, regel, v) in enumerate(geldig):
+        dossier_id = regel.dossier.get("id")
+        basis, gestrest = resultaten[2 * k], resultaten[2 * k + 1]
+        fout = basis.get("error") or gestrest.get("error")
+        if fout:
+            uitkomsten[pos] = {"regel": regel.nummer, "id": dossier_id, "error": fout}
+            continue
+        stress = invoeren[2 * k + 1]
+        scenario = _scenario_resultaat(
+            schok.naam, "stress", "dossier", stress["hypotheek_delen"],
+            stress["hoofd_inkomen_aanvrager"], stress["hoofd_inkomen_partner"],
+            v["ontvangt_aow"], v["geadviseerd"], peildatum, gestrest,
+        )
+        del scenario["hypotheek_delen_geprojecteerd"]
+        max_basis = round(basis["scenario1"]["annuitair"]["max_box1"], 2) if basis.get("scenario1") else 0
+        uitkomsten[pos] = {
+            "regel": regel.nummer,
+            "id": dossier_id,
+            "max_hypotheek_basis": max_basis,
+            "verschil": round(scenario["max_hypotheek_annuitair"] - max_basis, 2),
+            **scenario,
+        }
+    return uitkomsten
+
+
+def _los(invoer: dict) -> dict:
+    """Eén invoer apart door calculate_batch, met de fout als resultaat."""
+    try:
+        return calculate_batch([invoer])[0]
+    except (ValueError, TypeError, KeyError) as e:
+        return {"error": str(e)}
+
+
+def _chunks(regels: Iterable[Regel], grootte: int) -> Iterator[list[Regel]]:
+    iterator = iter(regels)
+    while chunk := list(islice(iterator, grootte)):
+        yield chunk
+
+
+def _max_in_vlucht(max_in_vlucht: Optional[int]) -> int:
+    return max_in_vlucht or 2 * rekenpool.stats()["workers"]
+
+
+def stress_test(regels: Iterable[Regel], schok: Schok, chunk_grootte: int = CHUNK_GROOTTE,
+                max_in_vlucht: int = None) -> Iterator[dict]:
+    """
+    Stresstest over een stroom dossiers; resultaten lazy en in invoervolgorde.
+
+    Leest pas een nieuwe chunk als er minder dan max_in_vlucht (default:
+    2x het aantal workers van de rekenpool) onderweg zijn.
+    """
+    vandaag = date.today()
+    limiet = _max_in_vlucht(max_in_vlucht)
+    onderweg = deque()
+    for chunk in _chunks(regels, chunk_grootte):
+        onderweg.append(rekenpool.submit(bereken_chunk, chunk, schok, vandaag))
+        if len(onderweg) >= limiet:
+            yield from onderweg.popleft().result()
+    while onderweg:
+        yield from onderweg.popleft().result()
+
+
+async def stress_test_async(regels: AsyncIterable[Regel], schok: Schok,
+                            chunk_grootte: int = CHUNK_GROOTTE,
+                            max_in_vlucht: int = None) -> AsyncIterator[dict]:
+    """Async variant van stress_test voor een request body; event loop blijft vrij."""
+    vandaag = date.today()
+    limiet = _max_in_vlucht(max_in_vlucht)
+    onderweg = deque()
+    chunk = []
+
+    def start(chunk):
+        onderweg.append(asyncio.wrap_future(rekenpool.submit(bereken_chunk, chunk, schok, vandaag)))
+
+    async for regel in regels:
+        chunk.append(regel)
+        if len(chunk) >= chunk_grootte:
+            start(chunk)
+            chunk = []
+            if len(onderweg) >= limiet:
+                for resultaat in await onderweg.popleft():
+                    yield resultaat
+    if chunk:
+        start(chunk)
+    while onderweg:
+        for resultaat in await onderweg.popleft():
+            yield resultaat
+
+
+def main(argv: list[str] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Portefeuille-stresstest (NDJSON in, NDJSON uit)")
+    parser.add_argument("invoer", help="NDJSON-bestand met dossiers, of - voor stdin")
+    standaard = Schok()
+    for veld in fields(Schok):
+        parser.add_argument("--" + veld.name.replace("_", "-"), type=type(getattr(standaard, veld.name)),
+                            default=getattr(standaard, veld.name))
+    parser.add_argument("--chunk-grootte", type=int, default=CHUNK_GROOTTE)
+    args = parser.parse_args(argv)
+
+    schok = Schok(**{veld.name: getattr(args, veld.name) for veld in fields(Schok)})
+    bestand = sys.stdin.buffer if args.invoer == "-" else open(args.invoer, "rb")
+    try:
+        uit = sys.stdout.buffer
+        for resultaat in stress_test(lees_ndjson(bestand), schok, args.chunk_grootte):
+            uit.write(naar_ndjson(resultaat))
+    finally:
+        if bestand is not sys.stdin.buffer:
+            bestand.close()
+        rekenpool.afsluiten()
+    print(f"Schok: {asdict(schok)}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
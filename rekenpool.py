@@ -0,0 +1,161 @@
+"""
+Gedeelde executor voor CPU-zware berekeningen
+
+De risico-scenario's (WIA/WW/ANW + NAT) zijn puur rekenwerk. Vanuit een
+async endpoint blokkeren ze de event loop, en daarmee elk ander request op
+dezelfde worker (ook /health). Deze module levert één executor per proces,
+gedeeld door app.py en de adviesrapport-orchestrator.
+
+Configuratie via env:
+- NAT_REKEN_EXECUTOR: "thread" (default), "process" of "inline"
+    thread:  ThreadPoolExecutor — houdt de event loop vrij en deelt
+             geheugen (RekenContext, resultaatcache), maar het rekenwerk is
+             puur Python en blijft door de GIL achter elkaar lopen
+    process: ProcessPoolExecutor (spawn) — echte parallelliteit over cores;
+             argumenten en resultaten moeten picklebaar zijn. Elke familie
+             heeft een eigen RekenContext: overlap tussen families wordt
+             per proces opnieuw gerekend. Workers hebben een eigen kopie van
+             de fiscale defaults; zie herstart()
+    inline:  direct in de aanroepende thread (debuggen, tests)
+- NAT_REKEN_WORKERS: aantal workers (default min(4, cpu_count))
+
+Nooit vanuit een taak op de pool zelf weer op de pool wachten: bij een
+volle pool is dat een deadlock.
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger("nat-api.rekenpool")
+
+MODI = ("thread", "process", "inline")
+
+_lock = threading.Lock()
+_executor: Optional[Executor] = None
+_modus = "thread"
+_workers = 1
+
+
+def _standaard_workers() -> int:
+    return min(4, os.cpu_count() or 1)
+
+
+def configureer(modus: Optional[str] = None, workers: Optional[int] = None) -> None:
+    """
+    (Her)configureer de executor. Zonder argumenten: uit env.
+
+    Een bestaande executor wordt afgesloten nadat lopende taken klaar zijn.
+    """
+    global _executor, _modus, _workers
+
+    modus = (modus or os.environ.get("NAT_REKEN_EXECUTOR") or "thread").lower()
+    if modus not in MODI:
+        raise ValueError(f"Ongeldige NAT_REKEN_EXECUTOR '{modus}'. Toegestaan: {', '.join(MODI)}")
+    if workers is None:
+        workers = int(os.environ.get("NAT_REKEN_WORKERS") or _standaard_workers())
+    if workers < 1:
+        raise ValueError("NAT_REKEN_WORKERS moet minimaal 1 zijn")
+
+    with _lock:
+        oud = _executor
+        _executor, _modus, _workers = None, modus, workers
+    if oud is not None:
+        oud.shutdown(wait=True)
+    logger.info("Rekenpool: %s, %d workers", modus, workers)
+
+
+def _get_executor() -> Optional[Executor]:
+    """Executor lazy aanmaken (process pools pas bij de eerste taak)."""
+    global _executor
+    if _modus == "inline":
+        return None
+    with _lock:
+        if _executor is None:
+            if _modus == "process":
+                _executor = ProcessPoolExecutor(
+                    max_workers=_workers, mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                _executor = ThreadPoolExecutor(max_workers=_workers, thread_name_prefix="reken")
+        return _executor
+
+
+def _ping() -> None:
+    """Lege taak: laat de pool zijn workers starten."""
+
+
+def start() -> None:
+    """Start de workers nu (bij het opstarten van de app) in plaats van bij de eerste taak."""
+    executor = _get_executor()
+    if executor is not None:
+        for _ in range(_workers):
+            executor.submit(_ping)
+
+
+def herstart() -> None:
+    """
+    Vervang de process pool door verse workers (na PUT /config/fiscaal).
+
+    Process-workers hebben een eigen _FISCAAL_DEFAULTS, CONFIG_VERSIE en
+    resultaatcache; alleen nieuwe workers lezen de herladen config. Taken die
+    al op de oude pool staan maken hun werk daar af. Thread en inline delen
+    het geheugen van de API: niets te doen.
+    """
+    global _executor
+    if deelt_geheugen():
+        return
+    with _lock:
+        oud, _executor = _executor, None
+    if oud is not None:
+        oud.shutdown(wait=False)
+        start()
+        logger.info("Rekenpool: workers vervangen na herladen config")
+
+
+def deelt_geheugen() -> bool:
+    """True als taken in dit proces draaien (thread/inline) en objecten kunnen delen."""
+    return _modus != "process"
+
+
+def submit(func: Callable, /, *args, **kwargs) -> Future:
+    """Start func(*args, **kwargs) op de pool; inline wordt direct uitgevoerd."""
+    executor = _get_executor()
+    if executor is not None:
+        return executor.submit(func, *args, **kwargs)
+    future: Future = Future()
+    try:
+        future.set_result(func(*args, **kwargs))
+    except BaseException as e:
+        future.set_exception(e)
+    return future
+
+
+async def voer_uit(func: Callable, /, *args, **kwargs) -> Any:
+    """Async variant van submit: wacht zonder de event loop te blokkeren."""
+    executor = _get_executor()
+    if executor is None:
+        return func(*args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+
+def afsluiten() -> None:
+    """Sluit de executor af (bijv. bij shutdown van de app)."""
+    global _executor
+    with _lock:
+        oud, _executor = _executor, None
+    if oud is not None:
+        oud.shutdown(wait=True)
+
+
+def stats() -> Dict[str, Any]:
+    return {"modus": _modus, "workers": _workers, "gestart": _executor is not None}
+
+
+configureer()
@@ -27,15 +27,99 @@ Werkloosheidsscenario's:
 - Hypotheek op startdatum (geen projectie — tijdelijk risico)
 """
 
+import threading
+from concurrent.futures import Future
 from datetime import date, timedelta
 from dateutil.relativedelta import relativedelta
 
+import rekenpool
 from aow_calculator import bereken_aow_datum
-from loan_projection import projecteer_hypotheekdelen
-from calculator_final import calculate
+from loan_projection import projecteer_hypotheekdelen, projecteer_tijdlijn
+from calculator_final import BerekeningInvoer, calculate
 from anw_nabestaanden import bereken_nabestaanden_inkomen
-from wia_calculator import bereken_wia_bruto_jaar, _bereken_lgu_duur
-from ww_calculator import bereken_ww_bruto_jaar, bereken_ww_duur
+from uitkering_tijdlijn import wia_tijdlijn, ww_tijdlijn
+
+
+class RekenContext:
+    """
+    Rekencontext voor één request: dedupliceert identieke NAT-berekeningen.
+
+    De scenariofamilies rekenen vaak met exact dezelfde invoer (elk WW-jaar
+    met hetzelfde totaal_ww en dezelfde delen, AO-fasen met gelijke inkomens).
+    Binnen één context wordt elke unieke BerekeningInvoer maar één keer
+    doorgerekend; herhalingen krijgen hetzelfde resultaat terug. Resultaten
+    worden alleen gelezen, niet gemuteerd.
+
+    Sleutel is BerekeningInvoer.cache_sleutel(), zodat int en float (en
+    daarmee de typen in de uitkomst) onderscheiden blijven. Thread-safe,
+    zodat families parallel met dezelfde context kunnen rekenen.
+    """
+
+    def __init__(self):
+        self._resultaten: dict = {}
+        self._lock = threading.Lock()
+        self.uitgevoerd = 0
+        self.hergebruikt = 0
+
+    def calculate(self, invoer: BerekeningInvoer) -> dict:
+        """calculate(invoer), of het eerder in deze context berekende resultaat."""
+        sleutel = invoer.cache_sleutel()
+        with self._lock:
+            result = self._resultaten.get(sleutel)
+            if result is not None:
+                self.hergebruikt += 1
+                return result
+        result = calculate(invoer)
+        with self._lock:
+            # Bij gelijktijdige berekening van dezelfde invoer wint de eerste
+            self.uitgevoerd += 1
+            return self._resultaten.setdefault(sleutel, result)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"uitgevoerd": self.uitgevoerd, "hergebruikt": self.hergebruikt}
+
+    def tel_op(self, stats: dict) -> None:
+        """Tel de tellingen van een context uit een ander proces erbij op."""
+        with self._lock:
+            self.uitgevoerd += stats["uitgevoerd"]
+            self.hergebruikt += stats["hergebruikt"]
+
+
+def start_familie(func, context: RekenContext = None, **kwargs) -> Future:
+    """
+    Start een scenariofamilie (bereken_*_scenarios) op de gedeelde rekenpool.
+
+    Bij een thread pool delen alle families de context van het request. Bij
+    een process pool kan dat niet: elke familie rekent dan in een eigen
+    context en de tellingen worden na afloop bij die van het request opgeteld.
+
+    Returns:
+        Future met het resultaat van func; in async code af te wachten via
+        asyncio.wrap_future.
+    """
+    if context is None or rekenpool.deelt_geheugen():
+        return rekenpool.submit(func, context=context, **kwargs)
+
+    resultaat: Future = Future()
+
+    def _klaar(future: Future) -> None:
+        try:
+            result, stats = future.result()
+        except BaseException as e:
+            resultaat.set_exception(e)
+            return
+        context.tel_op(stats)
+        resultaat.set_result(result)
+
+    rekenpool.submit(_in_eigen_context, func, kwargs).add_done_callback(_klaar)
+    return resultaat
+
+
+def _in_eigen_context(func, kwargs: dict) -> tuple[dict, dict]:
+    """Draai func met een verse RekenContext (in een worker-proces)."""
+    context = RekenContext()
+    return func(context=context, **kwargs), context.stats()
 
 
 def bereken_aow_scenarios(
@@ -56,6 +140,7 @@ def bereken_aow_scenarios(
     erfpachtcanon_per_jaar: float = 0,
     jaarlast_overige_kredieten: float = 0,
     geadviseerd_hypotheekbedrag: float = 0,
+    context: "RekenContext" = None,
 ) -> dict:
     """
     Bereken maximale hypotheek op AOW-momenten.
@@ -78,6 +163,8 @@ def bereken_aow_scenarios(
         erfpachtcanon_per_jaar: Erfpachtcanon per maand (API *12 intern)
         jaarlast_overige_kredieten: Overige kredieten maandlast (API *12 intern)
         geadviseerd_hypotheekbedrag: Geadviseerd bedrag voor tekort-berekening
+        context: RekenContext van het request (optioneel); identieke
+            NAT-berekeningen worden dan maar één keer uitgevoerd
 
     Returns:
         dict met:
@@ -94,14 +181,17 @@ def bereken_aow_scenarios(
         geb_partner = date.fromisoformat(geboortedatum_partner)
         aow_datum_partner = bereken_aow_datum(geb_partner)
 
+    # Projectie op beide AOW-momenten in één pass
+    momenten = [aow_datum_aanvrager] + ([aow_datum_partner] if aow_datum_partner else [])
+    tijdlijn = projecteer_tijdlijn(
+        hypotheek_delen, [_maanden_verschil(start, m) for m in momenten], momenten
+    )
+
     scenarios = []
 
     # --- Scenario: AOW aanvrager ---
     if aow_datum_aanvrager > date.today():
-        elapsed = _maanden_verschil(start, aow_datum_aanvrager)
-        projected = projecteer_hypotheekdelen(
-            hypotheek_delen, elapsed, aow_datum_aanvrager
-        )
+        projected = tijdlijn.delen_op(0)
 
         # Inkomen op AOW-datum aanvrager
         ink_aanvrager = inkomen_aanvrager_aow
@@ -138,6 +228,7 @@ def bereken_aow_scenarios(
             jaarlast=jaarlast_overige_kredieten,
             geadviseerd=geadviseerd_hypotheekbedrag,
             peildatum=aow_datum_aanvrager,
+            context=context,
         )
         scenarios.append(result)
 
@@ -145,10 +236,7 @@ def bereken_aow_scenarios(
     if (alleenstaande == "NEE" and aow_datum_partner
             and aow_datum_partner > date.today()
             and aow_datum_partner != aow_datum_aanvrager):
-        elapsed = _maanden_verschil(start, aow_datum_partner)
-        projected = projecteer_hypotheekdelen(
-            hypotheek_delen, elapsed, aow_datum_partner
-        )
+        projected = tijdlijn.delen_op(1)
 
         # Op AOW-datum partner: aanvrager is sowieso AOW (of niet)
         ink_partner = inkomen_partner_aow
@@ -182,6 +270,7 @@ def bereken_aow_scenarios(
             jaarlast=jaarlast_overige_kredieten,
             geadviseerd=geadviseerd_hypotheekbedrag,
             peildatum=aow_datum_partner,
+            context=context,
         )
         scenarios.append(result)
 
@@ -209,28 +298,70 @@ def _bereken_scenario(
     jaarlast: float,
     geadviseerd: float,
     peildatum: date,
+    context: "RekenContext" = None,
 ) -> dict:
     """Voer NAT berekening uit voor een enkel scenario."""
-    inputs = {
-        'hoofd_inkomen_aanvrager': inkomen_aanvrager,
-        'hoofd_inkomen_partner': inkomen_partner,
-        'alleenstaande': alleenstaande,
-        'ontvangt_aow': ontvangt_aow,
-        'energielabel': energielabel,
-        'verduurzamings_maatregelen': verduurzamings_maatregelen,
-        'limieten_bkr_geregistreerd': limieten_bkr,
-        'studievoorschot_studielening': studievoorschot,
-        'erfpachtcanon_per_jaar': erfpacht,
-        'jaarlast_overige_kredieten': jaarlast,
-        'hypotheek_delen': hypotheek_delen,
+    invoer = BerekeningInvoer(**_scenario_invoer(
+        hypotheek_delen, inkomen_aanvrager, inkomen_partner, alleenstaande, ontvangt_aow,
+        toetsrente, energielabel, verduurzamings_maatregelen, limieten_bkr, studievoorschot,
+        erfpacht, jaarlast,
+    ))
+
+    result = context.calculate(invoer) if context is not None else calculate(invoer)
+    return _scenario_resultaat(
+        naam, categorie, van_toepassing_op, hypotheek_delen, inkomen_aanvrager,
+        inkomen_partner, ontvangt_aow, geadviseerd, peildatum, result,
+    )
+
+
+def _scenario_invoer(
+    hypotheek_delen: list[dict],
+    inkomen_aanvrager: float,
+    inkomen_partner: float,
+    alleenstaande: str,
+    ontvangt_aow: str,
+    toetsrente: float,
+    energielabel: str,
+    verduurzamings_maatregelen: float,
+    limieten_bkr: float,
+    studievoorschot: float,
+    erfpacht: float,
+    jaarlast: float,
+) -> dict:
+    """Invoer voor calculate() van één scenario (ook bruikbaar voor calculate_batch)."""
+    return dict(
+        hoofd_inkomen_aanvrager=inkomen_aanvrager,
+        hoofd_inkomen_partner=inkomen_partner,
+        alleenstaande=alleenstaande,
+        ontvangt_aow=ontvangt_aow,
+        energielabel=energielabel,
+        verduurzamings_maatregelen=verduurzamings_maatregelen,
+        limieten_bkr_geregistreerd=limieten_bkr,
+        studievoorschot_studielening=studievoorschot,
+        erfpachtcanon_per_jaar=erfpacht,
+        jaarlast_overige_kredieten=jaarlast,
+        hypotheek_delen=hypotheek_delen,
         # Oorspronkelijke toetsrente als c_toets_rente meegeven.
         # Na projectie zijn alle RVPs 0 (< 120), dus alle delen
         # gebruiken c_toets_rente → gewogen rente = toetsrente.
-        'c_toets_rente': toetsrente,
-        'c_actuele_10jr_rente': toetsrente,
-    }
+        c_toets_rente=toetsrente,
+        c_actuele_10jr_rente=toetsrente,
+    )
 
-    result = calculate(inputs)
+
+def _scenario_resultaat(
+    naam: str,
+    categorie: str,
+    van_toepassing_op: str,
+    hypotheek_delen: list[dict],
+    inkomen_aanvrager: float,
+    inkomen_partner: float,
+    ontvangt_aow: str,
+    geadviseerd: float,
+    peildatum: date,
+    result: dict,
+) -> dict:
+    """Scenario-dict uit een calculate()-resultaat."""
     scenario1 = result.get('scenario1')
 
     if scenario1:
@@ -305,6 +436,7 @@ def bereken_overlijdens_scenarios(
     erfpachtcanon_per_jaar: float = 0,
     jaarlast_overige_kredieten: float = 0,
     geadviseerd_hypotheekbedrag: float = 0,
+    context: "RekenContext" = None,
 ) -> dict:
     """
     Bereken maximale hypotheek bij overlijden aanvrager of partner.
@@ -378,6 +510,7 @@ def bereken_overlijdens_scenarios(
         jaarlast=jaarlast_overige_kredieten,
         geadviseerd=geadviseerd_hypotheekbedrag,
         peildatum=peildatum,
+        context=context,
     )
     result1['anw_details'] = {
         'anw_eligible': anw_partner['anw_eligible'],
@@ -428,6 +561,7 @@ def bereken_overlijdens_scenarios(
         jaarlast=jaarlast_overige_kredieten,
         geadviseerd=geadviseerd_hypotheekbedrag,
         peildatum=peildatum,
+        context=context,
     )
     result2['anw_details'] = {
         'anw_eligible': anw_aanvrager['anw_eligible'],
@@ -486,6 +620,7 @@ def bereken_ao_scenarios(
     erfpachtcanon_per_jaar: float = 0,
     jaarlast_overige_kredieten: float = 0,
     geadviseerd_hypotheekbedrag: float = 0,
+    context: "RekenContext" = None,
 ) -> dict:
     """
     Bereken maximale hypotheek bij arbeidsongeschiktheid.
@@ -587,6 +722,7 @@ def bereken_ao_scenarios(
                 jaarlast=jaarlast_overige_kredieten,
                 geadviseerd=geadviseerd_hypotheekbedrag,
                 peildatum=peil_ldb,
+                context=context,
             )
             result['ao_details'] = {
                 'fase': 'loondoorbetaling',
@@ -601,15 +737,17 @@ def bereken_ao_scenarios(
             }
             scenarios.append(result)
 
-            # === Fase 2: WGA loongerelateerd ===
-            wia_lgu = bereken_wia_bruto_jaar(
+            # WIA-uitkering over de hele looptijd; de fasen zijn monsters daaruit
+            wia = wia_tijdlijn(
                 ao_percentage=ao_percentage,
                 sv_loon_jaar=sv_loon,
                 feitelijk_loon_maand=actual_wage_maand,
-                fase="lgu",
                 employment_history_years_to_2015=arbeidsverleden_jaren_tm_2015,
                 employment_history_years_from_2016=arbeidsverleden_jaren_vanaf_2016,
             )
+
+            # === Fase 2: WGA loongerelateerd ===
+            wia_lgu = wia.fase("lgu")
             totaal_lgu = wia_lgu['totaal_bruto_jaar'] + vast_ao_inkomen
 
             peil_lgu = today + timedelta(weeks=104)
@@ -639,6 +777,7 @@ def bereken_ao_scenarios(
                 jaarlast=jaarlast_overige_kredieten,
                 geadviseerd=geadviseerd_hypotheekbedrag,
                 peildatum=peil_lgu,
+                context=context,
             )
             result['ao_details'] = {
                 'fase': 'wga_loongerelateerd',
@@ -656,20 +795,10 @@ def bereken_ao_scenarios(
             scenarios.append(result)
 
             # === Fase 3: WGA loonaanvulling ===
-            wia_la = bereken_wia_bruto_jaar(
-                ao_percentage=ao_percentage,
-                sv_loon_jaar=sv_loon,
-                feitelijk_loon_maand=actual_wage_maand,
-                fase="na_lgu",
-                employment_history_years_to_2015=arbeidsverleden_jaren_tm_2015,
-                employment_history_years_from_2016=arbeidsverleden_jaren_vanaf_2016,
-            )
+            wia_la = wia.fase("na_lgu")
             totaal_la = wia_la['totaal_bruto_jaar'] + vast_ao_inkomen
 
-            lgu_duur = _bereken_lgu_duur(
-                arbeidsverleden_jaren_tm_2015,
-                arbeidsverleden_jaren_vanaf_2016,
-            )
+            lgu_duur = wia.lgu_duur
             peil_la = today + timedelta(weeks=104) + relativedelta(months=lgu_duur)
             elapsed_la = max(0, _maanden_verschil(start, peil_la))
             projected_la = projecteer_hypotheekdelen(
@@ -697,6 +826,7 @@ def bereken_ao_scenarios(
                 jaarlast=jaarlast_overige_kredieten,
                 geadviseerd=geadviseerd_hypotheekbedrag,
                 peildatum=peil_la,
+                context=context,
             )
             result['ao_details'] = {
                 'fase': wia_la['status'],
@@ -744,6 +874,7 @@ def bereken_ao_scenarios(
                 jaarlast=jaarlast_overige_kredieten,
                 geadviseerd=geadviseerd_hypotheekbedrag,
                 peildatum=today,
+                context=context,
             )
             result['ao_details'] = {
                 'fase': 'geen_loondienst',
@@ -796,6 +927,7 @@ def bereken_werkloosheid_scenarios(
     erfpachtcanon_per_jaar: float = 0,
     jaarlast_overige_kredieten: float = 0,
     geadviseerd_hypotheekbedrag: float = 0,
+    context: "RekenContext" = None,
 ) -> dict:
     """
     Bereken maximale hypotheek bij werkloosheid.
@@ -858,21 +990,17 @@ def bereken_werkloosheid_scenarios(
             # --- Met loondienst: WW-fase(n) + na-WW ---
             # Onderneming/ROZ vallen ook volledig weg bij werkloosheid
 
-            # WW-duur berekenen
-            ww_duur = bereken_ww_duur(
-                employment_years_total_relevant=p["av_totaal"],
-                employment_years_pre2016_above10=p["av_pre2016"],
-                employment_years_from2016_above10=p["av_vanaf2016"],
-            )
-
-            # WW-uitkering berekenen (70% structureel, maand 3+)
-            ww_result = bereken_ww_bruto_jaar(
+            # WW-uitkering over de hele looptijd (duur + bedrag per maand)
+            ww = ww_tijdlijn(
                 sv_loon_jaar=p["loondienst"],
                 employment_years_total_relevant=p["av_totaal"],
                 employment_years_pre2016_above10=p["av_pre2016"],
                 employment_years_from2016_above10=p["av_vanaf2016"],
-                ww_maand_nummer=3,  # structureel: 70%
             )
+            ww_duur = ww.duur
+
+            # WW-uitkering in maand 3 (70% structureel)
+            ww_result = ww.bruto_jaar(3)
 
             ww_inkomen_jaar = ww_result['ww_benefit_gross_year']
             # Tijdens WW: onderneming/ROZ vallen ook weg
@@ -906,6 +1034,7 @@ def bereken_werkloosheid_scenarios(
                     jaarlast=jaarlast_overige_kredieten,
                     geadviseerd=geadviseerd_hypotheekbedrag,
                     peildatum=date.today(),
+                    context=context,
                 )
                 result['ww_details'] = {
                     'fase': 'ww',
@@ -945,6 +1074,7 @@ def bereken_werkloosheid_scenarios(
                 jaarlast=jaarlast_overige_kredieten,
                 geadviseerd=geadviseerd_hypotheekbedrag,
                 peildatum=date.today(),
+                context=context,
             )
             result_na['ww_details'] = {
                 'fase': 'na_ww',
@@ -981,6 +1111,7 @@ def bereken_werkloosheid_scenarios(
                 jaarlast=jaarlast_overige_kredieten,
                 geadviseerd=geadviseerd_hypotheekbedrag,
                 peildatum=date.today(),
+                context=context,
             )
             result['ww_details'] = {
                 'fase': 'geen_loondienst',
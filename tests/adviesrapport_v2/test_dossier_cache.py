@@ -0,0 +1,113 @@
+"""Tests voor dossier_cache — hergebruik van genormaliseerde data op rij-versie."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from adviesrapport_v2 import dossier_cache, supabase_client
+from calculation_cache import ResultCache
+
+
+DOSSIER = {
+    "id": "d1",
+    "updated_at": "2026-10-17T09:00:00+00:00",
+    "invoer": {
+        "klantGegevens": {
+            "naamAanvrager": "Test Gebruiker",
+            "alleenstaand": True,
+            "geboortedatumAanvrager": "1990-06-15",
+        },
+        "berekeningen": [{"aankoopsomWoning": 350000, "eigenGeld": 25000}],
+    },
+}
+AANVRAAG = {"id": "a1", "updated_at": "2026-10-17T09:05:00+00:00", "nhg": True}
+
+
+class FakeSupabase:
+    """Rijen in geheugen; telt probes en volledige reads."""
+
+    def __init__(self, monkeypatch):
+        self.rijen = {"dossiers": dict(DOSSIER), "aanvragen": dict(AANVRAAG)}
+        self.probes = 0
+        self.reads = 0
+        self.probe_fout = None
+        monkeypatch.setattr(supabase_client, "lees_versie", self.lees_versie)
+        monkeypatch.setattr(supabase_client, "lees_dossier", self._lees("dossiers"))
+        monkeypatch.setattr(supabase_client, "lees_aanvraag", self._lees("aanvragen"))
+
+    async def lees_versie(self, tabel, rij_id, access_token=None):
+        self.probes += 1
+        if self.probe_fout:
+            raise self.probe_fout
+        return self.rijen[tabel].get("updated_at")
+
+    def _lees(self, tabel):
+        async def lees(rij_id, access_token=None):
+            self.reads += 1
+            return dict(self.rijen[tabel])
+        return lees
+
+
+@pytest.fixture
+def supabase(monkeypatch):
+    monkeypatch.setattr(dossier_cache, "DOSSIER_CACHE", ResultCache(maxsize=8, ttl=3600))
+    monkeypatch.setattr(dossier_cache, "_niet_gecachet", {"probe_fouten": 0, "zonder_versie": 0})
+    return FakeSupabase(monkeypatch)
+
+
+def laad():
+    return asyncio.run(dossier_cache.laad_dossier("d1", "a1", "token"))
+
+
+def test_ongewijzigd_dossier_uit_cache(supabase):
+    eerste = laad()
+    tweede = laad()
+
+    assert not eerste.cache_hit
+    assert tweede.cache_hit
+    assert supabase.reads == 2  # alleen bij de eerste: dossier + aanvraag
+    assert supabase.probes == 4
+    assert tweede.data.aanvrager.naam == eerste.data.aanvrager.naam
+    assert dossier_cache.stats()["hits"] == 1
+
+
+def test_cache_geeft_eigen_kopie(supabase):
+    laad()
+    laad().data.aanvrager.inkomen.aow_uitkering = 12345
+
+    assert laad().data.aanvrager.inkomen.aow_uitkering == 0
+
+
+def test_gewijzigde_aanvraag_wordt_opnieuw_gemapt(supabase):
+    laad()
+    supabase.rijen["aanvragen"]["updated_at"] = "2026-10-17T09:10:00+00:00"
+
+    assert not laad().cache_hit
+    assert laad().cache_hit
+    assert supabase.reads == 4
+
+
+def test_probe_fout_haalt_volledig_op(supabase):
+    supabase.probe_fout = httpx.ConnectError("weg")
+
+    assert not laad().cache_hit
+    assert not laad().cache_hit
+    assert supabase.reads == 4
+    assert dossier_cache.stats()["probe_fouten"] == 2
+
+
+def test_zonder_versiekolom_niet_gecachet(supabase):
+    del supabase.rijen["dossiers"]["updated_at"]
+
+    laad()
+    assert not laad().cache_hit
+    assert dossier_cache.stats()["size"] == 0
+    assert dossier_cache.stats()["zonder_versie"] == 2
+
+
+def test_niet_gevonden(supabase):
+    supabase.probe_fout = ValueError("Niet gevonden in dossiers: d1")
+
+    with pytest.raises(ValueError):
+        laad()
@@ -21,6 +21,7 @@ from adviesrapport_v2.report_orchestrator import (
     _bereken_maandlasten,
     _bepaal_scenario_checks,
     _build_pensioen_chart_data,
+    generate_sections,
 )
 from adviesrapport_v2.field_mapper import (
     extract_dossier_data,
@@ -227,3 +228,50 @@ class TestPensioenChartData:
         eerste = chart["jaren"][0]["restschuld"]
         laatste = chart["jaren"][-1]["restschuld"]
         assert eerste > laatste
+
+
+MOCK_DOSSIER_MET_INKOMEN = {
+    "invoer": {
+        **MOCK_DOSSIER["invoer"],
+        "klantGegevens": {
+            **MOCK_DOSSIER["invoer"]["klantGegevens"],
+            "hoofdinkomenAanvrager": 80000,
+        },
+    }
+}
+
+
+class TestGenerateSections:
+    def test_volledige_flow(self):
+        """Alle berekeningen via de rekengraaf leveren secties en context."""
+        sections, ctx = generate_sections(MOCK_DOSSIER_MET_INKOMEN, MOCK_AANVRAAG, AdviesrapportOptions())
+
+        ids = [s["id"] for s in sections]
+        assert ids[0] == "summary"
+        assert "retirement" in ids
+        assert ids[-1] == "closing"
+        assert ctx["max_hypotheek"] > 0
+
+    def test_fout_in_knoop_raakt_alleen_eigen_sectie(self, monkeypatch):
+        """Een falende scenariofamilie degradeert alleen de eigen sectie."""
+        import risk_scenarios
+        from adviesrapport_v2 import sectie_cache
+        from calculation_cache import ResultCache
+
+        # Zonder sectiecache: anders komen de berekeningen van de eerste aanroep terug
+        monkeypatch.setattr(sectie_cache, "SECTIE_CACHE", ResultCache(maxsize=0))
+
+        def ao_faalt(**kwargs):
+            raise RuntimeError("AO kapot")
+
+        goed, goed_ctx = generate_sections(MOCK_DOSSIER_MET_INKOMEN, MOCK_AANVRAAG, AdviesrapportOptions())
+        monkeypatch.setattr(risk_scenarios, "bereken_ao_scenarios", ao_faalt)
+        sections, ctx = generate_sections(MOCK_DOSSIER_MET_INKOMEN, MOCK_AANVRAAG, AdviesrapportOptions())
+
+        assert goed_ctx["ao_scenarios"]
+        assert ctx["ao_scenarios"] == []
+        assert ctx["max_hypotheek"] == goed_ctx["max_hypotheek"]
+        assert ctx["aow_scenarios"] == goed_ctx["aow_scenarios"]
+        assert ctx["ww_scenarios"] == goed_ctx["ww_scenarios"]
+        ids = [s["id"] for s in sections]
+        assert ids == [i for i in (s["id"] for s in goed) if i != "risk-disability"]
@@ -0,0 +1,66 @@
+"""Tests voor rekengraaf — knopen met afhankelijkheden, gelijktijdig uitgevoerd."""
+
+import logging
+import threading
+
+import pytest
+
+from adviesrapport_v2.rekengraaf import Knoop, voer_uit
+
+
+def test_afhankelijkheden_krijgen_uitkomsten():
+    uitkomsten, duur, mislukt = voer_uit({
+        "a": Knoop(lambda: 2),
+        "b": Knoop(lambda: 3),
+        "som": Knoop(lambda a, b: a + b, ("a", "b")),
+        "dubbel": Knoop(lambda som: som * 2, ("som",)),
+    })
+
+    assert uitkomsten == {"a": 2, "b": 3, "som": 5, "dubbel": 10}
+    assert set(duur) == {"a", "b", "som", "dubbel"}
+    assert mislukt == []
+    assert all(d >= 0 for d in duur.values())
+
+
+def test_onafhankelijke_knopen_lopen_gelijktijdig():
+    # Beide knopen wachten op elkaar: lukt alleen als ze tegelijk draaien
+    barriere = threading.Barrier(2, timeout=5)
+
+    uitkomsten, _, _ = voer_uit({
+        "a": Knoop(lambda: barriere.wait() is not None),
+        "b": Knoop(lambda: barriere.wait() is not None),
+    })
+
+    assert uitkomsten == {"a": True, "b": True}
+
+
+def test_fout_levert_standaard_en_raakt_alleen_eigen_knoop(caplog):
+    def faalt():
+        raise RuntimeError("kapot")
+
+    with caplog.at_level(logging.ERROR, logger="nat-api.adviesrapport_v2.rekengraaf"):
+        uitkomsten, _, mislukt = voer_uit({
+            "faalt": Knoop(faalt, standaard=(0, 0.05)),
+            "volgt": Knoop(lambda faalt: faalt[1], ("faalt",)),
+            "los": Knoop(lambda: "ok"),
+        })
+
+    assert uitkomsten == {"faalt": (0, 0.05), "volgt": 0.05, "los": "ok"}
+    assert mislukt == ["faalt"]
+    assert "faalt mislukt: kapot" in caplog.text
+
+
+def test_duur_wordt_gelogd(caplog):
+    with caplog.at_level(logging.INFO, logger="nat-api.adviesrapport_v2.rekengraaf"):
+        voer_uit({"max_hypotheek": Knoop(lambda: 1)})
+
+    assert "max_hypotheek=" in caplog.text
+
+
+@pytest.mark.parametrize("knopen", [
+    {"a": Knoop(lambda b: b, ("b",))},
+    {"a": Knoop(lambda b: b, ("b",)), "b": Knoop(lambda a: a, ("a",))},
+])
+def test_ongeldige_graaf(knopen):
+    with pytest.raises(ValueError):
+        voer_uit(knopen)
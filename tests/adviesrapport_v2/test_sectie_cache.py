@@ -0,0 +1,134 @@
+"""Tests voor sectie_cache — hergebruik van berekeningen en secties in generate_sections.
+
+pdf_generator wordt gemockt (WeasyPrint), zie test_orchestrator.py.
+"""
+
+import sys
+from unittest.mock import MagicMock
+
+sys.modules.setdefault("pdf_generator", MagicMock())
+
+import pytest
+
+import risk_scenarios
+from adviesrapport_v2 import report_orchestrator, sectie_cache
+from adviesrapport_v2.report_orchestrator import build_preview_response, generate_sections
+from adviesrapport_v2.schemas import AdviesrapportOptions
+from calculation_cache import ResultCache
+
+
+DOSSIER = {
+    "invoer": {
+        "klantGegevens": {
+            "naamAanvrager": "Jan Test",
+            "alleenstaand": False,
+            "geboortedatumAanvrager": "1985-03-01",
+            "hoofdinkomenAanvrager": 70000,
+            "naamPartner": "Piet Test",
+            "geboortedatumPartner": "1987-09-12",
+            "hoofdinkomenPartner": 40000,
+        },
+        "berekeningen": [{"aankoopsomWoning": 350000, "eigenGeld": 25000}],
+        "_dossierScenario1": {
+            "leningDelen": [{
+                "bedrag": 325000,
+                "aflossingsvorm": "annuiteit",
+                "rentepercentage": 4.5,
+                "origineleLooptijd": 360,
+                "restantLooptijd": 360,
+                "rentevastePeriode": 120,
+            }],
+        },
+    }
+}
+AANVRAAG = {"nhg": True}
+
+
+@pytest.fixture(autouse=True)
+def lege_cache(monkeypatch):
+    monkeypatch.setattr(sectie_cache, "SECTIE_CACHE", ResultCache(maxsize=256, ttl=3600))
+
+
+def genereer(options=None, **kwargs):
+    return generate_sections(DOSSIER, AANVRAAG, options or AdviesrapportOptions(), **kwargs)
+
+
+def test_ongewijzigde_invoer_hergebruikt_alles():
+    sections, ctx = genereer()
+    opnieuw, ctx2 = genereer()
+
+    assert ctx["secties_hergebruikt"] == []
+    assert not ctx["berekeningen_hergebruikt"]
+    assert ctx2["berekeningen_hergebruikt"]
+    assert ctx2["secties_hergebruikt"] == [s["id"] for s in sections]
+    assert opnieuw == sections
+    assert ctx2["aow_scenarios"] == ctx["aow_scenarios"]
+
+
+def test_alleen_secties_met_gewijzigde_invoer_opnieuw():
+    sections, _ = genereer()
+    _, ctx = genereer(AdviesrapportOptions(doel_hypotheek="Oversluiten"))
+
+    # Alleen het klantprofiel leest doel_hypotheek
+    assert ctx["secties_hergebruikt"] == [s["id"] for s in sections if s["id"] != "client-profile"]
+
+
+def test_text_overrides_na_de_cache():
+    sections, _ = genereer()
+    override = {"retirement": {"narratives": ["Eigen tekst"]}}
+
+    bewerkt, ctx = genereer(text_overrides=override)
+    zonder, _ = genereer()
+
+    def narratives(secties):
+        return next(s["narratives"] for s in secties if s["id"] == "retirement")
+
+    assert "retirement" in ctx["secties_hergebruikt"]
+    assert narratives(bewerkt) == ["Eigen tekst"]
+    assert narratives(zonder) == narratives(sections)
+
+
+def test_nieuwe_fiscale_regels_niet_hergebruikt(monkeypatch):
+    monkeypatch.setattr(report_orchestrator, "_maandlasten_regels_versie", lambda: "v1")
+    genereer()
+    monkeypatch.setattr(report_orchestrator, "_maandlasten_regels_versie", lambda: "v2")
+    _, ctx = genereer()
+
+    assert not ctx["berekeningen_hergebruikt"]
+    assert ctx["secties_hergebruikt"] == []
+
+
+def test_mislukte_berekening_niet_gecachet(monkeypatch):
+    def ao_faalt(**kwargs):
+        raise RuntimeError("AO kapot")
+
+    with monkeypatch.context() as m:
+        m.setattr(risk_scenarios, "bereken_ao_scenarios", ao_faalt)
+        _, ctx = genereer()
+    _, ctx2 = genereer()
+
+    assert ctx["ao_scenarios"] == []
+    assert not ctx2["berekeningen_hergebruikt"]
+    assert ctx2["ao_scenarios"]
+
+
+def test_mislukte_maandlasten_niet_gecachet(monkeypatch):
+    def kapot(self, request):
+        raise RuntimeError("regels tijdelijk onleesbaar")
+
+    with monkeypatch.context() as m:
+        m.setattr(report_orchestrator.MortgageCalculator, "calculate", kapot)
+        _, ctx = genereer()
+    _, ctx2 = genereer()
+
+    assert ctx["netto_maandlast"] == 0
+    assert not ctx2["berekeningen_hergebruikt"]
+    assert ctx2["netto_maandlast"] > 0
+
+
+def test_preview_meldt_hergebruik():
+    genereer()
+    preview = build_preview_response(*genereer())
+
+    assert preview["reused_calculations"] is True
+    assert preview["reused_sections"] == [s["id"] for s in preview["sections"]]
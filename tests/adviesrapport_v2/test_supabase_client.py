@@ -0,0 +1,104 @@
+"""Tests voor supabase_client — gedeelde client en gelijktijdige reads."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from adviesrapport_v2 import supabase_client
+from adviesrapport_v2.supabase_client import lees_aanvraag, lees_dossier, lees_parallel
+
+
+class FakeSupabase:
+    """MockTransport met rijen per tabel; houdt bij hoeveel requests tegelijk lopen."""
+
+    def __init__(self):
+        self.rijen = {"dossiers": [{"id": "d1"}], "aanvragen": [{"id": "a1"}]}
+        self.clients = 0
+        self.requests = 0
+        self.tegelijk = 0
+        self.max_tegelijk = 0
+        self.storingen = 0  # aantal requests dat op de verbinding faalt
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.storingen:
+            self.storingen -= 1
+            raise httpx.ConnectError("verbinding verbroken", request=request)
+        self.tegelijk += 1
+        self.max_tegelijk = max(self.max_tegelijk, self.tegelijk)
+        await asyncio.sleep(0.01)
+        self.tegelijk -= 1
+        tabel = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json=self.rijen[tabel])
+
+    def maak_client(self) -> httpx.AsyncClient:
+        self.clients += 1
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+
+@pytest.fixture
+def supabase(monkeypatch):
+    fake = FakeSupabase()
+    monkeypatch.setattr(supabase_client, "SUPABASE_URL", "https://test.supabase.co")
+    monkeypatch.setattr(supabase_client, "SUPABASE_ANON_KEY", "anon")
+    monkeypatch.setattr(supabase_client, "_maak_client", fake.maak_client)
+    monkeypatch.setattr(supabase_client, "_client", None)
+    return fake
+
+
+def lees_beide():
+    return lees_parallel(
+        lambda: lees_dossier("d1", "token"),
+        lambda: lees_aanvraag("a1", "token"),
+    )
+
+
+def test_reads_gelijktijdig_over_een_client(supabase):
+    async def twee_keer():
+        return await lees_beide(), await lees_beide()
+
+    eerste, tweede = asyncio.run(twee_keer())
+
+    assert eerste == tweede == [{"id": "d1"}, {"id": "a1"}]
+    assert supabase.max_tegelijk == 2
+    assert supabase.clients == 1
+
+
+def test_verbindingsfout_wordt_los_herhaald(supabase):
+    supabase.storingen = 1
+
+    assert asyncio.run(lees_beide()) == [{"id": "d1"}, {"id": "a1"}]
+    assert supabase.requests == 3
+
+
+def test_blijvende_verbindingsfout(supabase):
+    supabase.storingen = 3
+
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(lees_beide())
+
+
+def test_niet_gevonden_niet_herhaald(supabase):
+    supabase.rijen["aanvragen"] = []
+
+    with pytest.raises(ValueError, match="Aanvraag niet gevonden"):
+        asyncio.run(lees_beide())
+    assert supabase.requests == 2
+
+
+def test_client_van_vorige_loop_wordt_gesloten(supabase):
+    async def client_en_lezen():
+        await lees_beide()
+        return supabase_client._get_client()
+
+    eerste = asyncio.run(client_en_lezen())
+    tweede = asyncio.run(client_en_lezen())
+
+    assert supabase.clients == 2
+    assert eerste.is_closed
+    assert not tweede.is_closed
+
+    asyncio.run(supabase_client.sluit_client())
+    assert tweede.is_closed
+    assert supabase_client._client is None
@@ -1 +1,20 @@
 """Domain tests conftest — project root already on sys.path via root conftest.py."""
+
+import json
+import os
+
+import pytest
+
+import calculator_final
+
+
+@pytest.fixture
+def fiscaal_config():
+    """Inhoud van config/fiscaal.json; het bestand wordt na de test teruggezet en herladen."""
+    pad = os.path.join(calculator_final.BASE_DIR, "config", "fiscaal.json")
+    with open(pad, "rb") as f:
+        origineel = f.read()
+    yield json.loads(origineel)
+    with open(pad, "wb") as f:
+        f.write(origineel)
+    calculator_final.herlaad_fiscaal_defaults()
@@ -0,0 +1,84 @@
+"""
+Test aow_calculator.py — gecompileerde AOW-tabel.
+
+De bisect-lookup en de gevectoriseerde varianten moeten exact dezelfde
+uitkomst geven als de lineaire zoektocht door de tabel met relativedelta.
+"""
+
+import random
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+from dateutil.relativedelta import relativedelta
+
+import aow_calculator
+from aow_calculator import (
+    AOW_TABEL,
+    bepaal_aow_categorie,
+    bepaal_aow_categorieen,
+    bereken_aow_data,
+    bereken_aow_datum,
+    compileer_aow_tabel,
+)
+
+
+def _lineair(geboortedatum: date, tabel: list[dict]) -> date:
+    """De oorspronkelijke lookup: eerste passende regel in tabelvolgorde."""
+    for regel in tabel:
+        if regel["geboren_tot"] is None or geboortedatum <= regel["geboren_tot"]:
+            return geboortedatum + relativedelta(years=regel["jaren"], months=regel["maanden"])
+    return geboortedatum + relativedelta(years=67, months=3)
+
+
+def _geboortedata(n: int, seed: int = 0) -> list[date]:
+    rng = random.Random(seed)
+    vast = [date(1960, 12, 31), date(1961, 1, 1), date(1964, 9, 30), date(1964, 10, 1),
+            date(1960, 2, 29), date(1964, 2, 29), date(1963, 8, 31), date(1963, 5, 31)]
+    return vast + [date(1930, 1, 1) + timedelta(days=rng.randint(0, 30_000)) for _ in range(n)]
+
+
+GEBOORTEDATA = _geboortedata(3000)
+
+
+def test_bisect_gelijk_aan_lineair():
+    for geboortedatum in GEBOORTEDATA:
+        assert bereken_aow_datum(geboortedatum) == _lineair(geboortedatum, AOW_TABEL)
+
+
+@pytest.mark.parametrize("tabel", [
+    # Ongesorteerd en overlappend: de eerste passende regel wint
+    [{"geboren_tot": date(1964, 9, 30), "jaren": 67, "maanden": 3},
+     {"geboren_tot": date(1960, 12, 31), "jaren": 66, "maanden": 0},
+     {"geboren_tot": None, "jaren": 68, "maanden": 0}],
+    [{"geboren_tot": date(1955, 1, 1), "jaren": 65, "maanden": 0},
+     {"geboren_tot": date(1962, 6, 30), "jaren": 66, "maanden": 4},
+     {"geboren_tot": date(1962, 6, 30), "jaren": 60, "maanden": 0},
+     {"geboren_tot": date(1958, 3, 31), "jaren": 66, "maanden": 8},
+     {"geboren_tot": None, "jaren": 67, "maanden": 0},
+     {"geboren_tot": date(1990, 1, 1), "jaren": 70, "maanden": 0}],
+    # Zonder fallback-regel
+    [{"geboren_tot": date(1960, 12, 31), "jaren": 67, "maanden": 0}],
+])
+def test_onregelmatige_tabel(tabel, monkeypatch):
+    monkeypatch.setattr(aow_calculator, "AOW_INDEX", compileer_aow_tabel(tabel))
+    for geboortedatum in GEBOORTEDATA[:1000]:
+        assert bereken_aow_datum(geboortedatum) == _lineair(geboortedatum, tabel)
+
+
+def test_gevectoriseerd_gelijk_aan_scalair():
+    aow_data = bereken_aow_data(GEBOORTEDATA)
+
+    assert aow_data.dtype == np.dtype("datetime64[D]")
+    assert aow_data.tolist() == [bereken_aow_datum(g) for g in GEBOORTEDATA]
+
+
+@pytest.mark.parametrize("peildatum", [date(2026, 3, 1), date(2024, 2, 29), date(2031, 12, 31)])
+def test_categorieen_gelijk_aan_scalair(peildatum):
+    result = bepaal_aow_categorieen(np.array(GEBOORTEDATA, dtype="datetime64[D]"), peildatum)
+
+    for i, geboortedatum in enumerate(GEBOORTEDATA):
+        verwacht = bepaal_aow_categorie(geboortedatum, peildatum)
+        assert result["categorie"][i] == verwacht["categorie"]
+        assert result["aow_datum"][i].item().isoformat() == verwacht["aow_datum"]
+        assert result["jaren_tot_aow"][i] == verwacht["jaren_tot_aow"]
@@ -0,0 +1,95 @@
+"""
+Test benodigd_inkomen.bereken_benodigd_inkomen (inverse van max_box1).
+
+Per geval: bij het gevonden inkomen haalt calculate() het doelbedrag, één
+cent minder niet, en een grove scan vindt geen lager inkomen dat het haalt.
+"""
+
+import pytest
+
+from benodigd_inkomen import bereken_benodigd_inkomen
+import calculator_final
+from calculator_final import calculate
+
+
+def _max_box1(inputs, veld, inkomen, variant):
+    return calculate({**inputs, veld: inkomen})['scenario1'][variant]['max_box1']
+
+
+def _assert_minimaal(inputs, doel, variant='annuitair', onbekende='aanvrager'):
+    resultaat = bereken_benodigd_inkomen(inputs, doel, variant, onbekende)
+    veld = f"hoofd_inkomen_{onbekende}"
+    x = resultaat['benodigd_inkomen']
+
+    assert x is not None
+    assert _max_box1(inputs, veld, x, variant) >= doel
+    if x > 0:
+        assert _max_box1(inputs, veld, max(0.0, x - 0.01), variant) < doel
+        for inkomen in range(0, int(x), 500):
+            assert _max_box1(inputs, veld, inkomen, variant) < doel
+    return resultaat
+
+
+ANNUITEIT = {
+    'aflos_type': 'Annuïteit', 'org_lpt': 360, 'rest_lpt': 360,
+    'hoofdsom_box1': 150_000, 'hoofdsom_box3': 0, 'rvp': 120, 'werkelijke_rente': 0.042,
+}
+AFLOSVRIJ = {
+    'aflos_type': 'Aflosvrij', 'org_lpt': 360, 'rest_lpt': 360,
+    'hoofdsom_box1': 80_000, 'hoofdsom_box3': 40_000, 'rvp': 60, 'werkelijke_rente': 0.038,
+}
+
+
+def test_alleenstaande_zonder_leningdelen():
+    """Alleenstaande: toets-inkomen = F16, C26-sprong boven cAlleenGrensO."""
+    inputs = {'alleenstaande': 'JA', 'energielabel': 'A,B', 'hypotheek_delen': []}
+    resultaat = _assert_minimaal(inputs, 300_000)
+    assert resultaat['toets_inkomen'] == resultaat['inkomen_totaal']
+
+
+@pytest.mark.parametrize("factor", [1.0, 0.5, 0.0, 1.5])
+def test_stel_partnerfactor_takken(factor):
+    """Stel: MAX(F16 + G16×factor, G16 + F16×factor) over beide takken."""
+    inputs = {
+        'alleenstaande': 'NEE', 'hoofd_inkomen_partner': 45_000,
+        'c_factor_2e_inkomen': factor, 'hypotheek_delen': [ANNUITEIT],
+    }
+    for doel in (150_000, 320_000, 480_000):
+        _assert_minimaal(inputs, doel)
+
+
+def test_onbekend_partnerinkomen():
+    inputs = {
+        'alleenstaande': 'NEE', 'hoofd_inkomen_aanvrager': 52_000,
+        'c_factor_2e_inkomen': 0.5, 'hypotheek_delen': [ANNUITEIT, AFLOSVRIJ],
+    }
+    _assert_minimaal(inputs, 400_000, onbekende='partner')
+
+
+def test_niet_annuitair_met_box3_en_aow():
+    inputs = {
+        'alleenstaande': 'JA', 'ontvangt_aow': 'JA', 'limieten_bkr_geregistreerd': 2_500,
+        'hypotheek_delen': [AFLOSVRIJ],
+    }
+    _assert_minimaal(inputs, 250_000, variant='niet_annuitair')
+
+
+def test_doel_al_gehaald_zonder_inkomen():
+    """Energielabel-bonus boven het doel: inkomen 0 volstaat."""
+    inputs = {'alleenstaande': 'JA', 'energielabel': 'A++++', 'hypotheek_delen': []}
+    assert bereken_benodigd_inkomen(inputs, 25_000)['benodigd_inkomen'] == 0.0
+
+
+def test_partner_bij_alleenstaande_geeft_fout():
+    with pytest.raises(ValueError):
+        bereken_benodigd_inkomen({'alleenstaande': 'JA'}, 300_000, onbekende='partner')
+
+
+def test_proefpunten_blijven_buiten_de_resultaatcache():
+    calculator_final.RESULTAAT_CACHE.clear()
+    inputs = {'alleenstaande': 'NEE', 'energielabel': 'A,B', 'hoofd_inkomen_partner': 30_000,
+              'hypotheek_delen': [ANNUITEIT]}
+
+    bereken_benodigd_inkomen(inputs, 350_000)
+
+    assert calculator_final.RESULTAAT_CACHE.stats()['size'] == 0
@@ -0,0 +1,103 @@
+"""
+Test calculator_final.BerekeningInvoer en aggregeer_leningdelen.
+
+Record en dict moeten exact hetzelfde resultaat geven (repr-vergelijking, zodat
+ook int/float-typen gelijk blijven).
+"""
+
+import dataclasses
+import random
+
+import pytest
+
+import calculator_final
+from calculator_final import BerekeningInvoer, Leningdeel, _calculate, calculate
+
+
+def _willekeurig_deel(rng):
+    return {
+        'aflos_type': rng.choice(['Annuïteit', 'Lineair', 'Aflosvrij', 'Spaarhypotheek']),
+        'org_lpt': rng.choice([360, 300, 240]),
+        'rest_lpt': rng.choice([360, 200, 12, 1]),
+        'hoofdsom_box1': rng.choice([0, 150_000, rng.uniform(0, 400_000)]),
+        'hoofdsom_box3': rng.choice([0, 20_000, rng.uniform(0, 100_000)]),
+        'rvp': rng.choice([0, 60, 120, 240]),
+        'inleg_overig': rng.choice([0, 50, rng.uniform(0, 300)]),
+        'werkelijke_rente': rng.choice([0, 0.03, rng.uniform(0, 0.08)]),
+    }
+
+
+def _willekeurige_invoer(rng):
+    invoer = {
+        'hoofd_inkomen_aanvrager': rng.choice([0, 40_000, rng.uniform(0, 200_000)]),
+        'hoofd_inkomen_partner': rng.choice([0, 30_000.0, rng.uniform(0, 100_000)]),
+        'alleenstaande': rng.choice(['JA', 'NEE']),
+        'ontvangt_aow': rng.choice(['JA', 'NEE']),
+        'energielabel': rng.choice([None, 'A,B', 'A++++', 'E,F,G']),
+        'studievoorschot_studielening': rng.choice([0, 150]),
+        'hypotheek_delen': [_willekeurig_deel(rng) for _ in range(rng.randint(0, 12))],
+    }
+    if rng.random() < 0.3:
+        invoer['gewijzigd_hoofd_inkomen_aanvrager2'] = rng.choice([None, '', 20_000])
+        invoer['gewijzigd_hoofd_inkomen_aow2'] = rng.choice([None, 'JA', 'NEE'])
+    if rng.random() < 0.3:
+        invoer['c_toets_rente'] = rng.choice([0.05, 0.045])
+    return invoer
+
+
+def _uitkomst(inputs):
+    try:
+        return repr(_calculate(inputs))
+    except (ValueError, ZeroDivisionError) as e:
+        return repr(e)
+
+
+def test_record_gelijk_aan_dict():
+    rng = random.Random(6)
+    for _ in range(500):
+        invoer = _willekeurige_invoer(rng)
+        assert _uitkomst(BerekeningInvoer.uit_dict(invoer)) == _uitkomst(invoer)
+
+
+def test_record_is_frozen_en_beperkt_tot_tien_delen():
+    invoer = BerekeningInvoer(hypotheek_delen=[{'hoofdsom_box1': 1_000}] * 12)
+
+    assert len(invoer.hypotheek_delen) == 10
+    assert invoer.hypotheek_delen[0] == Leningdeel(hoofdsom_box1=1_000)
+    assert invoer.c_toets_rente == calculator_final._FISCAAL_DEFAULTS['c_toets_rente']
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        invoer.hoofd_inkomen_aanvrager = 1
+
+
+ANNUITEIT = {'aflos_type': 'Annuïteit', 'org_lpt': 360, 'rest_lpt': 360,
+             'hoofdsom_box1': 250_000, 'rvp': 120, 'werkelijke_rente': 0.04}
+
+
+def test_met_hergebruikt_aggregaten():
+    basis = BerekeningInvoer(hoofd_inkomen_aanvrager=50_000, hypotheek_delen=[ANNUITEIT])
+    aggregaten = basis.aggregaten
+
+    zelfde_delen = basis.met(hoofd_inkomen_aanvrager=70_000)
+    andere_rente = basis.met(c_toets_rente=0.045)
+
+    assert zelfde_delen.aggregaten is aggregaten
+    assert andere_rente.aggregaten is not aggregaten
+    assert repr(calculate(zelfde_delen)) == repr(_calculate(
+        {'hoofd_inkomen_aanvrager': 70_000, 'hypotheek_delen': [ANNUITEIT]}))
+
+
+def test_aow2_volgt_ontvangt_aow_als_niet_opgegeven():
+    """Ontbrekend gewijzigd_hoofd_inkomen_aow2 = ontvangt_aow, ook na met()."""
+    invoer = BerekeningInvoer(hoofd_inkomen_aanvrager=60_000, gewijzigd_hoofd_inkomen_aanvrager2=30_000)
+    aow = invoer.met(ontvangt_aow='JA')
+
+    assert repr(_calculate(aow)) == repr(_calculate({
+        'hoofd_inkomen_aanvrager': 60_000, 'gewijzigd_hoofd_inkomen_aanvrager2': 30_000, 'ontvangt_aow': 'JA',
+    }))
+
+
+def test_cache_sleutel_onderscheidt_int_en_float():
+    assert (BerekeningInvoer(hoofd_inkomen_aanvrager=1).cache_sleutel('v')
+            != BerekeningInvoer(hoofd_inkomen_aanvrager=1.0).cache_sleutel('v'))
+    assert (BerekeningInvoer.uit_dict({'alleenstaande': 'NEE', 'onbekend': 1}).cache_sleutel('v')
+            == BerekeningInvoer(alleenstaande='NEE').cache_sleutel('v'))
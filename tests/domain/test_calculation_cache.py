@@ -0,0 +1,88 @@
+"""
+Test calculation_cache.ResultCache en de cache rond calculator_final.calculate.
+"""
+
+import calculation_cache
+import calculator_final
+from calculation_cache import ResultCache
+from calculator_final import calculate
+
+
+def test_sleutel_canoniek():
+    """Keyvolgorde maakt niet uit; int en float en configversie wel."""
+    a = {'x': 1, 'delen': [{'p': 2.0, 'q': 3}]}
+    b = {'delen': [{'q': 3, 'p': 2.0}], 'x': 1}
+
+    assert ResultCache.sleutel(a, 'v1') == ResultCache.sleutel(b, 'v1')
+    assert ResultCache.sleutel(a, 'v1') != ResultCache.sleutel({**a, 'x': 1.0}, 'v1')
+    assert ResultCache.sleutel(a, 'v1') != ResultCache.sleutel(a, 'v2')
+
+
+def test_lru_verdringing():
+    cache = ResultCache(maxsize=2, ttl=0)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')          # a recent gebruikt → b wordt verdrongen
+    cache.put('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.stats()['evictions'] == 1
+
+
+def test_ttl_verloopt(monkeypatch):
+    nu = [1000.0]
+    monkeypatch.setattr(calculation_cache.time, 'monotonic', lambda: nu[0])
+    cache = ResultCache(maxsize=10, ttl=60)
+    cache.put('a', 1)
+
+    nu[0] += 59
+    assert cache.get('a') == 1
+    nu[0] += 2
+    assert cache.get('a') is None
+    assert cache.stats()['expirations'] == 1
+
+
+def test_calculate_gebruikt_cache_en_kopieert():
+    """Tweede identieke aanroep is een hit; muteren van het resultaat lekt niet."""
+    calculator_final.RESULTAAT_CACHE.clear()
+    invoer = {'hoofd_inkomen_aanvrager': 61_234, 'hypotheek_delen': []}
+
+    eerste = calculate(invoer)
+    hits = calculator_final.RESULTAAT_CACHE.hits
+    eerste['scenario1']['annuitair']['max_box1'] = -1
+    eerste['debug']['toets_rente'] = -1
+    tweede = calculate(invoer)
+
+    assert calculator_final.RESULTAAT_CACHE.hits == hits + 1
+    assert tweede == calculator_final._calculate(invoer)
+
+
+def test_herladen_fiscaal_leegt_cache():
+    calculate({'hoofd_inkomen_aanvrager': 48_000})
+    invalidaties = calculator_final.RESULTAAT_CACHE.invalidations
+
+    calculator_final.herlaad_fiscaal_defaults()
+
+    stats = calculator_final.RESULTAAT_CACHE.stats()
+    assert stats['size'] == 0
+    assert stats['invalidations'] == invalidaties + 1
+
+
+def test_calculate_endpoint_volgt_herladen_defaults(fiscaal_config):
+    """/calculate zonder c_*-velden rekent na PUT /config/fiscaal met de nieuwe defaults."""
+    from fastapi.testclient import TestClient
+
+    from app import app
+
+    invoer = {'hoofd_inkomen_aanvrager': 70_000, 'alleenstaande': 'JA'}
+    client = TestClient(app)
+    voor = client.post('/calculate', json=invoer).json()
+
+    fiscaal_config['defaults']['c_alleen_factor'] = 25_000
+    client.put('/config/fiscaal', json=fiscaal_config).raise_for_status()
+    na = client.post('/calculate', json=invoer).json()
+
+    assert na != voor
+    assert na['scenario1'] == calculate(invoer)['scenario1']
@@ -0,0 +1,354 @@
+"""
+Test calculator_batch tegen calculator_final.calculate.
+
+De gevectoriseerde route moet voor elke invoer exact (==, geen tolerantie)
+hetzelfde resultaat geven als de scalaire route, inclusief debugwaarden,
+scenario 2 en foutgevallen.
+"""
+
+import json
+import os
+import random
+from dataclasses import fields
+
+import numpy as np
+import pytest
+
+from calculator_batch import (
+    BatchInputs,
+    _round_exact,
+    calculate_batch,
+    calculate_grid,
+    calculate_kolommen,
+    pack_inputs,
+    pack_kolommen,
+)
+from calculator_final import _FISCAAL_DEFAULTS, calculate
+
+AFLOS_TYPES = ['Annuïteit', 'Lineair', 'Aflosvrij', 'Spaarhypotheek']
+ENERGIELABELS = [None, '', 'geen_label', 'E', 'C', 'B', 'A+', 'A++', 'A++++', 'A,B']
+
+
+def _willekeurige_invoer(rng: random.Random) -> dict:
+    """Genereer een willekeurige maar realistische calculate()-invoer."""
+    alleenstaande = rng.choice(['JA', 'NEE'])
+    delen = []
+    for _ in range(rng.randint(0, 4)):
+        org_lpt = rng.choice([120, 240, 360])
+        delen.append({
+            'aflos_type': rng.choice(AFLOS_TYPES),
+            'org_lpt': org_lpt,
+            'rest_lpt': rng.randint(1, org_lpt),
+            'hoofdsom_box1': rng.choice([0, rng.randint(10_000, 400_000)]),
+            'hoofdsom_box3': rng.choice([0, 0, rng.randint(5_000, 100_000)]),
+            'rvp': rng.choice([0, 12, 60, 120, 240]),
+            'inleg_overig': rng.choice([0, 0, rng.randint(0, 5_000)]),
+            'werkelijke_rente': round(rng.uniform(0.005, 0.07), 4),
+        })
+    invoer = {
+        'hoofd_inkomen_aanvrager': rng.choice([0, rng.randint(15_000, 150_000)]),
+        'hoofd_inkomen_partner': 0 if alleenstaande == 'JA' else rng.randint(0, 120_000),
+        'inkomen_uit_lijfrente_aanvrager': rng.choice([0, 0, 2_500.5]),
+        'huurinkomsten_aanvrager': rng.choice([0, 0, 1_200]),
+        'te_betalen_partneralimentatie_aanvrager': rng.choice([0, 0, 3_000]),
+        'inkomen_overige_aanvragers': rng.choice([0, 0, 10_000]),
+        'alleenstaande': alleenstaande,
+        'ontvangt_aow': rng.choice(['JA', 'NEE', 'NEE']),
+        'energielabel': rng.choice(ENERGIELABELS),
+        'verduurzamings_maatregelen': rng.choice([0, 5_000, 25_000, 60_000]),
+        'limieten_bkr_geregistreerd': rng.choice([0, 0, 2_500]),
+        'studievoorschot_studielening': rng.choice([0, 0, 150]),
+        'erfpachtcanon_per_jaar': rng.choice([0, 0, 1_800]),
+        'jaarlast_overige_kredieten': rng.choice([0, 0, 1_200]),
+        'hypotheek_delen': delen,
+        'c_actuele_10jr_rente': rng.choice([0.0, 0.0466]),
+    }
+    if rng.random() < 0.4:
+        invoer['gewijzigd_hoofd_inkomen_aanvrager2'] = rng.randint(0, 60_000)
+        invoer['gewijzigd_hoofd_inkomen_partner2'] = rng.choice([None, rng.randint(0, 40_000)])
+        invoer['gewijzigd_hoofd_inkomen_aow2'] = rng.choice([None, 'JA', 'NEE'])
+    return invoer
+
+
+def _scalair(invoer: dict) -> dict:
+    """calculate() met ValueError omgezet naar het batch-foutformaat."""
+    try:
+        return calculate(invoer)
+    except ValueError as e:
+        return {'error': str(e)}
+
+
+def test_batch_gelijk_aan_scalair_willekeurig():
+    """2000 willekeurige invoeren: batch == scalair, bit-voor-bit."""
+    rng = random.Random(20260101)
+    invoeren = [_willekeurige_invoer(rng) for _ in range(2000)]
+
+    batch = calculate_batch(invoeren)
+
+    assert len(batch) == len(invoeren)
+    for invoer, resultaat in zip(invoeren, batch):
+        assert resultaat == _scalair(invoer), invoer
+
+
+def test_batch_voorbeeld_request():
+    """docs/example_request.json levert hetzelfde resultaat via batch."""
+    pad = os.path.join(os.path.dirname(__file__), '..', '..', 'docs', 'example_request.json')
+    with open(pad, encoding='utf-8') as f:
+        invoer = json.load(f)
+
+    assert calculate_batch([invoer]) == [calculate(invoer)]
+
+
+def test_batch_fout_per_rij():
+    """Een rij met toetsrente 0 en niet-annuitaire delen faalt alleen zelf."""
+    goed = {'hoofd_inkomen_aanvrager': 60_000, 'hypotheek_delen': []}
+    fout = {
+        'hoofd_inkomen_aanvrager': 60_000,
+        'c_toets_rente': 0.0,
+        'hypotheek_delen': [{
+            'aflos_type': 'Aflosvrij', 'org_lpt': 360, 'rest_lpt': 360,
+            'hoofdsom_box1': 100_000, 'rvp': 0, 'werkelijke_rente': 0.0,
+        }],
+    }
+
+    resultaten = calculate_batch([goed, fout, goed])
+
+    assert resultaten[0] == calculate(goed)
+    assert resultaten[2] == calculate(goed)
+    with pytest.raises(ValueError) as exc:
+        calculate(fout)
+    assert resultaten[1] == {'error': str(exc.value)}
+
+
+def test_round_exact_gelijk_aan_python_round():
+    """Gevectoriseerde afronding == round(x, 5), ook op .5-grenzen."""
+    rng = random.Random(7)
+    waarden = [rng.uniform(-0.1, 0.1) for _ in range(20_000)]
+    waarden += [k / 1e5 + 0.5e-5 for k in range(-50, 5_000)]   # exact op de grens
+    waarden += [0.0, -0.0, 0.046655, 0.0466549999999, 1e-12, 123456.789015]
+    x = np.array(waarden)
+
+    verwacht = [round(v, 5) for v in waarden]
+
+    assert _round_exact(x, 5).tolist() == verwacht
+
+
+def test_batch_leeg():
+    assert calculate_batch([]) == []
+
+
+def _grid_referentie(basis: dict, assen: list) -> list:
+    """Per cel calculate(): (annuitair max_box1, niet-annuitair max_box3) of None."""
+    from itertools import product
+    cellen = []
+    for combinatie in product(*(waarden for _, waarden in assen)):
+        invoer = dict(basis, **dict(zip([veld for veld, _ in assen], combinatie)))
+        try:
+            s1 = calculate(invoer)['scenario1']
+            cellen.append((s1['annuitair']['max_box1'], s1['niet_annuitair']['max_box3']))
+        except ValueError:
+            cellen.append((None, None))
+    return cellen
+
+
+def _plat(matrix):
+    if isinstance(matrix, list):
+        return [x for rij in matrix for x in _plat(rij)]
+    return [matrix]
+
+
+@pytest.mark.parametrize("assen", [
+    [('c_toets_rente', [0.0, 0.03, 0.045, 0.06]),
+     ('hoofd_inkomen_aanvrager', [0, 40_000, 75_000])],
+    [('energielabel', ['E,F,G', 'A,B', 'A++++']),
+     ('verduurzamings_maatregelen', [0, 20_000])],
+    # Twee assen op hetzelfde afgeleide inkomen
+    [('hoofd_inkomen_aanvrager', [30_000, 60_000]),
+     ('huurinkomsten_aanvrager', [0, 6_000]),
+     ('ontvangt_aow', ['JA', 'NEE'])],
+])
+def test_grid_gelijk_aan_calculate_per_cel(assen):
+    """Elke gridcel == calculate() met dezelfde overschreven velden."""
+    basis = {
+        'hoofd_inkomen_aanvrager': 55_000,
+        'c_actuele_10jr_rente': 0.0,
+        'hypotheek_delen': [{
+            'aflos_type': 'Aflosvrij', 'org_lpt': 360, 'rest_lpt': 360,
+            'hoofdsom_box1': 150_000, 'rvp': 0, 'werkelijke_rente': 0.04,
+        }],
+    }
+
+    grid = calculate_grid(basis, assen)
+
+    assert grid['shape'] == [len(w) for _, w in assen]
+    verwacht = _grid_referentie(basis, assen)
+    assert list(zip(_plat(grid['annuitair']['max_box1']),
+                    _plat(grid['niet_annuitair']['max_box3']))) == verwacht
+
+
+def test_grid_as_die_alleen_voorwaardelijk_meetelt():
+    """Partnerinkomen telt alleen mee bij alleenstaande="NEE", niet in de basis."""
+    pad = os.path.join(os.path.dirname(__file__), '..', '..', 'docs', 'example_request.json')
+    with open(pad, encoding='utf-8') as f:
+        basis = dict(json.load(f), alleenstaande='JA', hoofd_inkomen_partner=30_000)
+    assen = [('alleenstaande', ['JA', 'NEE']),
+             ('hoofd_inkomen_partner', [0, 30_000, 60_000])]
+
+    grid = calculate_grid(basis, assen)
+
+    assert list(zip(_plat(grid['annuitair']['max_box1']),
+                    _plat(grid['niet_annuitair']['max_box3']))) == _grid_referentie(basis, assen)
+
+
+_KOLOM_DEFAULTS = {
+    'alleenstaande': 'JA',
+    'ontvangt_aow': 'NEE',
+    'energielabel': None,
+    'gewijzigd_hoofd_inkomen_aanvrager2': None,
+    'gewijzigd_hoofd_inkomen_partner2': None,
+}
+
+
+def _naar_kolommen(invoeren: list) -> tuple:
+    """Lijst van input-dicts → (kolommen, delen in lang formaat) met de defaults van calculate()."""
+    velden = {k for invoer in invoeren for k in invoer if k != 'hypotheek_delen'}
+    kolommen = {}
+    for veld in velden:
+        if veld == 'gewijzigd_hoofd_inkomen_aow2':
+            # Ontbrekend betekent: zelfde als ontvangt_aow
+            kolommen[veld] = [i.get(veld, i.get('ontvangt_aow', 'NEE')) for i in invoeren]
+        else:
+            standaard = _KOLOM_DEFAULTS.get(veld, _FISCAAL_DEFAULTS.get(veld, 0))
+            kolommen[veld] = [i.get(veld, standaard) for i in invoeren]
+    delen = {'rij': []}
+    for rij, invoer in enumerate(invoeren):
+        for deel in invoer.get('hypotheek_delen', []):
+            delen['rij'].append(rij)
+            for veld, waarde in deel.items():
+                delen.setdefault(veld, []).append(waarde)
+    return kolommen, delen
+
+
+def _naar_rijen(kolommen: dict) -> list:
+    """calculate_kolommen()-uitkomst → lijst in het formaat van calculate_batch()."""
+    def rij(groep, i):
+        if groep[next(iter(groep))] is None:
+            return None
+        if 'annuitair' in groep:
+            if groep['annuitair']['max_box1'][i] is None:
+                return None
+            return {g: {v: w[i] for v, w in velden.items()} for g, velden in groep.items()}
+        if groep['toets_inkomen'][i] is None:
+            return None
+        return {v: w[i] for v, w in groep.items()}
+
+    rijen = []
+    for i, fout in enumerate(kolommen['error']):
+        if fout is not None:
+            rijen.append({'error': fout})
+            continue
+        rijen.append({veld: rij(kolommen[veld], i)
+                      for veld in ('scenario1', 'scenario2', 'debug', 'debug_scenario2')})
+    return rijen
+
+
+def test_pack_kolommen_gelijk_aan_pack_inputs():
+    """Kolomsgewijs inpakken levert exact dezelfde BatchInputs als per dict."""
+    rng = random.Random(20260102)
+    invoeren = [_willekeurige_invoer(rng) for _ in range(1000)]
+    invoeren[3]['hypotheek_delen'] = invoeren[3]['hypotheek_delen'] * 4   # > 10 delen
+
+    kolommen, delen = _naar_kolommen(invoeren)
+    verwacht = pack_inputs(invoeren)
+    ingepakt = pack_kolommen(len(invoeren), kolommen, delen)
+
+    for veld in fields(BatchInputs):
+        a, b = getattr(ingepakt, veld.name), getattr(verwacht, veld.name)
+        if veld.name == 'n':
+            assert a == b
+        else:
+            assert a.dtype == b.dtype and np.array_equal(a, b), veld.name
+
+
+def test_kolommen_gelijk_aan_batch_willekeurig():
+    """calculate_kolommen == calculate_batch per rij, inclusief foutrijen en scenario 2."""
+    rng = random.Random(20260103)
+    invoeren = [_willekeurige_invoer(rng) for _ in range(2000)]
+    invoeren.append({'hoofd_inkomen_aanvrager': 60_000, 'c_toets_rente': 0.0, 'hypotheek_delen': [{
+        'aflos_type': 'Aflosvrij', 'org_lpt': 360, 'rest_lpt': 360,
+        'hoofdsom_box1': 100_000, 'hoofdsom_box3': 0, 'rvp': 0,
+        'inleg_overig': 0, 'werkelijke_rente': 0.0,
+    }]})
+
+    kolommen, delen = _naar_kolommen(invoeren)
+    resultaat = calculate_kolommen(len(invoeren), kolommen, delen)
+
+    assert _naar_rijen(resultaat) == calculate_batch(invoeren)
+    assert resultaat['error'][-1] is not None
+
+
+def test_kolommen_zonder_delen_en_scenario2():
+    invoeren = [{'hoofd_inkomen_aanvrager': 40_000}, {'hoofd_inkomen_aanvrager': 80_000}]
+
+    resultaat = calculate_kolommen(2, {'hoofd_inkomen_aanvrager': [40_000, 80_000]})
+
+    assert _naar_rijen(resultaat) == calculate_batch(invoeren)
+    assert resultaat['scenario2']['annuitair']['max_box1'] == [None, None]
+
+
+def test_kolommen_endpoint_gelijk_aan_calculate():
+    """/calculate/batch/kolommen geeft per berekening de /calculate-response."""
+    from fastapi.testclient import TestClient
+
+    import app as api
+
+    if api.RATE_LIMITING_ENABLED:
+        api.limiter.reset()
+    invoeren = [
+        {'hoofd_inkomen_aanvrager': 65_000, 'energielabel': 'A,B',
+         'gewijzigd_hoofd_inkomen_aanvrager2': 30_000},
+        {'hoofd_inkomen_aanvrager': 45_000, 'alleenstaande': 'NEE', 'hoofd_inkomen_partner': 30_000,
+         'hypotheek_delen': [{'aflos_type': 'Lineair', 'hoofdsom_box1': 150_000, 'rvp': 60},
+                             {'aflos_type': 'Aflosvrij', 'hoofdsom_box1': 50_000}]},
+    ]
+    body = {
+        'hoofd_inkomen_aanvrager': [65_000, 45_000],
+        'hoofd_inkomen_partner': [0, 30_000],
+        'alleenstaande': ['JA', 'NEE'],
+        'energielabel': ['A,B', 'Geen (geldig) Label'],
+        'gewijzigd_hoofd_inkomen_aanvrager2': [30_000, None],
+        'hypotheek_delen': {
+            'rij': [1, 1],
+            'aflos_type': ['Lineair', 'Aflosvrij'],
+            'hoofdsom_box1': [150_000, 50_000],
+            'rvp': [60, api.HypotheekDeel().rvp],
+        },
+    }
+    client = TestClient(api.app)
+
+    response = client.post('/calculate/batch/kolommen', json=body)
+
+    assert response.status_code == 200, response.text
+    kolommen = response.json()
+    assert kolommen['count'] == 2 and kolommen['errors'] == 0
+    verwacht = [client.post('/calculate', json=invoer).json() for invoer in invoeren]
+    assert _naar_rijen(kolommen) == verwacht
+
+
+@pytest.mark.parametrize("body", [
+    {'hoofd_inkomen_aanvrager': [1, 2], 'hoofd_inkomen_partner': [1]},
+    {'alleenstaande': ['ja']},
+    {'hoofd_inkomen_aanvrager': [1], 'hypotheek_delen': {'rij': [1]}},
+    {'hoofd_inkomen_aanvrager': [1], 'hypotheek_delen': {'rij': [0] * 11}},
+    {'hoofd_inkomen_aanvrager': [-1]},
+    {},
+])
+def test_kolommen_endpoint_ongeldige_invoer(body):
+    from fastapi.testclient import TestClient
+
+    import app as api
+
+    if api.RATE_LIMITING_ENABLED:
+        api.limiter.reset()
+
+    assert TestClient(api.app).post('/calculate/batch/kolommen', json=body).status_code == 422
@@ -18,7 +18,10 @@ Per 01-04-2052 (318 maanden, AOW partner):
 """
 
 from datetime import date
-from loan_projection import projecteer_hypotheekdelen, _annuitair_restant, _lineair_restant
+from loan_projection import (
+    projecteer_batch, projecteer_hypotheekdelen, projecteer_tijdlijn,
+    _annuitair_restant, _lineair_restant,
+)
 
 
 HARRY_SLINGER_DELEN = [
@@ -274,6 +277,42 @@ def test_elapsed_nul():
     print("[OK] Elapsed 0: ongewijzigd")
 
 
+def test_projecteer_batch_gelijk_aan_scalair():
+    """projecteer_batch geeft per item exact dezelfde delen als projecteer_hypotheekdelen."""
+    items = [(HARRY_SLINGER_DELEN, elapsed, peildatum) for elapsed, peildatum in (
+        (0, None), (12, date(2027, 1, 1)), (255, date(2047, 4, 1)),
+        (318, date(2052, 4, 1)), (400, date(2059, 5, 1)),
+    )]
+    items.append(([], 60, None))
+
+    batch = projecteer_batch([d for d, _, _ in items], [e for _, e, _ in items],
+                             [p for _, _, p in items])
+
+    for (delen, elapsed, peildatum), result in zip(items, batch):
+        assert repr(result) == repr(projecteer_hypotheekdelen(delen, elapsed, peildatum))
+    print("[OK] projecteer_batch == projecteer_hypotheekdelen")
+
+
+def test_projecteer_tijdlijn_gelijk_aan_scalair():
+    """Eén tijdlijn over 40 jaar geeft per jaar dezelfde delen als projecteer_hypotheekdelen."""
+    elapsed = [y * 12 for y in range(40)]
+    peildata = [date(2026 + y, 1, 1) for y in range(40)]
+
+    tijdlijn = projecteer_tijdlijn(HARRY_SLINGER_DELEN, elapsed, peildata)
+
+    assert tijdlijn.hoofdsom_box1.shape == (3, 40)
+    for t, (e, peildatum) in enumerate(zip(elapsed, peildata)):
+        assert repr(tijdlijn.delen_op(t)) == repr(projecteer_hypotheekdelen(HARRY_SLINGER_DELEN, e, peildatum))
+
+    # Annuïteit: onafgeronde restschuld, afgerond gelijk aan de closed-form helper
+    assert round(tijdlijn.restschuld[1, 21], 2) == _annuitair_restant(120000, 0.05, 360, 252)
+    assert tijdlijn.rest_lpt[2, 10] == 300 - 120
+    # Aflossingsvrij: box1 → box3 na rente_aftrekbaar_tot (2046-01-01)
+    assert tijdlijn.hoofdsom_box1[0, 20] == 145000
+    assert tijdlijn.hoofdsom_box1[0, 21] == 0 and tijdlijn.hoofdsom_box3[0, 21] == 145000
+    print("[OK] projecteer_tijdlijn == projecteer_hypotheekdelen")
+
+
 if __name__ == '__main__':
     test_lineair_exact()
     test_annuitair_detail()
@@ -283,6 +322,8 @@ if __name__ == '__main__':
     test_box1_naar_box3()
     test_box1_box3_proportioneel()
     test_elapsed_nul()
+    test_projecteer_batch_gelijk_aan_scalair()
+    test_projecteer_tijdlijn_gelijk_aan_scalair()
 
     print()
     print("=" * 60)
@@ -0,0 +1,136 @@
+"""
+Test pdf_renderpool: begrensde wachtrij, timeout en metrics.
+
+WeasyPrint is hier niet nodig: _render wordt vervangen door een nep-render.
+In thread- en inline-modus werkt de monkeypatch direct; in process-modus
+gaat de vervanger als referentie naar deze module mee naar de worker.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import pdf_renderpool
+
+
+class NepRender:
+    """Render die wacht tot `los` gezet wordt; telt hoeveel renders gestart zijn."""
+
+    def __init__(self):
+        self.los = threading.Event()
+        self.gestart = threading.Semaphore(0)
+
+    def __call__(self, html):
+        self.gestart.release()
+        self.los.wait(timeout=5)
+        return f"%PDF {html}".encode(), 0.01
+
+
+@pytest.fixture
+def nep(monkeypatch):
+    render = NepRender()
+    monkeypatch.setattr(pdf_renderpool, "_render", render)
+    monkeypatch.setattr(pdf_renderpool, "_opwarmen", lambda: None)
+    yield render
+    render.los.set()
+    pdf_renderpool.configureer()
+
+
+def wacht_op_slots_vrij():
+    for _ in range(100):
+        if pdf_renderpool.stats()["bezig"] == 0:
+            return
+        time.sleep(0.01)
+
+
+def test_inline_render_en_metrics(nep):
+    pdf_renderpool.configureer("inline", 1)
+    nep.los.set()
+
+    assert pdf_renderpool.render("<p>a</p>") == b"%PDF <p>a</p>"
+    stats = pdf_renderpool.stats()
+    assert stats["renders"] == 1
+    assert stats["render_ms_gem"] == stats["render_ms_max"] == 10.0
+    assert stats["bezig"] == stats["in_wachtrij"] == 0
+
+
+def test_volle_wachtrij_weigert(nep):
+    pdf_renderpool.configureer("thread", workers=1, wachtrij=1, timeout=5)
+
+    with ThreadPoolExecutor(max_workers=2) as aanroepers:
+        lopend = [aanroepers.submit(pdf_renderpool.render, f"<p>{i}</p>") for i in range(2)]
+        assert nep.gestart.acquire(timeout=5)
+        for _ in range(100):
+            if pdf_renderpool.stats()["in_wachtrij"] == 1:
+                break
+            time.sleep(0.01)
+
+        stats = pdf_renderpool.stats()
+        assert (stats["bezig"], stats["in_wachtrij"]) == (1, 1)
+        with pytest.raises(pdf_renderpool.RenderpoolVol):
+            pdf_renderpool.render("<p>te veel</p>")
+
+        nep.los.set()
+        assert [f.result(timeout=5) for f in lopend] == [b"%PDF <p>0</p>", b"%PDF <p>1</p>"]
+
+    stats = pdf_renderpool.stats()
+    assert (stats["renders"], stats["geweigerd"]) == (2, 1)
+
+
+def test_timeout_houdt_plek_bezet_tot_worker_klaar(nep):
+    pdf_renderpool.configureer("thread", workers=1, wachtrij=0, timeout=0.05)
+
+    with pytest.raises(pdf_renderpool.RenderTimeout):
+        pdf_renderpool.render("<p>traag</p>")
+    # De worker rendert nog: geen nieuwe job tot hij klaar is
+    with pytest.raises(pdf_renderpool.RenderpoolVol):
+        pdf_renderpool.render("<p>volgende</p>")
+
+    nep.los.set()
+    wacht_op_slots_vrij()
+    assert pdf_renderpool.render("<p>volgende</p>") == b"%PDF <p>volgende</p>"
+    assert pdf_renderpool.stats()["timeouts"] == 1
+
+
+def _nep_render_proces(html):
+    if html == "vast":
+        time.sleep(60)
+    return html.encode(), 0.0
+
+
+def _niet_opwarmen():
+    pass
+
+
+def test_vastgelopen_render_vervangt_process_pool(monkeypatch):
+    monkeypatch.setattr(pdf_renderpool, "_render", _nep_render_proces)
+    monkeypatch.setattr(pdf_renderpool, "_opwarmen", _niet_opwarmen)
+    pdf_renderpool.configureer("process", workers=1, wachtrij=0, timeout=2)
+    try:
+        assert pdf_renderpool.render("eerst") == b"eerst"
+        with pytest.raises(pdf_renderpool.RenderTimeout):
+            pdf_renderpool.render("vast")
+
+        # De vastgelopen worker wordt na één timeout beëindigd en geeft zijn plek vrij
+        for _ in range(100):
+            if pdf_renderpool.stats()["bezig"] == 0:
+                break
+            time.sleep(0.05)
+        assert pdf_renderpool.stats()["bezig"] == 0
+        assert pdf_renderpool.render("daarna") == b"daarna"
+    finally:
+        pdf_renderpool.configureer()
+
+
+def test_opwarmen_kent_stylesheets_en_assets():
+    html = pdf_renderpool._warm_html()
+
+    assert "fonts.googleapis.com" in html
+    assert 'src="assets/hondsrug-logo.png"' in html
+
+
+def test_ongeldige_modus():
+    with pytest.raises(ValueError, match="NAT_PDF_EXECUTOR"):
+        pdf_renderpool.configureer("gpu")
@@ -0,0 +1,173 @@
+"""
+Test portfolio_stress: per dossier dezelfde uitkomst als een los
+risico-scenario (risk_scenarios._bereken_scenario), foutregels zonder dat de
+stroom stopt, en resultaten in invoervolgorde over chunks heen.
+"""
+
+import asyncio
+import json
+from datetime import date
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from loan_projection import projecteer_hypotheekdelen
+from portfolio_stress import (
+    Schok, alees_ndjson, bereken_chunk, lees_ndjson, stress_test, stress_test_async,
+)
+from risk_scenarios import _bereken_scenario
+from tests.domain.test_reken_context import SLINGER_DELEN
+
+VANDAAG = date(2026, 3, 1)
+
+DOSSIER = {
+    "id": "D-1",
+    "hypotheek_delen": SLINGER_DELEN,
+    "inkomen_aanvrager_huidig": 80000,
+    "inkomen_partner_huidig": 40000,
+    "alleenstaande": "NEE",
+    "toetsrente": 0.04664,
+    "geadviseerd_hypotheekbedrag": 350000,
+}
+
+
+def _dossiers(aantal):
+    return [dict(DOSSIER, id=i, inkomen_aanvrager_huidig=40000 + 1000 * i) for i in range(aantal)]
+
+
+def _ndjson(dossiers):
+    return [json.dumps(d) for d in dossiers]
+
+
+def _verwacht(dossier, schok):
+    peildatum = VANDAAG + relativedelta(months=schok.horizon_maanden)
+    args = dict(alleenstaande="NEE", ontvangt_aow="NEE", energielabel="Geen (geldig) Label",
+                verduurzamings_maatregelen=0, limieten_bkr=0, studievoorschot=0, erfpacht=0,
+                jaarlast=0, geadviseerd=dossier["geadviseerd_hypotheekbedrag"])
+    basis = _bereken_scenario(
+        "basis", "basis", "dossier", dossier["hypotheek_delen"],
+        dossier["inkomen_aanvrager_huidig"], dossier["inkomen_partner_huidig"],
+        toetsrente=dossier["toetsrente"], peildatum=VANDAAG, **args,
+    )
+    stress = _bereken_scenario(
+        schok.naam, "stress", "dossier",
+        projecteer_hypotheekdelen(dossier["hypotheek_delen"], schok.horizon_maanden, peildatum),
+        dossier["inkomen_aanvrager_huidig"] * schok.inkomen_factor_aanvrager,
+        dossier["inkomen_partner_huidig"] * schok.inkomen_factor_partner,
+        toetsrente=dossier["toetsrente"] + schok.toetsrente_delta, peildatum=peildatum, **args,
+    )
+    return basis, stress
+
+
+@pytest.mark.parametrize("schok", [
+    Schok(),
+    Schok(toetsrente_delta=0.01, inkomen_factor_partner=0.0, horizon_maanden=12),
+    Schok(naam="ao", inkomen_factor_aanvrager=0.7, horizon_maanden=255),
+])
+def test_gelijk_aan_los_scenario(schok):
+    regels = list(lees_ndjson(_ndjson(_dossiers(5))))
+
+    resultaten = bereken_chunk(regels, schok, VANDAAG)
+
+    for dossier, resultaat in zip(_dossiers(5), resultaten):
+        basis, stress = _verwacht(dossier, schok)
+        del stress["hypotheek_delen_geprojecteerd"]
+        assert resultaat["id"] == dossier["id"]
+        assert resultaat["max_hypotheek_basis"] == basis["max_hypotheek_annuitair"]
+        assert {k: resultaat[k] for k in stress} == stress
+        assert resultaat["verschil"] == round(
+            stress["max_hypotheek_annuitair"] - basis["max_hypotheek_annuitair"], 2)
+
+
+@pytest.mark.parametrize("rvp", [60, 120, 240])
+def test_renteschok_raakt_ook_lange_rentevaste_periode(rvp):
+    """Delen met rvp ≥ c_rvp_toets_rente worden op de werkelijke rente getoetst: die gaat mee omhoog."""
+    deel = {"aflos_type": "Annuïteit", "org_lpt": 360, "rest_lpt": 360, "hoofdsom_box1": 300_000,
+            "hoofdsom_box3": 0, "rvp": rvp, "inleg_overig": 0, "werkelijke_rente": 0.04}
+    dossier = dict(DOSSIER, hypotheek_delen=[deel])
+    schok = Schok(toetsrente_delta=0.01)
+
+    resultaat = bereken_chunk(list(lees_ndjson(_ndjson([dossier]))), schok, VANDAAG)[0]
+
+    assert resultaat["verschil"] < 0
+    geschokt = dict(deel, werkelijke_rente=0.05) if rvp >= 120 else deel
+    _, stress = _verwacht(dict(dossier, hypotheek_delen=[geschokt]), schok)
+    assert resultaat["max_hypotheek_annuitair"] == stress["max_hypotheek_annuitair"]
+
+
+def test_foutregels_stoppen_de_stroom_niet():
+    regels = list(lees_ndjson([
+        json.dumps(DOSSIER),
+        "{kapot",
+        "",
+        "[1, 2]",
+        json.dumps(dict(DOSSIER, id="X", alleenstaande="misschien")),
+        json.dumps(dict(DOSSIER, id="Y", hypotheek_delen=[{"hoofdsom_box1": "veel"}])),
+        json.dumps(dict(DOSSIER, id="Z")),
+    ]))
+
+    resultaten = bereken_chunk(regels, Schok(), VANDAAG)
+
+    assert [r["regel"] for r in resultaten] == [1, 2, 4, 5, 6, 7]
+    assert [r["id"] for r in resultaten] == ["D-1", None, None, "X", "Y", "Z"]
+    assert ["error" in r for r in resultaten] == [False, True, True, True, True, False]
+    assert resultaten[0]["verschil"] == 0
+
+
+def test_schok_validatie():
+    with pytest.raises(ValueError, match="horizon_maanden"):
+        Schok(horizon_maanden=-1)
+    with pytest.raises(ValueError, match="Onbekende schokvelden"):
+        Schok.uit_dict({"rente": 0.01})
+
+
+def test_volgorde_over_chunks():
+    schok = Schok(toetsrente_delta=0.01)
+    dossiers = _dossiers(23)
+    verwacht = bereken_chunk(list(lees_ndjson(_ndjson(dossiers))), schok, date.today())
+
+    resultaten = list(stress_test(lees_ndjson(_ndjson(dossiers)), schok,
+                                  chunk_grootte=4, max_in_vlucht=2))
+
+    assert resultaten == verwacht
+
+
+def test_async_body_in_willekeurige_stukken():
+    schok = Schok(inkomen_factor_partner=0.0)
+    body = "\n".join(_ndjson(_dossiers(9))).encode()
+
+    async def stukken():
+        for i in range(0, len(body), 37):
+            yield body[i:i + 37]
+
+    async def verzamel():
+        return [r async for r in stress_test_async(alees_ndjson(stukken()), schok, chunk_grootte=2)]
+
+    resultaten = asyncio.run(verzamel())
+
+    assert [r["id"] for r in resultaten] == list(range(9))
+    assert resultaten == list(stress_test(lees_ndjson(_ndjson(_dossiers(9))), schok))
+
+
+def test_endpoint_sluit_tijdelijk_bestand(monkeypatch):
+    import tempfile
+
+    from fastapi.testclient import TestClient
+
+    from app import app
+
+    geopend = []
+
+    class Spool(tempfile.SpooledTemporaryFile):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            geopend.append(self)
+
+    monkeypatch.setattr(tempfile, "SpooledTemporaryFile", Spool)
+    body = "\n".join(_ndjson(_dossiers(3)))
+
+    response = TestClient(app).post("/portfolio/stress-test?toetsrente_delta=0.01", content=body)
+
+    assert response.status_code == 200
+    assert [json.loads(r)["id"] for r in response.text.splitlines()] == [0, 1, 2]
+    assert len(geopend) == 1 and geopend[0].closed
@@ -0,0 +1,67 @@
+"""
+Test risk_scenarios.RekenContext: identieke NAT-berekeningen binnen één
+request worden maar één keer uitgevoerd, met dezelfde uitkomst als zonder
+context.
+"""
+
+import calculator_final
+from calculator_final import BerekeningInvoer
+from risk_scenarios import RekenContext, bereken_ao_scenarios, bereken_werkloosheid_scenarios
+
+SLINGER_DELEN = [
+    {"aflos_type": "Aflosvrij", "org_lpt": 360, "rest_lpt": 360, "hoofdsom_box1": 145000,
+     "hoofdsom_box3": 0, "rvp": 120, "inleg_overig": 0, "werkelijke_rente": 0.05},
+    {"aflos_type": "Annuiteit", "org_lpt": 360, "rest_lpt": 360, "hoofdsom_box1": 120000,
+     "hoofdsom_box3": 0, "rvp": 120, "inleg_overig": 0, "werkelijke_rente": 0.05},
+    {"aflos_type": "Lineair", "org_lpt": 300, "rest_lpt": 300, "hoofdsom_box1": 85000,
+     "hoofdsom_box3": 0, "rvp": 120, "inleg_overig": 0, "werkelijke_rente": 0.03},
+]
+
+WW_INVOER = dict(
+    hypotheek_delen=SLINGER_DELEN, ingangsdatum_hypotheek="2026-03-01",
+    geboortedatum_aanvrager="1980-04-01", alleenstaande="NEE",
+    geboortedatum_partner="1985-06-15", inkomen_loondienst_aanvrager=80000,
+    inkomen_loondienst_partner=40000, arbeidsverleden_jaren_totaal_aanvrager=15,
+    arbeidsverleden_pre2016_boven10_aanvrager=1, arbeidsverleden_vanaf2016_boven10_aanvrager=4,
+    arbeidsverleden_jaren_totaal_partner=8, toetsrente=0.04664,
+    geadviseerd_hypotheekbedrag=338173,
+)
+
+
+def test_ww_jaren_worden_hergebruikt():
+    """Harry heeft 2 WW-jaren met gelijk inkomen → 1 van de 5 berekeningen hergebruikt."""
+    context = RekenContext()
+
+    met_context = bereken_werkloosheid_scenarios(**WW_INVOER, context=context)
+    zonder_context = bereken_werkloosheid_scenarios(**WW_INVOER)
+
+    assert met_context == zonder_context
+    assert len(met_context["scenarios"]) == 5
+    assert context.stats() == {"uitgevoerd": 4, "hergebruikt": 1}
+
+
+def test_context_gedeeld_over_families():
+    """Een tweede aanroep met dezelfde context rekent niets opnieuw; uitkomsten blijven gelijk."""
+    context = RekenContext()
+    bereken_werkloosheid_scenarios(**WW_INVOER, context=context)
+    bereken_werkloosheid_scenarios(**WW_INVOER, context=context)
+
+    assert context.stats() == {"uitgevoerd": 4, "hergebruikt": 6}
+
+    ao = dict(WW_INVOER)
+    for veld in [k for k in ao if k.startswith("arbeidsverleden")]:
+        del ao[veld]
+    assert (bereken_ao_scenarios(**ao, context=RekenContext())
+            == bereken_ao_scenarios(**ao))
+
+
+def test_int_en_float_niet_samengevoegd(monkeypatch):
+    monkeypatch.setattr(calculator_final.RESULTAAT_CACHE, "maxsize", 0)
+    context = RekenContext()
+
+    als_int = context.calculate(BerekeningInvoer(hoofd_inkomen_aanvrager=50_000))
+    als_float = context.calculate(BerekeningInvoer(hoofd_inkomen_aanvrager=50_000.0))
+
+    assert context.stats() == {"uitgevoerd": 2, "hergebruikt": 0}
+    assert repr(als_int) == repr(calculator_final._calculate({"hoofd_inkomen_aanvrager": 50_000}))
+    assert repr(als_float) == repr(calculator_final._calculate({"hoofd_inkomen_aanvrager": 50_000.0}))
@@ -0,0 +1,91 @@
+"""
+Test rekenpool en risk_scenarios.start_familie in alle executor-modi.
+
+Uitkomsten moeten gelijk zijn aan een directe aanroep; de tellingen van de
+RekenContext komen ook bij een process pool terug bij het request.
+"""
+
+import asyncio
+
+import pytest
+
+import rekenpool
+from risk_scenarios import RekenContext, bereken_werkloosheid_scenarios, start_familie
+from tests.domain.test_reken_context import WW_INVOER
+
+
+@pytest.fixture
+def modus(request):
+    rekenpool.configureer(request.param, 2)
+    yield request.param
+    rekenpool.configureer()
+
+
+@pytest.mark.parametrize("modus", ["inline", "thread", "process"], indirect=True)
+def test_start_familie_gelijk_aan_directe_aanroep(modus):
+    context = RekenContext()
+
+    taken = [start_familie(bereken_werkloosheid_scenarios, context=context, **WW_INVOER)
+             for _ in range(2)]
+
+    verwacht = bereken_werkloosheid_scenarios(**WW_INVOER)
+    assert [t.result(timeout=60) for t in taken] == [verwacht, verwacht]
+    stats = context.stats()
+    assert stats["uitgevoerd"] + stats["hergebruikt"] == 10
+    if rekenpool.deelt_geheugen():
+        assert stats["uitgevoerd"] == 4
+    else:
+        assert stats == {"uitgevoerd": 8, "hergebruikt": 2}
+
+
+@pytest.mark.parametrize("modus", ["inline", "thread"], indirect=True)
+def test_voer_uit_async(modus):
+    assert asyncio.run(rekenpool.voer_uit(divmod, 7, 2)) == (3, 1)
+
+
+def _faalt(context=None):
+    raise ValueError("kapot")
+
+
+@pytest.mark.parametrize("modus", ["thread", "process"], indirect=True)
+def test_fout_komt_terug_via_future(modus):
+    taak = start_familie(_faalt, context=RekenContext())
+    with pytest.raises(ValueError, match="kapot"):
+        taak.result(timeout=60)
+
+
+def test_ongeldige_modus():
+    with pytest.raises(ValueError, match="NAT_REKEN_EXECUTOR"):
+        rekenpool.configureer("gpu")
+
+
+AOW_BODY = {
+    "hypotheek_delen": [{"aflos_type": "Annuïteit", "hoofdsom_box1": 250_000, "rvp": 60,
+                         "werkelijke_rente": 0.04}],
+    "ingangsdatum_hypotheek": "2026-01-01",
+    "geboortedatum_aanvrager": "1970-05-01",
+    "inkomen_aanvrager_huidig": 70_000,
+    "inkomen_aanvrager_aow": 30_000,
+}
+
+
+def test_put_fiscaal_bereikt_process_workers(fiscaal_config):
+    """Na PUT /config/fiscaal rekenen ook process-workers met de nieuwe defaults."""
+    from fastapi.testclient import TestClient
+
+    from app import app
+
+    fiscaal_config["defaults"]["c_alleen_factor"] = 25_000
+    client = TestClient(app)
+
+    rekenpool.configureer("process", 1)
+    try:
+        voor = client.post("/calculate/risk-scenarios", json=AOW_BODY).json()
+        client.put("/config/fiscaal", json=fiscaal_config).raise_for_status()
+        na = client.post("/calculate/risk-scenarios", json=AOW_BODY).json()
+
+        rekenpool.configureer("inline")
+        verwacht = client.post("/calculate/risk-scenarios", json=AOW_BODY).json()
+        assert na == verwacht != voor
+    finally:
+        rekenpool.configureer()
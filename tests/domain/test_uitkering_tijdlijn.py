@@ -0,0 +1,92 @@
+"""
+Test uitkering_tijdlijn.py — WIA- en WW-tijdlijn tegen de bestaande helpers.
+
+Over een willekeurige set invoer moet elke fase uit de tijdlijn exact (ook
+int/float) gelijk zijn aan bereken_wia_bruto_jaar / bereken_ww_bruto_jaar.
+"""
+
+import random
+
+import pytest
+
+from uitkering_tijdlijn import wia_tijdlijn, ww_tijdlijn
+from wia_calculator import HELPER_FASE_WEKEN, _bereken_lgu_duur, bereken_wia_bruto_jaar
+from ww_calculator import bereken_ww_bruto_jaar
+
+
+def _zonder_toelichting(result: dict) -> dict:
+    return {k: v for k, v in result.items() if k != "toelichting"}
+
+
+def _gelijk(a: dict, b: dict) -> bool:
+    """Gelijk inclusief typen (0 vs 0.0 geeft een andere JSON-uitkomst)."""
+    return a.keys() == b.keys() and all(repr(a[k]) == repr(b[k]) for k in a)
+
+
+def _wia_invoer(rng: random.Random) -> dict:
+    sv_loon = rng.choice([0, rng.randint(10_000, 150_000), rng.randint(1, 10_000_000) / 100])
+    ao = rng.choice([0, 20, 35, 44.9, 50, 65, 79, 80, 100, rng.uniform(0, 100)])
+    maandloon = sv_loon / 12
+    return dict(
+        ao_percentage=ao,
+        sv_loon_jaar=sv_loon,
+        feitelijk_loon_maand=rng.choice([0, maandloon * (1 - ao / 100) * rng.choice([0.3, 0.5, 0.7, 1.0, 1.2])]),
+        is_durable=rng.random() < 0.3,
+        employment_history_years_to_2015=rng.randint(0, 30),
+        employment_history_years_from_2016=rng.randint(0, 30),
+        minimum_wage_month_reference=rng.choice([0, 0, 2200.0]),
+    )
+
+
+WIA_CORPUS = [_wia_invoer(random.Random(seed)) for seed in range(400)]
+
+
+@pytest.mark.parametrize("fase", [*HELPER_FASE_WEKEN, "onbekend"])
+def test_wia_fasen_gelijk_aan_helper(fase):
+    for invoer in WIA_CORPUS:
+        verwacht = _zonder_toelichting(bereken_wia_bruto_jaar(**invoer, fase=fase))
+        assert _gelijk(wia_tijdlijn(**invoer).fase(fase), verwacht), (invoer, fase)
+
+
+def test_wia_lgu_duur_gelijk_aan_helper():
+    for invoer in WIA_CORPUS:
+        assert wia_tijdlijn(**invoer).lgu_duur == _bereken_lgu_duur(
+            invoer["employment_history_years_to_2015"],
+            invoer["employment_history_years_from_2016"],
+        )
+
+
+def test_wia_maandreeks():
+    tijdlijn = wia_tijdlijn(ao_percentage=50, sv_loon_jaar=50400,
+                            employment_history_years_to_2015=5,
+                            employment_history_years_from_2016=0)
+
+    assert tijdlijn.lgu_duur == 5
+    assert [s for s, _ in tijdlijn.maanden] == ["wga_loongerelateerd"] * 5 + ["wga_vervolg"]
+    assert tijdlijn.maand(0)[1] == round(0.75 * tijdlijn.maandloon, 2)
+    assert tijdlijn.maand(2)[1] == round(0.70 * tijdlijn.maandloon, 2)
+    assert tijdlijn.maand(500) == tijdlijn.maanden[-1]
+
+
+@pytest.mark.parametrize("maand", [-1, 0, 1, 2, 3, 12, 24, 25, 40])
+def test_ww_gelijk_aan_helper(maand):
+    rng = random.Random(maand)
+    for _ in range(200):
+        invoer = dict(
+            sv_loon_jaar=rng.choice([0, rng.randint(10_000, 150_000), rng.randint(1, 10_000_000) / 100]),
+            earnings_from_employment_month=rng.choice([0, 0, rng.randint(1, 6000)]),
+            employment_years_total_relevant=rng.randint(0, 40),
+            employment_years_pre2016_above10=rng.randint(0, 20),
+            employment_years_from2016_above10=rng.randint(0, 20),
+        )
+        verwacht = _zonder_toelichting(bereken_ww_bruto_jaar(**invoer, ww_maand_nummer=maand))
+        assert _gelijk(ww_tijdlijn(**invoer).bruto_jaar(maand), verwacht), (invoer, maand)
+
+
+def test_ww_maandreeks():
+    tijdlijn = ww_tijdlijn(sv_loon_jaar=52200, employment_years_total_relevant=4)
+
+    assert tijdlijn.duur == 4
+    assert [s for s, _ in tijdlijn.maanden] == ["ww_lopend"] * 4 + ["beeindigd_duur"]
+    assert tijdlijn.maand(1)[1] == 0.75 * tijdlijn.maandloon
+    assert tijdlijn.maand(3)[1] == 0.70 * tijdlijn.maandloon
@@ -0,0 +1,72 @@
+"""
+Test calculator_final.lookup_woonquote (bisect op WOONQUOTE_INDEX) tegen
+de oorspronkelijke MATCH/XMATCH-semantiek op de ruwe JSON-tabellen.
+
+MATCH:  hoogste inkomen <= toets_inkomen (onder laagste → eerste rij)
+XMATCH: laagste rente >= toets_rente (boven hoogste → laatste kolom)
+"""
+
+import pytest
+
+from calculator_final import WOONQUOTE_TABLES, lookup_woonquote
+
+
+TABLE_KEYS = {
+    ('NEE', False): 'cWqTotAow',
+    ('NEE', True): 'cWqTotAowCons',
+    ('JA', False): 'cWqVnfAow',
+    ('JA', True): 'cWqVnfAowCons',
+}
+
+
+def _referentie_lookup(table: dict, toets_inkomen: float, toets_rente: float) -> float:
+    """Lineaire MATCH/XMATCH zoals de oorspronkelijke implementatie."""
+    income_keys = sorted(table.keys(), key=float)
+    selected = income_keys[0]
+    for key in income_keys:
+        if toets_inkomen >= float(key):
+            selected = key
+        else:
+            break
+    row = table[selected]
+
+    rate_keys = sorted(row.keys(), key=float)
+    selected_rate = rate_keys[-1]
+    for key in rate_keys:
+        if toets_rente <= float(key):
+            selected_rate = key
+            break
+    return row[selected_rate]
+
+
+def _probes(keys: list[str]) -> list[float]:
+    """Elke tabelwaarde, net eronder/erboven, en buiten het bereik."""
+    values = sorted(float(k) for k in keys)
+    probes = [values[0] - 1, values[-1] * 2]
+    for v in values:
+        probes.extend([v, v - 1e-9, v + 1e-9])
+    return probes
+
+
+@pytest.mark.parametrize("ontvangt_aow,is_box3", list(TABLE_KEYS.keys()))
+def test_elke_cel_gelijk_aan_referentie(ontvangt_aow, is_box3):
+    table = WOONQUOTE_TABLES[TABLE_KEYS[(ontvangt_aow, is_box3)]]
+    first_row = next(iter(table.values()))
+
+    income_probes = _probes(list(table.keys()))
+    rate_probes = _probes(list(first_row.keys())) + [0.0, 0.065005, 0.1]
+
+    for inkomen in income_probes:
+        for rente in rate_probes:
+            assert lookup_woonquote(inkomen, rente, ontvangt_aow, is_box3) == \
+                _referentie_lookup(table, inkomen, rente), (inkomen, rente)
+
+
+def test_onder_laagste_inkomen_pakt_eerste_rij():
+    assert lookup_woonquote(-5000, 0.05, 'NEE', False) == \
+        WOONQUOTE_TABLES['cWqTotAow']['0.0']['0.05']
+
+
+def test_boven_hoogste_rente_pakt_laatste_kolom():
+    assert lookup_woonquote(50000, 0.09, 'NEE', False) == \
+        WOONQUOTE_TABLES['cWqTotAow']['50000.0']['0.06501']
@@ -1,5 +1,7 @@
 """Integration tests for monthly costs API endpoint."""
 
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -137,3 +139,175 @@ class TestCalculateEndpoint:
         )
 
         assert response.status_code == 404
+
+
+class TestTimelineEndpoint:
+    """Tests for calculate monthly-costs/timeline endpoint."""
+
+    BODY = {
+        "fiscal_year": 2026,
+        "woz_value": 400000,
+        "loan_parts": [
+            {"id": "main", "principal": 300000, "interest_rate": 4.5,
+             "term_years": 30, "loan_type": "annuity", "box": 1},
+        ],
+        "partners": [{"id": "owner", "taxable_income": 60000, "age": 35}],
+    }
+
+    def test_timeline_matches_single_month(self, client):
+        response = client.post(
+            "/calculate/monthly-costs/timeline",
+            json={**self.BODY, "start_month": 12, "end_month": 24},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["months"] == list(range(12, 25))
+        assert len(data["net_monthly_cost"]) == 13
+        single = client.post(
+            "/calculate/monthly-costs", json={**self.BODY, "month_number": 24}
+        ).json()
+        assert data["net_monthly_cost"][-1] == single["net_monthly_cost"]
+
+    def test_timeline_full_term(self, client):
+        response = client.post("/calculate/monthly-costs/timeline", json=self.BODY)
+
+        assert response.status_code == 200
+        assert len(response.json()["months"]) == 360
+
+    def test_timeline_fast_engine(self, client):
+        exact = client.post("/calculate/monthly-costs/timeline", json=self.BODY).json()
+
+        fast = client.post("/calculate/monthly-costs/timeline?engine=fast", json=self.BODY).json()
+
+        assert fast["months"] == exact["months"]
+        assert [float(v) for v in fast["net_monthly_cost"]] == pytest.approx(
+            [float(v) for v in exact["net_monthly_cost"]], abs=0.01
+        )
+
+    def test_timeline_invalid_range(self, client):
+        response = client.post(
+            "/calculate/monthly-costs/timeline",
+            json={**self.BODY, "start_month": 20, "end_month": 10},
+        )
+        assert response.status_code == 422
+
+
+class TestBatchEndpoint:
+    """Tests for calculate monthly-costs/batch endpoint."""
+
+    HOUSEHOLD = {
+        "fiscal_year": 2026,
+        "woz_value": 450000,
+        "partners": [
+            {"id": "partner1", "taxable_income": 90000, "age": 38},
+            {"id": "partner2", "taxable_income": 45000, "age": 36},
+        ],
+        "partner_distribution": {"method": "optimize"},
+    }
+    LOAN = {"id": "main", "principal": 350000, "interest_rate": 4.2,
+            "term_years": 30, "loan_type": "annuity"}
+
+    def test_batch_matches_single_requests(self, client):
+        variants = [
+            {"loan_parts": [self.LOAN]},
+            {"loan_parts": [{**self.LOAN, "interest_rate": 3.8}], "month_number": 13},
+            {"loan_parts": [{**self.LOAN, "principal": 200000},
+                            {**self.LOAN, "id": "linear", "principal": 150000, "loan_type": "linear"}],
+             "woz_value": 500000,
+             "partner_distribution": {"method": "fixed_percent", "parameter": 60}},
+        ]
+
+        response = client.post(
+            "/calculate/monthly-costs/batch", json={**self.HOUSEHOLD, "variants": variants}
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert len(results) == 3
+        for variant, result in zip(variants, results):
+            single = client.post(
+                "/calculate/monthly-costs", json={**self.HOUSEHOLD, **variant}
+            ).json()
+            assert result == single
+
+    def test_batch_requires_woz_value(self, client):
+        household = {k: v for k, v in self.HOUSEHOLD.items() if k != "woz_value"}
+        response = client.post(
+            "/calculate/monthly-costs/batch",
+            json={**household, "variants": [{"loan_parts": [self.LOAN]}]},
+        )
+        assert response.status_code == 422
+
+
+class TestRulesEndpoint:
+    """Tests for the fiscal rules status endpoint."""
+
+    def test_version_matches_responses(self, client):
+        response = client.get("/calculate/monthly-costs/rules")
+
+        assert response.status_code == 200
+        years = {y["fiscal_year"]: y for y in response.json()["years"]}
+        assert {2025, 2026} <= set(years)
+
+        result = client.post(
+            "/calculate/monthly-costs",
+            json={**TestBatchEndpoint.HOUSEHOLD, "loan_parts": [TestBatchEndpoint.LOAN]},
+        ).json()
+        assert result["rules_version"] == years[2026]["version"]
+
+
+class TestAflosschemaEndpoint:
+    """Tests for the streamed /aflosschema endpoint."""
+
+    BODY = {
+        "loan_parts": [
+            {"id": "a", "principal": 300000, "interest_rate": 4.5, "term_years": 30,
+             "loan_type": "annuity"},
+            {"id": "b", "principal": 50000, "interest_rate": 3.9, "term_years": 10,
+             "loan_type": "linear"},
+        ]
+    }
+
+    def test_json(self, client):
+        response = client.post("/aflosschema", json=self.BODY)
+
+        assert response.status_code == 200
+        parts = response.json()["loan_parts"]
+        assert [len(p["schedule"]) for p in parts] == [360, 120]
+        assert parts[0]["schedule"][0]["interest"] == 1125.0
+        assert parts[1]["schedule"][-1]["remaining_principal"] == 0
+        assert parts[0]["totals"]["total_interest"] == pytest.approx(
+            sum(m["interest"] for m in parts[0]["schedule"]))
+
+    def test_ndjson(self, client):
+        response = client.post("/aflosschema?format=ndjson", json=self.BODY)
+
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["type"] for line in lines].count("month") == 480
+        assert lines[0] == {"type": "part", "id": "a", "loan_type": "annuity", "principal": 300000.0,
+                            "interest_rate": 4.5, "term_years": 30, "total_months": 360}
+        json_parts = client.post("/aflosschema", json=self.BODY).json()["loan_parts"]
+        assert lines[-1] == {"type": "totals", "id": "b", **json_parts[1]["totals"]}
+
+    def test_year_columnar(self, client):
+        response = client.post("/aflosschema?granularity=year&format=columnar", json=self.BODY)
+
+        assert response.status_code == 200
+        part = response.json()["loan_parts"][0]
+        schedule = part["schedule"]
+        assert list(schedule) == ["year", "interest", "principal_payment", "gross_payment",
+                                  "remaining_principal"]
+        assert schedule["year"] == list(range(1, 31))
+        assert len(schedule["interest"]) == 30
+        assert part["totals"]["total_interest"] == pytest.approx(sum(schedule["interest"]))
+
+    def test_columnar_matches_rows(self, client):
+        rows = client.post("/aflosschema", json=self.BODY).json()["loan_parts"][1]["schedule"]
+
+        columns = client.post("/aflosschema?format=columnar", json=self.BODY).json()["loan_parts"][1]["schedule"]
+
+        assert columns["month"] == [r["month"] for r in rows]
+        assert columns["remaining_principal"] == [r["remaining_principal"] for r in rows]
+
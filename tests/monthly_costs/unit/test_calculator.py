@@ -0,0 +1,138 @@
+"""Unit tests for the MortgageCalculator timeline mode."""
+
+import pytest
+from pydantic import ValidationError
+
+from monthly_costs.domain.calculator import MortgageCalculator
+from monthly_costs.schemas.input import (
+    MonthlyCostsBatchRequest,
+    MonthlyCostsRequest,
+    MonthlyCostsTimelineRequest,
+)
+
+BASE = {
+    "fiscal_year": 2026,
+    "woz_value": 450000,
+    "loan_parts": [
+        {"id": "annuity", "principal": 250000, "interest_rate": 4.2,
+         "term_years": 30, "loan_type": "annuity", "box": 1},
+        {"id": "linear", "principal": 60000, "interest_rate": 3.1,
+         "term_years": 20, "loan_type": "linear", "box": 1, "box1_end_month": 150},
+        {"id": "interest_only", "principal": 40000, "interest_rate": 1.5,
+         "term_years": 30, "loan_type": "interest_only", "box": 3},
+    ],
+    "partners": [
+        {"id": "partner1", "taxable_income": 90000, "age": 38},
+        {"id": "partner2", "taxable_income": 30000, "age": 36},
+    ],
+    "partner_distribution": {"method": "optimize"},
+}
+
+FIELDS = {
+    "total_gross_monthly": lambda r: r.total_gross_monthly,
+    "total_interest_monthly": lambda r: r.total_interest_monthly,
+    "total_principal_monthly": lambda r: r.total_principal_monthly,
+    "total_interest_box1_monthly": lambda r: r.total_interest_box1_monthly,
+    "interest_deduction_monthly": lambda r: r.tax_breakdown.interest_deduction_monthly,
+    "hillen_benefit_monthly": lambda r: r.tax_breakdown.hillen_benefit_monthly,
+    "ewf_tax_monthly": lambda r: r.tax_breakdown.ewf_tax_monthly,
+    "net_monthly_cost": lambda r: r.net_monthly_cost,
+}
+
+
+class TestCalculateTimeline:
+    """Timeline months equal calculate() apart from the Hillen phase-out."""
+
+    @pytest.mark.parametrize(
+        "include_hillen, months",
+        [
+            (True, (1, 2, 11, 12)),
+            (False, (1, 2, 12, 149, 150, 151, 239, 240, 241, 300, 359, 360)),
+        ],
+    )
+    def test_matches_single_month(self, include_hillen, months):
+        calculator = MortgageCalculator(2026)
+        body = {**BASE, "include_hillen": include_hillen}
+        timeline = calculator.calculate_timeline(
+            MonthlyCostsTimelineRequest(**body, start_month=1, end_month=360)
+        )
+
+        assert timeline.months == list(range(1, 361))
+        for month in months:
+            single = calculator.calculate(MonthlyCostsRequest(**body, month_number=month))
+            i = month - 1
+            for field, getter in FIELDS.items():
+                assert getattr(timeline, field)[i] == getter(single), (month, field)
+
+    def test_box1_expiry(self):
+        """After box1_end_month the linear part no longer counts as box 1 interest."""
+        timeline = MortgageCalculator(2026).calculate_timeline(
+            MonthlyCostsTimelineRequest(**BASE, start_month=150, end_month=151)
+        )
+        annuity_only = MortgageCalculator(2026).calculate(
+            MonthlyCostsRequest(
+                **{**BASE, "loan_parts": BASE["loan_parts"][:1]}, month_number=151
+            )
+        )
+
+        assert timeline.months == [150, 151]
+        assert timeline.total_interest_box1_monthly[1] == annuity_only.total_interest_box1_monthly
+        assert timeline.total_interest_box1_monthly[0] > timeline.total_interest_box1_monthly[1]
+
+    def test_hillen_phase_out_per_year(self):
+        """Hillen follows the phase-out of the rules per calendar year."""
+        calculator = MortgageCalculator(2026)
+        request = {
+            **BASE,
+            "loan_parts": [
+                {"id": "small", "principal": 20000, "interest_rate": 3.0,
+                 "term_years": 30, "loan_type": "annuity", "box": 1},
+            ],
+        }
+        timeline = calculator.calculate_timeline(
+            MonthlyCostsTimelineRequest(**request, end_month=36, first_calendar_month=7)
+        )
+        hillen = timeline.hillen_benefit_monthly
+
+        single = calculator.calculate(MonthlyCostsRequest(**request, month_number=6))
+        assert hillen[5] == single.tax_breakdown.hillen_benefit_monthly
+        # Month 7 is January of the next year: lower percentage
+        assert hillen[5] > hillen[6] > 0
+        assert hillen[17] > hillen[18] > 0
+        assert hillen[18] < calculator.calculate(
+            MonthlyCostsRequest(**request, month_number=19)
+        ).tax_breakdown.hillen_benefit_monthly
+
+    def test_default_end_is_longest_part(self):
+        timeline = MortgageCalculator(2026).calculate_timeline(
+            MonthlyCostsTimelineRequest(**BASE, start_month=355)
+        )
+        assert timeline.months == [355, 356, 357, 358, 359, 360]
+        assert len(timeline.net_monthly_cost) == 6
+
+    def test_end_before_start(self):
+        with pytest.raises(ValidationError):
+            MonthlyCostsTimelineRequest(**BASE, start_month=10, end_month=9)
+
+
+class TestCalculateBatch:
+    """Batch variants must equal separate calculate() calls."""
+
+    def test_matches_single_requests(self):
+        household = {k: v for k, v in BASE.items() if k != "loan_parts"}
+        variants = [
+            {"loan_parts": BASE["loan_parts"], "month_number": 24},
+            {"loan_parts": BASE["loan_parts"][:1], "woz_value": 300000},
+            {"loan_parts": BASE["loan_parts"][1:], "month_number": 200,
+             "partner_distribution": {"method": "fixed_amount", "parameter": 5000}},
+        ]
+        calculator = MortgageCalculator(2026)
+
+        batch = calculator.calculate_batch(
+            MonthlyCostsBatchRequest(**household, variants=variants)
+        )
+
+        assert batch.fiscal_year == 2026
+        for variant, result in zip(variants, batch.results):
+            single = calculator.calculate(MonthlyCostsRequest(**{**household, **variant}))
+            assert result == single
@@ -0,0 +1,93 @@
+"""Unit tests for compiled fiscal rules (bisect lookups and prefix sums)."""
+
+import pytest
+from decimal import Decimal
+
+from monthly_costs.domain.ewf import calculate_ewf
+from monthly_costs.domain.tax_calc import calculate_marginal_rate, calculate_tax_on_income
+from monthly_costs.rules.compiled import (
+    CompiledFiscalRules,
+    compile_brackets,
+    compile_ewf_table,
+)
+from monthly_costs.rules.loader import load_rules
+from monthly_costs.schemas.rules import TaxBracket
+
+
+class TestCompiledBrackets:
+    """Tests for compiled tax brackets."""
+
+    def test_prefix_sums(self, tax_brackets_2026):
+        compiled = compile_brackets(tax_brackets_2026)
+
+        assert compiled.regular
+        assert compiled.lowers == (Decimal("0"), Decimal("38883"), Decimal("78426"))
+        assert compiled.cumulative_tax == (
+            Decimal("0"),
+            Decimal("38883") * Decimal("0.3575"),
+            Decimal("38883") * Decimal("0.3575") + Decimal("39543") * Decimal("0.3756"),
+        )
+
+    @pytest.mark.parametrize(
+        "income", ["-1", "0", "1", "38883", "38883.01", "50000", "78426", "78427", "250000"]
+    )
+    def test_same_as_plain_list(self, tax_brackets_2026, income):
+        compiled = compile_brackets(tax_brackets_2026)
+        income = Decimal(income)
+
+        assert calculate_marginal_rate(income, compiled) == calculate_marginal_rate(
+            income, tax_brackets_2026
+        )
+        assert calculate_tax_on_income(income, compiled) == calculate_tax_on_income(
+            income, tax_brackets_2026
+        )
+
+    def test_tax_on_income_100k(self, tax_brackets_2026):
+        expected = (
+            Decimal("38883") * Decimal("0.3575")
+            + Decimal("39543") * Decimal("0.3756")
+            + Decimal("21574") * Decimal("0.495")
+        )
+        assert calculate_tax_on_income(Decimal("100000"), tax_brackets_2026) == expected
+
+    def test_overlapping_brackets_use_linear_walk(self):
+        brackets = [
+            TaxBracket(lower=Decimal("0"), upper=Decimal("50000"), rate=Decimal("0.3")),
+            TaxBracket(lower=Decimal("30000"), upper=None, rate=Decimal("0.5")),
+        ]
+        compiled = compile_brackets(brackets)
+
+        assert not compiled.regular
+        # Overlap is counted twice, exactly as the bracket-by-bracket walk does
+        assert calculate_tax_on_income(Decimal("60000"), compiled) == (
+            Decimal("50000") * Decimal("0.3") + Decimal("10000") * Decimal("0.5")
+        )
+
+
+class TestCompiledEWFTable:
+    """Tests for the compiled EWF table."""
+
+    @pytest.mark.parametrize(
+        "woz", ["0", "75000", "75001", "400000", "1350000", "1350001", "2000000"]
+    )
+    def test_same_as_plain_list(self, ewf_table_2026, woz):
+        compiled = compile_ewf_table(ewf_table_2026)
+        woz = Decimal(woz)
+
+        assert calculate_ewf(woz, compiled, 2026) == calculate_ewf(woz, ewf_table_2026, 2026)
+
+    def test_gap_between_bands_is_not_found(self, ewf_table_2026):
+        assert compile_ewf_table(ewf_table_2026).find(Decimal("75000.50")) is None
+
+
+class TestLoadRules:
+    """load_rules returns compiled rules."""
+
+    def test_compiled_on_load(self):
+        rules = load_rules(2026)
+
+        assert isinstance(rules, CompiledFiscalRules)
+        assert rules.tax_table_box1.regular
+        assert rules.tax_table_box1_aow.rates[0] == Decimal("0.1757")
+        assert rules.ewf_lookup.find(Decimal("400000")).percentage == Decimal("0.0035")
+        assert "tax_table_box1" not in rules.model_dump()
@@ -0,0 +1,104 @@
+"""Differential tests: FastMortgageCalculator against the Decimal MortgageCalculator.
+
+Both engines run over a seeded random corpus; every amount must agree to
+the cent after final rounding.
+"""
+
+import random
+from decimal import Decimal
+
+import pytest
+
+from monthly_costs.domain.calculator import MortgageCalculator
+from monthly_costs.domain.fast_calculator import FastMortgageCalculator
+from monthly_costs.schemas.input import MonthlyCostsRequest, MonthlyCostsTimelineRequest
+
+CENT = Decimal("0.01")
+
+TIMELINE_FIELDS = [
+    "total_gross_monthly",
+    "total_interest_monthly",
+    "total_principal_monthly",
+    "total_interest_box1_monthly",
+    "total_remaining_principal",
+    "interest_deduction_monthly",
+    "hillen_benefit_monthly",
+    "ewf_tax_monthly",
+    "net_monthly_cost",
+]
+
+
+def random_request(rng: random.Random) -> dict:
+    """Random but valid monthly costs input (without month selection)."""
+    loan_parts = []
+    for i in range(rng.randint(1, 4)):
+        term_months = rng.randint(12, 600)
+        loan_parts.append({
+            "id": f"part{i}",
+            "principal": str(Decimal(rng.randint(100_000, 80_000_000)) / 100),
+            "interest_rate": str(rng.choice([0, rng.randint(1, 9000) / 1000])),
+            "term_years": str(rng.choice([Decimal(term_months) / 12, Decimal(term_months // 12 or 1)])
+                              .quantize(Decimal("0.0001"))),
+            "loan_type": rng.choice(["annuity", "linear", "interest_only"]),
+            "box": rng.choice([1, 1, 1, 3]),
+            "box1_end_month": rng.choice([None, None, rng.randint(0, 600)]),
+        })
+    partners = [{"id": f"p{i}", "taxable_income": rng.randint(0, 250_000),
+                 "age": rng.randint(20, 80)} for i in range(rng.randint(1, 2))]
+    method = rng.choice(["fixed_percent", "fixed_amount", "optimize"])
+    parameter = {"fixed_percent": rng.randint(0, 100), "fixed_amount": rng.randint(0, 40_000),
+                 "optimize": None}[method]
+    return {
+        "fiscal_year": rng.choice([2025, 2026]),
+        "woz_value": rng.randint(50_000, 2_500_000),
+        "loan_parts": loan_parts,
+        "partners": partners,
+        "partner_distribution": {"method": method, "parameter": parameter},
+        "include_ewf": rng.random() < 0.9,
+        "include_hillen": rng.random() < 0.9,
+    }
+
+
+def assert_cent(fast, exact, label):
+    assert abs(Decimal(fast) - Decimal(exact)) <= CENT, (label, fast, exact)
+
+
+CORPUS = [random_request(random.Random(seed)) for seed in range(300)]
+
+
+@pytest.mark.parametrize("body", CORPUS[:60])
+def test_timeline_agrees_to_the_cent(body):
+    request = MonthlyCostsTimelineRequest(**body)
+
+    exact = MortgageCalculator(request.fiscal_year).calculate_timeline(request)
+    fast = FastMortgageCalculator(request.fiscal_year).calculate_timeline(request)
+
+    assert fast.months == exact.months
+    assert fast.ewf_annual == exact.ewf_annual
+    for field in TIMELINE_FIELDS:
+        for month, f, e in zip(exact.months, getattr(fast, field), getattr(exact, field)):
+            assert_cent(f, e, (field, month))
+
+
+def test_single_month_agrees_to_the_cent():
+    rng = random.Random(2026)
+    for body in CORPUS:
+        request = MonthlyCostsRequest(**body, month_number=rng.randint(1, 620))
+
+        exact = MortgageCalculator(request.fiscal_year).calculate(request)
+        fast = FastMortgageCalculator(request.fiscal_year).calculate(request)
+
+        for f, e in zip(fast.loan_parts, exact.loan_parts):
+            assert f.box == e.box
+            for field in ("remaining_principal", "interest_payment", "principal_payment", "gross_payment"):
+                assert_cent(getattr(f, field), getattr(e, field), field)
+        for field, value in exact.tax_breakdown.model_dump().items():
+            if field == "hillen_applicable":
+                continue
+            assert_cent(getattr(fast.tax_breakdown, field), value, field)
+        assert (fast.partner_results is None) == (exact.partner_results is None)
+        for f, e in zip(fast.partner_results or [], exact.partner_results or []):
+            for field, value in e.model_dump().items():
+                if field != "partner_id":
+                    assert_cent(getattr(f, field), value, field)
+        assert_cent(fast.net_monthly_cost, exact.net_monthly_cost, "net_monthly_cost")
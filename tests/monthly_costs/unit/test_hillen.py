@@ -3,7 +3,11 @@
 import pytest
 from decimal import Decimal
 
-from monthly_costs.domain.hillen import calculate_hillen_deduction, calculate_net_ewf_addition
+from monthly_costs.domain.hillen import (
+    calculate_hillen_deduction,
+    calculate_net_ewf_addition,
+    hillen_config_for_year,
+)
 from monthly_costs.schemas.rules import HillenConfig
 
 
@@ -105,3 +109,30 @@ class TestNetEWFAddition:
         )
         # EWF 1200 - Hillen 143.73 = 1056.27
         assert result == Decimal("1056.27")
+
+
+class TestHillenPhaseOut:
+    """Tests for the Hillen percentage in later years."""
+
+    @pytest.fixture
+    def hillen_config(self) -> HillenConfig:
+        return HillenConfig(
+            enabled=True,
+            reduction_percentage=Decimal("0.71867"),
+            phase_out_step=Decimal("0.04803"),
+        )
+
+    def test_fiscal_year_unchanged(self, hillen_config):
+        assert hillen_config_for_year(hillen_config, 2026, 2026) is hillen_config
+
+    def test_decreases_per_year(self, hillen_config):
+        config = hillen_config_for_year(hillen_config, 2026, 2028)
+        assert config.reduction_percentage == Decimal("0.62261")
+
+    def test_never_below_zero(self, hillen_config):
+        config = hillen_config_for_year(hillen_config, 2026, 2045)
+        assert config.reduction_percentage == Decimal("0")
+
+    def test_without_step_kept(self):
+        config = HillenConfig(enabled=True, reduction_percentage=Decimal("0.71867"))
+        assert hillen_config_for_year(config, 2026, 2030) is config
@@ -143,6 +143,78 @@ class TestInterestOnlyCalculator:
             assert result.remaining_principal == Decimal("150000")
 
 
+class TestIterSchedule:
+    """iter_schedule yields the same rounded payments as calculate_month for every month."""
+
+    @pytest.mark.parametrize("loan_type", ["annuity", "linear", "interest_only"])
+    @pytest.mark.parametrize(
+        "principal,annual_rate,term_years",
+        [
+            (Decimal("300000"), Decimal("0.045"), 30),
+            (Decimal("123456.78"), Decimal("0.0389"), 50),
+            (Decimal("85000"), Decimal("0.12"), 7),
+            (Decimal("120000"), Decimal("0"), 10),
+        ],
+    )
+    def test_equal_to_calculate_month(self, loan_type, principal, annual_rate, term_years):
+        calc = get_calculator(loan_type)
+
+        schedule = list(calc.iter_schedule(principal, annual_rate, term_years))
+
+        assert len(schedule) == term_years * 12
+        for month, payment in enumerate(schedule, start=1):
+            expected = calc.calculate_month(principal, annual_rate, term_years, month)
+            assert payment.interest_payment == expected.interest_payment
+            assert payment.principal_payment == expected.principal_payment
+            assert payment.gross_payment == expected.gross_payment
+            # Unrounded balance: may differ in the last of 28 digits, not as float
+            assert float(payment.remaining_principal) == float(expected.remaining_principal)
+
+    def test_is_lazy(self):
+        """The schedule is produced month by month, not built up front."""
+        schedule = AnnuityCalculator().iter_schedule(Decimal("300000"), Decimal("0.04"), 30)
+
+        first = next(schedule)
+
+        assert first.interest_payment == Decimal("1000.00")
+
+
+class TestIterYears:
+    """iter_years gives closed-form yearly totals close to the monthly rows."""
+
+    @pytest.mark.parametrize("loan_type", ["annuity", "linear", "interest_only"])
+    @pytest.mark.parametrize(
+        "principal,annual_rate,term_years",
+        [
+            (Decimal("300000"), Decimal("0.045"), 30),
+            (Decimal("123456.78"), Decimal("0.0389"), 50),
+            (Decimal("120000"), Decimal("0"), 10),
+        ],
+    )
+    def test_close_to_sum_of_months(self, loan_type, principal, annual_rate, term_years):
+        calc = get_calculator(loan_type)
+        months = list(calc.iter_schedule(principal, annual_rate, term_years))
+
+        years = list(calc.iter_years(principal, annual_rate, term_years))
+
+        assert [y.year for y in years] == list(range(1, term_years + 1))
+        for year in years:
+            rows = months[12 * (year.year - 1):12 * year.year]
+            # Rounded once per year instead of per month: at most a few cents apart
+            assert abs(year.interest_payment - sum(m.interest_payment for m in rows)) <= Decimal("0.12")
+            assert abs(year.principal_payment - sum(m.principal_payment for m in rows)) <= Decimal("0.12")
+            assert year.gross_payment == year.interest_payment + year.principal_payment
+            assert abs(year.remaining_principal - rows[-1].remaining_principal) <= Decimal("0.12")
+
+    def test_interest_only_exact(self):
+        calc = InterestOnlyCalculator()
+
+        years = list(calc.iter_years(Decimal("200000"), Decimal("0.04"), 5))
+
+        assert all(y.interest_payment == Decimal("666.67") * 12 for y in years)
+        assert all(y.remaining_principal == Decimal("200000") for y in years)
+
+
 class TestGetCalculator:
     """Tests for calculator factory."""
 
@@ -0,0 +1,114 @@
+"""Unit tests for the hot-reloading fiscal rules store."""
+
+import json
+import os
+import shutil
+import threading
+
+import pytest
+from decimal import Decimal
+
+from monthly_costs.config import RULES_DIR
+from monthly_costs.exceptions import FiscalRulesNotFoundError, InvalidFiscalRulesError
+from monthly_costs.rules.loader import RulesStore
+
+
+@pytest.fixture
+def rules_dir(tmp_path):
+    shutil.copy(RULES_DIR / "2026.json", tmp_path / "2026.json")
+    return tmp_path
+
+
+def rewrite(path, **changes):
+    """Write the rules file with changed fields and a newer mtime."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data.update(changes)
+    stat = path.stat()
+    path.write_text(json.dumps(data), encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestRulesStore:
+    """Tests for RulesStore."""
+
+    def test_version_is_content_hash(self, rules_dir):
+        store = RulesStore(rules_dir, reload_interval=0)
+
+        entry = store.get(2026)
+
+        assert entry.rules.version == entry.version
+        assert len(entry.version) == 12
+        assert RulesStore(rules_dir, reload_interval=0).get(2026).version == entry.version
+
+    def test_changed_file_is_swapped_in(self, rules_dir):
+        store = RulesStore(rules_dir, reload_interval=0)
+        old = store.get(2026)
+
+        rewrite(rules_dir / "2026.json", max_mortgage_interest_deduction_rate="0.30")
+        new = store.get(2026)
+
+        assert new.version != old.version
+        assert new.rules.max_mortgage_interest_deduction_rate == Decimal("0.30")
+        assert old.rules.max_mortgage_interest_deduction_rate == Decimal("0.3756")
+        assert store.reloads == 1
+
+    def test_interval_delays_the_check(self, rules_dir):
+        store = RulesStore(rules_dir, reload_interval=3600)
+        old = store.get(2026)
+
+        rewrite(rules_dir / "2026.json", max_mortgage_interest_deduction_rate="0.30")
+
+        assert store.get(2026) is old
+        assert store.check(2026).version != old.version
+
+    def test_touched_file_keeps_compiled_rules(self, rules_dir):
+        store = RulesStore(rules_dir, reload_interval=0)
+        old = store.get(2026)
+
+        path = rules_dir / "2026.json"
+        os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000_000))
+        new = store.get(2026)
+
+        assert new.version == old.version
+        assert new.rules is old.rules
+        assert store.reloads == 0
+
+    def test_invalid_file_keeps_previous_version(self, rules_dir):
+        store = RulesStore(rules_dir, reload_interval=0)
+        old = store.get(2026)
+
+        (rules_dir / "2026.json").write_text("{not json", encoding="utf-8")
+
+        assert store.get(2026).version == old.version
+        with pytest.raises(InvalidFiscalRulesError):
+            RulesStore(rules_dir).get(2026)
+
+    def test_missing_year(self, rules_dir):
+        with pytest.raises(FiscalRulesNotFoundError):
+            RulesStore(rules_dir).get(2025)
+
+    def test_cold_load_once_under_concurrency(self, rules_dir, monkeypatch):
+        store = RulesStore(rules_dir, reload_interval=3600)
+        loads = []
+        original = type(store)._refresh
+
+        def counting_refresh(self, year, entry):
+            loads.append(year)
+            return original(self, year, entry)
+
+        monkeypatch.setattr(RulesStore, "_refresh", counting_refresh)
+        threads = [threading.Thread(target=store.get, args=(2026,)) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert loads == [2026]
+
+    def test_stats(self, rules_dir):
+        store = RulesStore(rules_dir)
+        store.warm_up()
+
+        [stats] = store.stats()
+        assert stats["fiscal_year"] == 2026
+        assert stats["version"] == store.get(2026).version
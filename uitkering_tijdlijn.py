@@ -0,0 +1,270 @@
+"""
+Uitkeringstijdlijn — WIA- en WW-uitkering per maand, in één keer berekend.
+
+bereken_wia_bruto_jaar / bereken_ww_bruto_jaar rekenen per fase de hele
+uitkering opnieuw door (dagloon, maandloon, RVC, LGU- of WW-duur, datums en
+toelichtingen). De scenariobouwers in risk_scenarios.py vragen per persoon
+meerdere fasen op van dezelfde invoer.
+
+Hier wordt per persoon één keer de complete maandreeks opgebouwd:
+- WIA: loondoorbetaling jaar 1 en 2, daarna per WIA-maand status en
+  uitkering (LGU maand 1-2 / 3+, daarna loonaanvulling of vervolg)
+- WW: per WW-maand status en uitkering, daarna beëindigd
+
+De scenario's nemen een monster uit die reeks op de peildata van de
+helpers. De uitkomst is gelijk aan de helpers (zonder toelichting).
+Tijdlijnen zijn immutable en worden per invoer gecachet, zodat families en
+requests met dezelfde persoon ze delen.
+
+Tarieven uit config/wia.json en config/ww.json (via wia_calculator /
+ww_calculator).
+"""
+
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import lru_cache
+
+import wia_calculator
+import ww_calculator
+from wia_calculator import (
+    HELPER_FASE_WEKEN,
+    HELPER_ZIEKTEDAG,
+    _bepaal_rvc_en_ao,
+    _bereken_lgu_duur,
+    _bereken_loondoorbetaling,
+    _bereken_wachttijd_einde,
+    _bereken_wga_lgu,
+    _bereken_wga_na_lgu,
+    _maanden_verschil,
+)
+from ww_calculator import _check_toelating, bereken_ww_duur
+
+# Defaults van bereken_wia_uitkering die de helper niet doorgeeft
+_LDB_PCT_JAAR1 = 1.0
+_LDB_PCT_JAAR2 = 0.70
+
+
+def _wia_peilpunten() -> dict:
+    """
+    Per helper-fase waar de peildatum in de tijdlijn valt:
+    ("loondoorbetaling", 0 | 1) voor jaar 1/2, of ("wia", WIA-maand).
+    """
+    wachttijd_einde = _bereken_wachttijd_einde(HELPER_ZIEKTEDAG)
+    jaar1_einde = HELPER_ZIEKTEDAG + timedelta(weeks=52)
+    punten = {}
+    for fase in HELPER_FASE_WEKEN:
+        peil = wia_calculator.helper_peildatum(fase)
+        if peil < wachttijd_einde:
+            punten[fase] = ("loondoorbetaling", 0 if peil < jaar1_einde else 1)
+        else:
+            punten[fase] = ("wia", _maanden_verschil(wachttijd_einde, peil))
+    return punten
+
+
+_WIA_PEILPUNTEN = _wia_peilpunten()
+
+
+def _wia_resultaat(status: str, uwv_uitkering: float, actual_wage: float) -> dict:
+    """Bedragen zoals _maak_resultaat + bereken_wia_bruto_jaar ze afronden."""
+    uwv = round(uwv_uitkering, 2)
+    actual = round(actual_wage, 2)
+    totaal = round(uwv + actual, 2)
+    return {
+        "status": status,
+        "uwv_uitkering_bruto_maand": uwv,
+        "uwv_uitkering_bruto_jaar": round(uwv * 12, 2),
+        "loon_uit_arbeid_bruto_maand": actual,
+        "totaal_bruto_maand": totaal,
+        "totaal_bruto_jaar": round(totaal * 12, 2),
+    }
+
+
+@dataclass(frozen=True)
+class WIATijdlijn:
+    """WIA-uitkering van één persoon over de hele looptijd."""
+
+    maandloon: float
+    loon_uit_arbeid: float  # feitelijk loon per maand (na de wachttijd)
+    lgu_duur: int  # maanden
+    loondoorbetaling: tuple  # (jaar 1, jaar 2) per maand
+    maanden: tuple  # (status, uwv per maand) per WIA-maand; de laatste geldt daarna
+
+    def maand(self, wia_maand: int) -> tuple:
+        """(status, uwv per maand) in WIA-maand wia_maand (0 = eerste maand)."""
+        return self.maanden[min(max(wia_maand, 0), len(self.maanden) - 1)]
+
+    def fase(self, fase: str = "na_lgu") -> dict:
+        """Als bereken_wia_bruto_jaar(fase=...), zonder toelichting."""
+        soort, index = _WIA_PEILPUNTEN.get(fase, _WIA_PEILPUNTEN["na_lgu"])
+        if soort == "loondoorbetaling":
+            return _wia_resultaat("loondoorbetaling", self.loondoorbetaling[index], 0)
+        status, uwv = self.maand(index)
+        return _wia_resultaat(status, uwv, self.loon_uit_arbeid)
+
+
+@lru_cache(maxsize=1024)
+def wia_tijdlijn(
+    ao_percentage: float,
+    sv_loon_jaar: float,
+    feitelijk_loon_maand: float = 0,
+    is_durable: bool = False,
+    employment_history_years_to_2015: int = 10,
+    employment_history_years_from_2016: int = 5,
+    minimum_wage_month_reference: float = 0,
+) -> WIATijdlijn:
+    """
+    Bouw de WIA-tijdlijn; zelfde aannames als bereken_wia_bruto_jaar
+    (Nederlandse werknemer, AO% gegeven, standaard wachttijd).
+    """
+    _, maandloon, _, _ = wia_calculator._bereken_dagloon_maandloon(
+        sv_loon_jaar, None, None, wia_calculator.MAX_DAGLOON
+    )
+    pre_disability = sv_loon_jaar / 12 if sv_loon_jaar > 0 else 0
+
+    loondoorbetaling = tuple(
+        _bereken_loondoorbetaling(
+            peildatum=wia_calculator.helper_peildatum(fase),
+            first_sick_day=HELPER_ZIEKTEDAG,
+            pre_disability_gross_month=pre_disability,
+            salary_continuation_pct_year1=_LDB_PCT_JAAR1,
+            salary_continuation_pct_year2=_LDB_PCT_JAAR2,
+            minimum_wage_month_reference=minimum_wage_month_reference,
+            waiting_days=0,
+        )[0]
+        for fase in ("loondoorbetaling_y1", "loondoorbetaling_y2")
+    )
+
+    rvc, ao_pct, benutting_pct, _, _ = _bepaal_rvc_en_ao(
+        maandloon=maandloon,
+        ao_percentage=ao_percentage,
+        residual_earning_capacity_per_month=None,
+        current_actual_gross_wages_per_month=feitelijk_loon_maand,
+        uses_rvc_input_directly=False,
+    )
+    lgu_duur = _bereken_lgu_duur(
+        employment_history_years_to_2015, employment_history_years_from_2016
+    )
+
+    # Maandreeks na de wachttijd (volgorde als bereken_wia_uitkering)
+    earning_capacity_pct = 100 - ao_pct
+    if ao_pct < wia_calculator.MIN_AO_PCT:
+        maanden = (("geen_wia", 0),)
+    elif earning_capacity_pct <= 20 and is_durable:
+        maanden = (("iva", wia_calculator.IVA_CFG['percentage'] * maandloon),)
+    elif earning_capacity_pct <= 20:
+        cfg = wia_calculator.WGA_80_100_CFG
+        maand_1_2 = ("wga_80_100", cfg['percentage_maand_1_2'] * maandloon)
+        maanden = (maand_1_2, maand_1_2,
+                   ("wga_80_100", cfg['percentage_maand_3_plus'] * maandloon))
+    else:
+        lgu = [
+            ("wga_loongerelateerd", _bereken_wga_lgu(m, maandloon, feitelijk_loon_maand)[0])
+            for m in (0, 2)
+        ]
+        uwv, status, _ = _bereken_wga_na_lgu(
+            maandloon=maandloon,
+            rvc=rvc,
+            actual_wage=feitelijk_loon_maand,
+            ao_pct=ao_pct,
+            benutting_pct=benutting_pct,
+            minimum_wage=minimum_wage_month_reference,
+        )
+        maanden = tuple(lgu[0] if m < 2 else lgu[1] for m in range(lgu_duur)) + ((status, uwv),)
+
+    return WIATijdlijn(
+        maandloon=maandloon,
+        loon_uit_arbeid=feitelijk_loon_maand,
+        lgu_duur=lgu_duur,
+        loondoorbetaling=loondoorbetaling,
+        maanden=maanden,
+    )
+
+
+@dataclass(frozen=True)
+class WWTijdlijn:
+    """WW-uitkering van één persoon over de hele looptijd."""
+
+    maandloon: float  # 0 zonder recht op WW
+    duur: int  # WW-duur volgens arbeidsverleden (ook zonder recht)
+    recht: bool
+    loon_uit_arbeid: float
+    maanden: tuple  # (status, uwv per maand) per WW-maand vanaf 1; de laatste geldt daarna
+
+    def maand(self, ww_maand_nummer: int) -> tuple:
+        """(status, uwv per maand) in WW-maand ww_maand_nummer (1-based)."""
+        return self.maanden[min(max(ww_maand_nummer, 1), len(self.maanden)) - 1]
+
+    def bruto_jaar(self, ww_maand_nummer: int = 3) -> dict:
+        """Als bereken_ww_bruto_jaar(ww_maand_nummer=...), zonder toelichting."""
+        status, uwv = self.maand(ww_maand_nummer)
+        ww = round(uwv, 2)
+        emp = round(self.loon_uit_arbeid, 2)
+        totaal = round(ww + emp, 2)
+        return {
+            "ww_status": status,
+            "ww_month_wage": round(self.maandloon, 2),
+            "ww_benefit_gross_month": ww,
+            "ww_benefit_gross_year": round(ww * 12, 2),
+            "employment_income_gross_month": emp,
+            "total_gross_month": totaal,
+            "total_gross_year": round(totaal * 12, 2),
+            "ww_duration_months": self.duur if self.recht else 0,
+        }
+
+
+@lru_cache(maxsize=1024)
+def ww_tijdlijn(
+    sv_loon_jaar: float,
+    earnings_from_employment_month: float = 0,
+    employment_years_total_relevant: int = 0,
+    employment_years_pre2016_above10: int = 0,
+    employment_years_from2016_above10: int = 0,
+) -> WWTijdlijn:
+    """
+    Bouw de WW-tijdlijn; zelfde aannames als bereken_ww_bruto_jaar
+    (volledig werkloos, Nederlandse werknemer, voldoet aan de wekeneis).
+    """
+    duur = bereken_ww_duur(
+        employment_years_total_relevant=employment_years_total_relevant,
+        employment_years_pre2016_above10=employment_years_pre2016_above10,
+        employment_years_from2016_above10=employment_years_from2016_above10,
+    )
+    eligible, _, _ = _check_toelating(
+        insured_for_unemployment=True,
+        weeks_worked_last_36=36,
+        avg_hours=40.0,
+        lost_hours=40.0,
+        lost_wages=True,
+        available=True,
+    )
+    _, maandloon, _, _ = ww_calculator._bereken_dagloon_maandloon(
+        sv_loon_jaar, None, None, False, None
+    )
+    if not eligible or maandloon <= 0:
+        return WWTijdlijn(0, duur, False, earnings_from_employment_month, (("geen_ww", 0),))
+
+    # Inkomstenverrekening (geen fictief inkomen; de stopregel vraagt een
+    # vorige maand boven de grens, die de helper nooit opgeeft)
+    counted_income = earnings_from_employment_month
+    maanden = []
+    for pct in (ww_calculator.UITKERING_CFG['percentage_maand_1_2'],
+                ww_calculator.UITKERING_CFG['percentage_maand_3_plus']):
+        ww_basis = pct * maandloon
+        if counted_income > 0:
+            offset_pct = ww_calculator.VERREKENING_CFG['income_offset_pct']
+            ww_na_verrekening = max(0, ww_basis - offset_pct * counted_income)
+        else:
+            ww_na_verrekening = ww_basis
+        status = "ww_lopend"
+        if counted_income > 0 and ww_na_verrekening > 0:
+            status = "ww_aanvullend"
+        maanden.append((status, ww_na_verrekening))
+
+    reeks = tuple(maanden[0] if n <= 2 else maanden[1] for n in range(1, duur + 1))
+    return WWTijdlijn(
+        maandloon=maandloon,
+        duur=duur,
+        recht=True,
+        loon_uit_arbeid=earnings_from_employment_month,
+        maanden=reeks + (("beeindigd_duur", 0),),
+    )
@@ -706,6 +706,22 @@ def _maak_resultaat(
 # Vereenvoudigde helper voor risk_scenarios.py
 # ============================================================
 
+# Fictieve eerste ziektedag en peildata (weken na ziektedag) per fase
+HELPER_ZIEKTEDAG = date(2020, 1, 1)
+HELPER_FASE_WEKEN = {
+    "loondoorbetaling_y1": 26,  # halverwege jaar 1
+    "loondoorbetaling_y2": 78,  # halverwege jaar 2
+    "lgu": 115,  # ~11 weken in LGU → maand 3+ (70%)
+    "na_lgu": 104 + 130,  # ruim na LGU
+}
+
+
+def helper_peildatum(fase: str) -> date:
+    """Peildatum waarop de gevraagde fase actief is (onbekend → na_lgu)."""
+    weken = HELPER_FASE_WEKEN.get(fase, HELPER_FASE_WEKEN["na_lgu"])
+    return HELPER_ZIEKTEDAG + timedelta(weeks=weken)
+
+
 def bereken_wia_bruto_jaar(
     ao_percentage: float,
     sv_loon_jaar: float,
@@ -736,20 +752,11 @@ def bereken_wia_bruto_jaar(
         dict met status, uwv per maand/jaar, totaal per maand/jaar
     """
     # Stel peildatum zo in dat de gewenste fase actief is
-    fake_sick = date(2020, 1, 1)
-
-    if fase == "loondoorbetaling_y1":
-        peil = fake_sick + timedelta(weeks=26)  # halverwege jaar 1
-    elif fase == "loondoorbetaling_y2":
-        peil = fake_sick + timedelta(weeks=78)  # halverwege jaar 2
-    elif fase == "lgu":
-        peil = fake_sick + timedelta(weeks=115)  # ~11 weken in LGU → maand 3+ (70%)
-    else:  # na_lgu
-        peil = fake_sick + timedelta(weeks=104 + 130)  # ruim na LGU
+    peil = helper_peildatum(fase)
 
     result = bereken_wia_uitkering(
         peildatum=peil,
-        first_sick_day=fake_sick,
+        first_sick_day=HELPER_ZIEKTEDAG,
         sv_loon_12m_total=sv_loon_jaar,
         ao_percentage=ao_percentage,
         is_durable=is_durable,